@@ -0,0 +1,24 @@
+# Generated by Django 5.0.7 on 2026-10-16 23:07
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('analytics', '0003_rename_analytics_p_patient_0a1b2c_idx_analytics_p_patient_26d6cb_idx'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MedicineUsageOutbox',
+            fields=[
+                ('id', models.BigAutoField(primary_key=True, serialize=False)),
+                ('doctor_id', models.UUIDField(blank=True, null=True)),
+                ('patient_id', models.UUIDField(blank=True, null=True)),
+                ('drug_id', models.UUIDField()),
+                ('used_at', models.DateTimeField()),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+        ),
+    ]
@@ -77,4 +77,21 @@ class PatientMedicineUsage(models.Model):
             models.Index(fields=["patient_id"]),
         ]
     def __str__(self):
-        return f"{self.patient_id} - {self.drug.brand_name}"
\ No newline at end of file
+        return f"{self.patient_id} - {self.drug.brand_name}"
+
+class MedicineUsageOutbox(models.Model):
+    """
+    Write-behind usage deltas appended by ``Prescription.finalize``; one row per prescribed line.
+    ``analytics.flush_medicine_usage_outbox`` coalesces them into the usage tables.
+    Plain UUID columns (no FKs) keep the finalize insert free of parent-row locks.
+    """
+
+    id = models.BigAutoField(primary_key=True)
+    doctor_id = models.UUIDField(null=True, blank=True)
+    patient_id = models.UUIDField(null=True, blank=True)
+    drug_id = models.UUIDField()
+    used_at = models.DateTimeField()
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return f"{self.drug_id} @ {self.used_at:%Y-%m-%d %H:%M}"
@@ -0,0 +1,144 @@
+from __future__ import annotations
+
+"""
+Write-behind pipeline for doctor / patient medicine usage counters.
+
+``Prescription.finalize`` calls ``enqueue_usage_deltas`` (one bulk INSERT into
+``MedicineUsageOutbox``) instead of UPDATE-then-INSERT per line on both usage tables.
+``flush_usage_outbox`` (Celery beat) claims a batch with ``SKIP LOCKED``, coalesces deltas per
+(doctor, drug) and (patient, drug), and applies each table as one
+``INSERT ... ON CONFLICT DO UPDATE`` in key order, then deletes the claimed rows.
+The outbox has no foreign keys, so deltas for doctors, patients or drugs deleted since
+finalize are dropped (their outbox rows are still deleted) rather than failing the batch.
+"""
+
+import logging
+import uuid
+from collections.abc import Iterable
+from datetime import datetime
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.utils import timezone
+
+from account.models import User
+from analytics.models import DoctorMedicineUsage, MedicineUsageOutbox, PatientMedicineUsage
+from medicines.models import DrugMaster
+from patient_account.models import PatientProfile
+
+logger = logging.getLogger(__name__)
+
+FLUSH_BATCH_SIZE = 5000
+UPSERT_CHUNK_SIZE = 1000
+
+# key -> [count, last_used_at]
+UsageDeltas = dict[tuple[uuid.UUID, uuid.UUID], list]
+
+
+def usage_write_behind_enabled() -> bool:
+    return bool(getattr(settings, "MEDICINE_USAGE_WRITE_BEHIND", False))
+
+
+def enqueue_usage_deltas(
+    *,
+    doctor_id: uuid.UUID | None,
+    patient_id: uuid.UUID | None,
+    drug_ids: Iterable[uuid.UUID],
+    used_at: datetime,
+) -> int:
+    rows = [
+        MedicineUsageOutbox(doctor_id=doctor_id, patient_id=patient_id, drug_id=drug_id, used_at=used_at)
+        for drug_id in drug_ids
+    ]
+    if rows:
+        MedicineUsageOutbox.objects.bulk_create(rows)
+    return len(rows)
+
+
+def _add(deltas: UsageDeltas, key: tuple[uuid.UUID, uuid.UUID], used_at: datetime) -> None:
+    cur = deltas.get(key)
+    if cur is None:
+        deltas[key] = [1, used_at]
+        return
+    cur[0] += 1
+    if used_at > cur[1]:
+        cur[1] = used_at
+
+
+def _live_ids(model, ids: set[uuid.UUID]) -> set[uuid.UUID]:
+    if not ids:
+        return set()
+    return set(model.objects.filter(id__in=ids).values_list("id", flat=True))
+
+
+def _upsert_usage(model, owner_column: str, deltas: UsageDeltas, now: datetime) -> None:
+    table = connection.ops.quote_name(model._meta.db_table)
+    items = sorted(deltas.items(), key=lambda kv: (str(kv[0][0]), str(kv[0][1])))
+    for i in range(0, len(items), UPSERT_CHUNK_SIZE):
+        chunk = items[i : i + UPSERT_CHUNK_SIZE]
+        params: list = []
+        for (owner_id, drug_id), (count, used_at) in chunk:
+            params.extend([uuid.uuid4(), owner_id, drug_id, count, used_at, now, now])
+        values = ", ".join(["(%s, %s, %s, %s, %s, %s, %s)"] * len(chunk))
+        sql = (
+            f"INSERT INTO {table} (id, {owner_column}, drug_id, usage_count, last_used_at, created_at, updated_at) "
+            f"VALUES {values} "
+            f"ON CONFLICT ({owner_column}, drug_id) DO UPDATE SET "
+            f"usage_count = {table}.usage_count + EXCLUDED.usage_count, "
+            f"last_used_at = GREATEST({table}.last_used_at, EXCLUDED.last_used_at), "
+            f"updated_at = EXCLUDED.updated_at"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(sql, params)
+
+
+def flush_usage_outbox(*, batch_size: int = FLUSH_BATCH_SIZE) -> dict[str, int]:
+    """Apply one claimed batch of outbox deltas. Safe to run concurrently (rows are skip-locked)."""
+    with transaction.atomic():
+        claimed = list(
+            MedicineUsageOutbox.objects.select_for_update(skip_locked=True)
+            .order_by("id")
+            .values_list("id", "doctor_id", "patient_id", "drug_id", "used_at")[:batch_size]
+        )
+        if not claimed:
+            return {"deltas": 0, "doctor_rows": 0, "patient_rows": 0}
+
+        doctor_deltas: UsageDeltas = {}
+        patient_deltas: UsageDeltas = {}
+        for _, doctor_id, patient_id, drug_id, used_at in claimed:
+            if doctor_id:
+                _add(doctor_deltas, (doctor_id, drug_id), used_at)
+            if patient_id:
+                _add(patient_deltas, (patient_id, drug_id), used_at)
+
+        live_drugs = _live_ids(DrugMaster, {row[3] for row in claimed})
+        live_doctors = _live_ids(User, {d for d, _ in doctor_deltas})
+        live_patients = _live_ids(PatientProfile, {p for p, _ in patient_deltas})
+        doctor_deltas = {
+            k: v for k, v in doctor_deltas.items() if k[0] in live_doctors and k[1] in live_drugs
+        }
+        patient_deltas = {
+            k: v for k, v in patient_deltas.items() if k[0] in live_patients and k[1] in live_drugs
+        }
+
+        now = timezone.now()
+        if doctor_deltas:
+            _upsert_usage(DoctorMedicineUsage, "doctor_id", doctor_deltas, now)
+        if patient_deltas:
+            _upsert_usage(PatientMedicineUsage, "patient_id", patient_deltas, now)
+        MedicineUsageOutbox.objects.filter(id__in=[row[0] for row in claimed]).delete()
+
+        from medicines.services.suggestion_vectors import schedule_vector_refresh
+
+        schedule_vector_refresh(
+            doctor_ids={d for d, _ in doctor_deltas},
+            patient_ids={p for p, _ in patient_deltas},
+        )
+
+    logger.info(
+        "medicine usage outbox flushed: %s deltas -> %s doctor rows, %s patient rows",
+        len(claimed),
+        len(doctor_deltas),
+        len(patient_deltas),
+    )
+    return {"deltas": len(claimed), "doctor_rows": len(doctor_deltas), "patient_rows": len(patient_deltas)}
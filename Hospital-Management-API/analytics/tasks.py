@@ -0,0 +1,15 @@
+from celery import shared_task
+
+from analytics.services.usage_pipeline import FLUSH_BATCH_SIZE, flush_usage_outbox
+
+
+@shared_task(name="analytics.flush_medicine_usage_outbox")
+def flush_medicine_usage_outbox() -> dict:
+    """Drain the usage outbox; keeps going while full batches are returned."""
+    total = {"deltas": 0, "doctor_rows": 0, "patient_rows": 0}
+    while True:
+        out = flush_usage_outbox()
+        for k in total:
+            total[k] += out[k]
+        if out["deltas"] < FLUSH_BATCH_SIZE:
+            return total
@@ -1,3 +1,116 @@
+import uuid
+from datetime import timedelta
+
 from django.test import TestCase
+from django.utils import timezone
+
+from account.models import User
+from analytics.models import DoctorMedicineUsage, MedicineUsageOutbox, PatientMedicineUsage
+from analytics.services.usage_pipeline import enqueue_usage_deltas, flush_usage_outbox
+from medicines.models import DrugMaster, FormulationMaster
+from patient_account.models import PatientAccount, PatientProfile
+
+
+class UsageOutboxFlushTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.doctor = User.objects.create_user(
+            username="outboxdoc",
+            email="outboxdoc@test.com",
+            password="testpass123",
+            first_name="O",
+            last_name="Doc",
+        )
+        form = FormulationMaster.objects.create(name="outbox-tab")
+        cls.drug_a = DrugMaster.objects.create(code="OBX1", brand_name="Outboxa", formulation=form)
+        cls.drug_b = DrugMaster.objects.create(code="OBX2", brand_name="Outboxb", formulation=form)
+        patient_user = User.objects.create_user(
+            username="outboxpat",
+            email="outboxpat@test.com",
+            password="testpass123",
+            first_name="O",
+            last_name="Pat",
+        )
+        account = PatientAccount.objects.create(user=patient_user)
+        cls.patient_id = PatientProfile.objects.create(
+            account=account, first_name="Outbox", relation="self", age_years=30
+        ).id
+
+    def test_flush_coalesces_deltas_into_usage_rows(self):
+        t1 = timezone.now() - timedelta(hours=1)
+        t2 = timezone.now()
+        enqueue_usage_deltas(
+            doctor_id=self.doctor.id,
+            patient_id=self.patient_id,
+            drug_ids=[self.drug_a.id, self.drug_b.id],
+            used_at=t1,
+        )
+        enqueue_usage_deltas(
+            doctor_id=self.doctor.id,
+            patient_id=self.patient_id,
+            drug_ids=[self.drug_a.id],
+            used_at=t2,
+        )
+
+        out = flush_usage_outbox()
+
+        self.assertEqual(out, {"deltas": 3, "doctor_rows": 2, "patient_rows": 2})
+        row = DoctorMedicineUsage.objects.get(doctor=self.doctor, drug=self.drug_a)
+        self.assertEqual(row.usage_count, 2)
+        self.assertEqual(row.last_used_at, t2)
+        self.assertEqual(
+            PatientMedicineUsage.objects.get(patient_id=self.patient_id, drug=self.drug_b).usage_count,
+            1,
+        )
+        self.assertFalse(MedicineUsageOutbox.objects.exists())
+
+    def test_flush_increments_existing_rows_and_keeps_latest_use(self):
+        later = timezone.now()
+        DoctorMedicineUsage.objects.create(
+            doctor=self.doctor, drug=self.drug_a, usage_count=5, last_used_at=later
+        )
+        enqueue_usage_deltas(
+            doctor_id=self.doctor.id,
+            patient_id=None,
+            drug_ids=[self.drug_a.id],
+            used_at=later - timedelta(days=1),
+        )
+        flush_usage_outbox()
+        row = DoctorMedicineUsage.objects.get(doctor=self.doctor, drug=self.drug_a)
+        self.assertEqual(row.usage_count, 6)
+        self.assertEqual(row.last_used_at, later)
+        self.assertFalse(PatientMedicineUsage.objects.exists())
+
+    def test_unknown_doctor_deltas_are_dropped(self):
+        enqueue_usage_deltas(
+            doctor_id=uuid.uuid4(),
+            patient_id=self.patient_id,
+            drug_ids=[self.drug_a.id],
+            used_at=timezone.now(),
+        )
+        out = flush_usage_outbox()
+        self.assertEqual(out["doctor_rows"], 0)
+        self.assertEqual(out["patient_rows"], 1)
+        self.assertFalse(MedicineUsageOutbox.objects.exists())
+
+    def test_deltas_for_deleted_drugs_or_patients_are_dropped(self):
+        enqueue_usage_deltas(
+            doctor_id=self.doctor.id,
+            patient_id=self.patient_id,
+            drug_ids=[uuid.uuid4()],
+            used_at=timezone.now(),
+        )
+        enqueue_usage_deltas(
+            doctor_id=self.doctor.id,
+            patient_id=uuid.uuid4(),
+            drug_ids=[self.drug_a.id],
+            used_at=timezone.now(),
+        )
+        out = flush_usage_outbox()
+        self.assertEqual(out, {"deltas": 2, "doctor_rows": 1, "patient_rows": 0})
+        self.assertEqual(DoctorMedicineUsage.objects.get(doctor=self.doctor).drug_id, self.drug_a.id)
+        self.assertFalse(PatientMedicineUsage.objects.exists())
+        self.assertFalse(MedicineUsageOutbox.objects.exists())
 
-# Create your tests here.
+    def test_flush_empty_outbox(self):
+        self.assertEqual(flush_usage_outbox()["deltas"], 0)
@@ -8,6 +8,7 @@ from rest_framework_simplejwt.tokens import RefreshToken
 from medicines.models.drug import DrugMaster
 from medicines.models.masters import FormulationMaster
 from medicines.models.choices import DrugType
+from medicines.services.master_lookup import clear_master_lookup
 from tests.helpers.medicine_masters import ensure_autofill_route_and_dose_masters
 from tests.factories.clinic import ClinicFactory
 from tests.factories.doctor import DoctorFactory, ensure_doctor_group
@@ -30,6 +31,14 @@ def _locmem_cache(settings):
     }
 
 
+@pytest.fixture(autouse=True)
+def _clear_medicine_master_lookup():
+    # Master rows are rolled back between tests; drop process-local tables that may reference them.
+    clear_master_lookup()
+    yield
+    clear_master_lookup()
+
+
 @pytest.fixture
 def api_client():
     return APIClient()
@@ -1,8 +1,9 @@
+from django.utils.cache import get_conditional_response
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from consultation_config.services.schema_builder import get_render_schema
+from consultation_config.services.schema_builder import get_render_schema, render_schema_etag
 
 
 class ConsultationRenderSchemaAPIView(APIView):
@@ -17,6 +18,14 @@ class ConsultationRenderSchemaAPIView(APIView):
         specialty = request.query_params.get("specialty")
         section = request.query_params.get("section")
 
+        # Schemas only change with the metadata bundle, so clients that send
+        # the ETag back get a 304 without the schema being looked up.
+        etag = render_schema_etag(specialty, section)
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            not_modified["ETag"] = etag
+            return not_modified
+
         try:
             schema = get_render_schema(specialty=specialty, section=section)
         except ValueError as exc:
@@ -38,5 +47,7 @@ class ConsultationRenderSchemaAPIView(APIView):
         # All symptom-level rules like `no_hard_required` and dependencies are
         # passed through in the field definitions/meta; frontend is responsible
         # for respecting them visually without blocking workflow.
-        return Response(schema, status=status.HTTP_200_OK)
+        response = Response(schema, status=status.HTTP_200_OK)
+        response["ETag"] = etag
+        return response
 
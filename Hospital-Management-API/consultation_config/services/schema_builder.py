@@ -1,10 +1,9 @@
-import json
-import os
 from typing import Any, Dict, List
 
-from django.conf import settings
 from django.core.cache import cache
 
+from consultations_core.services.metadata_bundle import MetadataBundleStore
+
 
 SCHEMA_CACHE_TTL_SECONDS = 60 * 60  # 1 hour
 SCHEMA_CACHE_KEY_PATTERN = "consult_schema:{version}:{specialty}:{section}"
@@ -12,18 +11,10 @@ SCHEMA_CACHE_KEY_PATTERN = "consult_schema:{version}:{specialty}:{section}"
 
 def _load_json(relative_path: str) -> Dict[str, Any]:
     """
-    Load a JSON configuration file from the consultations_core templates_metadata tree.
+    Return a JSON configuration file from the consultations_core templates_metadata tree.
+    Served from the in-process metadata bundle; treat the result as read-only.
     """
-    base_dir = settings.BASE_DIR
-    path = os.path.join(
-        base_dir,
-        "consultations_core",
-        "templates_metadata",
-        *relative_path.split("/"),
-    )
-
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    return MetadataBundleStore.get(relative_path)
 
 
 def _get_specialty_config() -> Dict[str, Any]:
@@ -282,19 +273,26 @@ def _build_diagnosis_schema(specialty: str) -> Dict[str, Any]:
 
 def _get_metadata_version() -> str:
     """
-    Returns a string version derived from the shared metadata _version.json file.
+    Returns a string version derived from the metadata bundle: the
+    metadata_version in _version.json plus a prefix of the content hash.
+
+    Changing metadata_version (or any template file) moves cached schemas
+    to a new cache key namespace.
+    """
+    bundle = MetadataBundleStore.current()
+    version = "v1" if bundle.version is None else f"v{bundle.version}"
+    return f"{version}-{bundle.content_hash[:12]}"
+
 
-    Changing metadata_version there will automatically invalidate cached schemas
-    by moving them to a new cache key namespace.
+def render_schema_etag(specialty: str, section: str) -> str:
     """
-    try:
-        data = _load_json("_version.json")
-        version = data.get("metadata_version")
-        if version is None:
-            return "v1"
-        return f"v{version}"
-    except FileNotFoundError:
-        return "v1"
+    ETag for get_render_schema(specialty, section) under the current bundle.
+    """
+    return MetadataBundleStore.current().etag(
+        "render_schema",
+        (specialty or "").strip(),
+        (section or "").strip(),
+    )
 
 
 def _build_basic_section_schema(section: str) -> Dict[str, Any]:
@@ -22,6 +22,7 @@ from consultations_core.api.views.consultation import (
     ConsultationSummaryLiteAPIView,
     ConsultationSummaryLiteHTMLAPIView,
     ConsultationSummaryLitePDFAPIView,
+    ConsultationSummaryLitePDFRenderAPIView,
     CancelConsultationPrescriptionAPIView,
 )
 from consultations_core.api.views.instructions import (
@@ -175,6 +176,11 @@ urlpatterns = [
         ConsultationSummaryLitePDFAPIView.as_view(),
         name="consultation-summary-lite-pdf",
     ),
+    path(
+        "<uuid:consultation_id>/summary-lite/pdf/renders/<str:render_id>/",
+        ConsultationSummaryLitePDFRenderAPIView.as_view(),
+        name="consultation-summary-lite-pdf-render",
+    ),
     path(
         "<uuid:consultation_id>/prescription/cancel/",
         CancelConsultationPrescriptionAPIView.as_view(),
@@ -15,6 +15,7 @@ from django.core.exceptions import ValidationError
 from django.http import HttpResponse
 from django.template.loader import render_to_string
 from django.db.models import Q
+from django.urls import reverse
 from rest_framework import status
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.exceptions import NotFound
@@ -38,8 +39,18 @@ from consultations_core.services.consultation_summary_service import (
     build_consultation_summary,
     build_numeric_dose_display,
 )
+from consultations_core.services.prescription_pdf_renderer import (
+    PdfRenderStatus,
+    PrescriptionPdfCache,
+    async_pdf_rendering_enabled,
+    get_pdf_render,
+    render_pdf,
+    render_prescription_html,
+    request_pdf_render,
+)
 
 logger = logging.getLogger(__name__)
+_RENDER_ID_RE = re.compile(r"[0-9a-f]{64}")
 def _as_list(value):
     return value if isinstance(value, list) else []
 
@@ -438,25 +449,24 @@ class ConsultationSummaryLitePDFAPIView(ConsultationSummaryLiteHTMLAPIView):
         if isinstance(draft_payload, dict):
             summary = _apply_draft_preview_overrides(summary, draft_payload)
 
-        html = render_to_string("prescriptions/prescription.html", summary).strip()
+        html = render_prescription_html(summary)
         base_url = request.build_absolute_uri("/")
         try:
-            from weasyprint import HTML
-
-            pdf_binary = HTML(string=html, base_url=base_url).write_pdf()
-        except Exception as exc:
+            if async_pdf_rendering_enabled() and _wants_async_pdf(request):
+                render = request_pdf_render(html, base_url, consultation_id=consultation_id)
+                if render.pdf is None:
+                    return _pdf_render_status_response(request, consultation_id, render)
+                pdf_binary = render.pdf
+            else:
+                pdf_binary = render_pdf(html, base_url)
+        except Exception:
             logger.exception("Failed to generate prescription PDF for consultation %s", consultation_id)
             return Response(
-                {
-                    "detail": "PDF generation failed. Ensure WeasyPrint and system dependencies are installed.",
-                    "error": str(exc),
-                },
+                {"detail": "PDF generation failed."},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
-        response = HttpResponse(pdf_binary, content_type="application/pdf")
-        response["Content-Disposition"] = f'attachment; filename="prescription-{consultation_id}.pdf"'
-        return response
+        return _pdf_response(pdf_binary, consultation_id)
 
     def get(self, request, consultation_id):
         return self._render_pdf(request=request, consultation_id=consultation_id)
@@ -470,6 +480,62 @@ class ConsultationSummaryLitePDFAPIView(ConsultationSummaryLiteHTMLAPIView):
         )
 
 
+class ConsultationSummaryLitePDFRenderAPIView(APIView):
+    """
+    GET <consultation_id>/summary-lite/pdf/renders/<render_id>/
+
+    Status of a queued PDF render (PRESCRIPTION_PDF_ASYNC_ENABLED): the PDF
+    once ready, 202 while pending, 500 if it failed, 404 if unknown/expired
+    or not requested for this consultation.
+    """
+
+    authentication_classes = [JWTAuthentication]
+    permission_classes = [IsAuthenticated, IsDoctor]
+
+    def get(self, request, consultation_id, render_id):
+        if not Consultation.objects.filter(pk=consultation_id).exists():
+            return Response({"detail": "Consultation not found."}, status=status.HTTP_404_NOT_FOUND)
+        render = None
+        if _RENDER_ID_RE.fullmatch(render_id) and PrescriptionPdfCache.is_bound(render_id, consultation_id):
+            render = get_pdf_render(render_id)
+        if render is None:
+            return Response({"detail": "PDF render not found."}, status=status.HTTP_404_NOT_FOUND)
+        if render.pdf is not None:
+            return _pdf_response(render.pdf, consultation_id)
+        return _pdf_render_status_response(request, consultation_id, render)
+
+
+def _wants_async_pdf(request):
+    flag = str(request.query_params.get("async", "")).lower() in {"1", "true", "yes"}
+    return flag or "respond-async" in request.headers.get("Prefer", "").lower()
+
+
+def _pdf_response(pdf_binary, consultation_id):
+    response = HttpResponse(pdf_binary, content_type="application/pdf")
+    response["Content-Disposition"] = f'attachment; filename="prescription-{consultation_id}.pdf"'
+    return response
+
+
+def _pdf_render_status_response(request, consultation_id, render):
+    status_url = request.build_absolute_uri(
+        reverse(
+            "consultation-summary-lite-pdf-render",
+            kwargs={"consultation_id": consultation_id, "render_id": render.render_id},
+        )
+    )
+    payload = {"render_id": render.render_id, "status": render.status, "status_url": status_url}
+    if render.status == PdfRenderStatus.FAILED:
+        logger.warning(
+            "prescription_pdf_render_failed consultation_id=%s render_id=%s error=%s",
+            consultation_id,
+            render.render_id,
+            render.error,
+        )
+        payload["detail"] = "PDF generation failed."
+        return Response(payload, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+    return Response(payload, status=status.HTTP_202_ACCEPTED)
+
+
 class DoctorPrescriptionListPagination(PageNumberPagination):
     page_size = 20
     page_size_query_param = "page_size"
@@ -22,6 +22,7 @@ from django.db import IntegrityError
 from django.http import Http404
 from django.shortcuts import get_object_or_404
 from django.utils import timezone
+from django.utils.cache import get_conditional_response
 # Local App Imports
 from account.permissions import IsDiagnosticOrderOrchestrationActor, IsDoctor
 from consultations_core.audit import ConsultationAuditService, emit_after_commit
@@ -29,6 +30,7 @@ from shared.logging import LogModule, logger as dpc_logger
 from clinical_documentation.audit import schedule_allergy_audits, schedule_vitals_audit
 from consultations_core.domain.vitals_meaningful import vitals_data_is_meaningful
 from consultations_core.services.consultation_engine import ConsultationEngine
+from consultations_core.services.metadata_bundle import MetadataBundleStore
 from consultations_core.services.metadata_loader import MetadataLoader
 from consultations_core.services.preconsultation_service import (
     PreConsultationService,
@@ -214,10 +216,8 @@ class PreConsultationTemplateAPIView(APIView):
     def get(self, request):
         user = request.user
 
-        # For development: Always clear cache to ensure template changes are reflected immediately
-        # MetadataLoader also checks file modification times, but clearing cache
-        # ensures immediate reload without waiting for mtime check
-        
+        # For development: Always rebuild the metadata bundle so template changes
+        # are reflected immediately (workers otherwise reload on version change)
         if settings.DEBUG:
             MetadataLoader.clear_cache()
 
@@ -265,6 +265,13 @@ class PreConsultationTemplateAPIView(APIView):
         specialty_sections = specialty_cfg.get(specialty_key, {}).get("sections", [])
         logger.info(f"Specialty '{specialty_key}' has {len(specialty_sections)} sections configured: {specialty_sections}")
 
+        # The response depends only on the metadata bundle and the specialty.
+        etag = MetadataBundleStore.current().etag("pre_consultation_template", specialty_key)
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            not_modified["ETag"] = etag
+            return not_modified
+
         try:
             logger.info(f"Fetching template for specialty: '{specialty_key}' (raw: '{raw_specialty}')")
             template = ConsultationEngine.get_pre_consultation_template(specialty_key)
@@ -301,7 +308,7 @@ class PreConsultationTemplateAPIView(APIView):
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR,
             )
 
-        return Response(
+        response = Response(
             {
                 "specialty": specialty_key,
                 "metadata_version": metadata_version,
@@ -311,6 +318,8 @@ class PreConsultationTemplateAPIView(APIView):
             },
             status=status.HTTP_200_OK,
         )
+        response["ETag"] = etag
+        return response
 
 class CreateEncounterAPIView(APIView):
     """
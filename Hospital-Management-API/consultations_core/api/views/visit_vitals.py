@@ -30,6 +30,7 @@ from consultations_core.services.preconsultation_service import (
 from consultations_core.services.encounter_state_machine import EncounterStateMachine
 from clinical_documentation.audit import schedule_vitals_audit
 from queue_management.models import Queue
+from queue_management.services.queue_read_model import invalidate_queue_read_model
 
 logger = logging.getLogger(__name__)
 
@@ -304,6 +305,9 @@ class VisitVitalsAPIView(APIView):
                 status__in=("completed", "cancelled", "skipped")
             )
             updated_count = queue_rows.update(status="vitals_done")
+            invalidate_queue_read_model(
+                doctor_id=encounter.doctor_id, clinic_id=encounter.clinic_id, queue_date=today
+            )
             logger.info(
                 "encounter.lifecycle.vitals.mark_queue_done encounter_id=%s visit_pnr=%s updated_rows=%s",
                 encounter.id,
@@ -1,6 +1,22 @@
+import logging
+
 from django.apps import AppConfig
 
+logger = logging.getLogger(__name__)
+
 
 class ConsultationsCoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'consultations_core'
+
+    def ready(self):
+        # Replace consultation summary cache stamps on writes to the consultation graph.
+        import consultations_core.signals  # noqa: F401
+
+        # Parse template metadata once per process (before fork with --preload).
+        from consultations_core.services.metadata_bundle import MetadataBundleStore
+
+        try:
+            MetadataBundleStore.preload()
+        except Exception:
+            logger.exception("Consultation metadata bundle preload failed; loading on first use")
@@ -0,0 +1,42 @@
+"""
+Compile consultations_core/templates_metadata/*.json into one bundle file.
+Run at deploy time; point CONSULTATION_METADATA_BUNDLE_PATH at the output so
+workers load one file instead of walking and parsing the template tree.
+
+  python manage.py build_metadata_bundle                        # writes CONSULTATION_METADATA_BUNDLE_PATH
+  python manage.py build_metadata_bundle --output /tmp/bundle.json
+"""
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from consultations_core.services.metadata_bundle import compile_bundle, write_bundle
+
+
+class Command(BaseCommand):
+    help = "Compile template metadata JSON into one versioned, content-hashed bundle file."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            default=None,
+            help="Bundle file to write (defaults to CONSULTATION_METADATA_BUNDLE_PATH).",
+        )
+
+    def handle(self, *args, **options):
+        output = options.get("output") or getattr(settings, "CONSULTATION_METADATA_BUNDLE_PATH", "")
+        if not output:
+            raise CommandError("Pass --output or set CONSULTATION_METADATA_BUNDLE_PATH.")
+
+        try:
+            bundle = compile_bundle()
+        except ValueError as e:
+            # json.JSONDecodeError is a ValueError
+            raise CommandError(f"Invalid template metadata: {e}") from e
+
+        write_bundle(bundle, output)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Wrote {len(bundle.files)} files to {output} "
+                f"(metadata_version={bundle.version}, hash={bundle.content_hash[:12]})"
+            )
+        )
@@ -68,6 +68,11 @@ class Command(BaseCommand):
 
         if not dry_run:
             MetadataLoader.clear_cache()
-            self.stdout.write(self.style.SUCCESS("Cache cleared. Next API request will load templates from disk."))
+            self.stdout.write(
+                self.style.SUCCESS(
+                    "Cache cleared. Running workers reload templates once _version.json "
+                    "(or the built bundle) changes."
+                )
+            )
         else:
             self.stdout.write("Validation passed. Run without --dry-run to clear cache.")
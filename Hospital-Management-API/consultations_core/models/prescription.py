@@ -440,7 +440,24 @@ class Prescription(models.Model):
         now = self.finalized_at
         patient_id = self.consultation.encounter.patient_profile_id
 
+        from analytics.services.usage_pipeline import enqueue_usage_deltas, usage_write_behind_enabled
+
         # TODO: AI suggestions / allergy filtering can consume these aggregates
+        if usage_write_behind_enabled():
+            # One outbox INSERT; analytics.flush_medicine_usage_outbox coalesces into the usage tables.
+            enqueue_usage_deltas(
+                doctor_id=self.created_by_id,
+                patient_id=patient_id,
+                drug_ids=self.lines.exclude(drug_id=None).values_list("drug_id", flat=True),
+                used_at=now,
+            )
+        else:
+            self._increment_usage_counters(now=now, patient_id=patient_id)
+
+        self.save(update_fields=["status", "finalized_at"])
+
+    def _increment_usage_counters(self, *, now, patient_id):
+        """Inline counter updates (MEDICINE_USAGE_WRITE_BEHIND off)."""
         for line in self.lines.all():
             if not line.drug_id:
                 continue
@@ -470,7 +487,12 @@ class Prescription(models.Model):
                     last_used_at=now,
                 )
 
-        self.save(update_fields=["status", "finalized_at"])
+        from medicines.services.suggestion_vectors import schedule_vector_refresh
+
+        schedule_vector_refresh(
+            doctor_ids=[self.created_by_id] if self.created_by_id else [],
+            patient_ids=[patient_id] if patient_id else [],
+        )
 
     @transaction.atomic
     def cancel(
@@ -658,18 +680,52 @@ class PrescriptionLine(models.Model):
                 self.strength_snapshot = None
 
             self.formulation_snapshot = cm.dose_type
+    # =====================================================
+    # BULK CREATE
+    # =====================================================
+    @classmethod
+    def bulk_create_lines(cls, prescription, lines):
+        """
+        Insert new lines for one prescription in a single statement.
+
+        Same snapshot + validation as save(), but the prescription-level checks run once
+        and FK existence is left to the database instead of one query per FK per line.
+        """
+        if not lines:
+            return []
+
+        cls._validate_prescription_writable(prescription)
+
+        for line in lines:
+            if line.prescription_id != prescription.pk:
+                raise ValidationError("All lines must belong to the same prescription.")
+            line._create_snapshot()
+            line.clean_fields(
+                exclude=["prescription", "drug", "custom_medicine", "dose_unit", "route", "frequency", "deleted_by"]
+            )
+            line._validate_line()
+
+        with transaction.atomic():
+            return cls.objects.bulk_create(lines)
+
     def __str__(self):
         return f"{self.drug_name_snapshot} | {self.prescription.prescription_pnr}"
     def clean(self):
         super().clean()
-        EncounterLockValidator.validate(self.prescription.consultation)
+        self._validate_prescription_writable(self.prescription)
+        self._validate_line()
 
-        if self.dose_value <= 0:
-            raise ValidationError("Dose must be positive.")
+    @staticmethod
+    def _validate_prescription_writable(prescription):
+        EncounterLockValidator.validate(prescription.consultation)
 
-        if self.prescription.status == PrescriptionStatus.FINALIZED:
+        if prescription.status == PrescriptionStatus.FINALIZED:
             raise ValidationError("Cannot modify finalized prescription.")
 
+    def _validate_line(self):
+        if self.dose_value <= 0:
+            raise ValidationError("Dose must be positive.")
+
         if not self.drug and not self.custom_medicine:
             raise ValidationError("Either drug or custom medicine required.")
 
@@ -148,8 +148,8 @@ class ConsultationEngine:
                 
                 # Update validation object if it exists
                 if "validation" in updated_field:
-                    if updated_field["validation"] is None:
-                        updated_field["validation"] = {}
+                    # Copy nested dicts: fields belong to the shared metadata bundle.
+                    updated_field["validation"] = dict(updated_field["validation"] or {})
                     
                     # Update validation min/max
                     if "min" in field_range_config:
@@ -163,8 +163,9 @@ class ConsultationEngine:
                         updated_field["unit"] = field_range_config["canonical_unit"]
                     
                     # Update error messages with dynamic placeholders
-                    if "error_messages" not in updated_field["validation"]:
-                        updated_field["validation"]["error_messages"] = {}
+                    updated_field["validation"]["error_messages"] = dict(
+                        updated_field["validation"].get("error_messages") or {}
+                    )
                     
                     # Ensure error messages use placeholders for dynamic unit display
                     error_msgs = updated_field["validation"]["error_messages"]
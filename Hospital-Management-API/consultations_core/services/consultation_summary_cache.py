@@ -0,0 +1,142 @@
+"""
+Versioned cache for build_consultation_summary.
+
+Every entry is keyed by the consultation's summary stamp, a random token
+replaced (after commit) by any write to the consultation graph; see
+consultations_core.signals. Two layers share the stamp:
+
+- the composed summary per (profile, section set), one read on a hit;
+- each part ("base" header/vitals, and every section) on its own, so a
+  different profile or section set reuses parts already composed and
+  only queries the missing ones.
+
+Values are stored as zlib-compressed compact JSON.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import uuid
+import zlib
+from typing import Any, Iterable
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+logger = logging.getLogger(__name__)
+
+SUMMARY_CACHE_PREFIX = "consultation_summary"
+SUMMARY_CACHE_FORMAT = "v2"
+BASE_PART = "base"
+# Stamps outlive the entries they version; a lost stamp only costs misses.
+STAMP_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+def summary_cache_enabled() -> bool:
+    return bool(getattr(settings, "ENABLE_CONSULTATION_SUMMARY_CACHE", False))
+
+
+def _ttl() -> int:
+    return int(getattr(settings, "CONSULTATION_SUMMARY_CACHE_TTL_SECONDS", 900))
+
+
+def _encode(value: Any) -> bytes | None:
+    try:
+        raw = json.dumps(value, separators=(",", ":"), ensure_ascii=False)
+    except (TypeError, ValueError):
+        return None
+    return zlib.compress(raw.encode("utf-8"), 1)
+
+
+def _decode(blob: Any) -> Any:
+    if not isinstance(blob, (bytes, bytearray)):
+        return None
+    try:
+        return json.loads(zlib.decompress(blob))
+    except (zlib.error, ValueError):
+        return None
+
+
+class ConsultationSummaryCache:
+    @staticmethod
+    def _stamp_key(consultation_id) -> str:
+        return f"{SUMMARY_CACHE_PREFIX}:stamp:{consultation_id}"
+
+    @staticmethod
+    def _prefix(consultation_id, stamp: str) -> str:
+        return f"{SUMMARY_CACHE_PREFIX}:{consultation_id}:{SUMMARY_CACHE_FORMAT}:{stamp}"
+
+    @classmethod
+    def stamp(cls, consultation_id) -> str | None:
+        key = cls._stamp_key(consultation_id)
+        stamp = cache.get(key)
+        if stamp is None:
+            cache.add(key, uuid.uuid4().hex[:16], STAMP_TTL_SECONDS)
+            stamp = cache.get(key)
+        return stamp
+
+    @classmethod
+    def bump(cls, consultation_id) -> None:
+        cache.set(cls._stamp_key(consultation_id), uuid.uuid4().hex[:16], STAMP_TTL_SECONDS)
+
+    @classmethod
+    def summary_key(cls, consultation_id, stamp: str, profile: str, sections: Iterable[str]) -> str:
+        return f"{cls._prefix(consultation_id, stamp)}:{profile}:{','.join(sorted(sections))}"
+
+    @classmethod
+    def part_key(cls, consultation_id, stamp: str, part: str) -> str:
+        return f"{cls._prefix(consultation_id, stamp)}:part:{part}"
+
+    @classmethod
+    def get_summary(cls, key: str) -> dict[str, Any] | None:
+        value = _decode(cache.get(key))
+        return value if isinstance(value, dict) else None
+
+    @classmethod
+    def set_summary(cls, key: str, summary: dict[str, Any]) -> None:
+        blob = _encode(summary)
+        if blob is not None:
+            cache.set(key, blob, _ttl())
+
+    @classmethod
+    def get_parts(cls, consultation_id, stamp: str, parts: Iterable[str]) -> dict[str, Any]:
+        keys = {cls.part_key(consultation_id, stamp, part): part for part in parts}
+        found: dict[str, Any] = {}
+        for key, blob in cache.get_many(list(keys)).items():
+            value = _decode(blob)
+            if value is not None:
+                found[keys[key]] = value
+        return found
+
+    @classmethod
+    def set_parts(cls, consultation_id, stamp: str, parts: dict[str, Any]) -> None:
+        entries = {}
+        for part, value in parts.items():
+            blob = _encode(value)
+            if blob is not None:
+                entries[cls.part_key(consultation_id, stamp, part)] = blob
+        if entries:
+            cache.set_many(entries, _ttl())
+
+
+def invalidate_summary_on_commit(*, consultation_id=None, consultation_ids=None) -> None:
+    """
+    Replace the summary stamp once the current transaction commits.
+
+    consultation_ids may be a lazy queryset (values_list of ids); it is
+    evaluated inside the on_commit callback, after the write is visible.
+    """
+    if not summary_cache_enabled():
+        return
+
+    def _bump() -> None:
+        try:
+            ids = [consultation_id] if consultation_id is not None else list(consultation_ids or ())
+            for cid in ids:
+                ConsultationSummaryCache.bump(cid)
+        except Exception:
+            logger.exception("consultation_summary_cache_invalidation_failed")
+
+    transaction.on_commit(_bump)
@@ -6,7 +6,6 @@ import re
 from typing import Any, Iterable
 
 from django.conf import settings
-from django.core.cache import cache
 from django.db.models import Prefetch
 from django.utils import timezone
 
@@ -19,6 +18,11 @@ from consultations_core.models.investigation import InvestigationItem
 from consultations_core.models.prescription import Prescription
 from consultations_core.models.prescription import PrescriptionLine
 from consultations_core.models.symptoms import ConsultationSymptom
+from consultations_core.services.consultation_summary_cache import (
+    BASE_PART,
+    ConsultationSummaryCache,
+    summary_cache_enabled,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -44,20 +48,36 @@ PREVIEW_PDF_SECTIONS = (
 
 def build_consultation_summary(consultation_id, sections: Iterable[str] | None = None, profile: str = "full") -> dict[str, Any]:
     selected_sections = _resolve_sections(sections=sections, profile=profile)
-    cache_key = _summary_cache_key(consultation_id=consultation_id, sections=selected_sections, profile=profile)
-
-    if _is_cache_enabled():
-        cached = cache.get(cache_key)
-        if isinstance(cached, dict):
-            return attach_whatsapp_delivery_status(cached, consultation_id)
-
-    consultation = _get_consultation_with_relations(consultation_id=consultation_id, sections=selected_sections)
-    summary = _compose_summary(consultation=consultation, sections=selected_sections, profile=profile)
+    stamp = ConsultationSummaryCache.stamp(consultation_id) if _is_cache_enabled() else None
+    if not stamp:
+        consultation = _get_consultation_with_relations(consultation_id=consultation_id, sections=selected_sections)
+        summary = _compose_summary(consultation=consultation, sections=selected_sections, profile=profile)
+        return attach_whatsapp_delivery_status(summary, consultation_id)
+
+    cache_key = ConsultationSummaryCache.summary_key(consultation_id, stamp, profile, selected_sections)
+    cached = ConsultationSummaryCache.get_summary(cache_key)
+    if cached is not None:
+        return attach_whatsapp_delivery_status(cached, consultation_id)
+
+    # Reuse parts composed for other profiles / section sets; query only the rest.
+    parts = ConsultationSummaryCache.get_parts(consultation_id, stamp, [BASE_PART, *selected_sections])
+    missing = {section for section in selected_sections if section not in parts}
+    composed: dict[str, Any] = {}
+    if missing or BASE_PART not in parts:
+        consultation = _get_consultation_with_relations(consultation_id=consultation_id, sections=missing)
+        if BASE_PART not in parts:
+            composed[BASE_PART] = _summary_without_whatsapp(_compose_base(consultation))
+        for section in missing:
+            composed[section] = _compose_section(consultation, section)
+    parts.update(composed)
+
+    summary = _assemble_summary(parts, sections=selected_sections, profile=profile)
     summary = attach_whatsapp_delivery_status(summary, consultation_id)
 
-    if _is_cache_enabled() and summary.get("meta", {}).get("status") == "completed":
-        ttl_seconds = int(getattr(settings, "CONSULTATION_SUMMARY_CACHE_TTL_SECONDS", 900))
-        cache.set(cache_key, _summary_without_whatsapp(summary), ttl_seconds)
+    if summary.get("meta", {}).get("status") == "completed":
+        if composed:
+            ConsultationSummaryCache.set_parts(consultation_id, stamp, composed)
+        ConsultationSummaryCache.set_summary(cache_key, _summary_without_whatsapp(summary))
     return summary
 
 
@@ -102,12 +122,7 @@ def _resolve_sections(sections: Iterable[str] | None, profile: str) -> set[str]:
 
 
 def _is_cache_enabled() -> bool:
-    return bool(getattr(settings, "ENABLE_CONSULTATION_SUMMARY_CACHE", False))
-
-
-def _summary_cache_key(consultation_id, sections: set[str], profile: str) -> str:
-    sections_key = ",".join(sorted(sections))
-    return f"consultation_summary:{consultation_id}:v1:{profile}:{sections_key}"
+    return summary_cache_enabled()
 
 
 def _get_consultation_with_relations(consultation_id, sections: set[str]) -> Consultation:
@@ -261,21 +276,22 @@ def _get_consultation_with_relations(consultation_id, sections: set[str]) -> Con
 
 
 def _compose_summary(consultation: Consultation, sections: set[str], profile: str) -> dict[str, Any]:
+    parts = {section: _compose_section(consultation, section) for section in sections}
+    parts[BASE_PART] = _compose_base(consultation)
+    return _assemble_summary(parts, sections=sections, profile=profile)
+
+
+def _compose_base(consultation: Consultation) -> dict[str, Any]:
+    """Section-independent parts of the summary (meta without profile / generated_at)."""
     encounter = consultation.encounter
     pre_consultation = getattr(encounter, "pre_consultation", None)
-    now = timezone.now()
-
-    summary = {
+    return {
         "meta": {
             "consultation_id": str(consultation.id),
             "encounter_id": str(encounter.id),
             "status": _normalize_status(encounter_status=encounter.status, consultation=consultation),
             "created_at": _iso_datetime(consultation.created_at),
             "completed_at": _iso_datetime(consultation.ended_at or encounter.consultation_end_time),
-            "version": "v1",
-            "generated_at": _iso_datetime(now),
-            "generated_by": "summary_service",
-            "profile": profile,
         },
         "clinic": _build_clinic(encounter),
         "doctor": _build_doctor(encounter),
@@ -283,16 +299,63 @@ def _compose_summary(consultation: Consultation, sections: set[str], profile: st
         "visit": _build_visit(encounter),
         "prescription": _build_prescription_header(consultation),
         "vitals": _build_vitals(consultation=consultation, pre_consultation=pre_consultation),
-        "symptoms": _build_symptoms(consultation, pre_consultation) if "symptoms" in sections else [],
-        "findings": _build_findings(consultation) if "findings" in sections else [],
-        "diagnoses": _build_diagnoses(consultation) if "diagnoses" in sections else [],
-        "prescriptions": _build_prescriptions(consultation) if "prescriptions" in sections else [],
-        "instructions": _build_instructions(encounter) if "instructions" in sections else [],
-        "investigations": _build_investigations(consultation) if "investigations" in sections else [],
-        "procedures": _build_procedures(consultation) if "procedures" in sections else [],
-        "follow_up": _build_follow_up(consultation) if "follow_up" in sections else {"date": None, "notes": "", "type": ""},
     }
-    return summary
+
+
+def _compose_section(consultation: Consultation, section: str) -> Any:
+    if section == "symptoms":
+        return _build_symptoms(consultation, getattr(consultation.encounter, "pre_consultation", None))
+    if section == "findings":
+        return _build_findings(consultation)
+    if section == "diagnoses":
+        return _build_diagnoses(consultation)
+    if section == "prescriptions":
+        return _build_prescriptions(consultation)
+    if section == "instructions":
+        return _build_instructions(consultation.encounter)
+    if section == "investigations":
+        return _build_investigations(consultation)
+    if section == "procedures":
+        return _build_procedures(consultation)
+    if section == "follow_up":
+        return _build_follow_up(consultation)
+    raise ValueError(f"Unknown summary section: {section}")
+
+
+def _assemble_summary(parts: dict[str, Any], sections: set[str], profile: str) -> dict[str, Any]:
+    base = parts[BASE_PART]
+    meta = base["meta"]
+
+    def section(name: str, empty: Any) -> Any:
+        return parts[name] if name in sections else empty
+
+    return {
+        "meta": {
+            "consultation_id": meta["consultation_id"],
+            "encounter_id": meta["encounter_id"],
+            "status": meta["status"],
+            "created_at": meta["created_at"],
+            "completed_at": meta["completed_at"],
+            "version": "v1",
+            "generated_at": _iso_datetime(timezone.now()),
+            "generated_by": "summary_service",
+            "profile": profile,
+        },
+        "clinic": base["clinic"],
+        "doctor": base["doctor"],
+        "patient": base["patient"],
+        "visit": base["visit"],
+        "prescription": base["prescription"],
+        "vitals": base["vitals"],
+        "symptoms": section("symptoms", []),
+        "findings": section("findings", []),
+        "diagnoses": section("diagnoses", []),
+        "prescriptions": section("prescriptions", []),
+        "instructions": section("instructions", []),
+        "investigations": section("investigations", []),
+        "procedures": section("procedures", []),
+        "follow_up": section("follow_up", {"date": None, "notes": "", "type": ""}),
+    }
 
 
 def _build_prescription_header(consultation: Consultation) -> dict[str, Any]:
@@ -28,10 +28,12 @@ from django.utils import timezone
 from django.db import transaction
 import logging
 
+from consultations_core.models.consultation import Consultation
 from consultations_core.models.encounter import ClinicalEncounter
 from consultations_core.models.encounter import EncounterStatusLog
 from consultations_core.domain.audit import AuditService
 from consultations_core.domain.encounter_status import normalize_encounter_status
+from consultations_core.services.consultation_summary_cache import invalidate_summary_on_commit
 from account.models import User
 
 logger = logging.getLogger(__name__)
@@ -209,6 +211,10 @@ class EncounterStateMachine:
             update_kwargs["cancelled_by_id"] = user.id if user else None
         ClinicalEncounter.objects.filter(pk=encounter.pk).update(**update_kwargs)
         encounter.refresh_from_db()
+        # QuerySet.update() sends no post_save; the summary shows encounter status.
+        invalidate_summary_on_commit(
+            consultation_ids=Consultation.objects.filter(encounter_id=encounter.pk).values_list("id", flat=True)
+        )
 
         # Legacy encounter-specific log
         EncounterStatusLog.objects.create(
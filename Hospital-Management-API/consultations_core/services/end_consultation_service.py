@@ -33,6 +33,7 @@ from consultations_core.models.instruction import (
 )
 from consultations_core.models.follow_up import FollowUp
 from consultations_core.models.prescription import CustomMedicine, Prescription, PrescriptionLine
+from consultations_core.services.consultation_summary_cache import invalidate_summary_on_commit
 from consultations_core.services.procedure_service import persist_procedures
 from consultations_core.models.symptoms import (
     ConsultationSymptom,
@@ -53,7 +54,8 @@ from consultations_core.services.investigation_api_service import (
     get_or_create_investigations_container,
 )
 from diagnostics_engine.models import DiagnosticPackage, DiagnosticServiceMaster
-from medicines.models import DoseUnitMaster, DrugMaster, FrequencyMaster, RouteMaster
+from medicines.models import FrequencyMaster
+from medicines.services.master_lookup import fetch_active_drugs, get_master_lookup, on_master_saved
 
 logger = logging.getLogger(__name__)
 
@@ -136,52 +138,31 @@ def _as_uuid_or_none(raw_value):
         return None
 
 
-def _resolve_dose_unit(raw_value):
+def _resolve_dose_unit(raw_value, masters):
     if raw_value in (None, ""):
         _medicine_validation_error("Medicine dose_unit_id is required.")
     token = str(raw_value).strip()
-    token_uuid = _as_uuid_or_none(token)
-    if token_uuid:
-        unit = DoseUnitMaster.objects.filter(id=token_uuid, is_active=True).first()
-        if unit:
-            return unit
-    unit = DoseUnitMaster.objects.filter(name__iexact=token, is_active=True).first()
+    unit = masters.dose_unit(token)
     if unit:
         return unit
     _medicine_validation_error(f"Invalid dose unit '{token}'.")
 
 
-def _resolve_route(raw_value):
+def _resolve_route(raw_value, masters):
     if raw_value in (None, ""):
         _medicine_validation_error("Medicine route_id is required.")
     token = str(raw_value).strip()
-    token_uuid = _as_uuid_or_none(token)
-    if token_uuid:
-        route = RouteMaster.objects.filter(id=token_uuid, is_active=True).first()
-        if route:
-            return route
-    route = RouteMaster.objects.filter(code__iexact=token, is_active=True).first()
-    if route:
-        return route
-    route = RouteMaster.objects.filter(name__iexact=token, is_active=True).first()
+    route = masters.route(token)
     if route:
         return route
     _medicine_validation_error(f"Invalid route '{token}'.")
 
 
-def _resolve_frequency(raw_value):
+def _resolve_frequency(raw_value, masters):
     if raw_value in (None, ""):
         _medicine_validation_error("Medicine frequency_id is required.")
     token = str(raw_value).strip()
-    token_uuid = _as_uuid_or_none(token)
-    if token_uuid:
-        frequency = FrequencyMaster.objects.filter(id=token_uuid, is_active=True).first()
-        if frequency:
-            return frequency
-    frequency = FrequencyMaster.objects.filter(code__iexact=token, is_active=True).first()
-    if frequency:
-        return frequency
-    frequency = FrequencyMaster.objects.filter(display_name__iexact=token, is_active=True).first()
+    frequency = masters.frequency(token)
     if frequency:
         return frequency
     # Fallback for environments where frequency masters were not seeded yet.
@@ -216,6 +197,9 @@ def _resolve_frequency(raw_value):
         )
     except IntegrityError:
         pass
+    else:
+        # bulk_create skips post_save; invalidate the master lookup tables explicitly.
+        transaction.on_commit(on_master_saved)
     frequency = FrequencyMaster.objects.filter(code__iexact=normalized).first()
     if frequency:
         return frequency
@@ -913,16 +897,19 @@ def _persist_investigations(consultation, user, raw_investigations):
             _investigations_validation_error(str(e))
 
 
+def _is_custom_medicine(item, med):
+    return bool(
+        med.get("is_custom")
+        or item.get("isCustom")
+        or item.get("is_custom")
+    )
+
+
 def _persist_medicines(consultation, user, raw_medicines):
     if not isinstance(raw_medicines, list) or not raw_medicines:
         return
 
-    prescription = Prescription.objects.create(
-        consultation=consultation,
-        created_by=user,
-    )
-    created_any_line = False
-
+    entries = []
     for item in raw_medicines:
         if not isinstance(item, dict):
             continue
@@ -931,6 +918,24 @@ def _persist_medicines(consultation, user, raw_medicines):
             med = item.get("medicine", item)
         if not isinstance(med, dict):
             continue
+        entries.append((item, med))
+
+    # Resolve every referenced drug in one query and the dose unit / route / frequency
+    # masters from the process-local lookup tables, instead of per-line ORM lookups.
+    drugs = fetch_active_drugs(
+        med.get("drug_id")
+        for item, med in entries
+        if med.get("drug_id") and not _is_custom_medicine(item, med)
+    )
+    masters = get_master_lookup().resolver()
+
+    prescription = Prescription.objects.create(
+        consultation=consultation,
+        created_by=user,
+    )
+    lines = []
+
+    for item, med in entries:
         _validate_medicine(item, med)
 
         dose_value = med.get("dose_value")
@@ -945,18 +950,9 @@ def _persist_medicines(consultation, user, raw_medicines):
 
         drug = None
         custom_medicine = None
-        is_custom_medicine = bool(
-            med.get("is_custom")
-            or item.get("isCustom")
-            or item.get("is_custom")
-        )
         drug_id = med.get("drug_id")
-        if drug_id and not is_custom_medicine:
-            token_uuid = _as_uuid_or_none(drug_id)
-            if token_uuid:
-                drug = DrugMaster.objects.filter(id=token_uuid, is_active=True).first()
-            else:
-                drug = DrugMaster.objects.filter(code__iexact=str(drug_id).strip(), is_active=True).first()
+        if drug_id and not _is_custom_medicine(item, med):
+            drug = drugs.get(str(drug_id).strip())
             if drug is None:
                 _medicine_validation_error(f"Invalid medicine drug_id '{drug_id}'.")
         else:
@@ -982,19 +978,20 @@ def _persist_medicines(consultation, user, raw_medicines):
             drug=drug,
             custom_medicine=custom_medicine,
             dose_value=dose_value,
-            dose_unit=_resolve_dose_unit(med.get("dose_unit_id")),
-            route=_resolve_route(med.get("route_id")),
-            frequency=_resolve_frequency(med.get("frequency_id")),
+            dose_unit=_resolve_dose_unit(med.get("dose_unit_id"), masters),
+            route=_resolve_route(med.get("route_id"), masters),
+            frequency=_resolve_frequency(med.get("frequency_id"), masters),
             duration_value=duration_value,
             duration_unit=duration_unit,
             instructions=med.get("instructions") or None,
             is_prn=bool(med.get("is_prn", False)),
             is_stat=bool(med.get("is_stat", False)),
         )
-        line.save()
-        created_any_line = True
+        lines.append(line)
 
-    if created_any_line:
+    if lines:
+        PrescriptionLine.bulk_create_lines(prescription, lines)
+        invalidate_summary_on_commit(consultation_id=prescription.consultation_id)
         schedule_prescription_created(
             consultation=consultation,
             user=user,
@@ -1269,6 +1266,8 @@ def _persist_findings(consultation, user, raw_findings):
         consultation=consultation, is_active=True
     ).exclude(pk__in=keeper_ids)
     stale_n = stale_qs.update(is_active=False, updated_at=timezone.now())
+    if stale_n:
+        invalidate_summary_on_commit(consultation_id=consultation.id)
     if stale_n:
         logger.info(
             "EndConsultation findings: deactivated %s stale row(s) consultation=%s",
@@ -1474,7 +1473,8 @@ def _persist_diagnoses(consultation, user, raw_diagnoses):
     stale_qs = ConsultationDiagnosis.objects.filter(
         consultation=consultation, is_active=True
     ).exclude(pk__in=keeper_ids)
-    stale_qs.update(is_active=False, updated_at=timezone.now())
+    if stale_qs.update(is_active=False, updated_at=timezone.now()):
+        invalidate_summary_on_commit(consultation_id=consultation.id)
 
 
 def _persist_template_instruction_rows(encounter, user, raw_list):
@@ -1596,6 +1596,7 @@ def _persist_encounter_instructions(consultation, user, raw_instructions):
         is_active=False,
         updated_at=timezone.now(),
     )
+    invalidate_summary_on_commit(consultation_id=consultation.id)
 
     if raw_instructions is None:
         return
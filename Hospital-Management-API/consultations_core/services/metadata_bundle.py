@@ -0,0 +1,226 @@
+"""
+Precompiled, content-hashed bundle of the templates_metadata JSON tree.
+
+The whole tree is parsed once per process into an immutable MetadataBundle.
+Readers take a plain reference to the current bundle (no lock, no stat);
+a reload builds a new bundle and swaps the reference, so in-flight readers
+keep a consistent snapshot.
+
+Loading happens in ConsultationsCoreConfig.ready(), so with a preloading
+server (gunicorn --preload) workers inherit the parsed bundle across fork.
+`python manage.py build_metadata_bundle` writes the bundle to one file
+(CONSULTATION_METADATA_BUNDLE_PATH) so workers skip walking and parsing
+the source tree.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+import time
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Optional
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+BUNDLE_FORMAT = 1
+VERSION_FILE = "_version.json"
+DEFAULT_RELOAD_INTERVAL_SECONDS = 30
+
+SOURCE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(__file__)),
+    "templates_metadata",
+)
+
+
+@dataclass(frozen=True)
+class MetadataBundle:
+    """
+    Parsed metadata files keyed by path relative to templates_metadata/.
+    Values are shared by every request: treat them as read-only.
+    """
+
+    version: Optional[int]
+    content_hash: str
+    files: Mapping[str, Any]
+
+    def get(self, relative_path: str) -> Any:
+        try:
+            return self.files[relative_path]
+        except KeyError:
+            raise FileNotFoundError(f"Metadata file not in bundle: {relative_path}") from None
+
+    def etag(self, *parts: str) -> str:
+        """Strong ETag for a response derived from this bundle and `parts`."""
+        key = "|".join((self.content_hash, *(str(p) for p in parts)))
+        return '"%s"' % hashlib.sha256(key.encode("utf-8")).hexdigest()[:32]
+
+
+def _is_source_file(name: str) -> bool:
+    return name.endswith(".json") and not name.startswith(".")
+
+
+def compile_bundle(source_path: str = SOURCE_PATH) -> MetadataBundle:
+    """Parse every *.json under source_path into a MetadataBundle."""
+    digest = hashlib.sha256()
+    files: Dict[str, Any] = {}
+    for root, dirs, names in os.walk(source_path):
+        dirs[:] = sorted(d for d in dirs if not d.startswith("."))
+        for name in sorted(n for n in names if _is_source_file(n)):
+            full_path = os.path.join(root, name)
+            relative_path = os.path.relpath(full_path, source_path).replace(os.sep, "/")
+            with open(full_path, "rb") as f:
+                raw = f.read()
+            files[relative_path] = json.loads(raw)
+            digest.update(relative_path.encode("utf-8") + b"\0" + raw + b"\0")
+
+    version = None
+    version_info = files.get(VERSION_FILE)
+    if isinstance(version_info, dict):
+        version = version_info.get("metadata_version")
+    return MetadataBundle(
+        version=version,
+        content_hash=digest.hexdigest(),
+        files=MappingProxyType(files),
+    )
+
+
+def write_bundle(bundle: MetadataBundle, path: str) -> None:
+    """Write bundle to path atomically (readers never see a partial file)."""
+    payload = {
+        "format": BUNDLE_FORMAT,
+        "version": bundle.version,
+        "content_hash": bundle.content_hash,
+        "files": dict(bundle.files),
+    }
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(payload, f, ensure_ascii=False, separators=(",", ":"))
+    os.replace(tmp_path, path)
+
+
+def read_bundle(path: str) -> MetadataBundle:
+    with open(path, "r", encoding="utf-8") as f:
+        payload = json.load(f)
+    if payload.get("format") != BUNDLE_FORMAT:
+        raise ValueError(f"Unsupported metadata bundle format in {path}: {payload.get('format')!r}")
+    return MetadataBundle(
+        version=payload.get("version"),
+        content_hash=payload["content_hash"],
+        files=MappingProxyType(payload["files"]),
+    )
+
+
+class MetadataBundleStore:
+    """
+    Process-wide holder of the current MetadataBundle.
+
+    current() is lock-free. The lock only serialises loads. When
+    CONSULTATION_METADATA_RELOAD_INTERVAL_SECONDS is positive, at most one
+    reader per interval stats the version source (the bundle file, or
+    _version.json) and reloads when it changed.
+    """
+
+    _bundle: Optional[MetadataBundle] = None
+    _load_lock = threading.Lock()
+    _source_stamp: Optional[int] = None
+    _next_check_at = 0.0
+
+    @classmethod
+    def current(cls) -> MetadataBundle:
+        bundle = cls._bundle
+        if bundle is None:
+            return cls._load_initial()
+        interval = cls._reload_interval()
+        if interval > 0 and time.monotonic() >= cls._next_check_at:
+            cls._check_for_update(interval)
+            bundle = cls._bundle
+        return bundle
+
+    @classmethod
+    def get(cls, relative_path: str) -> Any:
+        return cls.current().get(relative_path)
+
+    @classmethod
+    def preload(cls) -> None:
+        """Load the bundle up front (worker start) instead of on first request."""
+        if cls._bundle is None:
+            cls._load_initial()
+
+    @classmethod
+    def reload(cls) -> bool:
+        """
+        Rebuild the bundle from its source and swap it in.
+        Returns True when the content changed.
+        """
+        with cls._load_lock:
+            return cls._swap(cls._build())
+
+    @classmethod
+    def _load_initial(cls) -> MetadataBundle:
+        with cls._load_lock:
+            if cls._bundle is None:
+                cls._swap(cls._build())
+            return cls._bundle
+
+    @classmethod
+    def _check_for_update(cls, interval: float) -> None:
+        if not cls._load_lock.acquire(blocking=False):
+            return  # another thread is checking; keep serving the current bundle
+        try:
+            cls._next_check_at = time.monotonic() + interval
+            if cls._read_source_stamp() == cls._source_stamp:
+                return
+            bundle = cls._build()
+            if bundle.version != cls._bundle.version or bundle.content_hash != cls._bundle.content_hash:
+                logger.info(
+                    "Reloading consultation metadata bundle: version %s -> %s",
+                    cls._bundle.version,
+                    bundle.version,
+                )
+            cls._swap(bundle)
+        except Exception:
+            logger.exception("Consultation metadata reload failed; keeping current bundle")
+        finally:
+            cls._load_lock.release()
+
+    @classmethod
+    def _swap(cls, bundle: MetadataBundle) -> bool:
+        # Caller holds _load_lock.
+        changed = cls._bundle is None or cls._bundle.content_hash != bundle.content_hash
+        cls._source_stamp = cls._read_source_stamp()
+        if changed:
+            cls._bundle = bundle
+        return changed
+
+    @classmethod
+    def _build(cls) -> MetadataBundle:
+        bundle_path = cls._bundle_path()
+        if bundle_path:
+            return read_bundle(bundle_path)
+        return compile_bundle(SOURCE_PATH)
+
+    @classmethod
+    def _read_source_stamp(cls) -> Optional[int]:
+        path = cls._bundle_path() or os.path.join(SOURCE_PATH, VERSION_FILE)
+        try:
+            return os.stat(path).st_mtime_ns
+        except OSError:
+            return None
+
+    @staticmethod
+    def _bundle_path() -> str:
+        return getattr(settings, "CONSULTATION_METADATA_BUNDLE_PATH", "") or ""
+
+    @staticmethod
+    def _reload_interval() -> float:
+        return float(
+            getattr(
+                settings,
+                "CONSULTATION_METADATA_RELOAD_INTERVAL_SECONDS",
+                DEFAULT_RELOAD_INTERVAL_SECONDS,
+            )
+        )
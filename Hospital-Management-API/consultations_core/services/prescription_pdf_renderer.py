@@ -0,0 +1,243 @@
+"""
+Prescription PDF rendering off the web workers.
+
+HTML is rendered from build_consultation_summary(profile="preview_pdf") by
+the caller; the PDF is keyed by a hash of that HTML (plus base_url), so
+identical summaries share one render. With PRESCRIPTION_PDF_ASYNC_ENABLED,
+renders run as a Celery task on PRESCRIPTION_PDF_QUEUE and the bytes and a
+render status are kept in the shared cache; the API returns a render id
+instead of waiting when the client opts in (?async=1 / Prefer: respond-async),
+and background callers wait on the queued render (render_pdf_via_queue).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Dict, Optional
+
+from django.conf import settings
+from django.core.cache import cache
+from django.template.loader import render_to_string
+
+logger = logging.getLogger(__name__)
+
+PRESCRIPTION_TEMPLATE = "prescriptions/prescription.html"
+PDF_CACHE_PREFIX = "rx_pdf:v1"
+DEFAULT_CACHE_TTL_SECONDS = 60 * 60
+# A pending status outlives a crashed worker by at most this long.
+PENDING_TIMEOUT_SECONDS = 5 * 60
+DEFAULT_QUEUE_WAIT_SECONDS = 120
+QUEUE_POLL_INTERVAL_SECONDS = 0.5
+
+_WARM_UP_HTML = '<html><body><p style="font-family: Arial, sans-serif">.</p></body></html>'
+
+
+class PdfRenderStatus:
+    PENDING = "pending"
+    READY = "ready"
+    FAILED = "failed"
+
+
+@dataclass(frozen=True)
+class PdfRender:
+    render_id: str
+    status: str
+    pdf: Optional[bytes] = None
+    error: Optional[str] = None
+
+
+def async_pdf_rendering_enabled() -> bool:
+    return bool(getattr(settings, "PRESCRIPTION_PDF_ASYNC_ENABLED", False))
+
+
+def render_prescription_html(summary: Dict[str, Any]) -> str:
+    return render_to_string(PRESCRIPTION_TEMPLATE, summary).strip()
+
+
+def pdf_render_id(html: str, base_url: str) -> str:
+    digest = hashlib.sha256()
+    digest.update(base_url.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(html.encode("utf-8"))
+    return digest.hexdigest()
+
+
+class PrescriptionPdfRenderer:
+    """
+    Process-local WeasyPrint state. The FontConfiguration (and the fontconfig /
+    Pango setup behind the first render) is reused by every render in the
+    process; PDF workers call warm() at start so the first request does not
+    pay for it.
+    """
+
+    _font_config = None
+
+    @classmethod
+    def render(cls, html: str, base_url: str = "/") -> bytes:
+        from weasyprint import HTML
+
+        return HTML(string=html, base_url=base_url).write_pdf(font_config=cls._fonts())
+
+    @classmethod
+    def warm(cls) -> None:
+        cls.render(_WARM_UP_HTML)
+
+    @classmethod
+    def _fonts(cls):
+        if cls._font_config is None:
+            from weasyprint.text.fonts import FontConfiguration
+
+            cls._font_config = FontConfiguration()
+        return cls._font_config
+
+
+class PrescriptionPdfCache:
+    @staticmethod
+    def _pdf_key(render_id: str) -> str:
+        return f"{PDF_CACHE_PREFIX}:pdf:{render_id}"
+
+    @staticmethod
+    def _status_key(render_id: str) -> str:
+        return f"{PDF_CACHE_PREFIX}:status:{render_id}"
+
+    @staticmethod
+    def _owner_key(render_id: str, consultation_id) -> str:
+        return f"{PDF_CACHE_PREFIX}:owner:{render_id}:{consultation_id}"
+
+    @staticmethod
+    def _ttl() -> int:
+        return int(getattr(settings, "PRESCRIPTION_PDF_CACHE_TTL_SECONDS", DEFAULT_CACHE_TTL_SECONDS))
+
+    @classmethod
+    def get_pdf(cls, render_id: str) -> Optional[bytes]:
+        return cache.get(cls._pdf_key(render_id))
+
+    @classmethod
+    def set_pdf(cls, render_id: str, pdf: bytes) -> None:
+        cache.set(cls._pdf_key(render_id), pdf, cls._ttl())
+        cache.set(cls._status_key(render_id), {"status": PdfRenderStatus.READY}, cls._ttl())
+
+    @classmethod
+    def get_status(cls, render_id: str) -> Optional[Dict[str, Any]]:
+        return cache.get(cls._status_key(render_id))
+
+    @classmethod
+    def claim(cls, render_id: str) -> bool:
+        """Mark a render pending; False when another request already did."""
+        return cache.add(
+            cls._status_key(render_id),
+            {"status": PdfRenderStatus.PENDING},
+            PENDING_TIMEOUT_SECONDS,
+        )
+
+    @classmethod
+    def mark_failed(cls, render_id: str, error: str) -> None:
+        cache.set(
+            cls._status_key(render_id),
+            {"status": PdfRenderStatus.FAILED, "error": error},
+            PENDING_TIMEOUT_SECONDS,
+        )
+
+    @classmethod
+    def release(cls, render_id: str) -> None:
+        cache.delete(cls._status_key(render_id))
+
+    @classmethod
+    def bind(cls, render_id: str, consultation_id) -> None:
+        """Record that render_id was requested for this consultation."""
+        cache.set(cls._owner_key(render_id, consultation_id), True, cls._ttl())
+
+    @classmethod
+    def is_bound(cls, render_id: str, consultation_id) -> bool:
+        return bool(cache.get(cls._owner_key(render_id, consultation_id)))
+
+
+def render_pdf(html: str, base_url: str = "/") -> bytes:
+    """
+    Render synchronously. When async rendering is enabled the output cache is
+    shared with queued renders, so a PDF already produced there is reused.
+    """
+    if not async_pdf_rendering_enabled():
+        return PrescriptionPdfRenderer.render(html, base_url)
+    render_id = pdf_render_id(html, base_url)
+    pdf = PrescriptionPdfCache.get_pdf(render_id)
+    if pdf is None:
+        pdf = PrescriptionPdfRenderer.render(html, base_url)
+        PrescriptionPdfCache.set_pdf(render_id, pdf)
+    return pdf
+
+
+def request_pdf_render(html: str, base_url: str = "/", *, consultation_id=None) -> PdfRender:
+    """
+    Return the cached PDF, or enqueue a render (once) and report its status.
+    With consultation_id the render is bound to it, so its status can only be
+    polled through that consultation.
+    """
+    from consultations_core.tasks import render_prescription_pdf
+
+    render_id = pdf_render_id(html, base_url)
+    if consultation_id is not None:
+        PrescriptionPdfCache.bind(render_id, consultation_id)
+    pdf = PrescriptionPdfCache.get_pdf(render_id)
+    if pdf is not None:
+        return PdfRender(render_id=render_id, status=PdfRenderStatus.READY, pdf=pdf)
+
+    state = PrescriptionPdfCache.get_status(render_id) or {}
+    if state.get("status") in (PdfRenderStatus.FAILED, PdfRenderStatus.READY):
+        # Retry failures; READY without bytes means the PDF expired first.
+        PrescriptionPdfCache.release(render_id)
+    if PrescriptionPdfCache.claim(render_id):
+        try:
+            render_prescription_pdf.delay(render_id, html, base_url)
+        except Exception:
+            PrescriptionPdfCache.release(render_id)
+            raise
+    return get_pdf_render(render_id) or PdfRender(render_id=render_id, status=PdfRenderStatus.PENDING)
+
+
+def render_pdf_via_queue(html: str, base_url: str = "/", *, timeout: Optional[float] = None) -> bytes:
+    """
+    Render on PRESCRIPTION_PDF_QUEUE and wait for the bytes, for callers that
+    already run in the background (WhatsApp preparation). Raises on failure
+    or after PRESCRIPTION_PDF_QUEUE_WAIT_SECONDS.
+    """
+    if timeout is None:
+        timeout = float(getattr(settings, "PRESCRIPTION_PDF_QUEUE_WAIT_SECONDS", DEFAULT_QUEUE_WAIT_SECONDS))
+    deadline = time.monotonic() + timeout
+    render = request_pdf_render(html, base_url)
+    while render.pdf is None:
+        if render.status == PdfRenderStatus.FAILED:
+            raise RuntimeError(f"Queued PDF render {render.render_id} failed: {render.error}")
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"Queued PDF render {render.render_id} not ready after {timeout}s")
+        time.sleep(QUEUE_POLL_INTERVAL_SECONDS)
+        render = get_pdf_render(render.render_id) or request_pdf_render(html, base_url)
+    return render.pdf
+
+
+def get_pdf_render(render_id: str) -> Optional[PdfRender]:
+    """Current state of a render, or None when unknown / expired."""
+    pdf = PrescriptionPdfCache.get_pdf(render_id)
+    if pdf is not None:
+        return PdfRender(render_id=render_id, status=PdfRenderStatus.READY, pdf=pdf)
+    state = PrescriptionPdfCache.get_status(render_id)
+    if not state or state.get("status") == PdfRenderStatus.READY:
+        return None
+    return PdfRender(render_id=render_id, status=state["status"], error=state.get("error"))
+
+
+def run_pdf_render(render_id: str, html: str, base_url: str = "/") -> bool:
+    """Task body: render and publish the PDF. Returns False on failure (never raises)."""
+    if PrescriptionPdfCache.get_pdf(render_id) is not None:
+        return True
+    try:
+        pdf = PrescriptionPdfRenderer.render(html, base_url)
+    except Exception as exc:
+        logger.exception("prescription_pdf_render_failed render_id=%s", render_id)
+        PrescriptionPdfCache.mark_failed(render_id, str(exc))
+        return False
+    PrescriptionPdfCache.set_pdf(render_id, pdf)
+    return True
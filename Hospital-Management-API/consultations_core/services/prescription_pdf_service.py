@@ -3,12 +3,16 @@
 from __future__ import annotations
 
 import logging
-from io import BytesIO
 
 from django.core.files.base import ContentFile
-from django.template.loader import render_to_string
 
 from consultations_core.services.consultation_summary_service import build_consultation_summary
+from consultations_core.services.prescription_pdf_renderer import (
+    async_pdf_rendering_enabled,
+    render_pdf,
+    render_pdf_via_queue,
+    render_prescription_html,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -16,6 +20,8 @@ logger = logging.getLogger(__name__)
 def generate_and_persist_prescription_pdf(*, prescription, base_url: str = "/") -> bool:
     """
     Render WeasyPrint PDF for the prescription consultation and save to pdf_file.
+    Reuses a PDF already rendered for the same summary (see prescription_pdf_renderer);
+    with PRESCRIPTION_PDF_ASYNC_ENABLED the render runs on the PDF queue.
     Returns True on success; False on failure (never raises).
     """
     consultation_id = prescription.consultation_id
@@ -28,10 +34,11 @@ def generate_and_persist_prescription_pdf(*, prescription, base_url: str = "/")
             logger.warning("prescription_pdf_empty_summary prescription_id=%s", prescription.id)
             return False
 
-        html = render_to_string("prescriptions/prescription.html", summary).strip()
-        from weasyprint import HTML
-
-        pdf_binary = HTML(string=html, base_url=base_url).write_pdf()
+        html = render_prescription_html(summary)
+        if async_pdf_rendering_enabled():
+            pdf_binary = render_pdf_via_queue(html, base_url)
+        else:
+            pdf_binary = render_pdf(html, base_url)
         filename = f"prescription-{prescription.id}.pdf"
         # Finalized prescriptions are immutable — persist PDF without re-running save() validation.
         prescription.pdf_file.save(filename, ContentFile(pdf_binary), save=False)
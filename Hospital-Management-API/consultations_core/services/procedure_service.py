@@ -1,6 +1,7 @@
 """Persist consultation procedures (free-text, idempotent replace-set)."""
 
 from consultations_core.models.procedure import Procedure
+from consultations_core.services.consultation_summary_cache import invalidate_summary_on_commit
 
 
 def persist_procedures(consultation, procedures_text, user):
@@ -10,6 +11,7 @@ def persist_procedures(consultation, procedures_text, user):
     procedures_text: stripped non-empty string to persist, or None/"" to leave none.
     """
     Procedure.objects.filter(consultation=consultation).delete()
+    invalidate_summary_on_commit(consultation_id=consultation.id)
     text = (procedures_text or "").strip()
     if not text:
         return
@@ -0,0 +1,91 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from consultations_core.models.consultation import Consultation
+from consultations_core.models.diagnosis import ConsultationDiagnosis
+from consultations_core.models.encounter import ClinicalEncounter
+from consultations_core.models.findings import ConsultationFinding
+from consultations_core.models.follow_up import FollowUp
+from consultations_core.models.instruction import EncounterInstruction
+from consultations_core.models.investigation import ConsultationInvestigations, InvestigationItem
+from consultations_core.models.pre_consultation import (
+    PreConsultation,
+    PreConsultationChiefComplaint,
+    PreConsultationVitals,
+)
+from consultations_core.models.prescription import Prescription, PrescriptionLine
+from consultations_core.models.procedure import Procedure
+from consultations_core.models.symptoms import ConsultationSymptom, SymptomExtensionData
+from consultations_core.services.consultation_summary_cache import invalidate_summary_on_commit
+
+# Writes to anything build_consultation_summary reads replace the consultation's
+# summary stamp. QuerySet.update()/bulk_create() send no signals, so those paths
+# call invalidate_summary_on_commit() themselves: the encounter state machine and,
+# in end_consultation_service, prescription lines, stale findings / diagnoses and
+# replaced encounter instructions. Procedure replace-set deletes do too.
+
+
+def _consultation_ids(**filters):
+    return Consultation.objects.filter(**filters).values_list("id", flat=True)
+
+
+@receiver(post_save, sender=Consultation)
+@receiver(post_delete, sender=Consultation)
+def invalidate_summary_on_consultation_change(sender, instance, **kwargs):
+    invalidate_summary_on_commit(consultation_id=instance.pk)
+
+
+@receiver(post_save, sender=ConsultationSymptom)
+@receiver(post_delete, sender=ConsultationSymptom)
+@receiver(post_save, sender=ConsultationFinding)
+@receiver(post_delete, sender=ConsultationFinding)
+@receiver(post_save, sender=ConsultationDiagnosis)
+@receiver(post_delete, sender=ConsultationDiagnosis)
+@receiver(post_save, sender=Prescription)
+@receiver(post_delete, sender=Prescription)
+@receiver(post_save, sender=ConsultationInvestigations)
+@receiver(post_delete, sender=ConsultationInvestigations)
+@receiver(post_save, sender=Procedure)
+@receiver(post_delete, sender=Procedure)
+@receiver(post_save, sender=FollowUp)
+@receiver(post_delete, sender=FollowUp)
+def invalidate_summary_on_section_change(sender, instance, **kwargs):
+    invalidate_summary_on_commit(consultation_id=instance.consultation_id)
+
+
+@receiver(post_save, sender=PrescriptionLine)
+@receiver(post_delete, sender=PrescriptionLine)
+def invalidate_summary_on_prescription_line_change(sender, instance, **kwargs):
+    invalidate_summary_on_commit(consultation_ids=_consultation_ids(prescriptions__id=instance.prescription_id))
+
+
+@receiver(post_save, sender=InvestigationItem)
+@receiver(post_delete, sender=InvestigationItem)
+def invalidate_summary_on_investigation_item_change(sender, instance, **kwargs):
+    invalidate_summary_on_commit(consultation_ids=_consultation_ids(investigations__id=instance.investigations_id))
+
+
+@receiver(post_save, sender=SymptomExtensionData)
+@receiver(post_delete, sender=SymptomExtensionData)
+def invalidate_summary_on_symptom_extension_change(sender, instance, **kwargs):
+    invalidate_summary_on_commit(consultation_ids=_consultation_ids(symptoms__id=instance.symptom_entry_id))
+
+
+@receiver(post_save, sender=ClinicalEncounter)
+def invalidate_summary_on_encounter_change(sender, instance, **kwargs):
+    invalidate_summary_on_commit(consultation_ids=_consultation_ids(encounter_id=instance.pk))
+
+
+@receiver(post_save, sender=EncounterInstruction)
+@receiver(post_delete, sender=EncounterInstruction)
+@receiver(post_save, sender=PreConsultation)
+def invalidate_summary_on_encounter_section_change(sender, instance, **kwargs):
+    invalidate_summary_on_commit(consultation_ids=_consultation_ids(encounter_id=instance.encounter_id))
+
+
+@receiver(post_save, sender=PreConsultationVitals)
+@receiver(post_save, sender=PreConsultationChiefComplaint)
+def invalidate_summary_on_preconsultation_section_change(sender, instance, **kwargs):
+    invalidate_summary_on_commit(
+        consultation_ids=_consultation_ids(encounter__pre_consultation__id=instance.pre_consultation_id)
+    )
@@ -0,0 +1,32 @@
+"""Celery tasks for consultations_core."""
+
+from __future__ import annotations
+
+import logging
+
+from celery import shared_task
+from celery.signals import worker_process_init
+from django.conf import settings
+
+from consultations_core.services.prescription_pdf_renderer import (
+    PrescriptionPdfRenderer,
+    run_pdf_render,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@shared_task(name="consultations_core.render_prescription_pdf", acks_late=True)
+def render_prescription_pdf(render_id: str, html: str, base_url: str = "/") -> bool:
+    """Render one prescription PDF into the shared cache (routed to PRESCRIPTION_PDF_QUEUE)."""
+    return run_pdf_render(render_id, html, base_url)
+
+
+@worker_process_init.connect(weak=False)
+def _warm_pdf_renderer(**kwargs) -> None:
+    if not getattr(settings, "PRESCRIPTION_PDF_WARM_WORKERS", False):
+        return
+    try:
+        PrescriptionPdfRenderer.warm()
+    except Exception:
+        logger.exception("prescription_pdf_warm_up_failed")
@@ -4,6 +4,7 @@ from unittest.mock import patch
 
 from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Group
+from django.core.cache import cache
 from django.db import connection
 from django.test import TestCase, override_settings
 from django.test.utils import CaptureQueriesContext
@@ -412,7 +413,7 @@ class ConsultationSummaryAPITests(TestCase):
 
     @override_settings(ENABLE_CONSULTATION_SUMMARY_CACHE=True)
     def test_cache_not_set_for_in_progress_consultation(self):
-        with patch("consultations_core.services.consultation_summary_service.cache.set") as cache_set:
+        with patch("consultations_core.services.consultation_summary_cache.cache.set") as cache_set:
             build_consultation_summary(self.consultation.id, profile="full")
         cache_set.assert_not_called()
 
@@ -422,7 +423,47 @@ class ConsultationSummaryAPITests(TestCase):
             is_finalized=True,
             ended_at=datetime.datetime.now(datetime.timezone.utc),
         )
-        with patch("consultations_core.services.consultation_summary_service.cache.set") as cache_set:
+        cache_path = "consultations_core.services.consultation_summary_cache.ConsultationSummaryCache"
+        with patch(f"{cache_path}.set_summary") as set_summary, patch(f"{cache_path}.set_parts") as set_parts:
             payload = build_consultation_summary(self.consultation.id, profile="full")
         self.assertEqual(payload["meta"]["status"], "completed")
-        cache_set.assert_called_once()
+        set_summary.assert_called_once()
+        self.assertEqual(set_summary.call_args.args[1]["meta"]["status"], "completed")
+        set_parts.assert_called_once()
+
+    def _finalize_consultation(self):
+        Consultation.objects.filter(pk=self.consultation.pk).update(
+            is_finalized=True,
+            ended_at=datetime.datetime.now(datetime.timezone.utc),
+        )
+        cache.clear()
+
+    @override_settings(ENABLE_CONSULTATION_SUMMARY_CACHE=True)
+    def test_cached_sections_are_reused_by_other_profiles(self):
+        self._seed_clinical_data()
+        self._finalize_consultation()
+        full = build_consultation_summary(self.consultation.id, profile="full")
+
+        line_table = PrescriptionLine._meta.db_table
+        with CaptureQueriesContext(connection) as ctx:
+            lite = build_consultation_summary(self.consultation.id, profile="preview_pdf")
+
+        self.assertFalse([q for q in ctx.captured_queries if line_table in q["sql"]])
+        self.assertEqual(lite["meta"]["profile"], "preview_pdf")
+        self.assertEqual(lite["prescriptions"], full["prescriptions"])
+        self.assertEqual(lite["symptoms"], [])
+
+    @override_settings(ENABLE_CONSULTATION_SUMMARY_CACHE=True)
+    def test_write_to_consultation_graph_invalidates_cached_summary(self):
+        self._seed_clinical_data()
+        self._finalize_consultation()
+        first = build_consultation_summary(self.consultation.id, profile="full")
+        self.assertEqual(first["follow_up"]["notes"], "Routine review")
+
+        follow_up = FollowUp.objects.get(consultation=self.consultation)
+        follow_up.condition_note = "Review with reports"
+        with self.captureOnCommitCallbacks(execute=True):
+            follow_up.save()
+
+        second = build_consultation_summary(self.consultation.id, profile="full")
+        self.assertEqual(second["follow_up"]["notes"], "Review with reports")
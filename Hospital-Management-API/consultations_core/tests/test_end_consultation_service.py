@@ -146,12 +146,12 @@ class EndConsultationMedicinesPersistenceTests(SimpleTestCase):
     @patch("consultations_core.services.end_consultation_service._resolve_frequency")
     @patch("consultations_core.services.end_consultation_service._resolve_route")
     @patch("consultations_core.services.end_consultation_service._resolve_dose_unit")
-    @patch("consultations_core.services.end_consultation_service.DrugMaster")
+    @patch("consultations_core.services.end_consultation_service.fetch_active_drugs")
     @patch("consultations_core.services.end_consultation_service.Prescription")
     def test_persist_medicines_creates_and_finalizes_prescription(
         self,
         prescription_cls,
-        drug_master_cls,
+        fetch_active_drugs,
         resolve_dose_unit,
         resolve_route,
         resolve_frequency,
@@ -161,7 +161,7 @@ class EndConsultationMedicinesPersistenceTests(SimpleTestCase):
         user = SimpleNamespace()
         prescription = MagicMock()
         prescription_cls.objects.create.return_value = prescription
-        drug_master_cls.objects.filter.return_value.first.return_value = MagicMock()
+        fetch_active_drugs.return_value = {"173c9601-6b0b-4513-b7e0-bb6b00d07e03": MagicMock()}
 
         line_obj = MagicMock()
         prescription_line_cls.return_value = line_obj
@@ -194,7 +194,8 @@ class EndConsultationMedicinesPersistenceTests(SimpleTestCase):
             consultation=consultation,
             created_by=user,
         )
-        self.assertTrue(line_obj.save.called)
+        prescription_line_cls.bulk_create_lines.assert_called_once_with(prescription, [line_obj])
+        line_obj.save.assert_not_called()
         self.assertTrue(prescription.finalize.called)
         prescription.delete.assert_not_called()
 
@@ -203,13 +204,13 @@ class EndConsultationMedicinesPersistenceTests(SimpleTestCase):
         _persist_medicines(consultation=SimpleNamespace(), user=SimpleNamespace(), raw_medicines=[])
         prescription_cls.objects.create.assert_not_called()
 
-    @patch("consultations_core.services.end_consultation_service.DrugMaster")
+    @patch("consultations_core.services.end_consultation_service.fetch_active_drugs")
     @patch("consultations_core.services.end_consultation_service.Prescription")
-    def test_persist_medicines_raises_for_invalid_drug_id(self, prescription_cls, drug_master_cls):
+    def test_persist_medicines_raises_for_invalid_drug_id(self, prescription_cls, fetch_active_drugs):
         consultation = SimpleNamespace(encounter=SimpleNamespace(clinic=SimpleNamespace()))
         user = SimpleNamespace()
         prescription_cls.objects.create.return_value = MagicMock()
-        drug_master_cls.objects.filter.return_value.first.return_value = None
+        fetch_active_drugs.return_value = {}
 
         raw_medicines = [
             {
@@ -0,0 +1,129 @@
+import json
+import os
+import tempfile
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from rest_framework.test import APIClient
+
+from consultations_core.services import metadata_bundle
+from consultations_core.services.metadata_bundle import (
+    MetadataBundleStore,
+    compile_bundle,
+    read_bundle,
+    write_bundle,
+)
+
+
+def _write(root: str, relative_path: str, data) -> None:
+    path = os.path.join(root, *relative_path.split("/"))
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f)
+
+
+class MetadataBundleTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        self._tmp = tempfile.TemporaryDirectory()
+        self.root = self._tmp.name
+        _write(self.root, "_version.json", {"metadata_version": 3})
+        _write(self.root, "pre_consultation/sections.json", {"sections": ["vitals"]})
+        _write(self.root, "pre_consultation/vitals/vitals_details.json.example", {"x": 1})
+        with open(os.path.join(self.root, ".DS_Store"), "wb") as f:
+            f.write(b"\x00\x01")
+
+        saved = (
+            MetadataBundleStore._bundle,
+            MetadataBundleStore._source_stamp,
+            MetadataBundleStore._next_check_at,
+        )
+        MetadataBundleStore._bundle = None
+
+        def restore():
+            (
+                MetadataBundleStore._bundle,
+                MetadataBundleStore._source_stamp,
+                MetadataBundleStore._next_check_at,
+            ) = saved
+            self._tmp.cleanup()
+
+        self.addCleanup(restore)
+        source_patch = patch.object(metadata_bundle, "SOURCE_PATH", self.root)
+        source_patch.start()
+        self.addCleanup(source_patch.stop)
+
+    def test_compile_collects_json_files_only(self):
+        bundle = compile_bundle(self.root)
+        self.assertEqual(sorted(bundle.files), ["_version.json", "pre_consultation/sections.json"])
+        self.assertEqual(bundle.version, 3)
+        self.assertEqual(bundle.get("pre_consultation/sections.json"), {"sections": ["vitals"]})
+        with self.assertRaises(FileNotFoundError):
+            bundle.get("pre_consultation/missing.json")
+
+    def test_content_hash_and_etag_follow_content(self):
+        before = compile_bundle(self.root)
+        self.assertEqual(compile_bundle(self.root).content_hash, before.content_hash)
+        _write(self.root, "pre_consultation/sections.json", {"sections": ["vitals", "allergies"]})
+        after = compile_bundle(self.root)
+        self.assertNotEqual(after.content_hash, before.content_hash)
+        self.assertNotEqual(after.etag("physician"), before.etag("physician"))
+        self.assertNotEqual(before.etag("physician"), before.etag("gynecology"))
+
+    def test_bundle_file_round_trip(self):
+        bundle = compile_bundle(self.root)
+        path = os.path.join(self.root, "bundle.out")
+        write_bundle(bundle, path)
+        loaded = read_bundle(path)
+        self.assertEqual(loaded.content_hash, bundle.content_hash)
+        self.assertEqual(loaded.version, 3)
+        self.assertEqual(dict(loaded.files), dict(bundle.files))
+
+    @override_settings(CONSULTATION_METADATA_RELOAD_INTERVAL_SECONDS=0)
+    def test_reload_swaps_only_on_change(self):
+        first = MetadataBundleStore.current()
+        self.assertIs(MetadataBundleStore.current(), first)
+        self.assertFalse(MetadataBundleStore.reload())
+        self.assertIs(MetadataBundleStore.current(), first)
+
+        _write(self.root, "pre_consultation/sections.json", {"sections": []})
+        # Without a reload the current snapshot is kept.
+        self.assertIs(MetadataBundleStore.current(), first)
+        self.assertTrue(MetadataBundleStore.reload())
+        self.assertEqual(MetadataBundleStore.get("pre_consultation/sections.json"), {"sections": []})
+
+    @override_settings(CONSULTATION_METADATA_RELOAD_INTERVAL_SECONDS=1)
+    def test_version_change_is_picked_up_after_interval(self):
+        first = MetadataBundleStore.current()
+        _write(self.root, "_version.json", {"metadata_version": 4})
+        version_path = os.path.join(self.root, "_version.json")
+        os.utime(version_path, ns=(0, MetadataBundleStore._source_stamp + 1_000_000_000))
+
+        MetadataBundleStore._next_check_at = 0.0
+        self.assertEqual(MetadataBundleStore.current().version, 4)
+        self.assertIsNot(MetadataBundleStore.current(), first)
+
+
+class RenderSchemaETagTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.client = APIClient()
+        self.url = "/api/consultation/render-schema/?specialty=physician&section=symptoms"
+
+    def test_matching_if_none_match_returns_304(self):
+        first = self.client.get(self.url)
+        self.assertEqual(first.status_code, 200)
+        etag = first["ETag"]
+
+        second = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(second.status_code, 304)
+        self.assertEqual(second["ETag"], etag)
+
+        other = self.client.get(
+            "/api/consultation/render-schema/?specialty=physician&section=findings",
+            HTTP_IF_NONE_MATCH=etag,
+        )
+        self.assertEqual(other.status_code, 200)
+        self.assertNotEqual(other["ETag"], etag)
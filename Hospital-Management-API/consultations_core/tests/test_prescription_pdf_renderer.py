@@ -0,0 +1,90 @@
+from unittest.mock import patch
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+
+from consultations_core.services.prescription_pdf_renderer import (
+    PdfRenderStatus,
+    PrescriptionPdfCache,
+    get_pdf_render,
+    pdf_render_id,
+    render_pdf,
+    render_pdf_via_queue,
+    request_pdf_render,
+    run_pdf_render,
+)
+
+HTML = "<html><body>Rx</body></html>"
+BASE_URL = "http://testserver/"
+
+RENDER_PATH = "consultations_core.services.prescription_pdf_renderer.PrescriptionPdfRenderer.render"
+
+
+@override_settings(PRESCRIPTION_PDF_ASYNC_ENABLED=True)
+class PrescriptionPdfRendererTests(SimpleTestCase):
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+
+    def test_render_id_depends_on_html_and_base_url(self):
+        self.assertEqual(pdf_render_id(HTML, BASE_URL), pdf_render_id(HTML, BASE_URL))
+        self.assertNotEqual(pdf_render_id(HTML, BASE_URL), pdf_render_id(HTML + " ", BASE_URL))
+        self.assertNotEqual(pdf_render_id(HTML, BASE_URL), pdf_render_id(HTML, "/"))
+
+    @patch(RENDER_PATH, return_value=b"%PDF-1")
+    def test_rendered_pdf_is_reused_by_content_hash(self, render):
+        # settings_test runs Celery tasks eagerly.
+        first = request_pdf_render(HTML, BASE_URL)
+        self.assertEqual(first.status, PdfRenderStatus.READY)
+        self.assertEqual(first.pdf, b"%PDF-1")
+
+        self.assertEqual(request_pdf_render(HTML, BASE_URL).pdf, b"%PDF-1")
+        self.assertEqual(render_pdf(HTML, BASE_URL), b"%PDF-1")
+        render.assert_called_once_with(HTML, BASE_URL)
+
+    @patch(RENDER_PATH, return_value=b"%PDF-2")
+    @patch("consultations_core.tasks.render_prescription_pdf.delay")
+    def test_pending_render_is_enqueued_once(self, delay, render):
+        first = request_pdf_render(HTML, BASE_URL)
+        second = request_pdf_render(HTML, BASE_URL)
+        self.assertEqual(first.status, PdfRenderStatus.PENDING)
+        self.assertIsNone(first.pdf)
+        self.assertEqual(second.status, PdfRenderStatus.PENDING)
+        delay.assert_called_once_with(first.render_id, HTML, BASE_URL)
+
+        self.assertTrue(run_pdf_render(first.render_id, HTML, BASE_URL))
+        done = get_pdf_render(first.render_id)
+        self.assertEqual(done.status, PdfRenderStatus.READY)
+        self.assertEqual(done.pdf, b"%PDF-2")
+
+    @patch(RENDER_PATH, side_effect=RuntimeError("no fonts"))
+    @patch("consultations_core.tasks.render_prescription_pdf.delay")
+    def test_failed_render_reports_status_and_is_retried(self, delay, render):
+        render_id = request_pdf_render(HTML, BASE_URL).render_id
+        self.assertFalse(run_pdf_render(render_id, HTML, BASE_URL))
+
+        failed = get_pdf_render(render_id)
+        self.assertEqual(failed.status, PdfRenderStatus.FAILED)
+        self.assertEqual(failed.error, "no fonts")
+
+        self.assertEqual(request_pdf_render(HTML, BASE_URL).status, PdfRenderStatus.PENDING)
+        self.assertEqual(delay.call_count, 2)
+
+    def test_unknown_render_is_none(self):
+        self.assertIsNone(get_pdf_render("0" * 64))
+
+    @patch(RENDER_PATH, return_value=b"%PDF-3")
+    def test_render_is_bound_to_requesting_consultation(self, render):
+        render_id = request_pdf_render(HTML, BASE_URL, consultation_id="c-1").render_id
+        self.assertTrue(PrescriptionPdfCache.is_bound(render_id, "c-1"))
+        self.assertFalse(PrescriptionPdfCache.is_bound(render_id, "c-2"))
+
+    @patch(RENDER_PATH, return_value=b"%PDF-4")
+    def test_render_via_queue_waits_for_queued_render(self, render):
+        self.assertEqual(render_pdf_via_queue(HTML, BASE_URL), b"%PDF-4")
+        self.assertEqual(get_pdf_render(pdf_render_id(HTML, BASE_URL)).pdf, b"%PDF-4")
+
+    @patch(RENDER_PATH, side_effect=RuntimeError("no fonts"))
+    def test_render_via_queue_raises_when_render_fails(self, render):
+        with self.assertRaises(RuntimeError):
+            render_pdf_via_queue(HTML, BASE_URL, timeout=1)
@@ -1,7 +1,6 @@
 """Legacy report views (api/diagnostics/ — deprecated, use v1 operational routes)."""
 
 from django.core.exceptions import ValidationError as DjangoValidationError
-from django.http import FileResponse
 from django.shortcuts import get_object_or_404
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
@@ -22,7 +21,7 @@ from diagnostics_engine.services.reports import (
     ReportQueryService,
     ReportWorkflowService,
 )
-from diagnostics_engine.storage.report_storage import ReportStorageService
+from diagnostics_engine.storage.report_streaming import stream_artifact_response
 from diagnostics_engine.permissions.reports import CanUploadReports
 from diagnostics_engine.services.reports.access_control import report_belongs_to_branch
 from labs.api.permissions import IsLabAdminUser
@@ -143,13 +142,8 @@ class ReportArtifactDownloadView(APIView):
         ):
             return Response({"detail": "Branch access denied."}, status=status.HTTP_403_FORBIDDEN)
         artifact = get_object_or_404(report.artifacts, pk=artifact_id, is_active=True)
-        filename = ReportStorageService.download_filename(artifact)
         inline = request.query_params.get("inline") == "1"
-        return FileResponse(
-            ReportStorageService.open_for_read(artifact),
-            as_attachment=not inline,
-            filename=filename,
-        )
+        return stream_artifact_response(request, artifact, as_attachment=not inline)
 
 
 class OrderReportsListView(APIView):
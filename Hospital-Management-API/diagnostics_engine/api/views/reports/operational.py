@@ -52,6 +52,8 @@ from diagnostics_engine.services.reports.report_task_presenter import (
     compute_report_task_counts,
     filter_assignments_ready_for_report_queue,
 )
+from diagnostics_engine.storage.report_streaming import stream_artifact_response
+from diagnostics_engine.storage.s3_report_storage import reports_local_stream_enabled
 from labs.api.services.lab_orders_list_service import (
     apply_list_filters,
     base_assignments_queryset,
@@ -398,22 +400,16 @@ class ReportOperationalDownloadView(LabReportOperationalMixin):
         except DjangoValidationError as exc:
             return validation_error_response(exc, request=request)
 
-        if not payload.get("download_url") and request.query_params.get("stream") == "1":
-            from django.http import FileResponse
-
-            from diagnostics_engine.domain.reports import get_primary_artifact
-            from diagnostics_engine.storage.report_storage import ReportStorageService
-
+        # Local storage: download_url points back here with ?stream=1.
+        if request.query_params.get("stream") == "1" and reports_local_stream_enabled():
             artifact = get_primary_artifact(report)
             if artifact is None:
                 return validation_error_response(
                     DjangoValidationError("No downloadable artifact."),
                     request=request,
                 )
-            content = ReportStorageService.open_for_read(artifact)
-            filename = ReportStorageService.download_filename(artifact)
             inline = request.query_params.get("inline") == "1"
-            return FileResponse(content, as_attachment=not inline, filename=filename)
+            return stream_artifact_response(request, artifact, as_attachment=not inline)
 
         return success_response(payload, request=request)
 
@@ -610,6 +610,7 @@ class ArtifactUploadService:
             artifact.storage_key = artifact.file.name
         if artifact.storage_path or artifact.storage_key:
             artifact.save(update_fields=["storage_path", "storage_key"])
+        ReportStorageService.remember_stored(artifact.storage_key)
         logger.info(
             "artifact_upload_created artifact_id=%s report_id=%s primary=%s",
             artifact.pk,
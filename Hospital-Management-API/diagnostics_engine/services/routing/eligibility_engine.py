@@ -5,12 +5,12 @@ from __future__ import annotations
 import json
 import logging
 import os
+from collections import defaultdict
 from dataclasses import dataclass, field
 from decimal import Decimal
 from typing import TYPE_CHECKING, Any
 
 from django.db.models import Q
-from django.db.models.functions import Trim
 from django.utils import timezone
 
 from diagnostics_engine.services.routing.routing_helpers import haversine_km, normalize_indian_pincode
@@ -20,6 +20,7 @@ logger = logging.getLogger(__name__)
 if TYPE_CHECKING:
     from diagnostics_engine.models.orders import DiagnosticOrder
     from diagnostics_engine.services.routing.routing_helpers import ResolvedRoutingLocation
+    from labs.models.branch_pricing import BranchServiceArea, BranchServicePricing
     from labs.models.lab_auth import LabBranch, LabOrganization
 
 
@@ -75,6 +76,52 @@ class EligibilityCandidate:
     ineligibility_reasons: list[str] = field(default_factory=list)
 
 
+@dataclass
+class BranchCoverage:
+    """
+    Service areas and currently valid pricing for a set of branches, loaded in two queries.
+
+    ``areas`` keeps each branch's active areas in ``BranchServiceArea.Meta.ordering`` so the
+    first in-memory match is the row ``.first()`` would return. ``pricing`` holds the latest
+    valid row (highest ``valid_from``) per (branch, service); keys are ``str`` ids.
+    """
+
+    areas: dict[str, list[BranchServiceArea]] = field(default_factory=dict)
+    pricing: dict[tuple[str, str], BranchServicePricing] = field(default_factory=dict)
+
+    @classmethod
+    def load(cls, branch_ids: list[Any], service_ids: list[Any], today: Any) -> BranchCoverage:
+        from labs.models.branch_pricing import BranchServiceArea, BranchServicePricing
+
+        coverage = cls()
+        if not branch_ids:
+            return coverage
+
+        areas: dict[str, list[BranchServiceArea]] = defaultdict(list)
+        for area in BranchServiceArea.objects.filter(
+            branch_id__in=branch_ids, is_active=True, is_deleted=False
+        ).order_by("branch_id", "pincode"):
+            areas[str(area.branch_id)].append(area)
+        coverage.areas = dict(areas)
+
+        if service_ids:
+            rows = (
+                BranchServicePricing.objects.filter(
+                    branch_id__in=branch_ids,
+                    service_id__in=service_ids,
+                    is_deleted=False,
+                    is_active=True,
+                    is_available=True,
+                    valid_from__lte=today,
+                )
+                .filter(Q(valid_to__isnull=True) | Q(valid_to__gte=today))
+                .order_by("branch_id", "service_id", "-valid_from")
+            )
+            for row in rows:
+                coverage.pricing.setdefault((str(row.branch_id), str(row.service_id)), row)
+        return coverage
+
+
 class EligibilityEngine:
     """Determine which lab branches can fulfill the order (no ranking)."""
 
@@ -83,10 +130,16 @@ class EligibilityEngine:
         cls,
         order: DiagnosticOrder,
         location: ResolvedRoutingLocation,
+        *,
+        full_scan: bool = False,
     ) -> list[EligibilityCandidate]:
-        """Every marketplace branch evaluated (eligible + ineligible). Used for audit / no-match samples."""
+        """
+        Every marketplace branch evaluated (eligible + ineligible). Used for audit / no-match samples.
+
+        With ``DIAGNOSTIC_ROUTING_SPATIAL_PREFILTER`` only branches near ``location`` are evaluated
+        unless ``full_scan``; see :meth:`_evaluate_prefiltered`.
+        """
         from diagnostics_engine.models.orders import DiagnosticOrderTestLine
-        from diagnostics_engine.services.routing.routing_helpers import routable_lab_branches_queryset
 
         today = timezone.now().date()
         test_lines = list(
@@ -113,34 +166,15 @@ class EligibilityEngine:
             for line in test_lines
         ]
 
-        branches_qs = routable_lab_branches_queryset()
-        if _reject_debug_enabled():
-            branch_list = list(branches_qs)
-            logger.info(
-                "Routing candidates | count=%s | branch_ids=%s | branch_codes=%s | required_tests=%s",
-                len(branch_list),
-                [str(b.pk) for b in branch_list],
-                [getattr(b, "branch_code", "") or "" for b in branch_list],
-                required_tests_debug,
-            )
-            branches_iter: Any = branch_list
-        else:
-            branches_iter = branches_qs
-
         mode = order.sample_collection_mode or "lab"
-        out: list[EligibilityCandidate] = []
-        for branch in branches_iter:
-            out.append(
-                cls._evaluate_branch(
-                    branch=branch,
-                    service_ids=service_ids,
-                    location=location,
-                    today=today,
-                    mode=mode,
-                    required_tests_debug=required_tests_debug,
-                )
-            )
-        return out
+        return cls._evaluate_prefiltered(
+            service_ids=service_ids,
+            location=location,
+            today=today,
+            mode=mode,
+            required_tests_debug=required_tests_debug,
+            full_scan=full_scan,
+        )
 
     @classmethod
     def evaluate(
@@ -159,15 +193,14 @@ class EligibilityEngine:
         mode: str,
         branches: Any | None = None,
         required_tests_debug: list[dict[str, Any]] | None = None,
+        full_scan: bool = False,
     ) -> list[EligibilityCandidate]:
         """
         Eligibility for a hypothetical order (no DiagnosticOrder / test lines).
 
         Used by debug_lab_routing and future routing introspection APIs. Same rules as
-        evaluate_all → _evaluate_branch.
+        evaluate_all → _evaluate_branch. Explicit ``branches`` are never prefiltered.
         """
-        from diagnostics_engine.services.routing.routing_helpers import routable_lab_branches_queryset
-
         if not service_ids:
             return []
 
@@ -175,9 +208,12 @@ class EligibilityEngine:
         if required_tests_debug is None:
             from diagnostics_engine.models.catalog import DiagnosticServiceMaster
 
+            services = {
+                str(pk): svc for pk, svc in DiagnosticServiceMaster.objects.in_bulk(service_ids).items()
+            }
             required_tests_debug = []
             for sid in service_ids:
-                svc = DiagnosticServiceMaster.objects.filter(pk=sid).first()
+                svc = services.get(str(sid))
                 required_tests_debug.append(
                     {
                         "id": str(sid),
@@ -186,21 +222,105 @@ class EligibilityEngine:
                     }
                 )
 
-        branches_iter = branches if branches is not None else routable_lab_branches_queryset()
-        out: list[EligibilityCandidate] = []
-        for branch in branches_iter:
-            out.append(
-                cls._evaluate_branch(
-                    branch=branch,
-                    service_ids=service_ids,
-                    location=location,
-                    today=today,
-                    mode=mode,
-                    required_tests_debug=required_tests_debug,
-                )
+        if branches is None:
+            return cls._evaluate_prefiltered(
+                service_ids=service_ids,
+                location=location,
+                today=today,
+                mode=mode,
+                required_tests_debug=required_tests_debug,
+                full_scan=full_scan,
+            )
+        return cls._evaluate_branches(
+            branches=list(branches),
+            service_ids=service_ids,
+            location=location,
+            today=today,
+            mode=mode,
+            required_tests_debug=required_tests_debug,
+        )
+
+    @classmethod
+    def _evaluate_prefiltered(
+        cls,
+        *,
+        service_ids: list[Any],
+        location: ResolvedRoutingLocation,
+        today: Any,
+        mode: str,
+        required_tests_debug: list[dict[str, Any]],
+        full_scan: bool,
+    ) -> list[EligibilityCandidate]:
+        """
+        Evaluate the routable pool, narrowed by the spatial prefilter when enabled.
+
+        When nothing in the narrowed set is eligible the full pool is evaluated instead, so
+        no-match audit samples and default-allow branches outside the radius are unchanged.
+        """
+        from diagnostics_engine.services.routing.routing_helpers import routable_lab_branches_queryset
+        from diagnostics_engine.services.routing.spatial_index import spatial_candidate_ids
+
+        candidate_ids = None if full_scan else spatial_candidate_ids(location)
+        branches_qs = routable_lab_branches_queryset()
+        if candidate_ids is not None:
+            branches_qs = branches_qs.filter(pk__in=list(candidate_ids))
+        branch_list = list(branches_qs)
+        if _reject_debug_enabled():
+            logger.info(
+                "Routing candidates | count=%s | branch_ids=%s | branch_codes=%s | required_tests=%s | "
+                "prefiltered=%s",
+                len(branch_list),
+                [str(b.pk) for b in branch_list],
+                [getattr(b, "branch_code", "") or "" for b in branch_list],
+                required_tests_debug,
+                candidate_ids is not None,
+            )
+
+        out = cls._evaluate_branches(
+            branches=branch_list,
+            service_ids=service_ids,
+            location=location,
+            today=today,
+            mode=mode,
+            required_tests_debug=required_tests_debug,
+        )
+        if candidate_ids is not None and not any(not c.ineligibility_reasons for c in out):
+            return cls._evaluate_prefiltered(
+                service_ids=service_ids,
+                location=location,
+                today=today,
+                mode=mode,
+                required_tests_debug=required_tests_debug,
+                full_scan=True,
             )
         return out
 
+    @classmethod
+    def _evaluate_branches(
+        cls,
+        *,
+        branches: list[LabBranch],
+        service_ids: list[Any],
+        location: ResolvedRoutingLocation,
+        today: Any,
+        mode: str,
+        required_tests_debug: list[dict[str, Any]],
+    ) -> list[EligibilityCandidate]:
+        """Bulk-load coverage for every branch once, then evaluate each branch in memory."""
+        coverage = BranchCoverage.load([b.pk for b in branches], service_ids, today)
+        return [
+            cls._evaluate_branch(
+                branch=branch,
+                service_ids=service_ids,
+                location=location,
+                today=today,
+                mode=mode,
+                required_tests_debug=required_tests_debug,
+                coverage=coverage,
+            )
+            for branch in branches
+        ]
+
     @classmethod
     def _evaluate_branch(
         cls,
@@ -211,8 +331,13 @@ class EligibilityEngine:
         today: Any,
         mode: str,
         required_tests_debug: list[dict[str, Any]],
+        coverage: BranchCoverage | None = None,
     ) -> EligibilityCandidate:
-        from labs.models.branch_pricing import BranchServiceArea, BranchServicePricing
+        from labs.models.branch_pricing import BranchServicePricing
+
+        if coverage is None:
+            coverage = BranchCoverage.load([branch.pk], service_ids, today)
+        branch_key = str(branch.pk)
 
         org = branch.organization
         er: list[str] = []
@@ -239,20 +364,16 @@ class EligibilityEngine:
             else:
                 er.append(ER_WALK_IN_SUPPORTED)
 
-        areas_qs = BranchServiceArea.objects.filter(
-            branch=branch, is_active=True, is_deleted=False
-        )
-        if areas_qs.exists():
+        areas = coverage.areas.get(branch_key, [])
+        if areas:
             matched = None
             np = normalize_indian_pincode(location.pincode)
             if np:
-                matched = (
-                    areas_qs.annotate(_pc=Trim("pincode"))
-                    .filter(_pc=np)
-                    .first()
-                )
+                # Same comparison as SQL TRIM(pincode) = np (TRIM strips spaces only).
+                matched = next((a for a in areas if (a.pincode or "").strip(" ") == np), None)
             if matched is None and location.city:
-                matched = areas_qs.filter(city__iexact=location.city.strip()).first()
+                city = location.city.strip().upper()
+                matched = next((a for a in areas if (a.city or "").upper() == city), None)
             if matched is None:
                 _record_reject(ir, branch, IR_OUTSIDE_SERVICE_AREA)
             else:
@@ -337,19 +458,7 @@ class EligibilityEngine:
         # Marketplace pricing is keyed by DiagnosticServiceMaster primary key (service_id), not by
         # display name or code. Fuzzy name/code matching is unsafe for billing and clinical traceability.
         for sid in service_ids:
-            row = (
-                BranchServicePricing.objects.filter(
-                    branch=branch,
-                    service_id=sid,
-                    is_deleted=False,
-                    is_active=True,
-                    is_available=True,
-                    valid_from__lte=today,
-                )
-                .filter(Q(valid_to__isnull=True) | Q(valid_to__gte=today))
-                .order_by("-valid_from")
-                .first()
-            )
+            row = coverage.pricing.get((branch_key, str(sid)))
             if row is None:
                 missing.append({"service_id": str(sid), "code": IR_MISSING_TEST_PRICING})
                 _record_reject(ir, branch, IR_MISSING_TEST_PRICING)
@@ -382,24 +491,24 @@ class EligibilityEngine:
                 },
             )
 
-        pricing_rows = list(
-            BranchServicePricing.objects.filter(
-                branch=branch,
-                service_id__in=service_ids,
-                is_deleted=False,
-            )
-            .select_related("service")
-            .order_by("service__code", "-valid_from")
-        )
-        branch_pricing_debug = [
-            {
-                "service_id": str(p.service_id),
-                "service_code": getattr(p.service, "code", "") or "",
-                "service_name": getattr(p.service, "name", "") or "",
-            }
-            for p in pricing_rows
-        ]
         if _pricing_filter_ladder_debug_enabled():
+            pricing_rows = list(
+                BranchServicePricing.objects.filter(
+                    branch=branch,
+                    service_id__in=service_ids,
+                    is_deleted=False,
+                )
+                .select_related("service")
+                .order_by("service__code", "-valid_from")
+            )
+            branch_pricing_debug = [
+                {
+                    "service_id": str(p.service_id),
+                    "service_code": getattr(p.service, "code", "") or "",
+                    "service_name": getattr(p.service, "name", "") or "",
+                }
+                for p in pricing_rows
+            ]
             _bc = getattr(branch, "branch_code", "") or "—"
             logger.info(
                 "Pricing match debug | branch=%s (%s) | required_tests=%s | branch_pricing=%s",
@@ -39,29 +39,29 @@ class RankingEngine:
         *,
         weights: ScoringWeights | None = None,
     ) -> list[RankedLab]:
+        """
+        Rank ``candidates`` (best first).
+
+        Scores stay float through the whole batch; ``Decimal`` quantization (4 dp, the
+        ``RoutingEvent`` precision) happens once per row when building ``RankedLab``.
+        """
         if not candidates:
             return []
         w = weights or ScoringWeights.from_django_settings()
-        funcs = ScoringFunctions(w)
-
-        distances = [c.distance_km for c in candidates]
-        prices = [c.estimated_price for c in candidates]
-        tats = [c.estimated_tat_hours for c in candidates]
-
-        d_s, p_s, t_s, q_s, pt_s = funcs.dimension_scores(
-            distances_km=distances,
-            prices=prices,
-            tat_hours=tats,
+        matrix = ScoringFunctions(w).score_matrix(
+            distances_km=[c.distance_km for c in candidates],
+            prices=[c.estimated_price for c in candidates],
+            tat_hours=[c.estimated_tat_hours for c in candidates],
         )
-        finals = funcs.final_scores(d_s, p_s, t_s, q_s, pt_s)
+        finals = matrix.final_scores(w)
 
-        min_price = min((float(p) for p in prices if p is not None), default=None)
-        min_tat = min((t for t in tats if t is not None), default=None)
-        min_dist = min((d for d in distances if d is not None), default=None)
-        max_final = max(finals) if finals else 0.0
+        min_price = min((float(c.estimated_price) for c in candidates if c.estimated_price is not None), default=None)
+        min_tat = min((c.estimated_tat_hours for c in candidates if c.estimated_tat_hours is not None), default=None)
+        min_dist = min((c.distance_km for c in candidates if c.distance_km is not None), default=None)
+        max_final = max(finals)
         eps = 1e-6
 
-        ranked: list[RankedLab] = []
+        rows: list[tuple[float, RankedLab]] = []
         for i, c in enumerate(candidates):
             labels: list[str] = []
             if min_price is not None and c.estimated_price is not None:
@@ -77,26 +77,23 @@ class RankingEngine:
                 labels.append(RecommendationLabel.RECOMMENDED)
                 labels.append(RecommendationLabel.BEST_VALUE)
 
-            # de-dupe preserve order
-            seen: set[str] = set()
-            uniq = []
-            for lb in labels:
-                if lb not in seen:
-                    seen.add(lb)
-                    uniq.append(lb)
-
-            ranked.append(
-                RankedLab(
-                    candidate=c,
-                    distance_score=_d(d_s[i]),
-                    price_score=_d(p_s[i]),
-                    tat_score=_d(t_s[i]),
-                    quality_score=_d(q_s[i]),
-                    partner_score=_d(pt_s[i]),
-                    final_score=_d(finals[i]),
-                    recommendation_labels=uniq,
+            # Sort on the quantized value, as before: round() equals float(_d()) exactly.
+            final_q = round(finals[i], 4)
+            rows.append(
+                (
+                    final_q,
+                    RankedLab(
+                        candidate=c,
+                        distance_score=_d(matrix.distance[i]),
+                        price_score=_d(matrix.price[i]),
+                        tat_score=_d(matrix.tat[i]),
+                        quality_score=_d(matrix.quality[i]),
+                        partner_score=_d(matrix.partner[i]),
+                        final_score=_d(finals[i]),
+                        recommendation_labels=list(dict.fromkeys(labels)),
+                    ),
                 )
             )
 
-        ranked.sort(key=lambda r: float(r.final_score), reverse=True)
-        return ranked
+        rows.sort(key=lambda row: row[0], reverse=True)
+        return [r for _, r in rows]
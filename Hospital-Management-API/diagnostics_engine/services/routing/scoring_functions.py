@@ -4,7 +4,6 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from decimal import Decimal
-from typing import Iterable
 
 from diagnostics_engine.services.routing.scoring_weights import ScoringWeights
 
@@ -37,6 +36,28 @@ def normalize_lower_is_better(raw: list[float | None]) -> list[float]:
     return out
 
 
+@dataclass(frozen=True)
+class ScoreMatrix:
+    """Normalized per-dimension scores for one candidate set, stored column-wise."""
+
+    distance: tuple[float, ...]
+    price: tuple[float, ...]
+    tat: tuple[float, ...]
+    quality: tuple[float, ...]
+    partner: tuple[float, ...]
+
+    def __len__(self) -> int:
+        return len(self.distance)
+
+    def final_scores(self, weights: ScoringWeights) -> list[float]:
+        wd, wp, wt, wq, wpt = weights.distance, weights.price, weights.tat, weights.quality, weights.partner
+        # Same term order as ScoringFunctions.final_scores so results are bit-identical.
+        return [
+            wd * d + wp * p + wt * t + wq * q + wpt * pt
+            for d, p, t, q, pt in zip(self.distance, self.price, self.tat, self.quality, self.partner)
+        ]
+
+
 @dataclass
 class ScoringFunctions:
     """Pluggable scoring; swap implementations for marketplace / AI tiers."""
@@ -60,6 +81,24 @@ class ScoringFunctions:
         pt_score = partner if partner is not None else [0.5] * n
         return d_score, p_score, t_score, q_score, pt_score
 
+    def score_matrix(
+        self,
+        *,
+        distances_km: list[float | None],
+        prices: list[Decimal | None],
+        tat_hours: list[int | None],
+        quality: list[float] | None = None,
+        partner: list[float] | None = None,
+    ) -> ScoreMatrix:
+        d, p, t, q, pt = self.dimension_scores(
+            distances_km=distances_km,
+            prices=prices,
+            tat_hours=tat_hours,
+            quality=quality,
+            partner=partner,
+        )
+        return ScoreMatrix(tuple(d), tuple(p), tuple(t), tuple(q), tuple(pt))
+
     def final_scores(
         self,
         d_score: list[float],
@@ -0,0 +1,225 @@
+"""
+Process-local spatial prefilter for routing (optional; ``DIAGNOSTIC_ROUTING_SPATIAL_PREFILTER``).
+
+Narrows the routable pool before ``EligibilityEngine`` runs, using the same rules that decide
+service-area eligibility:
+
+  • pincode → branch ids and city → branch ids, from active ``BranchServiceArea`` rows
+    (a branch with area rows can only be eligible when one of them matches);
+  • branches without any area rows ("default allow") are kept when their ``LabAddress``
+    falls within ``DIAGNOSTIC_ROUTING_PREFILTER_RADIUS_KM`` of the routing location, looked
+    up through a geohash grid; branches without coordinates are always kept.
+
+``EligibilityEngine`` falls back to the full pool when nothing in the prefiltered set is
+eligible, so no-match audit samples and far-away default-allow branches behave as before.
+
+Freshness: ``LabBranch`` / ``LabAddress`` / ``BranchServiceArea`` changes bump a version stamp
+in the shared cache on commit; each process rebuilds when the stamp changes or the snapshot
+is older than ``REBUILD_MAX_AGE_SECONDS``.
+"""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+import uuid
+from collections import defaultdict
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+from django.conf import settings
+from django.core.cache import cache
+
+from diagnostics_engine.services.routing.routing_helpers import haversine_km, normalize_indian_pincode
+
+if TYPE_CHECKING:
+    from diagnostics_engine.services.routing.routing_helpers import ResolvedRoutingLocation
+
+logger = logging.getLogger(__name__)
+
+SPATIAL_INDEX_VERSION_CACHE_KEY = "routing_spatial_index_version"
+REBUILD_MAX_AGE_SECONDS = 300
+# Precision 4 cells are ~39 km x 19.5 km; a 50 km radius touches a handful of them.
+GEOHASH_PRECISION = 4
+KM_PER_DEGREE_LAT = 111.32
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+
+
+def spatial_prefilter_enabled() -> bool:
+    return bool(getattr(settings, "DIAGNOSTIC_ROUTING_SPATIAL_PREFILTER", False))
+
+
+def _radius_km() -> float:
+    return float(getattr(settings, "DIAGNOSTIC_ROUTING_PREFILTER_RADIUS_KM", 50))
+
+
+def geohash_encode(lat: float, lon: float, precision: int = GEOHASH_PRECISION) -> str:
+    lat_lo, lat_hi = -90.0, 90.0
+    lon_lo, lon_hi = -180.0, 180.0
+    out: list[str] = []
+    bits = 0
+    ch = 0
+    even = True
+    while len(out) < precision:
+        if even:
+            mid = (lon_lo + lon_hi) / 2
+            if lon >= mid:
+                ch = (ch << 1) | 1
+                lon_lo = mid
+            else:
+                ch <<= 1
+                lon_hi = mid
+        else:
+            mid = (lat_lo + lat_hi) / 2
+            if lat >= mid:
+                ch = (ch << 1) | 1
+                lat_lo = mid
+            else:
+                ch <<= 1
+                lat_hi = mid
+        even = not even
+        bits += 1
+        if bits == 5:
+            out.append(_BASE32[ch])
+            bits = 0
+            ch = 0
+    return "".join(out)
+
+
+def _cell_size_degrees(precision: int) -> tuple[float, float]:
+    total = 5 * precision
+    lon_bits = (total + 1) // 2
+    lat_bits = total // 2
+    return 180.0 / (1 << lat_bits), 360.0 / (1 << lon_bits)
+
+
+def geohash_cells_within(lat: float, lon: float, radius_km: float, precision: int = GEOHASH_PRECISION) -> set[str]:
+    """Every cell intersecting the bounding box of the radius around (lat, lon)."""
+    dlat = radius_km / KM_PER_DEGREE_LAT
+    cos_lat = max(math.cos(math.radians(lat)), 0.01)
+    dlon = min(radius_km / (KM_PER_DEGREE_LAT * cos_lat), 180.0)
+    cell_h, cell_w = _cell_size_degrees(precision)
+
+    lat_min, lat_max = max(lat - dlat, -90.0), min(lat + dlat, 90.0)
+    lon_min, lon_max = lon - dlon, lon + dlon
+    cells: set[str] = set()
+    y = lat_min
+    while True:
+        x = lon_min
+        while True:
+            wrapped = ((x + 180.0) % 360.0) - 180.0
+            cells.add(geohash_encode(min(y, 89.999999), wrapped, precision))
+            if x >= lon_max:
+                break
+            x = min(x + cell_w, lon_max)
+        if y >= lat_max:
+            break
+        y = min(y + cell_h, lat_max)
+    return cells
+
+
+@dataclass
+class _Snapshot:
+    branch_ids: set[str] = field(default_factory=set)
+    branches_with_areas: set[str] = field(default_factory=set)
+    by_pincode: dict[str, set[str]] = field(default_factory=lambda: defaultdict(set))
+    by_city: dict[str, set[str]] = field(default_factory=lambda: defaultdict(set))
+    by_cell: dict[str, set[str]] = field(default_factory=lambda: defaultdict(set))
+    coords: dict[str, tuple[float, float]] = field(default_factory=dict)
+    built_at: float = 0.0
+    version: str | None = None
+
+
+def _build_snapshot(version: str | None) -> _Snapshot:
+    from labs.models.branch_pricing import BranchServiceArea
+    from labs.models.lab_auth import LabBranch
+
+    snap = _Snapshot(built_at=time.monotonic(), version=version)
+    for pk, lat, lon in LabBranch.objects.filter(is_deleted=False).values_list(
+        "pk", "address__latitude", "address__longitude"
+    ):
+        key = str(pk)
+        snap.branch_ids.add(key)
+        if lat is not None and lon is not None:
+            point = (float(lat), float(lon))
+            snap.coords[key] = point
+            snap.by_cell[geohash_encode(*point)].add(key)
+
+    for branch_id, pincode, city in BranchServiceArea.objects.filter(
+        is_active=True, is_deleted=False
+    ).values_list("branch_id", "pincode", "city"):
+        key = str(branch_id)
+        snap.branches_with_areas.add(key)
+        pc = (pincode or "").strip(" ")
+        if pc:
+            snap.by_pincode[pc].add(key)
+        if city:
+            snap.by_city[city.upper()].add(key)
+    return snap
+
+
+class RoutingSpatialIndex:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._snap: _Snapshot | None = None
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snap = None
+
+    def _ensure_fresh(self) -> _Snapshot:
+        version = cache.get(SPATIAL_INDEX_VERSION_CACHE_KEY)
+        snap = self._snap
+        if (
+            snap is None
+            or snap.version != version
+            or time.monotonic() - snap.built_at > REBUILD_MAX_AGE_SECONDS
+        ):
+            snap = _build_snapshot(version)
+            with self._lock:
+                self._snap = snap
+        return snap
+
+    def candidate_branch_ids(self, location: ResolvedRoutingLocation, *, radius_km: float) -> set[str]:
+        snap = self._ensure_fresh()
+        ids: set[str] = set()
+
+        np = normalize_indian_pincode(location.pincode)
+        if np:
+            ids |= snap.by_pincode.get(np, set())
+        if location.city:
+            ids |= snap.by_city.get(location.city.strip().upper(), set())
+
+        default_allow = snap.branch_ids - snap.branches_with_areas
+        if location.latitude is None or location.longitude is None:
+            return ids | default_allow
+
+        lat, lon = float(location.latitude), float(location.longitude)
+        for cell in geohash_cells_within(lat, lon, radius_km):
+            for key in snap.by_cell.get(cell, ()):
+                if key in default_allow and haversine_km(lat, lon, *snap.coords[key]) <= radius_km:
+                    ids.add(key)
+        ids |= {key for key in default_allow if key not in snap.coords}
+        return ids
+
+
+_index = RoutingSpatialIndex()
+
+
+def spatial_candidate_ids(location: ResolvedRoutingLocation) -> set[str] | None:
+    """Branch ids worth evaluating for ``location``, or ``None`` when the prefilter is off."""
+    if not spatial_prefilter_enabled():
+        return None
+    return _index.candidate_branch_ids(location, radius_km=_radius_km())
+
+
+def clear_spatial_index() -> None:
+    """Test helper: drop the process-local snapshot."""
+    _index.clear()
+
+
+def bump_spatial_index_version() -> None:
+    cache.set(SPATIAL_INDEX_VERSION_CACHE_KEY, uuid.uuid4().hex, None)
@@ -1,9 +1,16 @@
+from django.db import transaction
 from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
 from consultations_core.models import ConsultationDiagnosis, ConsultationSymptom, InvestigationItem
 from diagnostics_engine.models import DiagnosticOrderItem, DiagnosticPackage, DiagnosticPackageItem
 from diagnostics_engine.services.investigation_suggestions.cache import invalidate_encounter_suggestions
+from diagnostics_engine.services.routing.spatial_index import (
+    bump_spatial_index_version,
+    spatial_prefilter_enabled,
+)
+from labs.models.branch_pricing import BranchServiceArea
+from labs.models.lab_auth import LabAddress, LabBranch
 
 
 def _invalidate_for_encounter(encounter_id) -> None:
@@ -51,3 +58,14 @@ def refresh_package_search_text_on_item_change(sender, instance, **kwargs):
     except DiagnosticPackage.DoesNotExist:
         return
     pkg.refresh_search_text()
+
+
+@receiver(post_save, sender=LabBranch)
+@receiver(post_delete, sender=LabBranch)
+@receiver(post_save, sender=LabAddress)
+@receiver(post_delete, sender=LabAddress)
+@receiver(post_save, sender=BranchServiceArea)
+@receiver(post_delete, sender=BranchServiceArea)
+def refresh_routing_spatial_index(sender, instance, **kwargs):
+    if spatial_prefilter_enabled():
+        transaction.on_commit(bump_spatial_index_version)
@@ -0,0 +1,105 @@
+"""
+Caches in front of report artifact storage (REPORT_STORAGE_ACCESS_CACHE_ENABLED).
+
+- PresignedUrlCache: process-local, short-lived presigned GET URLs per
+  (key, disposition, filename, expiry). A URL is reused for at most
+  REPORT_PRESIGNED_URL_CACHE_SECONDS (and never more than half its expiry),
+  so a cached URL always has most of its lifetime left when handed out.
+- ArtifactExistenceCache: shared cache of storage keys known to exist,
+  written after an upload commits, so download paths skip the HEAD request.
+  Report object keys are never overwritten (AWS_S3_FILE_OVERWRITE=False);
+  deletes through ReportStorageService drop the entry.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+EXISTS_CACHE_PREFIX = "report_storage:exists:v1"
+DEFAULT_PRESIGNED_URL_CACHE_SECONDS = 60
+DEFAULT_EXISTS_CACHE_TTL_SECONDS = 24 * 60 * 60
+PRESIGNED_URL_CACHE_MAX_ENTRIES = 2048
+
+
+def storage_access_cache_enabled() -> bool:
+    return bool(getattr(settings, "REPORT_STORAGE_ACCESS_CACHE_ENABLED", False))
+
+
+class PresignedUrlCache:
+    _entries: "OrderedDict[tuple, tuple[float, str]]" = OrderedDict()
+    _lock = threading.Lock()
+
+    @staticmethod
+    def ttl_for(expires_in: int) -> int:
+        configured = int(
+            getattr(settings, "REPORT_PRESIGNED_URL_CACHE_SECONDS", DEFAULT_PRESIGNED_URL_CACHE_SECONDS)
+        )
+        return max(0, min(configured, expires_in // 2))
+
+    @classmethod
+    def get(cls, key: tuple) -> str | None:
+        with cls._lock:
+            entry = cls._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, url = entry
+            if time.monotonic() >= expires_at:
+                del cls._entries[key]
+                return None
+            cls._entries.move_to_end(key)
+            return url
+
+    @classmethod
+    def set(cls, key: tuple, url: str, ttl: int) -> None:
+        if ttl <= 0:
+            return
+        with cls._lock:
+            cls._entries[key] = (time.monotonic() + ttl, url)
+            cls._entries.move_to_end(key)
+            while len(cls._entries) > PRESIGNED_URL_CACHE_MAX_ENTRIES:
+                cls._entries.popitem(last=False)
+
+    @classmethod
+    def forget(cls, storage_key: str) -> None:
+        with cls._lock:
+            for key in [k for k in cls._entries if k[0] == storage_key]:
+                del cls._entries[key]
+
+    @classmethod
+    def clear(cls) -> None:
+        with cls._lock:
+            cls._entries.clear()
+
+
+class ArtifactExistenceCache:
+    @staticmethod
+    def _key(storage_key: str) -> str:
+        digest = hashlib.sha256(storage_key.encode("utf-8")).hexdigest()
+        return f"{EXISTS_CACHE_PREFIX}:{digest}"
+
+    @staticmethod
+    def _ttl() -> int:
+        return int(getattr(settings, "REPORT_STORAGE_EXISTS_CACHE_TTL_SECONDS", DEFAULT_EXISTS_CACHE_TTL_SECONDS))
+
+    @classmethod
+    def known_to_exist(cls, storage_key: str) -> bool:
+        return bool(cache.get(cls._key(storage_key)))
+
+    @classmethod
+    def remember(cls, storage_key: str) -> None:
+        cache.set(cls._key(storage_key), True, cls._ttl())
+
+    @classmethod
+    def remember_on_commit(cls, storage_key: str) -> None:
+        transaction.on_commit(lambda: cls.remember(storage_key))
+
+    @classmethod
+    def forget(cls, storage_key: str) -> None:
+        cache.delete(cls._key(storage_key))
@@ -6,6 +6,10 @@ from typing import Literal
 
 from diagnostics_engine.models.reports import DiagnosticReportArtifact
 from diagnostics_engine.storage.providers import DefaultStorageProvider
+from diagnostics_engine.storage.report_access_cache import (
+    ArtifactExistenceCache,
+    storage_access_cache_enabled,
+)
 from diagnostics_engine.storage.s3_report_storage import (
     generate_presigned_download_url,
 )
@@ -59,7 +63,20 @@ class ReportStorageService:
         path = ReportStorageService.storage_path(artifact)
         if not path:
             return False
-        return ReportStorageService.provider.exists(path)
+        if not storage_access_cache_enabled():
+            return ReportStorageService.provider.exists(path)
+        if ArtifactExistenceCache.known_to_exist(path):
+            return True
+        found = ReportStorageService.provider.exists(path)
+        if found:
+            ArtifactExistenceCache.remember(path)
+        return found
+
+    @staticmethod
+    def remember_stored(storage_key: str | None) -> None:
+        """Record a freshly written object once the upload transaction commits."""
+        if storage_key and storage_access_cache_enabled():
+            ArtifactExistenceCache.remember_on_commit(storage_key)
 
     @staticmethod
     def open_for_read(artifact: DiagnosticReportArtifact):
@@ -0,0 +1,181 @@
+"""
+Local report artifact delivery (used when presigned URLs are unavailable).
+
+- ETag is the artifact checksum; If-None-Match answers 304 without opening
+  the file.
+- Single byte ranges (``Range: bytes=a-b``, honouring If-Range) are served
+  as 206 from a bounded streaming iterator, so PDF viewers fetch the pages
+  they display instead of the whole file. Multiple ranges get the full body.
+- REPORT_STREAM_OFFLOAD hands the transfer to the reverse proxy
+  (X-Accel-Redirect under REPORT_STREAM_ACCEL_REDIRECT_PREFIX, or
+  X-Sendfile with the file path); the proxy then handles ranges itself.
+"""
+
+from __future__ import annotations
+
+import mimetypes
+import re
+from urllib.parse import quote
+
+from django.conf import settings
+from django.http import FileResponse, HttpResponse, StreamingHttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import content_disposition_header
+
+from diagnostics_engine.storage.report_storage import ReportStorageService
+
+STREAM_CHUNK_SIZE = 64 * 1024
+OFFLOAD_ACCEL_REDIRECT = "x-accel-redirect"
+OFFLOAD_SENDFILE = "x-sendfile"
+
+_RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def artifact_etag(artifact) -> str | None:
+    checksum = getattr(artifact, "checksum_sha256", None) or getattr(artifact, "checksum", None)
+    return f'"{checksum}"' if checksum else None
+
+
+def artifact_content_type(artifact, filename: str) -> str:
+    content_type = getattr(artifact, "content_type", None) or ""
+    if not content_type:
+        guessed, _ = mimetypes.guess_type(filename)
+        content_type = guessed or "application/octet-stream"
+    return content_type
+
+
+def parse_byte_range(header: str, size: int) -> tuple[int, int] | None:
+    """
+    Return the inclusive (start, end) of a single satisfiable range, None for
+    a header to ignore (absent, malformed including last < first, multi-range).
+    Raises ValueError when the range cannot be satisfied.
+    """
+    match = _RANGE_RE.match((header or "").strip())
+    if not match:
+        return None
+    first, last = match.groups()
+    if not first and not last:
+        return None
+    if not first:
+        suffix = int(last)
+        if suffix == 0 or size == 0:
+            raise ValueError("unsatisfiable range")
+        return max(0, size - suffix), size - 1
+    start = int(first)
+    if last and int(last) < start:
+        # Syntactically invalid (RFC 9110 14.1.1): ignore the header, serve 200.
+        return None
+    if start >= size:
+        raise ValueError("unsatisfiable range")
+    end = min(int(last), size - 1) if last else size - 1
+    return start, end
+
+
+def _iter_range(file_obj, start: int, length: int):
+    try:
+        file_obj.seek(start)
+        remaining = length
+        while remaining > 0:
+            chunk = file_obj.read(min(STREAM_CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+    finally:
+        file_obj.close()
+
+
+def _offload_mode() -> str:
+    return str(getattr(settings, "REPORT_STREAM_OFFLOAD", "") or "").strip().lower()
+
+
+def _offload_response(artifact, mode: str) -> HttpResponse | None:
+    if mode == OFFLOAD_ACCEL_REDIRECT:
+        prefix = str(getattr(settings, "REPORT_STREAM_ACCEL_REDIRECT_PREFIX", "") or "")
+        name = getattr(artifact.file, "name", None)
+        if not prefix or not name:
+            return None
+        response = HttpResponse()
+        response["X-Accel-Redirect"] = prefix.rstrip("/") + "/" + quote(name.lstrip("/"))
+        return response
+    if mode == OFFLOAD_SENDFILE:
+        try:
+            path = artifact.file.path
+        except (NotImplementedError, ValueError):
+            return None
+        response = HttpResponse()
+        response["X-Sendfile"] = path
+        return response
+    return None
+
+
+def _artifact_size(artifact) -> int:
+    size = getattr(artifact, "file_size", None)
+    if size is None:
+        size = artifact.file.size
+    return int(size)
+
+
+def stream_artifact_response(request, artifact, *, as_attachment: bool) -> HttpResponse:
+    """Serve an artifact's bytes with conditional GET, byte ranges and proxy offload."""
+    if not artifact.file:
+        raise FileNotFoundError("Artifact has no file.")
+    filename = ReportStorageService.download_filename(artifact)
+    content_type = artifact_content_type(artifact, filename)
+    etag = artifact_etag(artifact)
+
+    headers = {"Accept-Ranges": "bytes", "Cache-Control": "private, no-cache"}
+    if etag:
+        headers["ETag"] = etag
+        not_modified = get_conditional_response(request, etag=etag)
+        if not_modified is not None:
+            for key, value in headers.items():
+                not_modified[key] = value
+            return not_modified
+
+    response = _offload_response(artifact, _offload_mode())
+    if response is not None:
+        response["Content-Type"] = content_type
+        response["Content-Disposition"] = content_disposition_header(as_attachment, filename)
+    else:
+        response = _range_response(request, artifact, etag, content_type)
+        if response is None:
+            response = FileResponse(
+                ReportStorageService.open_for_read(artifact),
+                as_attachment=as_attachment,
+                filename=filename,
+                content_type=content_type,
+            )
+        elif response.status_code == 206:
+            response["Content-Disposition"] = content_disposition_header(as_attachment, filename)
+    for key, value in headers.items():
+        response[key] = value
+    return response
+
+
+def _range_response(request, artifact, etag: str | None, content_type: str) -> HttpResponse | None:
+    range_header = request.META.get("HTTP_RANGE")
+    if not range_header:
+        return None
+    if_range = request.META.get("HTTP_IF_RANGE")
+    if if_range and if_range.strip() != etag:
+        return None
+    size = _artifact_size(artifact)
+    try:
+        byte_range = parse_byte_range(range_header, size)
+    except ValueError:
+        response = HttpResponse(status=416)
+        response["Content-Range"] = f"bytes */{size}"
+        return response
+    if byte_range is None:
+        return None
+    start, end = byte_range
+    length = end - start + 1
+    response = StreamingHttpResponse(
+        _iter_range(ReportStorageService.open_for_read(artifact), start, length),
+        status=206,
+        content_type=content_type,
+    )
+    response["Content-Length"] = str(length)
+    response["Content-Range"] = f"bytes {start}-{end}/{size}"
+    return response
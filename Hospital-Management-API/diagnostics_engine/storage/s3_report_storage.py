@@ -3,10 +3,18 @@
 from __future__ import annotations
 
 import logging
+import os
+import threading
 from typing import Any, Literal
 
 from django.conf import settings
 
+from diagnostics_engine.storage.report_access_cache import (
+    ArtifactExistenceCache,
+    PresignedUrlCache,
+    storage_access_cache_enabled,
+)
+
 logger = logging.getLogger("diagnostics.reports")
 
 Disposition = Literal["attachment", "inline"]
@@ -47,14 +55,38 @@ def reports_local_stream_enabled() -> bool:
     return reports_storage_backend() == "local"
 
 
-def _s3_client():
-    import boto3
+_clients: dict[tuple, Any] = {}
+_clients_lock = threading.Lock()
 
-    kwargs: dict[str, Any] = {}
-    region = getattr(settings, "AWS_S3_REGION_NAME", None)
-    if region:
-        kwargs["region_name"] = region
-    return boto3.client("s3", **kwargs)
+
+def _s3_client():
+    """
+    Process-wide S3 client per region. boto3 clients are thread-safe; the
+    session behind them is not, so it is only touched under the lock. Keyed
+    by pid so forked workers build their own connection pool.
+    """
+    region = getattr(settings, "AWS_S3_REGION_NAME", None) or None
+    cache_key = (os.getpid(), region)
+    client = _clients.get(cache_key)
+    if client is not None:
+        return client
+    with _clients_lock:
+        client = _clients.get(cache_key)
+        if client is None:
+            import boto3
+
+            kwargs: dict[str, Any] = {}
+            if region:
+                kwargs["region_name"] = region
+            client = boto3.session.Session().client("s3", **kwargs)
+            _clients[cache_key] = client
+        return client
+
+
+def reset_s3_clients() -> None:
+    """Drop cached clients (credential rotation, tests)."""
+    with _clients_lock:
+        _clients.clear()
 
 
 def generate_presigned_download_url(
@@ -76,6 +108,13 @@ def generate_presigned_download_url(
     expiry = expires_in if expires_in is not None else int(
         getattr(settings, "REPORT_PRESIGNED_URL_EXPIRY_SECONDS", 300)
     )
+    use_cache = storage_access_cache_enabled()
+    url_cache_key = (storage_key, disposition, download_filename or "", expiry)
+    if use_cache:
+        cached = PresignedUrlCache.get(url_cache_key)
+        if cached is not None:
+            return cached
+
     params: dict[str, Any] = {
         "Bucket": settings.AWS_REPORTS_BUCKET,
         "Key": storage_key,
@@ -87,7 +126,7 @@ def generate_presigned_download_url(
         )
 
     try:
-        return _s3_client().generate_presigned_url(
+        url = _s3_client().generate_presigned_url(
             "get_object",
             Params=params,
             ExpiresIn=expiry,
@@ -95,12 +134,18 @@ def generate_presigned_download_url(
     except Exception:
         logger.exception("presigned_url_failed key=%s", storage_key)
         return None
+    if use_cache and url:
+        PresignedUrlCache.set(url_cache_key, url, PresignedUrlCache.ttl_for(expiry))
+    return url
 
 
 def delete_object(storage_key: str) -> bool:
     """Best-effort delete for upload rollback. Returns True if removed or absent."""
     if not storage_key:
         return True
+    if storage_access_cache_enabled():
+        ArtifactExistenceCache.forget(storage_key)
+        PresignedUrlCache.forget(storage_key)
     if reports_s3_enabled():
         try:
             _s3_client().delete_object(
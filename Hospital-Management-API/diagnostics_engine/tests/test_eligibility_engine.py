@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+
+from django.test import TestCase
+from django.utils import timezone
+
+from diagnostics_engine.models import DiagnosticCategory, DiagnosticServiceMaster
+from diagnostics_engine.services.routing.eligibility_engine import (
+    ER_HAS_SERVICE_PRICING,
+    ER_IN_SERVICE_AREA,
+    IR_MISSING_TEST_PRICING,
+    IR_OUTSIDE_SERVICE_AREA,
+    EligibilityEngine,
+)
+from diagnostics_engine.services.routing.routing_helpers import ResolvedRoutingLocation
+from diagnostics_engine.tests.test_routing_service import _branch_with_area_and_org
+from labs.models.branch_pricing import BranchServiceArea, BranchServicePricing
+
+
+def _price(branch, service, amount, valid_from):
+    return BranchServicePricing.objects.create(
+        branch=branch,
+        service=service,
+        selling_price=Decimal(amount),
+        platform_margin_type="flat",
+        platform_margin_value=Decimal("5"),
+        doctor_commission_type="flat",
+        doctor_commission_value=Decimal("2"),
+        valid_from=valid_from,
+    )
+
+
+class SetBasedEligibilityTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cat = DiagnosticCategory.objects.create(name="Cat Elig", code=f"CAT-EL-{uuid.uuid4().hex[:6]}")
+        cls.svc_a = DiagnosticServiceMaster.objects.create(
+            code=f"svc_el_a_{uuid.uuid4().hex[:6]}", name="Elig A", category=cat
+        )
+        cls.svc_b = DiagnosticServiceMaster.objects.create(
+            code=f"svc_el_b_{uuid.uuid4().hex[:6]}", name="Elig B", category=cat
+        )
+        today = timezone.now().date()
+        cls.branches = [_branch_with_area_and_org()[1] for _ in range(3)]
+        for branch in cls.branches:
+            _price(branch, cls.svc_a, "120.00", today - timedelta(days=1))
+            _price(branch, cls.svc_b, "50.00", today - timedelta(days=1))
+        # Second branch misses svc_b; third only serves another pincode (city still matches).
+        BranchServicePricing.objects.filter(branch=cls.branches[1], service=cls.svc_b).update(
+            is_available=False
+        )
+        BranchServiceArea.objects.filter(branch=cls.branches[2]).update(pincode=" 400099 ")
+        cls.location = ResolvedRoutingLocation(
+            source="test",
+            pincode="400001",
+            latitude=None,
+            longitude=None,
+            city="city",
+            confidence="high",
+        )
+
+    def _evaluate(self, branches):
+        return {
+            c.branch.pk: c
+            for c in EligibilityEngine.evaluate_requirements(
+                service_ids=[self.svc_a.id, self.svc_b.id],
+                location=self.location,
+                mode="lab",
+                branches=branches,
+                required_tests_debug=[],
+            )
+        }
+
+    def test_reason_codes_and_pricing(self):
+        out = self._evaluate(self.branches)
+        first, second, third = (out[b.pk] for b in self.branches)
+
+        self.assertEqual(first.ineligibility_reasons, [])
+        self.assertIn(ER_IN_SERVICE_AREA, first.eligibility_reasons)
+        self.assertIn(ER_HAS_SERVICE_PRICING, first.eligibility_reasons)
+        self.assertEqual(first.estimated_price, Decimal("170.00"))
+
+        self.assertEqual(second.ineligibility_reasons, [IR_MISSING_TEST_PRICING])
+        self.assertEqual(second.missing_tests, [{"service_id": str(self.svc_b.id), "code": IR_MISSING_TEST_PRICING}])
+
+        self.assertNotIn(IR_OUTSIDE_SERVICE_AREA, third.ineligibility_reasons)
+
+    def test_matches_single_branch_path(self):
+        bulk = self._evaluate(self.branches)
+        for branch in self.branches:
+            single = self._evaluate([branch])[branch.pk]
+            self.assertEqual(single.eligibility_reasons, bulk[branch.pk].eligibility_reasons)
+            self.assertEqual(single.ineligibility_reasons, bulk[branch.pk].ineligibility_reasons)
+            self.assertEqual(single.estimated_price, bulk[branch.pk].estimated_price)
+
+    def test_query_count_independent_of_branch_count(self):
+        with self.assertNumQueries(2):
+            self._evaluate(self.branches)
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import random
+from decimal import Decimal
+
+from django.test import SimpleTestCase
+
+from diagnostics_engine.services.routing.eligibility_engine import EligibilityCandidate
+from diagnostics_engine.services.routing.ranking_engine import RankingEngine
+from diagnostics_engine.services.routing.scoring_weights import ScoringWeights
+
+PERSISTED = Decimal("0.0001")  # RoutingEvent score columns: decimal_places=4
+
+
+def _candidates(n: int, seed: int) -> list[EligibilityCandidate]:
+    rng = random.Random(seed)
+    out = []
+    for _ in range(n):
+        out.append(
+            EligibilityCandidate(
+                lab=None,
+                branch=None,
+                supports_all_tests=True,
+                supports_home_collection=True,
+                distance_km=None if rng.random() < 0.1 else rng.uniform(0.2, 40.0),
+                estimated_price=Decimal(rng.randrange(9900, 250000)) / 100,
+                estimated_tat_hours=rng.choice([6, 12, 24, 24, 48, None]),
+            )
+        )
+    return out
+
+
+def _normalized(raw) -> list[Decimal]:
+    present = [Decimal(x) for x in raw if x is not None]
+    lo, hi = (min(present), max(present)) if present else (Decimal(0), Decimal(0))
+    out = []
+    for x in raw:
+        if x is None:
+            out.append(Decimal(0))
+        elif hi == lo:
+            out.append(Decimal(1))
+        else:
+            out.append((hi - Decimal(x)) / (hi - lo))
+    return out
+
+
+def _reference_finals(candidates, weights) -> list[Decimal]:
+    """Pre-batch formula in exact Decimal arithmetic, independent of ScoringFunctions."""
+    dist = _normalized([c.distance_km for c in candidates])
+    price = _normalized([c.estimated_price for c in candidates])
+    tat = _normalized([c.estimated_tat_hours for c in candidates])
+    neutral = Decimal("0.5")  # quality / partner have no inputs yet
+    w = {name: Decimal(str(getattr(weights, name))) for name in ("distance", "price", "tat", "quality", "partner")}
+    return [
+        (
+            w["distance"] * dist[i]
+            + w["price"] * price[i]
+            + w["tat"] * tat[i]
+            + (w["quality"] + w["partner"]) * neutral
+        ).quantize(PERSISTED)
+        for i in range(len(candidates))
+    ]
+
+
+class RankingEngineBatchTests(SimpleTestCase):
+    def test_batch_scores_match_reference_at_persisted_precision(self):
+        what_if = ScoringWeights(distance=0.1, price=0.6, tat=0.2, quality=0.05, partner=0.05)
+        for weights in (ScoringWeights(), what_if):
+            for seed in range(20):
+                cands = _candidates(40, seed)
+                expected = dict(zip(map(id, cands), _reference_finals(cands, weights)))
+                ranked = RankingEngine.rank(cands, weights=weights)
+                self.assertEqual(len(ranked), len(cands))
+                for rl in ranked:
+                    # Float vs exact arithmetic may differ by one unit when rounding a tie.
+                    self.assertLessEqual(abs(rl.final_score - expected[id(rl.candidate)]), PERSISTED)
+                finals = [rl.final_score for rl in ranked]
+                self.assertEqual(finals, sorted(finals, reverse=True))
@@ -3,10 +3,15 @@
 from __future__ import annotations
 
 from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
 
-from django.test import SimpleTestCase
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
 
+from diagnostics_engine.storage import s3_report_storage
+from diagnostics_engine.storage.report_access_cache import ArtifactExistenceCache, PresignedUrlCache
 from diagnostics_engine.storage.report_storage import ReportStorageService
+from diagnostics_engine.storage.report_streaming import parse_byte_range
 
 
 class ReportStorageServiceTests(SimpleTestCase):
@@ -36,3 +41,81 @@ class ReportStorageServiceTests(SimpleTestCase):
             file=SimpleNamespace(name="diagnostic-reports/file-only.pdf"),
         )
         self.assertIsNone(ReportStorageService.storage_path(artifact))
+
+
+@override_settings(
+    REPORT_STORAGE_ACCESS_CACHE_ENABLED=True,
+    REPORT_ARTIFACT_STORAGE="s3",
+    AWS_REPORTS_BUCKET="reports-bucket",
+    REPORT_PRESIGNED_URL_CACHE_SECONDS=60,
+)
+class ReportStorageAccessCacheTests(SimpleTestCase):
+    KEY = "diagnostic-reports/active/report.pdf"
+
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        PresignedUrlCache.clear()
+        s3_report_storage.reset_s3_clients()
+
+    def tearDown(self):
+        s3_report_storage.reset_s3_clients()
+        super().tearDown()
+
+    @patch("boto3.session.Session")
+    def test_client_is_built_once_per_process(self, session_cls):
+        first = s3_report_storage._s3_client()
+        second = s3_report_storage._s3_client()
+        self.assertIs(first, second)
+        session_cls.assert_called_once_with()
+
+    @patch("diagnostics_engine.storage.s3_report_storage._s3_client")
+    def test_presigned_url_is_reused_per_key_and_disposition(self, client_factory):
+        client = MagicMock()
+        client.generate_presigned_url.side_effect = ["https://signed/1", "https://signed/2"]
+        client_factory.return_value = client
+
+        sign = s3_report_storage.generate_presigned_download_url
+        self.assertEqual(sign(self.KEY, expires_in=300, download_filename="r.pdf"), "https://signed/1")
+        self.assertEqual(sign(self.KEY, expires_in=300, download_filename="r.pdf"), "https://signed/1")
+        self.assertEqual(
+            sign(self.KEY, expires_in=300, download_filename="r.pdf", disposition="inline"),
+            "https://signed/2",
+        )
+        self.assertEqual(client.generate_presigned_url.call_count, 2)
+
+    def test_short_expiry_urls_are_not_cached_beyond_half_their_life(self):
+        self.assertEqual(PresignedUrlCache.ttl_for(300), 60)
+        self.assertEqual(PresignedUrlCache.ttl_for(30), 15)
+        self.assertEqual(PresignedUrlCache.ttl_for(1), 0)
+
+    def test_remembered_key_skips_provider_exists(self):
+        artifact = SimpleNamespace(storage_key=self.KEY)
+        ArtifactExistenceCache.remember(self.KEY)
+        with patch.object(ReportStorageService.provider.__class__, "exists") as exists:
+            self.assertTrue(ReportStorageService.exists(artifact))
+        exists.assert_not_called()
+
+    @patch("diagnostics_engine.storage.s3_report_storage._s3_client")
+    def test_delete_forgets_existence(self, client_factory):
+        ArtifactExistenceCache.remember(self.KEY)
+        self.assertTrue(s3_report_storage.delete_object(self.KEY))
+        self.assertFalse(ArtifactExistenceCache.known_to_exist(self.KEY))
+
+
+class ParseByteRangeTests(SimpleTestCase):
+    def test_single_ranges(self):
+        self.assertEqual(parse_byte_range("bytes=0-99", 1000), (0, 99))
+        self.assertEqual(parse_byte_range("bytes=900-", 1000), (900, 999))
+        self.assertEqual(parse_byte_range("bytes=-100", 1000), (900, 999))
+        self.assertEqual(parse_byte_range("bytes=500-5000", 1000), (500, 999))
+
+    def test_ignored_headers(self):
+        self.assertIsNone(parse_byte_range("", 1000))
+        self.assertIsNone(parse_byte_range("bytes=0-1,5-6", 1000))
+        self.assertIsNone(parse_byte_range("items=0-1", 1000))
+        self.assertIsNone(parse_byte_range("bytes=5-2", 1000))
+
+    def test_unsatisfiable(self):
+        with self.assertRaises(ValueError):
+            parse_byte_range("bytes=1000-", 1000)
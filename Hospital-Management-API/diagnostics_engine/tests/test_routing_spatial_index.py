@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+from decimal import Decimal
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+
+from diagnostics_engine.services.routing.eligibility_engine import EligibilityEngine
+from diagnostics_engine.services.routing.routing_helpers import ResolvedRoutingLocation
+from diagnostics_engine.services.routing.spatial_index import (
+    clear_spatial_index,
+    geohash_cells_within,
+    geohash_encode,
+    spatial_candidate_ids,
+)
+from diagnostics_engine.tests.test_routing_service import _branch_with_area_and_org
+from labs.models.branch_pricing import BranchServiceArea
+from labs.models.lab_auth import LabAddress
+
+
+class GeohashTests(SimpleTestCase):
+    def test_encode_reference_point(self):
+        self.assertEqual(geohash_encode(57.64911, 10.40744, precision=11), "u4pruydqqvj")
+
+    def test_cells_cover_neighbouring_points(self):
+        cells = geohash_cells_within(19.0760, 72.8777, 50)
+        for lat, lon in ((19.4, 72.8777), (18.75, 73.2), (19.0760, 72.45)):
+            self.assertIn(geohash_encode(lat, lon), cells)
+
+
+@override_settings(DIAGNOSTIC_ROUTING_SPATIAL_PREFILTER=True, DIAGNOSTIC_ROUTING_PREFILTER_RADIUS_KM=50)
+class RoutingSpatialPrefilterTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.area_match = _branch_with_area_and_org()[1]
+        cls.area_other = _branch_with_area_and_org()[1]
+        BranchServiceArea.objects.filter(branch=cls.area_other).update(pincode="560001", city="Bengaluru")
+        cls.near_default = _branch_with_area_and_org()[1]
+        cls.far_default = _branch_with_area_and_org()[1]
+        cls.unplaced_default = _branch_with_area_and_org()[1]
+        BranchServiceArea.objects.filter(
+            branch__in=[cls.near_default, cls.far_default, cls.unplaced_default]
+        ).delete()
+        LabAddress.objects.filter(branch=cls.far_default).update(
+            latitude=Decimal("28.6139"), longitude=Decimal("77.2090")
+        )
+        LabAddress.objects.filter(branch=cls.unplaced_default).update(latitude=None, longitude=None)
+        cls.location = ResolvedRoutingLocation(
+            source="test",
+            pincode="400001",
+            latitude=19.0800,
+            longitude=72.8800,
+            city=None,
+            confidence="high",
+        )
+
+    def setUp(self):
+        cache.clear()
+        clear_spatial_index()
+
+    def tearDown(self):
+        clear_spatial_index()
+
+    def test_candidates_follow_service_area_rules_and_radius(self):
+        ids = spatial_candidate_ids(self.location)
+        self.assertIn(str(self.area_match.pk), ids)
+        self.assertIn(str(self.near_default.pk), ids)
+        self.assertIn(str(self.unplaced_default.pk), ids)
+        self.assertNotIn(str(self.area_other.pk), ids)
+        self.assertNotIn(str(self.far_default.pk), ids)
+
+    def test_disabled_returns_none(self):
+        with self.settings(DIAGNOSTIC_ROUTING_SPATIAL_PREFILTER=False):
+            self.assertIsNone(spatial_candidate_ids(self.location))
+
+    def test_no_eligible_nearby_falls_back_to_full_pool(self):
+        # No pricing anywhere: nothing is eligible, so every routable branch is evaluated.
+        with self.settings(DIAGNOSTIC_ROUTING_SPATIAL_PREFILTER=False):
+            full = EligibilityEngine.evaluate_requirements(
+                service_ids=["00000000-0000-0000-0000-000000000000"],
+                location=self.location,
+                mode="lab",
+                required_tests_debug=[],
+            )
+        got = EligibilityEngine.evaluate_requirements(
+            service_ids=["00000000-0000-0000-0000-000000000000"],
+            location=self.location,
+            mode="lab",
+            required_tests_debug=[],
+        )
+        self.assertEqual({c.branch.pk for c in got}, {c.branch.pk for c in full})
+        self.assertIn(self.far_default.pk, {c.branch.pk for c in got})
@@ -2,16 +2,14 @@
 
 from __future__ import annotations
 
-import mimetypes
-
-from django.http import FileResponse, HttpResponseRedirect
+from django.http import HttpResponseRedirect
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 from rest_framework_simplejwt.authentication import JWTAuthentication
 
-from diagnostics_engine.storage.report_storage import ReportStorageService
+from diagnostics_engine.storage.report_streaming import stream_artifact_response
 from shared.logging import LogModule, logger
 from shared.logging.constants import CORRELATION_ID_HTTP_HEADER
 
@@ -51,22 +49,6 @@ def _correlation_headers(request) -> dict:
     return {}
 
 
-def _stream_artifact_response(artifact, *, as_attachment: bool) -> FileResponse:
-    """Authenticated local/dev fallback when S3 presigned URLs are unavailable."""
-    content = ReportStorageService.open_for_read(artifact)
-    filename = ReportStorageService.download_filename(artifact)
-    content_type = getattr(artifact, "content_type", None) or ""
-    if not content_type:
-        guessed, _ = mimetypes.guess_type(filename)
-        content_type = guessed or "application/octet-stream"
-    return FileResponse(
-        content,
-        as_attachment=as_attachment,
-        filename=filename,
-        content_type=content_type,
-    )
-
-
 class WorkspaceListAPIView(APIView):
     """GET /workspace/ — paginated report browser."""
 
@@ -285,8 +267,9 @@ class WorkspaceReportDownloadAPIView(APIView):
             raise
 
         if result.stream_artifact is not None:
-            response = _stream_artifact_response(
-                result.stream_artifact, as_attachment=True
+            # Authenticated local/dev fallback when S3 presigned URLs are unavailable.
+            response = stream_artifact_response(
+                request, result.stream_artifact, as_attachment=True
             )
         else:
             response = HttpResponseRedirect(result.url)
@@ -358,8 +341,9 @@ class WorkspaceReportPreviewAPIView(APIView):
             )
 
         if result.stream_artifact is not None:
-            response = _stream_artifact_response(
-                result.stream_artifact, as_attachment=False
+            # Authenticated local/dev fallback when S3 presigned URLs are unavailable.
+            response = stream_artifact_response(
+                request, result.stream_artifact, as_attachment=False
             )
         else:
             response = HttpResponseRedirect(result.url)
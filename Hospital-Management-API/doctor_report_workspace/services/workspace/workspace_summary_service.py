@@ -65,7 +65,10 @@ class WorkspaceSummaryService:
             critical=0,
             as_response=True,
         )
-        duration_ms = int((time.perf_counter() - started) * 1000)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        logger.performance(
+            "doctor_report_workspace.summary", duration_ms=elapsed_ms, emit=False
+        )
         logger.info(
             "Workspace summary completed",
             module=LogModule.REPORTS,
@@ -73,7 +76,7 @@ class WorkspaceSummaryService:
             metadata={
                 "reports_ready": reports_ready,
                 "awaiting": awaiting,
-                "duration_ms": duration_ms,
+                "duration_ms": int(elapsed_ms),
             },
         )
         return dto
@@ -104,6 +104,35 @@ class WorkspaceReportPreviewAPITests(APITestCase):
         self.assertTrue(body.startswith(b"%PDF"))
         self.assertNotIn(b"storage_key", body[:200].lower())
 
+    @patch(
+        "doctor_report_workspace.services.workspace.workspace_report_preview_service."
+        "ArtifactAccessService.generate_preview_url",
+        side_effect=ArtifactAccessError("no s3"),
+    )
+    @patch(
+        "doctor_report_workspace.services.workspace.workspace_report_preview_service."
+        "schedule_report_viewed",
+    )
+    @patch(
+        "doctor_report_workspace.services.workspace.workspace_report_preview_service."
+        "reports_local_stream_enabled",
+        return_value=True,
+    )
+    def test_local_stream_serves_byte_ranges_and_etag(self, _local, _audit, _access):
+        DiagnosticReportArtifact.objects.filter(report=self.report).update(checksum_sha256="abc123")
+        self._auth()
+        params = {"clinic_id": str(self.clinic.id)}
+
+        res = self.client.get(self.url, params, HTTP_RANGE="bytes=0-3")
+        self.assertEqual(res.status_code, status.HTTP_206_PARTIAL_CONTENT)
+        self.assertEqual(b"".join(res.streaming_content), b"%PDF")
+        self.assertEqual(res["Content-Range"], f"bytes 0-3/{len(b'%PDF-1.4 test')}")
+        self.assertEqual(res["ETag"], '"abc123"')
+
+        res = self.client.get(self.url, params, HTTP_IF_NONE_MATCH='"abc123"')
+        self.assertEqual(res.status_code, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(res["ETag"], '"abc123"')
+
 
     def test_unsupported_200(self):
         DiagnosticReportArtifact.objects.filter(report=self.report).update(
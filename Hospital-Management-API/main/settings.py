@@ -43,6 +43,17 @@ MARKETPLACE_DISPLAY_MRP_MARKUP_PERCENT = int(os.getenv("MARKETPLACE_DISPLAY_MRP_
 # (is_eligible=False) for support / explainability (full evaluation can be huge).
 DIAGNOSTIC_ROUTING_MAX_REJECT_SNAPSHOTS = int(os.getenv("DIAGNOSTIC_ROUTING_MAX_REJECT_SNAPSHOTS", "50"))
 
+# Evaluate only branches whose service areas match the routing location, plus default-allow
+# branches (no service-area rows) within the radius (diagnostics_engine.services.routing.spatial_index).
+# Falls back to the full pool when nothing nearby is eligible. Off by default.
+DIAGNOSTIC_ROUTING_SPATIAL_PREFILTER = os.getenv("DIAGNOSTIC_ROUTING_SPATIAL_PREFILTER", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+    "on",
+)
+DIAGNOSTIC_ROUTING_PREFILTER_RADIUS_KM = int(os.getenv("DIAGNOSTIC_ROUTING_PREFILTER_RADIUS_KM", "50"))
+
 # Verbose routing pipeline + plain-language patient/test/lab lines on logger
 # ``diagnostics_engine.services.routing``. When you set either env below, settings also attach a
 # StreamHandler so INFO lines appear in the runserver terminal (otherwise only WARNING+ may show).
@@ -72,11 +83,91 @@ INV_SUGGEST_MAX_PER_CATEGORY = int(os.getenv("INV_SUGGEST_MAX_PER_CATEGORY", "3"
 INV_SUGGEST_MAX_PACKAGE_SIZE = int(os.getenv("INV_SUGGEST_MAX_PACKAGE_SIZE", "25"))
 INV_SUGGEST_CACHE_TTL_SECONDS = int(os.getenv("INV_SUGGEST_CACHE_TTL_SECONDS", "120"))
 
+# Medicine type-ahead: serve search from a process-local prefix/trigram index (see
+# medicines.services.search_index). Off by default; the SQL path is used when disabled.
+MEDICINE_SEARCH_INDEX_ENABLED = os.getenv("MEDICINE_SEARCH_INDEX_ENABLED", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+    "on",
+)
+MEDICINE_SEARCH_INDEX_MAX_AGE_SECONDS = int(os.getenv("MEDICINE_SEARCH_INDEX_MAX_AGE_SECONDS", "900"))
+MEDICINE_SEARCH_INDEX_SYNC_INTERVAL_SECONDS = int(
+    os.getenv("MEDICINE_SEARCH_INDEX_SYNC_INTERVAL_SECONDS", "5")
+)
+
+# Medicine suggestions: read doctor / diagnosis / patient / global signals from precomputed
+# vectors in the shared cache (medicines.services.suggestion_vectors). Off by default.
+MEDICINE_SUGGESTION_VECTORS_ENABLED = os.getenv("MEDICINE_SUGGESTION_VECTORS_ENABLED", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+    "on",
+)
+MEDICINE_SUGGESTION_VECTOR_TTL_SECONDS = int(os.getenv("MEDICINE_SUGGESTION_VECTOR_TTL_SECONDS", "86400"))
+
+# End-consultation resolves dose unit / route / frequency tokens from process-local tables
+# (medicines.services.master_lookup); master saves invalidate them via a shared version stamp.
+MEDICINE_MASTER_LOOKUP_MAX_AGE_SECONDS = int(os.getenv("MEDICINE_MASTER_LOOKUP_MAX_AGE_SECONDS", "300"))
+
+# When enabled, Prescription.finalize appends usage deltas to analytics.MedicineUsageOutbox
+# and the analytics.flush_medicine_usage_outbox beat task coalesces them into the usage
+# tables. Off by default: DoctorMedicineUsage / PatientMedicineUsage are updated inline.
+MEDICINE_USAGE_WRITE_BEHIND = os.getenv("MEDICINE_USAGE_WRITE_BEHIND", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+    "on",
+)
+
+# Smart Queue realtime (queue_management.services.queue_realtime): process-wide Redis pool size, and
+# the window within which check-in / skip / complete syncs for one clinic+doctor collapse into a
+# single broadcast (0, the default, syncs inline on every change).
+QUEUE_REALTIME_REDIS_MAX_CONNECTIONS = int(os.getenv("QUEUE_REALTIME_REDIS_MAX_CONNECTIONS", "20"))
+QUEUE_REALTIME_DEBOUNCE_MS = int(os.getenv("QUEUE_REALTIME_DEBOUNCE_MS", "0"))
+# Approximate cap on the per-day SMART_QUEUE_DELTA stream that websocket clients resume from.
+QUEUE_UPDATES_STREAM_MAXLEN = int(os.getenv("QUEUE_UPDATES_STREAM_MAXLEN", "500"))
+# Serve doctor / helpdesk queue GETs from serialized rows kept in Redis by the queue sync
+# (queue_management.services.queue_read_model); entries expire after the max age.
+QUEUE_READ_MODEL_ENABLED = os.getenv("QUEUE_READ_MODEL_ENABLED", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+    "on",
+)
+QUEUE_READ_MODEL_MAX_AGE_SECONDS = int(os.getenv("QUEUE_READ_MODEL_MAX_AGE_SECONDS", "60"))
+
 # Support Investigation API throttling (M5.6)
 SUPPORT_SEARCH_RATE = os.getenv("SUPPORT_SEARCH_RATE", "60/min")
 SUPPORT_LOOKUP_RATE = os.getenv("SUPPORT_LOOKUP_RATE", "120/min")
 SUPPORT_TIMELINE_RATE = os.getenv("SUPPORT_TIMELINE_RATE", "120/min")
 
+# Support timelines: keep merged events per correlation / workflow / booking scope in the
+# shared cache and append only newer audit rows on reload
+# (support_trace.timeline.timeline_cache). Off by default.
+SUPPORT_TRACE_TIMELINE_CACHE_ENABLED = os.getenv(
+    "SUPPORT_TRACE_TIMELINE_CACHE_ENABLED", "false"
+).lower() in (
+    "1",
+    "true",
+    "yes",
+    "on",
+)
+SUPPORT_TRACE_TIMELINE_CACHE_TTL_SECONDS = int(
+    os.getenv("SUPPORT_TRACE_TIMELINE_CACHE_TTL_SECONDS", "900")
+)
+
+# Support Trace projections: run the audit projections of one transaction together
+# after commit and write each workflow once (support_trace.services.projection_buffer).
+SUPPORT_TRACE_COALESCE_PROJECTIONS = os.getenv(
+    "SUPPORT_TRACE_COALESCE_PROJECTIONS", "false"
+).lower() in (
+    "1",
+    "true",
+    "yes",
+    "on",
+)
+
 # Diagnostic report artifact uploads (per-file and batch limits)
 MAX_REPORT_UPLOAD_SIZE_MB = int(os.getenv("MAX_REPORT_UPLOAD_SIZE_MB", "20"))
 MAX_REPORT_BATCH_UPLOAD_SIZE_MB = int(os.getenv("MAX_REPORT_BATCH_UPLOAD_SIZE_MB", "100"))
@@ -97,6 +188,15 @@ AWS_S3_FILE_OVERWRITE = False
 AWS_DEFAULT_ACL = None
 AWS_S3_OBJECT_PARAMETERS = {"ServerSideEncryption": os.getenv("AWS_S3_SSE", "AES256")}
 REPORT_PRESIGNED_URL_EXPIRY_SECONDS = int(os.getenv("REPORT_PRESIGNED_URL_EXPIRY_SECONDS", "300"))
+# Reuse presigned URLs briefly (per process) and remember uploaded keys so downloads skip the S3 HEAD.
+REPORT_STORAGE_ACCESS_CACHE_ENABLED = os.getenv("REPORT_STORAGE_ACCESS_CACHE_ENABLED", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+    "on",
+)
+REPORT_PRESIGNED_URL_CACHE_SECONDS = int(os.getenv("REPORT_PRESIGNED_URL_CACHE_SECONDS", "60"))
+REPORT_STORAGE_EXISTS_CACHE_TTL_SECONDS = int(os.getenv("REPORT_STORAGE_EXISTS_CACHE_TTL_SECONDS", "86400"))
 IDEMPOTENCY_KEY_TTL_HOURS = int(os.getenv("IDEMPOTENCY_KEY_TTL_HOURS", "24"))
 REPORT_DELIVERY_ASYNC = os.getenv("REPORT_DELIVERY_ASYNC", "true").lower() in ("1", "true", "yes", "on")
 
@@ -123,6 +223,11 @@ if _REPORTS_USE_S3_STORAGE and AWS_REPORTS_BUCKET:
         },
     }
 
+# Local report streaming offload: "" (Django streams), "x-accel-redirect" (nginx internal
+# location under REPORT_STREAM_ACCEL_REDIRECT_PREFIX mapped to MEDIA_ROOT), or "x-sendfile".
+REPORT_STREAM_OFFLOAD = os.getenv("REPORT_STREAM_OFFLOAD", "").strip().lower()
+REPORT_STREAM_ACCEL_REDIRECT_PREFIX = os.getenv("REPORT_STREAM_ACCEL_REDIRECT_PREFIX", "/protected-media/")
+
 # Placeholder public report download base (never expose raw S3 URLs in delivery metadata)
 REPORT_PUBLIC_DOWNLOAD_BASE_URL = os.getenv(
     "REPORT_PUBLIC_DOWNLOAD_BASE_URL",
@@ -137,7 +242,33 @@ ENABLE_CONSULTATION_SUMMARY_CACHE = os.getenv("ENABLE_CONSULTATION_SUMMARY_CACHE
     "on",
 )
 CONSULTATION_SUMMARY_CACHE_TTL_SECONDS = int(os.getenv("CONSULTATION_SUMMARY_CACHE_TTL_SECONDS", "900"))
+# Consultation template metadata bundle (consultations_core.services.metadata_bundle).
+# Prebuilt file from `manage.py build_metadata_bundle`; empty = parse templates_metadata/.
+CONSULTATION_METADATA_BUNDLE_PATH = os.getenv("CONSULTATION_METADATA_BUNDLE_PATH", "").strip()
+# How often a worker checks the bundle source for a new version (0 = explicit reload only).
+CONSULTATION_METADATA_RELOAD_INTERVAL_SECONDS = int(
+    os.getenv("CONSULTATION_METADATA_RELOAD_INTERVAL_SECONDS", "30")
+)
 PRESCRIPTION_TIMING_SLOT_MAX = int(os.getenv("PRESCRIPTION_TIMING_SLOT_MAX", "2"))
+# Prescription PDF rendering (consultations_core.services.prescription_pdf_renderer).
+# When enabled, summary-lite PDFs render on a Celery queue and are cached by content hash.
+PRESCRIPTION_PDF_ASYNC_ENABLED = os.getenv("PRESCRIPTION_PDF_ASYNC_ENABLED", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+    "on",
+)
+PRESCRIPTION_PDF_QUEUE = os.getenv("PRESCRIPTION_PDF_QUEUE", "pdf_render").strip() or "pdf_render"
+PRESCRIPTION_PDF_CACHE_TTL_SECONDS = int(os.getenv("PRESCRIPTION_PDF_CACHE_TTL_SECONDS", "3600"))
+# How long background callers (WhatsApp PDF preparation) wait for a queued render.
+PRESCRIPTION_PDF_QUEUE_WAIT_SECONDS = int(os.getenv("PRESCRIPTION_PDF_QUEUE_WAIT_SECONDS", "120"))
+# Render a warm-up PDF in each worker process at start (set on the PDF queue workers only).
+PRESCRIPTION_PDF_WARM_WORKERS = os.getenv("PRESCRIPTION_PDF_WARM_WORKERS", "false").lower() in (
+    "1",
+    "true",
+    "yes",
+    "on",
+)
 
 # WhatsApp prescription delivery (Phase 1)
 WHATSAPP_ACCESS_TOKEN = os.getenv("WHATSAPP_ACCESS_TOKEN", "").strip()
@@ -330,6 +461,7 @@ SWAGGER_SETTINGS = {
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
     'shared.logging.middleware.CorrelationMiddleware',
+    'shared.logging.middleware.RequestTimingMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -480,6 +612,9 @@ CELERY_TASK_ALWAYS_EAGER = os.getenv("CELERY_TASK_ALWAYS_EAGER", "").lower() in
     "on",
 )
 CELERY_TASK_EAGER_PROPAGATES = CELERY_TASK_ALWAYS_EAGER
+CELERY_TASK_ROUTES = {
+    "consultations_core.render_prescription_pdf": {"queue": PRESCRIPTION_PDF_QUEUE},
+}
 
 LAB_ASSIGNMENT_AUTO_REJECT_MINUTES = int(
     os.environ.get("LAB_ASSIGNMENT_AUTO_REJECT_MINUTES", "60"),
@@ -501,6 +636,14 @@ CELERY_BEAT_SCHEDULE = {
         "task": "diagnostics_engine.expire_stale_bookings",
         "schedule": timedelta(minutes=5),
     },
+    "analytics-flush-medicine-usage-outbox": {
+        "task": "analytics.flush_medicine_usage_outbox",
+        "schedule": timedelta(seconds=30),
+    },
+    "medicines-precompute-suggestion-vectors": {
+        "task": "medicines.precompute_suggestion_vectors",
+        "schedule": timedelta(hours=1),
+    },
 }
 
 
@@ -564,6 +707,7 @@ if _routing_journey_console_env:
 from shared.logging.config import LoggingConfig, validate_logging_config
 from shared.logging.constants import Environment, LogLevel
 from shared.logging.factory import set_pending_logging_config
+from shared.logging.sampling import parse_sampling_rules
 
 ENVIRONMENT = os.getenv("ENVIRONMENT", "development").lower()
 
@@ -582,13 +726,46 @@ DOCTORPROCARE_LOGGING_CONFIG = validate_logging_config(
         log_level=LogLevel(os.getenv("LOG_LEVEL", "INFO")),
         handlers=_LOGGING_HANDLER_PRESETS.get(ENVIRONMENT, ("console",)),
         json_pretty=ENVIRONMENT == "development",
+        console_buffered=os.getenv(
+            "LOG_CONSOLE_BUFFERED",
+            "true" if ENVIRONMENT in ("staging", "production") else "false",
+        ).lower()
+        in (
+            "1",
+            "true",
+            "yes",
+            "on",
+        ),
         cloudwatch_log_group=os.getenv("CLOUDWATCH_LOG_GROUP"),
         cloudwatch_region=os.getenv("AWS_REGION", os.getenv("AWS_DEFAULT_REGION")),
         cloudwatch_stream_name=os.getenv("CLOUDWATCH_LOG_STREAM"),
+        cloudwatch_background=os.getenv("CLOUDWATCH_BACKGROUND_SHIPPER", "true").lower()
+        in (
+            "1",
+            "true",
+            "yes",
+            "on",
+        ),
+        cloudwatch_queue_size=int(os.getenv("CLOUDWATCH_QUEUE_SIZE", "10000")),
+        cloudwatch_overflow_policy=os.getenv("CLOUDWATCH_OVERFLOW_POLICY", "drop_oldest"),
+        cloudwatch_spill_path=os.getenv("CLOUDWATCH_SPILL_PATH") or None,
         retention_days=int(os.getenv("LOG_RETENTION_DAYS", "90"))
         if os.getenv("LOG_RETENTION_DAYS")
         else None,
+        sampling_rules=parse_sampling_rules(os.getenv("LOG_SAMPLING_RULES")),
+        # Aggregated latency histograms as CloudWatch EMF records; 0 disables.
+        metrics_flush_interval_sec=float(os.getenv("LOG_METRICS_FLUSH_INTERVAL_SEC", "60"))
+        or None,
+        metrics_namespace=os.getenv("LOG_METRICS_NAMESPACE", "DoctorProCare"),
     )
 )
 
+# JSON dump of the in-process metrics registry at /internal/metrics/ for staff users
+# or callers sending LOG_METRICS_ENDPOINT_TOKEN in the X-Metrics-Token header.
+LOG_METRICS_ENDPOINT_ENABLED = os.getenv(
+    "LOG_METRICS_ENDPOINT_ENABLED",
+    "true" if ENVIRONMENT == "development" else "false",
+).lower() in ("1", "true", "yes", "on")
+LOG_METRICS_ENDPOINT_TOKEN = os.getenv("LOG_METRICS_ENDPOINT_TOKEN", "")
+
 set_pending_logging_config(DOCTORPROCARE_LOGGING_CONFIG)
@@ -28,6 +28,7 @@ CHANNEL_LAYERS = {"default": {"BACKEND": "channels.layers.InMemoryChannelLayer"}
 CELERY_TASK_ALWAYS_EAGER = True
 CELERY_TASK_EAGER_PROPAGATES = True
 REPORT_DELIVERY_ASYNC = True
+QUEUE_REALTIME_DEBOUNCE_MS = 0
 
 ALLOWED_HOSTS = ["*"]
 USE_TZ = True
@@ -17,6 +17,7 @@ from django.contrib import admin
 from django.urls import path, include
 
 from consultations_core.api.views.visit_vitals import VisitVitalsAPIView
+from shared.logging.views import metrics_dump
 from django.conf import settings
 from django.conf.urls.static import static
 
@@ -71,6 +72,7 @@ urlpatterns = [
     path('api/v1/templates/', include('consultations_core.api.template_urls')),
     path('api/v1/visits/', include('consultations_core.api.visit_urls')),
     path('api/v1/support/', include('support_trace.api.urls')),
+    path('internal/metrics/', metrics_dump, name='internal-metrics'),
     #Swagger API
     path('swagger/', schema_view.with_ui('swagger', cache_timeout=0), name='schema-swagger-ui'),
     path('redoc/', schema_view.with_ui('redoc', cache_timeout=0), name='schema-redoc'),
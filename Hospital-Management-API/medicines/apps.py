@@ -4,3 +4,7 @@ from django.apps import AppConfig
 class MedicinesConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'medicines'
+
+    def ready(self):
+        # Keep the search index and suggestion vectors in step with master / usage edits.
+        import medicines.signals  # noqa: F401
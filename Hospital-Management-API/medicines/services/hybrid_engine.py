@@ -15,7 +15,14 @@ from medicines.services.cache import (
 )
 from medicines.services.ranking import MedicineRanker
 from medicines.services.search_engine import search_medicines
+from medicines.services.search_index import get_search_index
 from medicines.services.suggestion_engine import MedicineSuggestionEngine
+from medicines.services.suggestion_vectors import (
+    schedule_vector_refresh,
+    suggestion_vectors_enabled,
+    vectors_ready,
+)
+from shared.logging import logger as platform_logger
 
 logger = logging.getLogger(__name__)
 
@@ -48,6 +55,13 @@ def format_hybrid_result(drug: DrugMaster, source: str, score: float) -> dict[st
 def _hydrate_drugs(drug_ids: set[uuid.UUID]) -> dict[uuid.UUID, DrugMaster]:
     if not drug_ids:
         return {}
+    out: dict[uuid.UUID, DrugMaster] = {}
+    index = get_search_index()
+    if index is not None:
+        out = index.get_drugs(drug_ids)
+        drug_ids = drug_ids - out.keys()
+        if not drug_ids:
+            return out
     qs = (
         DrugMaster.objects.filter(id__in=drug_ids, is_active=True)
         .select_related("formulation")
@@ -59,7 +73,8 @@ def _hydrate_drugs(drug_ids: set[uuid.UUID]) -> dict[uuid.UUID, DrugMaster]:
             "formulation",
         )
     )
-    return {d.id: d for d in qs}
+    out.update({d.id: d for d in qs})
+    return out
 
 
 def _rows_to_cache_entries(rows: list[dict]) -> list[HybridSuggestionEntry]:
@@ -168,6 +183,7 @@ def run_hybrid(
 
         results.sort(key=lambda r: r["score"], reverse=True)
         timing_ms = (time.monotonic() - t0) * 1000.0
+        platform_logger.performance("medicines.hybrid.suggestion", duration_ms=timing_ms, emit=False)
         return {
             "results": results[:cap],
             "meta": {"mode": "suggestion", "timing_ms": round(timing_ms, 2)},
@@ -189,7 +205,20 @@ def run_hybrid(
         if cached is not None:
             return cached
         if time.monotonic() - t0 > DEADLINE_NO_COLD_SUGGEST_S:
-            return []
+            # Warm precomputed vectors make a cold engine run a few cache reads, so they keep
+            # suggestions past the deadline; a vector miss would build inline, so skip it and
+            # warm the missing vectors for the next request instead.
+            if not suggestion_vectors_enabled():
+                return []
+            if not vectors_ready(
+                doctor_id=doctor_id, patient_id=patient_id, diagnosis_ids=diagnosis_ids
+            ):
+                schedule_vector_refresh(
+                    doctor_ids=[doctor_id],
+                    patient_ids=[patient_id] if patient_id else [],
+                    diagnosis_ids=diagnosis_ids,
+                )
+                return []
         engine = MedicineSuggestionEngine(
             doctor_id=doctor_id,
             patient_id=patient_id,
@@ -274,6 +303,7 @@ def run_hybrid(
         results.append(row)
 
     timing_ms = (time.monotonic() - t0) * 1000.0
+    platform_logger.performance(f"medicines.hybrid.{mode}", duration_ms=timing_ms, emit=False)
     return {
         "results": results,
         "meta": {"mode": mode, "timing_ms": round(timing_ms, 2)},
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+"""
+Process-local lookup tables for ``DoseUnitMaster`` / ``RouteMaster`` / ``FrequencyMaster``.
+
+End-consultation resolves every dose unit, route and frequency token in a prescription
+against these tables instead of issuing up to three ORM lookups per token. Each table is
+loaded with one query over the active rows (the catalogs are small) and keyed the same way
+the per-token lookups matched:
+
+  dose unit:  id, then ``name`` (case-insensitive)
+  route:      id, then ``code``, then ``name``
+  frequency:  id, then ``code``, then ``display_name``
+
+Rows are keyed in ``Meta.ordering`` and the first row wins, matching ``.first()``.
+
+Freshness: master saves bump a version stamp in the shared cache on commit; ``tables()``
+reloads when the stamp changes or the tables are older than
+``MEDICINE_MASTER_LOOKUP_MAX_AGE_SECONDS`` (catches queryset ``.update()`` / ``bulk_create``).
+``MasterResolver`` also reloads once per request on a miss, so newly seeded rows are never
+reported as invalid.
+"""
+
+import logging
+import threading
+import time
+import uuid
+from collections.abc import Iterable
+from dataclasses import dataclass
+from functools import reduce
+from operator import or_
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import Q
+
+from medicines.models import DoseUnitMaster, DrugMaster, FrequencyMaster, RouteMaster
+
+logger = logging.getLogger(__name__)
+
+MASTER_LOOKUP_VERSION_CACHE_KEY = "med_master_lookup_version"
+
+
+def _as_uuid_or_none(token: str) -> uuid.UUID | None:
+    try:
+        return uuid.UUID(token)
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
+def _keyed(rows, *attrs: str) -> list[dict]:
+    """One dict per attribute (``id`` kept as UUID, others case-folded); first row wins."""
+    out: list[dict] = [{} for _ in attrs]
+    for row in rows:
+        for i, attr in enumerate(attrs):
+            val = getattr(row, attr)
+            if val is None:
+                continue
+            out[i].setdefault(val if attr == "id" else str(val).upper(), row)
+    return out
+
+
+@dataclass(frozen=True)
+class MasterTables:
+    dose_units: list[dict]
+    routes: list[dict]
+    frequencies: list[dict]
+
+    @staticmethod
+    def _find(maps: list[dict], token: str):
+        token_uuid = _as_uuid_or_none(token)
+        if token_uuid and token_uuid in maps[0]:
+            return maps[0][token_uuid]
+        key = token.upper()
+        for m in maps[1:]:
+            if key in m:
+                return m[key]
+        return None
+
+    def dose_unit(self, token: str) -> DoseUnitMaster | None:
+        return self._find(self.dose_units, token)
+
+    def route(self, token: str) -> RouteMaster | None:
+        return self._find(self.routes, token)
+
+    def frequency(self, token: str) -> FrequencyMaster | None:
+        return self._find(self.frequencies, token)
+
+
+def _load_tables() -> MasterTables:
+    return MasterTables(
+        dose_units=_keyed(DoseUnitMaster.objects.filter(is_active=True), "id", "name"),
+        routes=_keyed(RouteMaster.objects.filter(is_active=True).defer("search_vector"), "id", "code", "name"),
+        frequencies=_keyed(
+            FrequencyMaster.objects.filter(is_active=True).defer("search_vector"),
+            "id",
+            "code",
+            "display_name",
+        ),
+    )
+
+
+class MasterLookup:
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._tables: MasterTables | None = None
+        self._seen_version = None
+        self._loaded_at = 0.0
+
+    def _max_age(self) -> float:
+        return float(getattr(settings, "MEDICINE_MASTER_LOOKUP_MAX_AGE_SECONDS", 300))
+
+    def tables(self) -> MasterTables:
+        version = cache.get(MASTER_LOOKUP_VERSION_CACHE_KEY)
+        tables = self._tables
+        if (
+            tables is None
+            or version != self._seen_version
+            or time.monotonic() - self._loaded_at > self._max_age()
+        ):
+            return self.refresh(version)
+        return tables
+
+    def refresh(self, version=None) -> MasterTables:
+        tables = _load_tables()
+        with self._lock:
+            self._tables = tables
+            self._seen_version = version if version is not None else cache.get(MASTER_LOOKUP_VERSION_CACHE_KEY)
+            self._loaded_at = time.monotonic()
+        return tables
+
+    def clear(self) -> None:
+        with self._lock:
+            self._tables = None
+            self._seen_version = None
+            self._loaded_at = 0.0
+
+    def resolver(self) -> MasterResolver:
+        return MasterResolver(self)
+
+
+class MasterResolver:
+    """Per-request view: tables fetched lazily once, reloaded at most once on a miss."""
+
+    def __init__(self, lookup: MasterLookup) -> None:
+        self._lookup = lookup
+        self._tables: MasterTables | None = None
+        self._refreshed = False
+
+    def _get(self, kind: str, token: str):
+        if self._tables is None:
+            self._tables = self._lookup.tables()
+        hit = getattr(self._tables, kind)(token)
+        if hit is None and not self._refreshed:
+            self._refreshed = True
+            self._tables = self._lookup.refresh()
+            hit = getattr(self._tables, kind)(token)
+        return hit
+
+    def dose_unit(self, token: str) -> DoseUnitMaster | None:
+        return self._get("dose_unit", token)
+
+    def route(self, token: str) -> RouteMaster | None:
+        return self._get("route", token)
+
+    def frequency(self, token: str) -> FrequencyMaster | None:
+        return self._get("frequency", token)
+
+
+def fetch_active_drugs(tokens: Iterable[str]) -> dict[str, DrugMaster]:
+    """
+    Resolve drug tokens (UUID id or ``code``, case-insensitive) in one query.
+    Keys are the stripped tokens as given; unresolved tokens are absent.
+    """
+    tokens = [t for t in dict.fromkeys(str(t).strip() for t in tokens) if t]
+    if not tokens:
+        return {}
+    by_uuid = {t: u for t in tokens if (u := _as_uuid_or_none(t))}
+    codes = [t for t in tokens if t not in by_uuid]
+    cond = [Q(id__in=list(by_uuid.values()))] if by_uuid else []
+    cond += [Q(code__iexact=c) for c in codes]
+    rows = DrugMaster.objects.select_related("formulation").filter(reduce(or_, cond), is_active=True)
+    by_id: dict[uuid.UUID, DrugMaster] = {}
+    by_code: dict[str, DrugMaster] = {}
+    for drug in rows:
+        by_id[drug.id] = drug
+        by_code.setdefault(drug.code.upper(), drug)
+    out: dict[str, DrugMaster] = {}
+    for t in tokens:
+        drug = by_id.get(by_uuid[t]) if t in by_uuid else by_code.get(t.upper())
+        if drug is not None:
+            out[t] = drug
+    return out
+
+
+_lookup = MasterLookup()
+
+
+def get_master_lookup() -> MasterLookup:
+    return _lookup
+
+
+def clear_master_lookup() -> None:
+    """Test helper: drop the process-local tables."""
+    _lookup.clear()
+
+
+def bump_master_lookup_version() -> None:
+    cache.set(MASTER_LOOKUP_VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+
+
+def on_master_saved() -> None:
+    _lookup.clear()
+    bump_master_lookup_version()
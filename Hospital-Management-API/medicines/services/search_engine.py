@@ -6,6 +6,9 @@ Single-query medicine search: combined ILIKE + optional FTS, cap candidates, ran
 Scalability: Candidate rows are always limited to ``MAX_CANDIDATES`` (SQL slice), so work is
 bounded even if ``DrugMaster`` has millions of rows—assuming ``is_active``/``brand_name``/
 ``search_vector`` indexes are present (see ``DrugMaster.Meta.indexes``).
+
+When ``MEDICINE_SEARCH_INDEX_ENABLED`` is on, candidates come from the process-local
+postings in ``medicines.services.search_index`` instead of SQL (same cap, same scoring).
 """
 
 from django.contrib.postgres.search import SearchQuery, SearchRank
@@ -14,6 +17,7 @@ from django.db.models.functions import Coalesce
 
 from medicines.models import DrugMaster
 from medicines.services.ranking import MedicineRanker
+from medicines.services.search_index import get_search_index
 
 MAX_CANDIDATES = 50
 
@@ -39,6 +43,10 @@ def search_medicines(q: str, *, include_fts: bool) -> list[tuple[DrugMaster, flo
     Returns (drug, search_norm) sorted by search_norm descending.
     q must already be strip().lower().
     """
+    index = get_search_index()
+    if index is not None:
+        return _score_candidates(index.candidates(q, include_fts=include_fts, limit=MAX_CANDIDATES), q)
+
     base = DrugMaster.objects.filter(is_active=True).select_related("formulation")
 
     if include_fts:
@@ -84,9 +92,15 @@ def search_medicines(q: str, *, include_fts: bool) -> list[tuple[DrugMaster, flo
             )[:MAX_CANDIDATES]
         )
 
+    return _score_candidates(
+        ((drug, float(getattr(drug, "fts_rank", 0.0) or 0.0)) for drug in qs),
+        q,
+    )
+
+
+def _score_candidates(candidates, q: str) -> list[tuple[DrugMaster, float]]:
     scored: list[tuple[DrugMaster, float]] = []
-    for drug in qs:
-        fts = float(getattr(drug, "fts_rank", 0.0) or 0.0)
+    for drug, fts in candidates:
         raw = _raw_search_score(drug, q, fts)
         scored.append((drug, MedicineRanker.search_norm_from_raw(raw)))
 
@@ -0,0 +1,387 @@
+from __future__ import annotations
+
+"""
+Process-local medicine search index (optional; ``MEDICINE_SEARCH_INDEX_ENABLED``).
+
+Serves ``search_medicines`` without a DB round trip once warm:
+
+  • Brand substring lookups use 1–3 character gram postings over ``brand_name.lower()``.
+    Queries of length <= 3 are an exact postings hit; longer queries scan the shortest
+    trigram posting list and verify with ``q in brand``.
+  • Generic-name lookups (the FTS branch, ``include_fts=True``) use word-prefix postings
+    over ``generic_name`` tokens. This approximates ``SearchQuery`` lexeme matching;
+    matches receive ``APPROX_GENERIC_FTS_RANK`` in place of ``ts_rank``.
+
+Postings hold integer ordinals in ``array("I")``. Ordinals are assigned in ``brand_name``
+order on full build (same order as the SQL path's ``Meta.ordering``), so the first
+``MAX_CANDIDATES`` hits match the SQL ``LIMIT``. Incremental upserts tombstone the old
+ordinal and append a new one; a full rebuild happens once the delta grows past
+``REBUILD_DELTA_THRESHOLD`` or the snapshot exceeds ``MEDICINE_SEARCH_INDEX_MAX_AGE_SECONDS``.
+
+Cross-process freshness: ``DrugMaster`` / ``FormulationMaster`` saves bump a version stamp in
+the shared cache on commit. Each process checks the stamp at most every
+``MEDICINE_SEARCH_INDEX_SYNC_INTERVAL_SECONDS`` and pulls rows with ``updated_at`` past its
+last sync (queryset ``.update()`` / ``bulk_create`` are picked up by the max-age rebuild).
+"""
+
+import logging
+import re
+import threading
+import time
+import uuid
+from array import array
+from dataclasses import dataclass, field
+from datetime import timedelta
+from typing import NamedTuple
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+
+from medicines.models import DrugMaster, FormulationMaster
+
+logger = logging.getLogger(__name__)
+
+SEARCH_INDEX_VERSION_CACHE_KEY = "med_search_index_version"
+MAX_BRAND_GRAM = 3
+MIN_GENERIC_PREFIX = 3
+MAX_GENERIC_PREFIX = 8
+REBUILD_DELTA_THRESHOLD = 500
+APPROX_GENERIC_FTS_RANK = 0.2
+SYNC_CLOCK_SKEW = timedelta(seconds=2)
+
+_WORD_RE = re.compile(r"[0-9a-z]+")
+
+_INDEX_FIELDS = (
+    "id",
+    "brand_name",
+    "strength",
+    "generic_name",
+    "composition",
+    "drug_type",
+    "formulation",
+    "is_common",
+    "is_active",
+)
+
+
+class IndexedDrug(NamedTuple):
+    id: uuid.UUID
+    brand_name: str
+    brand_lower: str
+    strength: str | None
+    generic_name: str | None
+    composition: str | None
+    drug_type: str
+    formulation_id: uuid.UUID | None
+    is_common: bool
+
+
+@dataclass
+class _Snapshot:
+    entries: list[IndexedDrug | None] = field(default_factory=list)
+    ordinal_by_id: dict[uuid.UUID, int] = field(default_factory=dict)
+    brand_postings: dict[str, array] = field(default_factory=dict)
+    generic_postings: dict[str, array] = field(default_factory=dict)
+    formulation_names: dict[uuid.UUID, str] = field(default_factory=dict)
+    base_count: int = 0
+    built_at: float = 0.0
+
+
+def search_index_enabled() -> bool:
+    return bool(getattr(settings, "MEDICINE_SEARCH_INDEX_ENABLED", False))
+
+
+def _brand_grams(brand_lower: str) -> set[str]:
+    grams: set[str] = set()
+    n = len(brand_lower)
+    for size in range(1, MAX_BRAND_GRAM + 1):
+        for i in range(n - size + 1):
+            grams.add(brand_lower[i : i + size])
+    return grams
+
+
+def _generic_prefixes(generic_name: str | None) -> set[str]:
+    keys: set[str] = set()
+    for word in _WORD_RE.findall((generic_name or "").lower()):
+        if len(word) < MIN_GENERIC_PREFIX:
+            keys.add(word)
+            continue
+        for size in range(MIN_GENERIC_PREFIX, min(len(word), MAX_GENERIC_PREFIX) + 1):
+            keys.add(word[:size])
+    return keys
+
+
+def _entry_from_row(row: DrugMaster) -> IndexedDrug:
+    brand = row.brand_name or ""
+    return IndexedDrug(
+        id=row.id,
+        brand_name=brand,
+        brand_lower=brand.lower(),
+        strength=row.strength,
+        generic_name=row.generic_name,
+        composition=row.composition,
+        drug_type=row.drug_type,
+        formulation_id=row.formulation_id,
+        is_common=bool(row.is_common),
+    )
+
+
+def _add_postings(snap: _Snapshot, ordinal: int, entry: IndexedDrug) -> None:
+    for gram in _brand_grams(entry.brand_lower):
+        snap.brand_postings.setdefault(gram, array("I")).append(ordinal)
+    for key in _generic_prefixes(entry.generic_name):
+        snap.generic_postings.setdefault(key, array("I")).append(ordinal)
+
+
+class MedicineSearchIndex:
+    """Compact in-memory postings over active ``DrugMaster`` rows (one instance per process)."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._snap: _Snapshot | None = None
+        self._synced_at = None
+        self._seen_version = None
+        self._next_version_check = 0.0
+
+    # ------------------------------------------------------------------ lifecycle
+
+    def build(self) -> None:
+        """Full rebuild from the DB; swaps the snapshot atomically."""
+        started = time.monotonic()
+        synced_at = timezone.now()
+        version = cache.get(SEARCH_INDEX_VERSION_CACHE_KEY)
+        snap = _Snapshot()
+        snap.formulation_names = {
+            fid: name for fid, name in FormulationMaster.objects.values_list("id", "name")
+        }
+        qs = (
+            DrugMaster.objects.filter(is_active=True)
+            .only(*_INDEX_FIELDS)
+            .order_by("brand_name", "id")
+        )
+        for row in qs.iterator(chunk_size=2000):
+            entry = _entry_from_row(row)
+            ordinal = len(snap.entries)
+            snap.entries.append(entry)
+            snap.ordinal_by_id[entry.id] = ordinal
+            _add_postings(snap, ordinal, entry)
+        snap.base_count = len(snap.entries)
+        snap.built_at = time.monotonic()
+        with self._lock:
+            self._snap = snap
+            self._synced_at = synced_at
+            self._seen_version = version
+        logger.info(
+            "medicine search index built: %s drugs in %.1f ms",
+            snap.base_count,
+            (time.monotonic() - started) * 1000.0,
+        )
+
+    def clear(self) -> None:
+        with self._lock:
+            self._snap = None
+            self._synced_at = None
+            self._seen_version = None
+            self._next_version_check = 0.0
+
+    def upsert(self, drug: DrugMaster) -> None:
+        """Apply one saved row in place (deactivated rows are tombstoned)."""
+        with self._lock:
+            snap = self._snap
+            if snap is None:
+                return
+            self._apply_row(snap, drug)
+
+    def upsert_formulation(self, formulation: FormulationMaster) -> None:
+        with self._lock:
+            if self._snap is not None:
+                self._snap.formulation_names[formulation.id] = formulation.name
+
+    def _apply_row(self, snap: _Snapshot, drug: DrugMaster) -> None:
+        old = snap.ordinal_by_id.pop(drug.id, None)
+        if old is not None:
+            snap.entries[old] = None
+        if not drug.is_active:
+            return
+        entry = _entry_from_row(drug)
+        ordinal = len(snap.entries)
+        snap.entries.append(entry)
+        snap.ordinal_by_id[entry.id] = ordinal
+        _add_postings(snap, ordinal, entry)
+
+    def _ensure_fresh(self) -> _Snapshot:
+        snap = self._snap
+        max_age = float(getattr(settings, "MEDICINE_SEARCH_INDEX_MAX_AGE_SECONDS", 900))
+        if (
+            snap is None
+            or time.monotonic() - snap.built_at > max_age
+            or len(snap.entries) - snap.base_count > REBUILD_DELTA_THRESHOLD
+        ):
+            with self._build_lock:
+                if self._snap is snap:
+                    self.build()
+            return self._snap
+
+        now = time.monotonic()
+        if now < self._next_version_check:
+            return snap
+        self._next_version_check = now + float(
+            getattr(settings, "MEDICINE_SEARCH_INDEX_SYNC_INTERVAL_SECONDS", 5)
+        )
+        version = cache.get(SEARCH_INDEX_VERSION_CACHE_KEY)
+        if version != self._seen_version:
+            self._sync_changed(version)
+        return self._snap
+
+    def _sync_changed(self, version) -> None:
+        synced_at = timezone.now()
+        since = self._synced_at - SYNC_CLOCK_SKEW
+        rows = list(DrugMaster.objects.filter(updated_at__gte=since).only(*_INDEX_FIELDS).order_by())
+        formulations = list(
+            FormulationMaster.objects.filter(updated_at__gte=since).order_by().values_list("id", "name")
+        )
+        with self._lock:
+            snap = self._snap
+            if snap is None:
+                return
+            for fid, name in formulations:
+                snap.formulation_names[fid] = name
+            for row in rows:
+                self._apply_row(snap, row)
+            self._synced_at = synced_at
+            self._seen_version = version
+
+    # ------------------------------------------------------------------ reads
+
+    def _materialize(self, snap: _Snapshot, entry: IndexedDrug) -> DrugMaster:
+        drug = DrugMaster(
+            id=entry.id,
+            brand_name=entry.brand_name,
+            strength=entry.strength,
+            generic_name=entry.generic_name,
+            composition=entry.composition,
+            drug_type=entry.drug_type,
+            is_common=entry.is_common,
+            is_active=True,
+        )
+        if entry.formulation_id is not None:
+            form = FormulationMaster(
+                id=entry.formulation_id,
+                name=snap.formulation_names.get(entry.formulation_id, ""),
+            )
+            form._state.adding = False
+            form._state.db = "default"
+            drug.formulation = form
+        drug._state.adding = False
+        drug._state.db = "default"
+        return drug
+
+    def _brand_hits(self, snap: _Snapshot, q: str) -> array | list[int]:
+        if len(q) <= MAX_BRAND_GRAM:
+            return snap.brand_postings.get(q, ())
+        shortest = None
+        for i in range(len(q) - MAX_BRAND_GRAM + 1):
+            postings = snap.brand_postings.get(q[i : i + MAX_BRAND_GRAM])
+            if not postings:
+                return ()
+            if shortest is None or len(postings) < len(shortest):
+                shortest = postings
+        entries = snap.entries
+        return [o for o in shortest if entries[o] is not None and q in entries[o].brand_lower]
+
+    def _generic_hits(self, snap: _Snapshot, q: str) -> set[int]:
+        words = _WORD_RE.findall(q)
+        if not words:
+            return set()
+        hits: set[int] | None = None
+        for word in words:
+            postings = snap.generic_postings.get(word[:MAX_GENERIC_PREFIX], ())
+            matched = set()
+            for o in postings:
+                entry = snap.entries[o]
+                if entry is None:
+                    continue
+                tokens = _WORD_RE.findall((entry.generic_name or "").lower())
+                if any(t.startswith(word) for t in tokens):
+                    matched.add(o)
+            hits = matched if hits is None else hits & matched
+            if not hits:
+                return set()
+        return hits or set()
+
+    def candidates(self, q: str, *, include_fts: bool, limit: int) -> list[tuple[DrugMaster, float]]:
+        """
+        Returns up to ``limit`` (drug, fts_rank) pairs in brand order, mirroring the SQL path's
+        ``filter(...)[:MAX_CANDIDATES]``. ``fts_rank`` is 0.0 for brand hits.
+        """
+        snap = self._ensure_fresh()
+        entries = snap.entries
+        brand = self._brand_hits(snap, q)
+        generic = self._generic_hits(snap, q) if include_fts else set()
+
+        ordinals: list[int] = []
+        delta: list[int] = []
+        for o in brand:
+            if entries[o] is None:
+                continue
+            if o >= snap.base_count:
+                delta.append(o)
+            elif len(ordinals) < limit:
+                ordinals.append(o)
+        brand_set = set(ordinals) | set(delta)
+        extra = [o for o in generic if o not in brand_set]
+        if extra or delta:
+            merged = ordinals + delta + extra
+            merged.sort(key=lambda o: (entries[o].brand_lower, str(entries[o].id)))
+            ordinals = merged[:limit]
+
+        out: list[tuple[DrugMaster, float]] = []
+        for o in ordinals:
+            entry = entries[o]
+            rank = 0.0 if o in brand_set else APPROX_GENERIC_FTS_RANK
+            out.append((self._materialize(snap, entry), rank))
+        return out
+
+    def get_drugs(self, drug_ids: set[uuid.UUID]) -> dict[uuid.UUID, DrugMaster]:
+        """Hydrate active drugs held by the index; ids it does not know are omitted."""
+        snap = self._ensure_fresh()
+        out: dict[uuid.UUID, DrugMaster] = {}
+        for did in drug_ids:
+            o = snap.ordinal_by_id.get(did)
+            if o is None:
+                continue
+            entry = snap.entries[o]
+            if entry is not None:
+                out[did] = self._materialize(snap, entry)
+        return out
+
+
+_index = MedicineSearchIndex()
+
+
+def get_search_index() -> MedicineSearchIndex | None:
+    """The process-wide index when enabled, else ``None`` (callers fall back to SQL)."""
+    if not search_index_enabled():
+        return None
+    return _index
+
+
+def clear_search_index() -> None:
+    """Test helper: drop the process-local snapshot."""
+    _index.clear()
+
+
+def bump_search_index_version() -> None:
+    cache.set(SEARCH_INDEX_VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+
+
+def on_drug_saved(drug: DrugMaster) -> None:
+    _index.upsert(drug)
+    bump_search_index_version()
+
+
+def on_formulation_saved(formulation: FormulationMaster) -> None:
+    _index.upsert_formulation(formulation)
+    bump_search_index_version()
@@ -16,6 +16,11 @@ Grouping:
   • quick_suggestions: first min(5, limit) rows from that sorted list (not per-bucket).
   • Secondary buckets: dominant_signal (argmax) matches; each drug appears at most once
     across all buckets; total distinct drug ids in the response never exceeds self.limit.
+
+Precomputed vectors (``medicines.services.suggestion_vectors``):
+  • When ``MEDICINE_SUGGESTION_VECTORS_ENABLED`` is on, each signal is read from its cached
+    vector instead of queried; a miss builds that one vector (same query) and stores it, so
+    only the first request per doctor / diagnosis / patient per TTL pays for it.
 """
 
 import uuid
@@ -26,6 +31,21 @@ from typing import Any
 from analytics.models import DiagnosisMedicineMap, DoctorMedicineUsage, PatientMedicineUsage
 from medicines.models import DrugMaster
 from medicines.services.ranking import MedicineRanker
+from medicines.services.suggestion_vectors import (
+    DOCTOR_FETCH_CAP,
+    GLOBAL_FETCH_CAP,
+    PATIENT_FETCH_CAP,
+    VectorEntry,
+    build_diagnosis_vectors,
+    build_doctor_vectors,
+    build_global_vector,
+    build_patient_vectors,
+    get_diagnosis_vectors,
+    get_vector,
+    parse_last_used,
+    store_vectors,
+    suggestion_vectors_enabled,
+)
 
 # TODO: AI-based ranking
 # TODO: seasonal trends
@@ -34,9 +54,6 @@ from medicines.services.ranking import MedicineRanker
 # TODO: When DrugMaster is huge, set True to limit global candidate scan to is_common rows.
 GLOBAL_RESTRICT_TO_COMMON = False
 
-DOCTOR_FETCH_CAP = 20
-PATIENT_FETCH_CAP = 20
-GLOBAL_FETCH_CAP = 50
 FALLBACK_GLOBAL_CAP = 10
 QUICK_VISIBLE_CAP = 5
 BUCKET_CAP = 3
@@ -63,6 +80,7 @@ class MedicineSuggestionEngine:
         self._doctor_last_used: dict[uuid.UUID, datetime | None] = {}
         self._patient_last_used: dict[uuid.UUID, datetime | None] = {}
         self._drug_by_id: dict[uuid.UUID, DrugMaster] = {}
+        self._use_vectors = suggestion_vectors_enabled()
 
     def run_ranked_rows(self) -> list[dict[str, Any]]:
         merged = self._collect_signal_scores()
@@ -109,6 +127,9 @@ class MedicineSuggestionEngine:
 
     def _fallback_global_only_scores(self) -> dict[uuid.UUID, dict[str, float]]:
         scores: dict[uuid.UUID, dict[str, float]] = self._new_scores_dict()
+        if self._use_vectors:
+            self._apply_global_vector(scores, FALLBACK_GLOBAL_CAP)
+            return scores
         drugs = list(self._global_drugs_query()[:FALLBACK_GLOBAL_CAP])
         self._apply_global_norms_for_drugs(scores, drugs)
         return scores
@@ -127,7 +148,60 @@ class MedicineSuggestionEngine:
             prev = scores[d.id]["global"]
             scores[d.id]["global"] = max(prev, norms[i])
 
+    # ------------------------------------------------------------------ precomputed vectors
+
+    def _usage_vector(self, kind: str, owner_id, builder) -> list[VectorEntry]:
+        vec = get_vector(kind, owner_id)
+        if vec is None:
+            vec = builder([owner_id]).get(str(owner_id), [])
+            store_vectors(kind, {str(owner_id): vec})
+        return vec
+
+    def _apply_usage_vector(
+        self,
+        scores: dict[uuid.UUID, dict[str, float]],
+        kind: str,
+        vec: list[VectorEntry],
+        last_used: dict[uuid.UUID, datetime | None],
+    ) -> None:
+        for drug_id, norm, used_at in vec:
+            did = uuid.UUID(drug_id)
+            scores[did][kind] = float(norm)
+            last_used[did] = parse_last_used(used_at)
+
+    def _apply_diagnosis_vectors(self, scores: dict[uuid.UUID, dict[str, float]]) -> None:
+        vectors = get_diagnosis_vectors(self.diagnosis_ids)
+        if vectors is None:
+            vectors = build_diagnosis_vectors(self.diagnosis_ids)
+            store_vectors("diagnosis", vectors)
+        best_weight: dict[uuid.UUID, float] = defaultdict(float)
+        for vec in vectors.values():
+            for drug_id, w, _ in vec:
+                did = uuid.UUID(drug_id)
+                best_weight[did] = max(best_weight[did], float(w))
+        if not best_weight:
+            return
+        mx = max(best_weight.values())
+        for drug_id, w in best_weight.items():
+            scores[drug_id]["diagnosis"] = (w / mx) if mx > 0 else 0.0
+
+    def _apply_global_vector(self, scores: dict[uuid.UUID, dict[str, float]], cap: int) -> None:
+        vec = get_vector("global")
+        if vec is None:
+            vec = build_global_vector(restrict_to_common=GLOBAL_RESTRICT_TO_COMMON)
+            store_vectors("global", {None: vec})
+        ids = [uuid.UUID(drug_id) for drug_id, _, _ in vec[:cap]]
+        norms = MedicineRanker.normalize_rank_desc(len(ids))
+        for i, did in enumerate(ids):
+            scores[did]["global"] = max(scores[did]["global"], norms[i])
+
+    # ------------------------------------------------------------------ live signals
+
     def _apply_doctor_signal(self, scores: dict[uuid.UUID, dict[str, float]]) -> None:
+        if self._use_vectors:
+            vec = self._usage_vector("doctor", self.doctor_id, build_doctor_vectors)
+            self._apply_usage_vector(scores, "doctor", vec, self._doctor_last_used)
+            return
         # deleted_at: all analytics usage/map models in this project define deleted_at — exclude soft-deleted rows.
         qs = (
             DoctorMedicineUsage.objects.filter(
@@ -150,6 +224,9 @@ class MedicineSuggestionEngine:
     def _apply_diagnosis_signal(self, scores: dict[uuid.UUID, dict[str, float]]) -> None:
         if not self.diagnosis_ids:
             return
+        if self._use_vectors:
+            self._apply_diagnosis_vectors(scores)
+            return
         qs = (
             DiagnosisMedicineMap.objects.filter(
                 diagnosis_id__in=self.diagnosis_ids,
@@ -174,6 +251,10 @@ class MedicineSuggestionEngine:
     def _apply_patient_signal(self, scores: dict[uuid.UUID, dict[str, float]]) -> None:
         if not self.patient_id:
             return
+        if self._use_vectors:
+            vec = self._usage_vector("patient", self.patient_id, build_patient_vectors)
+            self._apply_usage_vector(scores, "patient", vec, self._patient_last_used)
+            return
         qs = (
             PatientMedicineUsage.objects.filter(
                 patient_id=self.patient_id,
@@ -193,6 +274,9 @@ class MedicineSuggestionEngine:
                     self._drug_by_id[r.drug_id] = r.drug
 
     def _apply_global_signal(self, scores: dict[uuid.UUID, dict[str, float]]) -> None:
+        if self._use_vectors:
+            self._apply_global_vector(scores, GLOBAL_FETCH_CAP)
+            return
         drugs = list(self._global_drugs_query()[:GLOBAL_FETCH_CAP])
         self._apply_global_norms_for_drugs(scores, drugs)
 
@@ -0,0 +1,239 @@
+from __future__ import annotations
+
+"""
+Precomputed suggestion signal vectors (optional; ``MEDICINE_SUGGESTION_VECTORS_ENABLED``).
+
+``MedicineSuggestionEngine`` reads these instead of running its per-signal queries:
+
+  doctor:    top ``DOCTOR_FETCH_CAP`` rows by usage, already normalized by max
+  patient:   top ``PATIENT_FETCH_CAP`` rows by usage, already normalized by max
+  diagnosis: top ``DIAGNOSIS_VECTOR_CAP`` raw weights (normalized at merge time, because the
+             max spans every diagnosis on the consultation)
+  global:    ordered drug ids of the global candidate list (``GLOBAL_FETCH_CAP``)
+
+Vectors are compact JSON lists in the shared cache. ``precompute_all_vectors`` (Celery beat)
+rebuilds everything with one windowed query per signal; ``refresh_vectors`` recomputes only
+the doctors / patients / diagnoses whose usage changed. A missing vector means "not
+precomputed" and the engine falls back to its live query for that signal.
+"""
+
+import logging
+import uuid
+from collections import defaultdict
+from collections.abc import Iterable
+from datetime import datetime
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models import F, Window
+from django.db.models.functions import RowNumber
+
+from analytics.models import DiagnosisMedicineMap, DoctorMedicineUsage, PatientMedicineUsage
+from medicines.models import DrugMaster
+from medicines.services.ranking import MedicineRanker
+
+logger = logging.getLogger(__name__)
+
+VECTOR_CACHE_PREFIX = "med_vec_v1"
+DOCTOR_FETCH_CAP = 20
+PATIENT_FETCH_CAP = 20
+GLOBAL_FETCH_CAP = 50
+DIAGNOSIS_VECTOR_CAP = 50
+PRECOMPUTE_CHUNK_SIZE = 500
+
+# (drug_id, score, last_used_at ISO or None)
+VectorEntry = list[Any]
+
+
+def suggestion_vectors_enabled() -> bool:
+    return bool(getattr(settings, "MEDICINE_SUGGESTION_VECTORS_ENABLED", False))
+
+
+def _ttl_seconds() -> int:
+    return int(getattr(settings, "MEDICINE_SUGGESTION_VECTOR_TTL_SECONDS", 24 * 60 * 60))
+
+
+def vector_cache_key(kind: str, key: uuid.UUID | str | None = None) -> str:
+    if key is None:
+        return f"{VECTOR_CACHE_PREFIX}:{kind}"
+    return f"{VECTOR_CACHE_PREFIX}:{kind}:{key}"
+
+
+def _iso(dt: datetime | None) -> str | None:
+    return dt.isoformat() if dt else None
+
+
+def parse_last_used(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
+
+
+# ---------------------------------------------------------------------- reads
+
+
+def get_vector(kind: str, key: uuid.UUID | str | None = None) -> list[VectorEntry] | None:
+    val = cache.get(vector_cache_key(kind, key))
+    return val if isinstance(val, list) else None
+
+
+def get_diagnosis_vectors(diagnosis_ids: Iterable[uuid.UUID | str]) -> dict[str, list[VectorEntry]] | None:
+    """All-or-nothing: ``None`` unless every diagnosis has a precomputed vector."""
+    ids = [str(d) for d in diagnosis_ids]
+    if not ids:
+        return {}
+    keys = {vector_cache_key("diagnosis", d): d for d in ids}
+    found = cache.get_many(list(keys))
+    if len(found) != len(keys):
+        return None
+    return {keys[k]: v for k, v in found.items()}
+
+
+def vectors_ready(
+    *,
+    doctor_id: uuid.UUID | str,
+    patient_id: uuid.UUID | str | None,
+    diagnosis_ids: Iterable[uuid.UUID | str],
+) -> bool:
+    """True when every vector a suggestion run needs is precomputed (no inline build)."""
+    keys = [vector_cache_key("doctor", doctor_id), vector_cache_key("global")]
+    if patient_id:
+        keys.append(vector_cache_key("patient", patient_id))
+    keys.extend(vector_cache_key("diagnosis", d) for d in diagnosis_ids)
+    return len(cache.get_many(keys)) == len(keys)
+
+
+# ---------------------------------------------------------------------- builders
+
+
+def _usage_vectors(model, owner_field: str, owner_ids: list, cap: int) -> dict[str, list[VectorEntry]]:
+    """Top-``cap`` usage rows per owner in one windowed query, normalized by per-owner max."""
+    rows = (
+        model.objects.filter(**{f"{owner_field}__in": owner_ids}, deleted_at__isnull=True)
+        .annotate(
+            _rank=Window(
+                expression=RowNumber(),
+                partition_by=[F(owner_field)],
+                order_by=[F("usage_count").desc(), F("last_used_at").desc()],
+            )
+        )
+        .filter(_rank__lte=cap)
+        .values_list(owner_field, "drug_id", "usage_count", "last_used_at", "_rank")
+        .order_by(owner_field, "_rank")
+    )
+    grouped: dict[str, list[tuple]] = defaultdict(list)
+    for owner, drug_id, count, last_used, _ in rows:
+        grouped[str(owner)].append((drug_id, float(count or 0), last_used))
+
+    out: dict[str, list[VectorEntry]] = {str(o): [] for o in owner_ids}
+    for owner, items in grouped.items():
+        norms = MedicineRanker.normalize_by_max([c for _, c, _ in items])
+        out[owner] = [[str(d), norms[i], _iso(t)] for i, (d, _, t) in enumerate(items)]
+    return out
+
+
+def build_doctor_vectors(doctor_ids: list) -> dict[str, list[VectorEntry]]:
+    return _usage_vectors(DoctorMedicineUsage, "doctor_id", doctor_ids, DOCTOR_FETCH_CAP)
+
+
+def build_patient_vectors(patient_ids: list) -> dict[str, list[VectorEntry]]:
+    return _usage_vectors(PatientMedicineUsage, "patient_id", patient_ids, PATIENT_FETCH_CAP)
+
+
+def build_diagnosis_vectors(diagnosis_ids: list) -> dict[str, list[VectorEntry]]:
+    best: dict[str, dict[str, float]] = {str(d): {} for d in diagnosis_ids}
+    rows = DiagnosisMedicineMap.objects.filter(
+        diagnosis_id__in=diagnosis_ids,
+        deleted_at__isnull=True,
+    ).values_list("diagnosis_id", "drug_id", "weight")
+    for diagnosis_id, drug_id, weight in rows:
+        per_dx = best[str(diagnosis_id)]
+        key = str(drug_id)
+        per_dx[key] = max(float(weight or 0.0), per_dx.get(key, 0.0))
+    out: dict[str, list[VectorEntry]] = {}
+    for diagnosis_id, weights in best.items():
+        top = sorted(weights.items(), key=lambda kv: kv[1], reverse=True)[:DIAGNOSIS_VECTOR_CAP]
+        out[diagnosis_id] = [[drug_id, w, None] for drug_id, w in top]
+    return out
+
+
+def build_global_vector(*, restrict_to_common: bool = False) -> list[VectorEntry]:
+    qs = DrugMaster.objects.filter(is_active=True).order_by("-is_common", "brand_name")
+    if restrict_to_common:
+        qs = qs.filter(is_common=True)
+    return [[str(d), 0.0, None] for d in qs.values_list("id", flat=True)[:GLOBAL_FETCH_CAP]]
+
+
+# ---------------------------------------------------------------------- writes
+
+
+def store_vectors(kind: str, vectors: dict[str | None, list[VectorEntry]]) -> None:
+    if vectors:
+        cache.set_many({vector_cache_key(kind, k): v for k, v in vectors.items()}, _ttl_seconds())
+
+
+def _chunks(ids: list, size: int = PRECOMPUTE_CHUNK_SIZE):
+    for i in range(0, len(ids), size):
+        yield ids[i : i + size]
+
+
+def refresh_vectors(
+    *,
+    doctor_ids: Iterable = (),
+    patient_ids: Iterable = (),
+    diagnosis_ids: Iterable = (),
+) -> None:
+    """Incremental refresh for owners whose usage / mapping rows changed."""
+    for chunk in _chunks(list(dict.fromkeys(doctor_ids))):
+        store_vectors("doctor", build_doctor_vectors(chunk))
+    for chunk in _chunks(list(dict.fromkeys(patient_ids))):
+        store_vectors("patient", build_patient_vectors(chunk))
+    for chunk in _chunks(list(dict.fromkeys(diagnosis_ids))):
+        store_vectors("diagnosis", build_diagnosis_vectors(chunk))
+
+
+def precompute_all_vectors(*, restrict_global_to_common: bool = False) -> dict[str, int]:
+    """Full batch stage: every doctor and diagnosis with live rows, plus the global list."""
+    doctor_ids = list(
+        DoctorMedicineUsage.objects.filter(deleted_at__isnull=True)
+        .order_by()
+        .values_list("doctor_id", flat=True)
+        .distinct()
+    )
+    diagnosis_ids = list(
+        DiagnosisMedicineMap.objects.filter(deleted_at__isnull=True)
+        .order_by()
+        .values_list("diagnosis_id", flat=True)
+        .distinct()
+    )
+    refresh_vectors(doctor_ids=doctor_ids, diagnosis_ids=diagnosis_ids)
+    store_vectors("global", {None: build_global_vector(restrict_to_common=restrict_global_to_common)})
+    return {"doctors": len(doctor_ids), "diagnoses": len(diagnosis_ids)}
+
+
+def schedule_vector_refresh(
+    *,
+    doctor_ids: Iterable = (),
+    patient_ids: Iterable = (),
+    diagnosis_ids: Iterable = (),
+) -> None:
+    """Enqueue an incremental refresh after the surrounding transaction commits."""
+    if not suggestion_vectors_enabled():
+        return
+    payload = {
+        "doctor_ids": [str(i) for i in doctor_ids],
+        "patient_ids": [str(i) for i in patient_ids],
+        "diagnosis_ids": [str(i) for i in diagnosis_ids],
+    }
+    if not any(payload.values()):
+        return
+
+    def _enqueue():
+        from medicines.tasks import refresh_medicine_suggestion_vectors
+
+        try:
+            refresh_medicine_suggestion_vectors.delay(**payload)
+        except Exception:
+            logger.exception("suggestion vector refresh enqueue failed")
+
+    transaction.on_commit(_enqueue)
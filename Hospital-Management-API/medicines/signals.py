@@ -0,0 +1,34 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from analytics.models import DiagnosisMedicineMap
+from medicines.models import DoseUnitMaster, DrugMaster, FormulationMaster, FrequencyMaster, RouteMaster
+from medicines.services.master_lookup import on_master_saved
+from medicines.services.search_index import on_drug_saved, on_formulation_saved, search_index_enabled
+from medicines.services.suggestion_vectors import schedule_vector_refresh
+
+
+@receiver(post_save, sender=DrugMaster)
+def refresh_search_index_on_drug_save(sender, instance, **kwargs):
+    if search_index_enabled():
+        transaction.on_commit(lambda: on_drug_saved(instance))
+
+
+@receiver(post_save, sender=FormulationMaster)
+def refresh_search_index_on_formulation_save(sender, instance, **kwargs):
+    if search_index_enabled():
+        transaction.on_commit(lambda: on_formulation_saved(instance))
+
+
+@receiver(post_save, sender=DoseUnitMaster)
+@receiver(post_save, sender=RouteMaster)
+@receiver(post_save, sender=FrequencyMaster)
+def refresh_master_lookup_on_save(sender, instance, **kwargs):
+    transaction.on_commit(on_master_saved)
+
+
+@receiver(post_save, sender=DiagnosisMedicineMap)
+@receiver(post_delete, sender=DiagnosisMedicineMap)
+def refresh_suggestion_vectors_on_diagnosis_map_change(sender, instance, **kwargs):
+    schedule_vector_refresh(diagnosis_ids=[instance.diagnosis_id])
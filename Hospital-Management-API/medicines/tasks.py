@@ -0,0 +1,29 @@
+from celery import shared_task
+
+from medicines.services.suggestion_vectors import (
+    precompute_all_vectors,
+    refresh_vectors,
+    suggestion_vectors_enabled,
+)
+
+
+@shared_task(name="medicines.precompute_suggestion_vectors")
+def precompute_medicine_suggestion_vectors() -> dict:
+    """Batch stage: rebuild every doctor / diagnosis vector and the global list."""
+    if not suggestion_vectors_enabled():
+        return {}
+    return precompute_all_vectors()
+
+
+@shared_task(name="medicines.refresh_suggestion_vectors")
+def refresh_medicine_suggestion_vectors(
+    *,
+    doctor_ids: list[str] | None = None,
+    patient_ids: list[str] | None = None,
+    diagnosis_ids: list[str] | None = None,
+) -> None:
+    refresh_vectors(
+        doctor_ids=doctor_ids or (),
+        patient_ids=patient_ids or (),
+        diagnosis_ids=diagnosis_ids or (),
+    )
@@ -0,0 +1,67 @@
+from django.core.cache import cache
+from django.test import TestCase
+
+from medicines.models import DoseUnitMaster, DrugMaster, FormulationMaster, FrequencyMaster, RouteMaster
+from medicines.services.master_lookup import (
+    clear_master_lookup,
+    fetch_active_drugs,
+    get_master_lookup,
+)
+
+
+class MasterLookupTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.unit = DoseUnitMaster.objects.create(name="lkp-ml")
+        cls.route = RouteMaster.objects.bulk_create([RouteMaster(code="LKP-PO", name="lkp oral")])[0]
+        cls.freq = FrequencyMaster.objects.bulk_create(
+            [FrequencyMaster(code="LKP-BD", display_name="Lkp Twice Daily")]
+        )[0]
+        form = FormulationMaster.objects.create(name="lkp-tab")
+        cls.drug = DrugMaster.objects.create(code="LKP-1", brand_name="Lkpdrug", formulation=form)
+        cls.inactive_drug = DrugMaster.objects.create(
+            code="LKP-2", brand_name="Lkpgone", formulation=form, is_active=False
+        )
+
+    def setUp(self):
+        cache.clear()
+        clear_master_lookup()
+
+    def tearDown(self):
+        clear_master_lookup()
+
+    def test_resolves_by_id_code_and_name_case_insensitively(self):
+        masters = get_master_lookup().resolver()
+        self.assertEqual(masters.dose_unit(str(self.unit.id)), self.unit)
+        self.assertEqual(masters.dose_unit("LKP-ML"), self.unit)
+        self.assertEqual(masters.route("lkp-po"), self.route)
+        self.assertEqual(masters.route("Lkp Oral"), self.route)
+        self.assertEqual(masters.frequency("lkp-bd"), self.freq)
+        self.assertEqual(masters.frequency("lkp twice daily"), self.freq)
+        self.assertIsNone(masters.frequency("nope"))
+
+    def test_warm_tables_resolve_without_queries(self):
+        get_master_lookup().tables()
+        masters = get_master_lookup().resolver()
+        with self.assertNumQueries(0):
+            masters.dose_unit("lkp-ml")
+            masters.route("LKP-PO")
+            masters.frequency("LKP-BD")
+
+    def test_master_save_invalidates_tables(self):
+        get_master_lookup().tables()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.unit.is_active = False
+            self.unit.save()
+        self.assertIsNone(get_master_lookup().tables().dose_unit("lkp-ml"))
+
+    def test_miss_reloads_once_for_new_rows(self):
+        get_master_lookup().tables()
+        unit = DoseUnitMaster.objects.create(name="lkp-drops")
+        self.assertEqual(get_master_lookup().resolver().dose_unit("lkp-drops"), unit)
+
+    def test_fetch_active_drugs_in_one_query(self):
+        with self.assertNumQueries(1):
+            drugs = fetch_active_drugs([str(self.drug.id), " lkp-1 ", "LKP-2", "missing"])
+        self.assertEqual(drugs, {str(self.drug.id): self.drug, "lkp-1": self.drug})
+        self.assertEqual(drugs["lkp-1"].formulation.name, "lkp-tab")
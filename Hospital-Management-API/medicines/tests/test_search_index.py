@@ -0,0 +1,94 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from medicines.models import DrugMaster, FormulationMaster
+from medicines.services.search_engine import MAX_CANDIDATES, search_medicines
+from medicines.services.search_index import clear_search_index, get_search_index
+
+
+@override_settings(MEDICINE_SEARCH_INDEX_ENABLED=True)
+class MedicineSearchIndexTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.form = FormulationMaster.objects.create(name="idx-tab")
+        cls.para = DrugMaster.objects.create(
+            code="IDX1",
+            brand_name="Idxparacet",
+            generic_name="Paracetamol",
+            formulation=cls.form,
+            is_common=True,
+        )
+        cls.amox = DrugMaster.objects.create(
+            code="IDX2",
+            brand_name="Idxmox",
+            generic_name="Amoxicillin",
+            formulation=cls.form,
+        )
+        cls.inactive = DrugMaster.objects.create(
+            code="IDX3",
+            brand_name="Idxgone",
+            formulation=cls.form,
+            is_active=False,
+        )
+
+    def setUp(self):
+        cache.clear()
+        clear_search_index()
+
+    def tearDown(self):
+        clear_search_index()
+
+    def _ids(self, hits):
+        return [d.id for d, _ in hits]
+
+    def test_disabled_by_default(self):
+        with self.settings(MEDICINE_SEARCH_INDEX_ENABLED=False):
+            self.assertIsNone(get_search_index())
+
+    def test_matches_sql_path_for_brand_queries(self):
+        for q in ("i", "id", "idx", "idxpara", "mox"):
+            with self.settings(MEDICINE_SEARCH_INDEX_ENABLED=False):
+                expected = search_medicines(q, include_fts=False)
+            got = search_medicines(q, include_fts=False)
+            self.assertEqual(
+                sorted((d.id, s) for d, s in got),
+                sorted((d.id, s) for d, s in expected),
+                msg=q,
+            )
+
+    def test_served_without_db_queries_once_warm(self):
+        search_medicines("idx", include_fts=True)
+        with self.assertNumQueries(0):
+            hits = search_medicines("idxpara", include_fts=True)
+        self.assertEqual(self._ids(hits), [self.para.id])
+        self.assertEqual(hits[0][0].formulation.name, "idx-tab")
+
+    def test_inactive_rows_are_not_indexed(self):
+        self.assertNotIn(self.inactive.id, self._ids(search_medicines("idx", include_fts=False)))
+
+    def test_generic_prefix_match_when_fts_enabled(self):
+        self.assertEqual(self._ids(search_medicines("amoxi", include_fts=True)), [self.amox.id])
+        self.assertEqual(search_medicines("amoxi", include_fts=False), [])
+
+    def test_save_updates_index_incrementally(self):
+        search_medicines("idx", include_fts=False)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.amox.brand_name = "Idxamoxnew"
+            self.amox.save()
+        self.assertEqual(self._ids(search_medicines("amoxnew", include_fts=False)), [self.amox.id])
+        self.assertEqual(search_medicines("idxmox", include_fts=False), [])
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.amox.is_active = False
+            self.amox.save()
+        self.assertNotIn(self.amox.id, self._ids(search_medicines("idx", include_fts=False)))
+
+    def test_candidates_capped(self):
+        DrugMaster.objects.bulk_create(
+            [
+                DrugMaster(code=f"IDXC{i:04d}", brand_name=f"Idxcap {i}", formulation=self.form)
+                for i in range(MAX_CANDIDATES + 10)
+            ]
+        )
+        clear_search_index()
+        self.assertEqual(len(search_medicines("idxcap", include_fts=False)), MAX_CANDIDATES)
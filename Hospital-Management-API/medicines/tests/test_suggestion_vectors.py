@@ -0,0 +1,89 @@
+import uuid
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from account.models import User
+from analytics.models import DiagnosisMedicineMap, DoctorMedicineUsage, PatientMedicineUsage
+from consultations_core.models.diagnosis import DiagnosisMaster
+from medicines.models import DrugMaster, FormulationMaster
+from medicines.services.suggestion_engine import MedicineSuggestionEngine
+from medicines.services.suggestion_vectors import (
+    get_vector,
+    precompute_all_vectors,
+    refresh_vectors,
+    vectors_ready,
+)
+
+
+@override_settings(MEDICINE_SUGGESTION_VECTORS_ENABLED=True)
+class SuggestionVectorTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create_user(
+            username="vecdoc",
+            email="vecdoc@test.com",
+            password="testpass123",
+            first_name="V",
+            last_name="Doc",
+        )
+        form = FormulationMaster.objects.create(name="vec-tab")
+        cls.drugs = [
+            DrugMaster.objects.create(code=f"VEC{i}", brand_name=f"Vecdrug {i}", formulation=form)
+            for i in range(4)
+        ]
+        DoctorMedicineUsage.objects.create(doctor=cls.user, drug=cls.drugs[0], usage_count=40)
+        DoctorMedicineUsage.objects.create(doctor=cls.user, drug=cls.drugs[1], usage_count=10)
+        cls.patient_id = uuid.uuid4()
+        PatientMedicineUsage.objects.create(patient_id=cls.patient_id, drug=cls.drugs[2], usage_count=5)
+        cls.dx = DiagnosisMaster.objects.create(key="vec-dx", label="Vec DX", category="test")
+        DiagnosisMedicineMap.objects.create(diagnosis=cls.dx, drug=cls.drugs[3], weight=4.0)
+        DiagnosisMedicineMap.objects.create(diagnosis=cls.dx, drug=cls.drugs[1], weight=2.0)
+
+    def setUp(self):
+        cache.clear()
+
+    def _engine(self):
+        return MedicineSuggestionEngine(
+            doctor_id=self.user.id,
+            patient_id=self.patient_id,
+            diagnosis_ids=[self.dx.id],
+            limit=10,
+        )
+
+    def _summary(self, rows):
+        return [(r["drug"].id, round(r["final_score"], 6), r["dominant_signal"]) for r in rows]
+
+    def test_vector_rows_match_live_rows(self):
+        with self.settings(MEDICINE_SUGGESTION_VECTORS_ENABLED=False):
+            live = self._summary(self._engine().run_ranked_rows())
+        self.assertEqual(self._summary(self._engine().run_ranked_rows()), live)
+        precompute_all_vectors()
+        self.assertEqual(self._summary(self._engine().run_ranked_rows()), live)
+
+    def test_precomputed_engine_only_hydrates_drugs(self):
+        precompute_all_vectors()
+        refresh_vectors(patient_ids=[self.patient_id])
+        with self.assertNumQueries(1):
+            rows = self._engine().run_ranked_rows()
+        self.assertTrue(rows)
+
+    def test_doctor_vector_is_normalized(self):
+        precompute_all_vectors()
+        vec = get_vector("doctor", self.user.id)
+        self.assertEqual(vec[0][:2], [str(self.drugs[0].id), 1.0])
+        self.assertAlmostEqual(vec[1][1], 0.25)
+
+    def test_refresh_picks_up_usage_change(self):
+        precompute_all_vectors()
+        DoctorMedicineUsage.objects.filter(doctor=self.user, drug=self.drugs[1]).update(usage_count=80)
+        refresh_vectors(doctor_ids=[self.user.id])
+        self.assertEqual(get_vector("doctor", self.user.id)[0][0], str(self.drugs[1].id))
+
+    def test_vectors_ready_requires_every_signal(self):
+        kwargs = {"doctor_id": self.user.id, "patient_id": self.patient_id, "diagnosis_ids": [self.dx.id]}
+        self.assertFalse(vectors_ready(**kwargs))
+        precompute_all_vectors()
+        self.assertFalse(vectors_ready(**kwargs))
+        refresh_vectors(patient_ids=[self.patient_id])
+        self.assertTrue(vectors_ready(**kwargs))
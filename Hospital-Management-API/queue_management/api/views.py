@@ -1,10 +1,8 @@
 import json
-import redis
 import logging
 import threading
-from django.conf import settings
 from django.utils.timezone import localdate
-from django.db.models import F, Q
+from django.db.models import F
 from rest_framework import generics, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
@@ -29,29 +27,36 @@ from queue_management.api.serializers import (
 from account.permissions import IsDoctor, IsDoctorOrHelpdesk,IsHelpdesk
 from django.db import IntegrityError, transaction
 from shared.logging import LogModule, logger
-from queue_management.services.queue_realtime import (
-    publish_queue_update,
-    queue_reorder_lock,
-    update_queue_sorted_set,
+from queue_management.services.queue_realtime import get_redis_client, queue_reorder_lock
+from queue_management.services.queue_read_model import (
+    doctor_queue_queryset,
+    fill_doctor_queue,
+    fill_helpdesk_queue,
+    helpdesk_queue_queryset,
+    invalidate_queue_read_model,
+    queue_read_model_enabled,
+    read_doctor_queue,
+    read_helpdesk_queue,
+    read_model_generations,
 )
 from queue_management.services.queue_service import add_to_queue
-from queue_management.services.queue_sync import _sync_queue_realtime
+from queue_management.services.queue_sync import _sync_queue_realtime, coalesce_queue_sync
 from queue_management.tasks import sync_queue_realtime_task
 
-# Hide helpdesk "today" rows when the *clinical* visit is finished/cancelled but the Queue row was
-# never updated (stale waiting row). Do NOT exclude consultation_in_progress / in_consultation:
-# if consultation started but PATCH /queue/start/ failed, encounter advances while Queue.status
-# can still be waiting — those patients must remain visible for helpdesk triage.
-HELPDESK_TODAY_EXCLUDE_IF_ENCOUNTER_STATUS_IN = (
-    "consultation_completed",
-    "closed",
-    "cancelled",
-    "no_show",
-    "completed",
-)
+# Shares the process-wide realtime pool.
+redis_client = get_redis_client()
+
+
+def _request_queue_sync(*, doctor_id, clinic_id, queue_date):
+    """Every queue mutation: once it commits, invalidate the screens' read model, then sync."""
+    invalidate_queue_read_model(doctor_id=doctor_id, clinic_id=clinic_id, queue_date=queue_date)
+
+    def _sync():
+        if not coalesce_queue_sync(doctor_id=doctor_id, clinic_id=clinic_id, queue_date=queue_date):
+            _sync_queue_realtime(doctor_id=doctor_id, clinic_id=clinic_id, queue_date=queue_date)
+
+    transaction.on_commit(_sync)
 
-# Initialize Redis connection
-redis_client = redis.StrictRedis(host=settings.REDIS_HOST, port=settings.REDIS_PORT, db=0, decode_responses=True)
 
 # 1. POST /queue/check-in/ – Add a patient to the queue
 class CheckInQueueAPIView(APIView):
@@ -151,41 +156,21 @@ class DoctorQueueAPIView(APIView):
             if doctor_profile is None or str(doctor_profile.id) != str(doctor_id):
                 return Response({"detail": "Invalid queue scope."}, status=status.HTTP_403_FORBIDDEN)
         today = localdate()
-        queue = (
-            Queue.objects.filter(
-                doctor_id=doctor_id,
-                clinic_id=clinic_id,
-                created_at__date=today,
-                status__in=("waiting", "vitals_done"),
-            )
-            .select_related(
-                "patient",
-                "appointment",
-                "encounter",
-                "encounter__pre_consultation",
-                "encounter__pre_consultation__preconsultationvitals",
-            )
-            .only(
-                "id",
-                "encounter_id",
-                "patient_id",
-                "appointment_id",
-                "status",
-                "position_in_queue",
-                "created_at",
-                "patient__first_name",
-                "patient__last_name",
-                "patient__public_id",
-                "patient__gender",
-                "patient__date_of_birth",
-                "patient__age_years",
-                "encounter__visit_pnr",
-                "encounter__pre_consultation__id",
-                "encounter__pre_consultation__preconsultationvitals__data",
-            )
-            .order_by("position_in_queue")
-        )
-        return Response(DoctorActiveQueueSerializer(queue, many=True).data)
+        generation = None
+        if queue_read_model_enabled():
+            generations = read_model_generations(clinic_id=clinic_id, doctor_ids=[doctor_id], queue_date=today)
+            if generations is not None:
+                generation = generations[str(doctor_id)]
+                rows = read_doctor_queue(
+                    doctor_id=doctor_id, clinic_id=clinic_id, queue_date=today, generation=generation
+                )
+                if rows is not None:
+                    return Response(rows)
+        queue = doctor_queue_queryset(doctor_id=doctor_id, clinic_id=clinic_id, queue_date=today)
+        data = DoctorActiveQueueSerializer(queue, many=True).data
+        if generation is not None:
+            fill_doctor_queue(doctor_id=doctor_id, clinic_id=clinic_id, queue_date=today, rows=data, generation=generation)
+        return Response(data)
 
 
 class HelpdeskClinicQueueAPIView(APIView):
@@ -215,28 +200,21 @@ class HelpdeskClinicQueueAPIView(APIView):
             resp = Response([], status=status.HTTP_200_OK)
             resp["X-Queue-Calendar-Date"] = today.isoformat()
             return resp
-        queue = (
-            Queue.objects.filter(
-                clinic_id=clinic.id,
-                doctor_id__in=doctor_ids,
-                created_at__date=today,
-                status__in=("waiting", "vitals_done"),
-            )
-            .filter(
-                Q(encounter__isnull=True)
-                | ~Q(encounter__status__in=HELPDESK_TODAY_EXCLUDE_IF_ENCOUNTER_STATUS_IN)
-            )
-            .select_related(
-                "patient",
-                "appointment",
-                "encounter",
-                "encounter__pre_consultation",
-                "encounter__pre_consultation__preconsultationvitals",
-                "patient_account__user",
-            )
-            .order_by("doctor_id", "position_in_queue")
-        )
-        body = HelpdeskQueueRowSerializer(queue, many=True).data
+        generations = None
+        body = None
+        if queue_read_model_enabled():
+            generations = read_model_generations(clinic_id=clinic.id, doctor_ids=doctor_ids, queue_date=today)
+            if generations is not None:
+                body = read_helpdesk_queue(
+                    clinic_id=clinic.id, doctor_ids=doctor_ids, queue_date=today, generations=generations
+                )
+        if body is None:
+            queue = helpdesk_queue_queryset(clinic_id=clinic.id, doctor_ids=doctor_ids, queue_date=today)
+            body = HelpdeskQueueRowSerializer(queue, many=True).data
+            if generations is not None:
+                fill_helpdesk_queue(
+                    clinic_id=clinic.id, doctor_ids=doctor_ids, queue_date=today, rows=body, generations=generations
+                )
         resp = Response(body, status=status.HTTP_200_OK)
         resp["X-Queue-Calendar-Date"] = today.isoformat()
         return resp
@@ -343,6 +321,7 @@ class StartConsultationAPIView(APIView):
                 sync_doctor_id = str(queue_entry.doctor_id)
                 sync_clinic_id = str(queue_entry.clinic_id)
                 sync_queue_date = today
+                invalidate_queue_read_model(doctor_id=sync_doctor_id, clinic_id=sync_clinic_id, queue_date=today)
                 logging.getLogger(__name__).info(
                     "encounter.lifecycle.queue.start queue_id=%s encounter_id=%s clinic_id=%s user_id=%s",
                     queue_entry.id,
@@ -422,7 +401,7 @@ class CompleteConsultationAPIView(APIView):
             queue_clinic_id = queue_entry.clinic_id
             queue_entry.status = "completed"
             queue_entry.save()
-            _sync_queue_realtime(
+            _request_queue_sync(
                 doctor_id=queue_doctor_id,
                 clinic_id=queue_clinic_id,
                 queue_date=today,
@@ -456,7 +435,7 @@ class SkipPatientAPIView(APIView):
             queue_clinic_id = queue_entry.clinic_id
             queue_entry.status = "skipped"
             queue_entry.save()
-            _sync_queue_realtime(
+            _request_queue_sync(
                 doctor_id=queue_doctor_id,
                 clinic_id=queue_clinic_id,
                 queue_date=today,
@@ -524,7 +503,7 @@ class UrgentPatientAPIView(APIView):
                     row.position_in_queue = movable_slots[index]
                 Queue.objects.bulk_update(reordered, ["position_in_queue"])
 
-            _sync_queue_realtime(
+            _request_queue_sync(
                 doctor_id=queue_entry.doctor_id,
                 clinic_id=queue_entry.clinic_id,
                 queue_date=today,
@@ -559,6 +538,11 @@ class UpdateQueuePositionView(APIView):
             if new_position is not None:
                 queue.position_in_queue = new_position
                 queue.save()
+                _request_queue_sync(
+                    doctor_id=queue.doctor_id,
+                    clinic_id=queue.clinic_id,
+                    queue_date=localdate(queue.created_at),
+                )
                 serializer = QueueSerializer(queue)
                 return Response(serializer.data)
             else:
@@ -675,35 +659,11 @@ class QueueReorderAPIView(APIView):
                         row.position_in_queue = item["position"]
                         final_updates.append(row)
                     Queue.objects.bulk_update(final_updates, ["position_in_queue"])
-                    updates = final_updates
-
-                    ordered_rows = sorted(
-                        updates,
-                        key=lambda x: x.position_in_queue,
-                    )
-                    redis_payload = [
-                        {
-                            "id": str(row.id),
-                            "encounter_id": str(row.encounter_id) if row.encounter_id else None,
-                            "position": row.position_in_queue,
-                        }
-                        for row in ordered_rows
-                    ]
         except TimeoutError:
             return self._error("QUEUE_LOCK_TIMEOUT", "Queue is being updated. Please retry shortly.", status.HTTP_409_CONFLICT)
 
-        update_queue_sorted_set(
-            clinic_id=str(scope_clinic_id),
-            doctor_id=str(scope_doctor_id),
-            queue_date=today,
-            queue_rows=redis_payload,
-        )
-        publish_queue_update(
-            clinic_id=str(scope_clinic_id),
-            doctor_id=str(scope_doctor_id),
-            queue_date=today,
-            queue_rows=redis_payload,
-        )
+        # Full active rows: the delta diff needs every row (and its status), not just the moved ones.
+        _request_queue_sync(doctor_id=scope_doctor_id, clinic_id=scope_clinic_id, queue_date=today)
 
         return Response({"message": "Queue reordered successfully"}, status=status.HTTP_200_OK)
 
@@ -725,6 +685,11 @@ class MarkPatientNotAvailableAPIView(APIView):
 
         queue_entry.status = "skipped"  # Mark as skipped (Can be re-added later)
         queue_entry.save()
+        _request_queue_sync(
+            doctor_id=queue_entry.doctor_id,
+            clinic_id=queue_entry.clinic_id,
+            queue_date=localdate(queue_entry.created_at),
+        )
 
         return Response({"message": "Patient marked as not available"}, status=status.HTTP_200_OK)
 
@@ -744,6 +709,11 @@ class CancelAppointmentAPIView(APIView):
             queue_entry.status = "cancelled"
             queue_entry.appointment.delete()  # Delete appointment record
             queue_entry.delete()  # Remove from queue
+            _request_queue_sync(
+                doctor_id=queue_entry.doctor_id,
+                clinic_id=queue_entry.clinic_id,
+                queue_date=localdate(queue_entry.created_at),
+            )
 
         return Response({"message": "Appointment cancelled and removed from queue"},
                         status=status.HTTP_204_NO_CONTENT)
@@ -759,6 +729,11 @@ class CancelAppointmentView(APIView):
         queue_entry = get_object_or_404(Queue, patient__id=id, status='waiting')
         queue_entry.status = 'cancelled'
         queue_entry.save(update_fields=['status'])
+        _request_queue_sync(
+            doctor_id=queue_entry.doctor_id,
+            clinic_id=queue_entry.clinic_id,
+            queue_date=localdate(queue_entry.created_at),
+        )
 
         return Response({"message": "Appointment cancelled successfully."}, status=status.HTTP_200_OK)
 
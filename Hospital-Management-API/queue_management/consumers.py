@@ -1,17 +1,105 @@
 import json
+import logging
+from datetime import date
+from urllib.parse import parse_qs
+
+from asgiref.sync import sync_to_async
 from channels.generic.websocket import AsyncWebsocketConsumer
+from django.utils.timezone import localdate
+
+from queue_management.services.queue_realtime import read_queue_deltas
+
+logger = logging.getLogger(__name__)
+
+
+def _since_from_query(query_string: bytes) -> int | None:
+    values = parse_qs(query_string.decode("latin-1")).get("since")
+    if not values:
+        return None
+    try:
+        return max(int(values[0]), 0)
+    except ValueError:
+        return None
 
 
 class QueueUpdatesConsumer(AsyncWebsocketConsumer):
+    """
+    Legacy clients receive the full ``SMART_QUEUE_UPDATE`` on every change.
+
+    Clients connecting with ``?since=<seq>`` switch to the delta protocol: missed
+    ``SMART_QUEUE_DELTA`` messages are replayed from the day's stream, then live deltas follow.
+    A live delta that skips a sequence triggers the same replay. When the stream cannot cover
+    the gap a ``SMART_QUEUE_RESYNC`` tells the client to re-read the queue over HTTP and
+    continue from the given sequence; the stream also carries one when the server-side
+    snapshot had to be rebuilt.
+    """
+
     async def connect(self):
         self.clinic_id = self.scope["url_route"]["kwargs"]["clinic_id"]
         self.doctor_id = self.scope["url_route"]["kwargs"]["doctor_id"]
         self.group_name = f"queue_updates_{self.clinic_id}_{self.doctor_id}"
+        self.last_seq = _since_from_query(self.scope.get("query_string", b""))
+        self.queue_date = localdate().isoformat()
         await self.channel_layer.group_add(self.group_name, self.channel_name)
         await self.accept()
+        if self.last_seq is not None:
+            await self._replay()
 
     async def disconnect(self, close_code):
         await self.channel_layer.group_discard(self.group_name, self.channel_name)
 
+    async def _replay(self):
+        try:
+            deltas, latest = await sync_to_async(read_queue_deltas, thread_sensitive=False)(
+                self.clinic_id, self.doctor_id, date.fromisoformat(self.queue_date), self.last_seq
+            )
+        except Exception:
+            logger.exception("Queue delta replay failed")
+            deltas, latest = None, self.last_seq
+        if deltas is None:
+            await self._send_resync(latest)
+            return
+        for delta in deltas:
+            await self._send_delta(delta, replaying=True)
+
+    async def _send_resync(self, seq):
+        self.last_seq = seq
+        await self.send(
+            text_data=json.dumps(
+                {
+                    "type": "SMART_QUEUE_RESYNC",
+                    "doctor_id": str(self.doctor_id),
+                    "clinic_id": str(self.clinic_id),
+                    "queue_date": self.queue_date,
+                    "seq": seq,
+                }
+            )
+        )
+
+    async def _send_delta(self, delta, *, replaying=False):
+        # Sequences restart with each day's stream.
+        if delta["queue_date"] != self.queue_date:
+            self.queue_date = delta["queue_date"]
+            self.last_seq = 0
+        seq = delta["seq"]
+        if seq <= self.last_seq:
+            return
+        if seq > self.last_seq + 1:
+            # A live delta was lost (dropped group_send, consumer restart): catch up from the
+            # stream, which includes this one. The stream itself has no holes, so a gap while
+            # replaying means entries vanished and the client has to re-read.
+            if replaying:
+                await self._send_resync(seq)
+            else:
+                await self._replay()
+            return
+        self.last_seq = seq
+        await self.send(text_data=json.dumps(delta))
+
     async def queue_update(self, event):
-        await self.send(text_data=json.dumps(event["payload"]))
+        if self.last_seq is None:
+            await self.send(text_data=json.dumps(event["payload"]))
+            return
+        delta = event.get("delta")
+        if delta is not None:
+            await self._send_delta(delta)
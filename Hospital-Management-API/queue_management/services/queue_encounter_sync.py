@@ -15,6 +15,7 @@ from typing import Any
 from django.utils import timezone
 
 from queue_management.models import Queue
+from queue_management.services.queue_read_model import invalidate_queue_read_model_for_encounter
 
 logger = logging.getLogger(__name__)
 
@@ -36,6 +37,7 @@ def mark_queue_rows_for_encounter_completed(encounter_id: Any) -> int:
     ).update(status="completed", updated_at=timezone.now())
     if n:
         logger.info("queue_encounter_sync.completed encounter_id=%s updated_rows=%s", eid, n)
+        invalidate_queue_read_model_for_encounter(eid)
     return n
 
 
@@ -50,6 +52,7 @@ def mark_queue_rows_for_encounter_cancelled(encounter_id: Any) -> int:
     ).update(status="cancelled", updated_at=timezone.now())
     if n:
         logger.info("queue_encounter_sync.cancelled encounter_id=%s updated_rows=%s", eid, n)
+        invalidate_queue_read_model_for_encounter(eid)
     return n
 
 
@@ -64,6 +67,7 @@ def mark_queue_rows_for_encounter_no_show(encounter_id: Any) -> int:
     ).update(status="skipped", updated_at=timezone.now())
     if n:
         logger.info("queue_encounter_sync.no_show encounter_id=%s updated_rows=%s", eid, n)
+        invalidate_queue_read_model_for_encounter(eid)
     return n
 
 
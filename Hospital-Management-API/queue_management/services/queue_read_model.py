@@ -0,0 +1,296 @@
+"""
+Redis read model for the doctor and helpdesk queue screens (optional; ``QUEUE_READ_MODEL_ENABLED``).
+
+``_sync_queue_realtime`` writes the fully serialized active rows for one clinic/doctor/day
+(``DoctorActiveQueueSerializer`` and ``HelpdeskQueueRowSerializer`` shapes) after every queue
+change; ``DoctorQueueAPIView`` and ``HelpdeskClinicQueueAPIView`` serve from it and fall back to
+the database on a miss, repopulating only keys that are still absent.
+
+Entries expire after ``QUEUE_READ_MODEL_MAX_AGE_SECONDS``, which bounds staleness for changes
+that do not pass through the queue sync (e.g. patient profile edits). Every queue mutation calls
+``invalidate_*`` on commit (vitals saves and encounter transitions directly, the queue views via
+``_request_queue_sync``).
+
+Keys carry a per clinic/doctor/day generation. Invalidation bumps it instead of deleting, and a
+read-through fill writes under the generation it saw *before* its database read, so a fill that
+raced an invalidation lands on a key nobody reads any more.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+from datetime import date
+from typing import Iterable
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from rest_framework.utils.encoders import JSONEncoder
+
+from queue_management.models import Queue
+from queue_management.services.queue_realtime import get_redis_client
+
+logger = logging.getLogger(__name__)
+
+DOCTOR_VIEW = "doctor"
+HELPDESK_VIEW = "helpdesk"
+ACTIVE_STATUSES = ("waiting", "vitals_done")
+
+# Hide helpdesk "today" rows when the *clinical* visit is finished/cancelled but the Queue row was
+# never updated (stale waiting row). Do NOT exclude consultation_in_progress / in_consultation:
+# if consultation started but PATCH /queue/start/ failed, encounter advances while Queue.status
+# can still be waiting — those patients must remain visible for helpdesk triage.
+HELPDESK_TODAY_EXCLUDE_IF_ENCOUNTER_STATUS_IN = (
+    "consultation_completed",
+    "closed",
+    "cancelled",
+    "no_show",
+    "completed",
+)
+
+
+def queue_read_model_enabled() -> bool:
+    return bool(getattr(settings, "QUEUE_READ_MODEL_ENABLED", False))
+
+
+def _max_age_seconds() -> int:
+    return int(getattr(settings, "QUEUE_READ_MODEL_MAX_AGE_SECONDS", 60))
+
+
+# Outlives the day's entries; a lost generation only restarts at "0".
+GENERATION_TTL_SECONDS = 86400
+
+
+def read_model_key(view: str, clinic_id, doctor_id, queue_date: date, generation: str = "0") -> str:
+    return f"queue_view:{view}:{clinic_id}:{doctor_id}:{queue_date.isoformat()}:{generation}"
+
+
+def read_model_generation_key(clinic_id, doctor_id, queue_date: date) -> str:
+    return f"queue_view_gen:{clinic_id}:{doctor_id}:{queue_date.isoformat()}"
+
+
+def read_model_generations(*, clinic_id, doctor_ids: Iterable, queue_date: date) -> dict[str, str] | None:
+    """Current generation per doctor (read before any database fallback), or None when Redis is down."""
+    ordered = [str(doctor_id) for doctor_id in doctor_ids]
+    try:
+        raws = get_redis_client().mget(
+            [read_model_generation_key(clinic_id, doctor_id, queue_date) for doctor_id in ordered]
+        )
+    except Exception:
+        logger.exception("Queue read model unavailable")
+        return None
+    return {doctor_id: raw or "0" for doctor_id, raw in zip(ordered, raws)}
+
+
+def doctor_queue_queryset(*, doctor_id, clinic_id, queue_date: date):
+    return (
+        Queue.objects.filter(
+            doctor_id=doctor_id,
+            clinic_id=clinic_id,
+            created_at__date=queue_date,
+            status__in=ACTIVE_STATUSES,
+        )
+        .select_related(
+            "patient",
+            "appointment",
+            "encounter",
+            "encounter__pre_consultation",
+            "encounter__pre_consultation__preconsultationvitals",
+        )
+        .only(
+            "id",
+            "encounter_id",
+            "patient_id",
+            "appointment_id",
+            "status",
+            "position_in_queue",
+            "created_at",
+            "patient__first_name",
+            "patient__last_name",
+            "patient__public_id",
+            "patient__gender",
+            "patient__date_of_birth",
+            "patient__age_years",
+            "encounter__visit_pnr",
+            "encounter__pre_consultation__id",
+            "encounter__pre_consultation__preconsultationvitals__data",
+        )
+        .order_by("position_in_queue")
+    )
+
+
+def helpdesk_queue_queryset(*, clinic_id, doctor_ids: Iterable, queue_date: date):
+    return (
+        Queue.objects.filter(
+            clinic_id=clinic_id,
+            doctor_id__in=list(doctor_ids),
+            created_at__date=queue_date,
+            status__in=ACTIVE_STATUSES,
+        )
+        .filter(
+            Q(encounter__isnull=True)
+            | ~Q(encounter__status__in=HELPDESK_TODAY_EXCLUDE_IF_ENCOUNTER_STATUS_IN)
+        )
+        .select_related(
+            "patient",
+            "appointment",
+            "encounter",
+            "encounter__pre_consultation",
+            "encounter__pre_consultation__preconsultationvitals",
+            "patient_account__user",
+        )
+        .order_by("doctor_id", "position_in_queue")
+    )
+
+
+def _dumps(rows) -> str:
+    return json.dumps(rows, cls=JSONEncoder)
+
+
+def write_queue_read_model(*, doctor_id, clinic_id, queue_date: date) -> None:
+    """Serialize one doctor's active queue in both screen shapes from a single query."""
+    from queue_management.api.serializers import DoctorActiveQueueSerializer, HelpdeskQueueRowSerializer
+
+    client = get_redis_client()
+    # Read before the query: an invalidation after it moves readers past this generation.
+    generation = client.get(read_model_generation_key(clinic_id, doctor_id, queue_date)) or "0"
+    rows = list(
+        Queue.objects.filter(
+            doctor_id=doctor_id,
+            clinic_id=clinic_id,
+            created_at__date=queue_date,
+            status__in=ACTIVE_STATUSES,
+        )
+        .select_related(
+            "patient",
+            "appointment",
+            "encounter",
+            "encounter__pre_consultation",
+            "encounter__pre_consultation__preconsultationvitals",
+            "patient_account__user",
+        )
+        .order_by("position_in_queue")
+    )
+    helpdesk_rows = [
+        row
+        for row in rows
+        if row.encounter is None or row.encounter.status not in HELPDESK_TODAY_EXCLUDE_IF_ENCOUNTER_STATUS_IN
+    ]
+    ttl = _max_age_seconds()
+    pipe = client.pipeline(transaction=False)
+    pipe.set(
+        read_model_key(DOCTOR_VIEW, clinic_id, doctor_id, queue_date, generation),
+        _dumps(DoctorActiveQueueSerializer(rows, many=True).data),
+        ex=ttl,
+    )
+    pipe.set(
+        read_model_key(HELPDESK_VIEW, clinic_id, doctor_id, queue_date, generation),
+        _dumps(HelpdeskQueueRowSerializer(helpdesk_rows, many=True).data),
+        ex=ttl,
+    )
+    pipe.execute()
+
+
+def read_doctor_queue(*, doctor_id, clinic_id, queue_date: date, generation: str | None = None) -> list | None:
+    try:
+        client = get_redis_client()
+        if generation is None:
+            generation = client.get(read_model_generation_key(clinic_id, doctor_id, queue_date)) or "0"
+        raw = client.get(read_model_key(DOCTOR_VIEW, clinic_id, doctor_id, queue_date, generation))
+    except Exception:
+        logger.exception("Queue read model unavailable")
+        return None
+    return json.loads(raw) if raw is not None else None
+
+
+def read_helpdesk_queue(
+    *, clinic_id, doctor_ids: list, queue_date: date, generations: dict[str, str] | None = None
+) -> list | None:
+    """All doctors' rows in ``(doctor_id, position)`` order, or None when any doctor is missing."""
+    ordered = sorted(doctor_ids)
+    if generations is None:
+        generations = read_model_generations(clinic_id=clinic_id, doctor_ids=ordered, queue_date=queue_date)
+        if generations is None:
+            return None
+    try:
+        raws = get_redis_client().mget(
+            [
+                read_model_key(HELPDESK_VIEW, clinic_id, doctor_id, queue_date, generations[str(doctor_id)])
+                for doctor_id in ordered
+            ]
+        )
+    except Exception:
+        logger.exception("Queue read model unavailable")
+        return None
+    if any(raw is None for raw in raws):
+        return None
+    out: list = []
+    for raw in raws:
+        out.extend(json.loads(raw))
+    return out
+
+
+def fill_doctor_queue(*, doctor_id, clinic_id, queue_date: date, rows, generation: str) -> None:
+    """
+    Read-through after a DB fallback; never overwrites a fresher write-through entry.
+    ``generation`` must be read before the DB query (see the module docstring).
+    """
+    try:
+        get_redis_client().set(
+            read_model_key(DOCTOR_VIEW, clinic_id, doctor_id, queue_date, generation),
+            _dumps(rows),
+            ex=_max_age_seconds(),
+            nx=True,
+        )
+    except Exception:
+        logger.exception("Queue read model fill failed")
+
+
+def fill_helpdesk_queue(*, clinic_id, doctor_ids: list, queue_date: date, rows, generations: dict[str, str]) -> None:
+    by_doctor: dict[str, list] = {str(doctor_id): [] for doctor_id in doctor_ids}
+    for row in rows:
+        by_doctor.setdefault(str(row["doctor"]), []).append(row)
+    ttl = _max_age_seconds()
+    try:
+        pipe = get_redis_client().pipeline(transaction=False)
+        for doctor_id, doctor_rows in by_doctor.items():
+            generation = generations.get(doctor_id)
+            if generation is None:
+                continue
+            pipe.set(
+                read_model_key(HELPDESK_VIEW, clinic_id, doctor_id, queue_date, generation),
+                _dumps(doctor_rows),
+                ex=ttl,
+                nx=True,
+            )
+        pipe.execute()
+    except Exception:
+        logger.exception("Queue read model fill failed")
+
+
+def invalidate_queue_read_model(*, doctor_id, clinic_id, queue_date: date) -> None:
+    if not queue_read_model_enabled():
+        return
+
+    def _bump():
+        key = read_model_generation_key(clinic_id, doctor_id, queue_date)
+        try:
+            pipe = get_redis_client().pipeline(transaction=False)
+            pipe.incr(key)
+            pipe.expire(key, GENERATION_TTL_SECONDS)
+            pipe.execute()
+        except Exception:
+            logger.exception("Queue read model invalidation failed")
+
+    transaction.on_commit(_bump)
+
+
+def invalidate_queue_read_model_for_encounter(encounter_id) -> None:
+    if not queue_read_model_enabled():
+        return
+    scopes = set(
+        Queue.objects.filter(encounter_id=encounter_id).values_list("doctor_id", "clinic_id", "created_at__date")
+    )
+    for doctor_id, clinic_id, queue_date in scopes:
+        invalidate_queue_read_model(doctor_id=doctor_id, clinic_id=clinic_id, queue_date=queue_date)
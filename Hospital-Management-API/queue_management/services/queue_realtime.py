@@ -1,8 +1,8 @@
 import json
 import logging
+import threading
 from contextlib import contextmanager
 from datetime import date
-from typing import Iterable
 
 import redis
 from asgiref.sync import async_to_sync
@@ -12,15 +12,42 @@ from django.conf import settings
 logger = logging.getLogger(__name__)
 
 QUEUE_UPDATES_CHANNEL = "queue_updates"
+# The ZSET / status snapshot lives as long as the stream it is diffed against.
+QUEUE_STREAM_TTL_SECONDS = 86400
+
+# One pool per process: redis-py resets it after fork, and the blocking pool makes bursts
+# (bulk helpdesk check-ins) wait for a free connection instead of opening new sockets.
+_pool: redis.BlockingConnectionPool | None = None
+_pool_lock = threading.Lock()
+
+
+def _get_pool() -> redis.BlockingConnectionPool:
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = redis.BlockingConnectionPool(
+                    host=settings.REDIS_HOST,
+                    port=settings.REDIS_PORT,
+                    db=0,
+                    decode_responses=True,
+                    max_connections=int(getattr(settings, "QUEUE_REALTIME_REDIS_MAX_CONNECTIONS", 20)),
+                    timeout=5,
+                )
+    return _pool
 
 
 def get_redis_client() -> redis.Redis:
-    return redis.Redis(
-        host=settings.REDIS_HOST,
-        port=settings.REDIS_PORT,
-        db=0,
-        decode_responses=True,
-    )
+    return redis.Redis(connection_pool=_get_pool())
+
+
+def reset_redis_pool() -> None:
+    """Disconnect and drop the process-wide pool (tests / settings changes)."""
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.disconnect()
 
 
 def queue_cache_key(clinic_id: str, doctor_id: str, queue_date: date) -> str:
@@ -39,39 +66,186 @@ def queue_group_name_scoped(clinic_id: str, doctor_id: str) -> str:
     return f"queue_updates_{clinic_id}_{doctor_id}"
 
 
-def update_queue_sorted_set(clinic_id: str, doctor_id: str, queue_date: date, queue_rows: Iterable[dict]) -> str:
-    key = queue_cache_key(clinic_id=clinic_id, doctor_id=doctor_id, queue_date=queue_date)
-    redis_client = get_redis_client()
-    pipe = redis_client.pipeline()
-    pipe.delete(key)
-    for row in queue_rows:
-        member = str(row.get("encounter_id") or row["id"])
-        score = int(row["position"])
-        pipe.zadd(key, {member: score})
-    pipe.expire(key, 300)
-    pipe.execute()
-    return key
+def queue_status_key(clinic_id: str, doctor_id: str, queue_date: date) -> str:
+    return f"queue_status:{clinic_id}:{doctor_id}:{queue_date.isoformat()}"
+
+
+def queue_stream_key(clinic_id: str, doctor_id: str, queue_date: date) -> str:
+    return f"queue_stream:{clinic_id}:{doctor_id}:{queue_date.isoformat()}"
+
+
+def _queue_member(row: dict) -> str:
+    return str(row.get("encounter_id") or row["id"])
 
 
-def publish_queue_update(clinic_id: str, doctor_id: str, queue_date: date, queue_rows: list[dict]) -> None:
-    top_queue = list(queue_rows[:3])
-    payload = {
+def _stream_maxlen() -> int:
+    return int(getattr(settings, "QUEUE_UPDATES_STREAM_MAXLEN", 500))
+
+
+# Diffs the new active rows against the ZSET (positions) and status hash, patches both in place
+# and, when anything changed, appends a SMART_QUEUE_DELTA with the next sequence to the day's
+# stream. Sequence = last stream id + 1, so it is monotonic per clinic/doctor/day. Returns the
+# encoded delta message, or false when the queue is unchanged.
+# The status hash carries a marker field so an empty queue still has a snapshot. When the
+# snapshot is gone but the stream is not (eviction), a diff would be wrong: the snapshot is
+# rebuilt and a sequenced SMART_QUEUE_RESYNC is appended instead.
+# KEYS: zset, status hash, stream. ARGV: snapshot ttl, stream ttl, stream maxlen, header json, rows json.
+_QUEUE_DELTA_SCRIPT = """
+local zkey, skey, xkey = KEYS[1], KEYS[2], KEYS[3]
+local rows = cjson.decode(ARGV[5])
+
+local prev = {}
+local flat = redis.call('ZRANGE', zkey, 0, -1, 'WITHSCORES')
+for i = 1, #flat, 2 do prev[flat[i]] = tonumber(flat[i + 1]) end
+local statuses = {}
+local has_snapshot = false
+flat = redis.call('HGETALL', skey)
+for i = 1, #flat, 2 do
+  if flat[i] == '__snapshot' then has_snapshot = true else statuses[flat[i]] = flat[i + 1] end
+end
+local resync = (not has_snapshot) and redis.call('EXISTS', xkey) == 1
+
+local deltas = {}
+local seen = {}
+for _, r in ipairs(rows) do
+  local old = prev[r.key]
+  seen[r.key] = true
+  if old == nil then
+    table.insert(deltas, {op = 'add', key = r.key, position = r.position, row = r.row})
+    redis.call('ZADD', zkey, r.position, r.key)
+  elseif old ~= r.position then
+    table.insert(deltas, {op = 'move', key = r.key, position = r.position})
+    redis.call('ZADD', zkey, r.position, r.key)
+  end
+  if r.status ~= cjson.null then
+    local was = statuses[r.key]
+    if old ~= nil and was ~= nil and was ~= r.status then
+      table.insert(deltas, {op = 'status', key = r.key, status = r.status})
+    end
+    if was ~= r.status then redis.call('HSET', skey, r.key, r.status) end
+  end
+end
+local gone = {}
+for member in pairs(prev) do
+  if not seen[member] then table.insert(gone, member) end
+end
+table.sort(gone)
+for _, member in ipairs(gone) do
+  table.insert(deltas, {op = 'remove', key = member})
+  redis.call('ZREM', zkey, member)
+  redis.call('HDEL', skey, member)
+end
+redis.call('HSET', skey, '__snapshot', '1')
+redis.call('EXPIRE', zkey, ARGV[1])
+redis.call('EXPIRE', skey, ARGV[1])
+if #deltas == 0 and not resync then return false end
+
+local seq = 1
+local last = redis.call('XREVRANGE', xkey, '+', '-', 'COUNT', 1)
+if #last > 0 then seq = tonumber(string.match(last[1][1], '^(%d+)')) + 1 end
+local msg = cjson.decode(ARGV[4])
+msg.seq = seq
+msg.total_active = #rows
+if resync then msg.type = 'SMART_QUEUE_RESYNC' else msg.deltas = deltas end
+local body = cjson.encode(msg)
+redis.call('XADD', xkey, 'MAXLEN', '~', ARGV[3], seq .. '-0', 'data', body)
+redis.call('EXPIRE', xkey, ARGV[2])
+return body
+"""
+
+
+def _queue_update_payload(clinic_id: str, doctor_id: str, queue_rows: list[dict]) -> dict:
+    return {
         "type": "SMART_QUEUE_UPDATE",
         "doctor_id": str(doctor_id),
         "clinic_id": str(clinic_id),
         "data": {
-            "top_queue": top_queue,
+            "top_queue": list(queue_rows[:3]),
             "total_active": len(queue_rows),
         },
     }
-    body = json.dumps(payload)
+
+
+def _stage_publish(pipe, clinic_id: str, doctor_id: str, body: str) -> None:
+    pipe.publish(queue_updates_channel_name(clinic_id=str(clinic_id), doctor_id=str(doctor_id)), body)
+    pipe.publish(QUEUE_UPDATES_CHANNEL, body)
+
+
+def _stage_queue_delta(pipe, clinic_id: str, doctor_id: str, queue_date: date, queue_rows: list[dict]) -> None:
+    header = {
+        "type": "SMART_QUEUE_DELTA",
+        "doctor_id": str(doctor_id),
+        "clinic_id": str(clinic_id),
+        "queue_date": queue_date.isoformat(),
+    }
+    entries = [
+        {"key": _queue_member(row), "position": int(row["position"]), "status": row.get("status"), "row": row}
+        for row in queue_rows
+    ]
+    pipe.eval(
+        _QUEUE_DELTA_SCRIPT,
+        3,
+        queue_cache_key(clinic_id=clinic_id, doctor_id=doctor_id, queue_date=queue_date),
+        queue_status_key(clinic_id=clinic_id, doctor_id=doctor_id, queue_date=queue_date),
+        queue_stream_key(clinic_id=clinic_id, doctor_id=doctor_id, queue_date=queue_date),
+        QUEUE_STREAM_TTL_SECONDS,
+        QUEUE_STREAM_TTL_SECONDS,
+        _stream_maxlen(),
+        json.dumps(header),
+        json.dumps(entries),
+    )
+
+
+def dispatch_queue_update(clinic_id: str, doctor_id: str, queue_date: date, queue_rows: list[dict]) -> str:
+    """
+    Patch the queue ZSET in place, record a sequenced delta in the day's stream and publish
+    on both Redis channels in one round trip, then broadcast over the channel layer.
+
+    Legacy websocket clients keep receiving the full ``SMART_QUEUE_UPDATE``; clients that
+    connect with ``?since=<seq>`` receive only ``SMART_QUEUE_DELTA`` messages.
+    """
+    key = queue_cache_key(clinic_id=clinic_id, doctor_id=doctor_id, queue_date=queue_date)
+    payload = _queue_update_payload(clinic_id, doctor_id, queue_rows)
+    delta = None
     try:
-        redis_client = get_redis_client()
-        redis_client.publish(queue_updates_channel_name(clinic_id=str(clinic_id), doctor_id=str(doctor_id)), body)
-        redis_client.publish(QUEUE_UPDATES_CHANNEL, body)
+        pipe = get_redis_client().pipeline(transaction=False)
+        _stage_queue_delta(pipe, clinic_id, doctor_id, queue_date, queue_rows)
+        _stage_publish(pipe, clinic_id, doctor_id, json.dumps(payload))
+        delta_body = pipe.execute()[0]
+        if delta_body:
+            delta = json.loads(delta_body)
     except Exception:
-        logger.exception("Failed publishing queue update on Redis channel")
+        logger.exception("Failed writing queue update to Redis")
+    _broadcast_queue_update(clinic_id, doctor_id, payload, delta=delta)
+    return key
+
+
+def read_queue_deltas(clinic_id: str, doctor_id: str, queue_date: date, since_seq: int) -> tuple[list[dict] | None, int]:
+    """
+    Deltas after ``since_seq`` from the day's stream, plus the latest sequence.
+
+    Returns ``(None, latest)`` when the client cannot catch up from the stream (entries were
+    trimmed or expired, or ``since_seq`` is ahead of it) and must re-read the queue over HTTP.
+    """
+    key = queue_stream_key(clinic_id=clinic_id, doctor_id=doctor_id, queue_date=queue_date)
+    pipe = get_redis_client().pipeline(transaction=False)
+    pipe.xrange(key, min="-", max="+", count=1)
+    pipe.xrevrange(key, max="+", min="-", count=1)
+    pipe.xrange(key, min=f"{since_seq + 1}-0", max="+")
+    first, last, entries = pipe.execute()
 
+    def _seq(entry_id: str) -> int:
+        return int(entry_id.split("-", 1)[0])
+
+    latest = _seq(last[0][0]) if last else 0
+    if since_seq > latest:
+        return None, latest
+    if first and since_seq < _seq(first[0][0]) - 1:
+        return None, latest
+    return [json.loads(fields["data"]) for _entry_id, fields in entries], latest
+
+
+def _broadcast_queue_update(clinic_id: str, doctor_id: str, payload: dict, *, delta: dict | None = None) -> None:
     channel_layer = get_channel_layer()
     if channel_layer is None:
         return
@@ -81,12 +255,31 @@ def publish_queue_update(clinic_id: str, doctor_id: str, queue_date: date, queue
             {
                 "type": "queue.update",
                 "payload": payload,
+                "delta": delta,
             },
         )
     except Exception:
         logger.exception("Failed broadcasting queue update over channel layer")
 
 
+def queue_sync_pending_key(clinic_id: str, doctor_id: str, queue_date: date) -> str:
+    return f"queue_sync_pending:{clinic_id}:{doctor_id}:{queue_date.isoformat()}"
+
+
+def claim_queue_sync(clinic_id: str, doctor_id: str, queue_date: date, *, ttl_ms: int) -> bool:
+    """True when no sync is pending for this queue yet; the caller must schedule one."""
+    key = queue_sync_pending_key(clinic_id=clinic_id, doctor_id=doctor_id, queue_date=queue_date)
+    return bool(get_redis_client().set(key, "1", nx=True, px=ttl_ms))
+
+
+def release_queue_sync(clinic_id: str, doctor_id: str, queue_date: date) -> None:
+    key = queue_sync_pending_key(clinic_id=clinic_id, doctor_id=doctor_id, queue_date=queue_date)
+    try:
+        get_redis_client().delete(key)
+    except Exception:
+        logger.exception("Failed clearing pending queue sync marker")
+
+
 @contextmanager
 def queue_reorder_lock(doctor_id: str, timeout_seconds: int = 5):
     lock = get_redis_client().lock(f"queue_lock:{doctor_id}", timeout=timeout_seconds, blocking_timeout=timeout_seconds)
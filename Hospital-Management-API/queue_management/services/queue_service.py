@@ -7,7 +7,8 @@ from django.db.models import Max
 from django.utils import timezone
 
 from queue_management.models import Queue
-from queue_management.services.queue_sync import _sync_queue_realtime
+from queue_management.services.queue_read_model import invalidate_queue_read_model
+from queue_management.services.queue_sync import _sync_queue_realtime, coalesce_queue_sync
 
 logger = logging.getLogger(__name__)
 
@@ -19,14 +20,20 @@ class InvalidEncounterForQueueError(Exception):
 
 
 def trigger_queue_realtime_update(queue):
-    """Schedule Redis + channel sync after commit so readers see the new row."""
+    """
+    Schedule Redis + channel sync after commit so readers see the new row. Bursts for the same
+    clinic/doctor (bulk check-ins) collapse into one debounced sync when enabled.
+    """
 
     doctor_id = queue.doctor_id
     clinic_id = queue.clinic_id
     queue_date = timezone.localdate()
+    invalidate_queue_read_model(doctor_id=doctor_id, clinic_id=clinic_id, queue_date=queue_date)
 
     def _run():
         try:
+            if coalesce_queue_sync(doctor_id=doctor_id, clinic_id=clinic_id, queue_date=queue_date):
+                return
             _sync_queue_realtime(
                 doctor_id=doctor_id,
                 clinic_id=clinic_id,
@@ -1,9 +1,26 @@
 """Build queue payloads and push Smart Queue realtime updates (Redis + channels)."""
 
+import logging
+
+from django.conf import settings
 from django.utils.timezone import localdate
 
 from queue_management.models import Queue
-from queue_management.services.queue_realtime import publish_queue_update, update_queue_sorted_set
+from queue_management.services.queue_read_model import queue_read_model_enabled, write_queue_read_model
+from queue_management.services.queue_realtime import (
+    claim_queue_sync,
+    dispatch_queue_update,
+    release_queue_sync,
+)
+
+logger = logging.getLogger(__name__)
+
+# A lost task (worker restart) must not silence a queue for longer than this past the window.
+PENDING_SYNC_GRACE_MS = 30_000
+
+
+def queue_sync_debounce_ms() -> int:
+    return int(getattr(settings, "QUEUE_REALTIME_DEBOUNCE_MS", 0))
 
 
 def _build_active_queue_payload(*, doctor_id, clinic_id, queue_date):
@@ -105,15 +122,56 @@ def _sync_queue_realtime(*, doctor_id, clinic_id, queue_date):
         clinic_id=clinic_id,
         queue_date=queue_date,
     )
-    update_queue_sorted_set(
-        clinic_id=str(clinic_id),
-        doctor_id=str(doctor_id),
-        queue_date=queue_date,
-        queue_rows=queue_payload,
-    )
-    publish_queue_update(
+    dispatch_queue_update(
         clinic_id=str(clinic_id),
         doctor_id=str(doctor_id),
         queue_date=queue_date,
         queue_rows=queue_payload,
     )
+    if queue_read_model_enabled():
+        try:
+            write_queue_read_model(doctor_id=doctor_id, clinic_id=clinic_id, queue_date=queue_date)
+        except Exception:
+            logger.exception("Queue read model write failed")
+
+
+def coalesce_queue_sync(*, doctor_id, clinic_id, queue_date) -> bool:
+    """
+    Defer the realtime sync for this clinic/doctor by ``QUEUE_REALTIME_DEBOUNCE_MS`` so a
+    burst of changes produces one broadcast built from the latest rows.
+
+    Returns False when debouncing is off or unavailable; the caller then syncs inline.
+    """
+    debounce_ms = queue_sync_debounce_ms()
+    if debounce_ms <= 0:
+        return False
+    from queue_management.tasks import sync_queue_realtime_task
+
+    try:
+        if not claim_queue_sync(
+            str(clinic_id), str(doctor_id), queue_date, ttl_ms=debounce_ms + PENDING_SYNC_GRACE_MS
+        ):
+            return True
+    except Exception:
+        logger.exception("Queue sync debounce unavailable; syncing inline")
+        return False
+    try:
+        sync_queue_realtime_task.apply_async(
+            kwargs={
+                "doctor_id": str(doctor_id),
+                "clinic_id": str(clinic_id),
+                "queue_date_iso": queue_date.isoformat(),
+            },
+            countdown=debounce_ms / 1000,
+        )
+    except Exception:
+        logger.exception("Queue sync dispatch failed; syncing inline")
+        release_queue_sync(str(clinic_id), str(doctor_id), queue_date)
+        return False
+    return True
+
+
+def run_coalesced_queue_sync(*, doctor_id, clinic_id, queue_date):
+    """Task body: clear the pending marker first so changes made during the sync schedule another."""
+    release_queue_sync(str(clinic_id), str(doctor_id), queue_date)
+    _sync_queue_realtime(doctor_id=doctor_id, clinic_id=clinic_id, queue_date=queue_date)
@@ -0,0 +1,168 @@
+"""Redis read model for the doctor / helpdesk queue screens (QUEUE_READ_MODEL_ENABLED)."""
+
+import json
+import uuid
+from unittest.mock import patch
+
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils.timezone import localdate
+from rest_framework import status
+
+from clinic.models import Clinic
+from helpdesk.models import HelpdeskClinicUser
+from queue_management.models import Queue
+from queue_management.services import queue_read_model
+from queue_management.services.queue_encounter_sync import mark_queue_rows_for_encounter_completed
+from queue_management.services.queue_sync import _sync_queue_realtime
+from queue_management.tests.test_helpdesk_queue_encounter import (
+    _doctor_and_patient,
+    _doctor_client,
+    _helpdesk_client,
+)
+
+
+class _FakeRedis:
+    def __init__(self):
+        self.store = {}
+
+    def get(self, key):
+        return self.store.get(key)
+
+    def mget(self, keys):
+        return [self.store.get(k) for k in keys]
+
+    def set(self, key, value, ex=None, nx=False):
+        if nx and key in self.store:
+            return None
+        self.store[key] = value
+        return True
+
+    def delete(self, *keys):
+        for key in keys:
+            self.store.pop(key, None)
+
+    def incr(self, key):
+        self.store[key] = str(int(self.store.get(key) or 0) + 1)
+        return int(self.store[key])
+
+    def expire(self, key, seconds):
+        return key in self.store
+
+    def pipeline(self, transaction=True):
+        return self
+
+    def execute(self):
+        return []
+
+
+def _queue_sql(ctx):
+    return [q["sql"] for q in ctx.captured_queries if "queue_management_queue" in q["sql"]]
+
+
+@override_settings(QUEUE_READ_MODEL_ENABLED=True)
+class QueueReadModelTests(TestCase):
+    def setUp(self):
+        self.redis = _FakeRedis()
+        patcher = patch.object(queue_read_model, "get_redis_client", return_value=self.redis)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.client, self.helpdesk_user = _helpdesk_client()
+        self.clinic = Clinic.objects.create(name=f"Clinic {uuid.uuid4().hex[:6]}")
+        HelpdeskClinicUser.objects.create(user=self.helpdesk_user, clinic=self.clinic, is_active=True)
+        self.doctor, account_a, profile_a = _doctor_and_patient(self.clinic)
+        self.other_doctor, account_b, profile_b = _doctor_and_patient(self.clinic)
+        _, account_c, profile_c = _doctor_and_patient(self.clinic)
+        for doctor, account, profile in (
+            (self.doctor, account_a, profile_a),
+            (self.doctor, account_b, profile_b),
+            (self.other_doctor, account_c, profile_c),
+        ):
+            resp = self.client.post(
+                reverse("queue-check-in"),
+                {
+                    "clinic_id": str(self.clinic.id),
+                    "patient_account_id": str(account.id),
+                    "patient_profile_id": str(profile.id),
+                    "doctor_id": str(doctor.id),
+                },
+                format="json",
+            )
+            self.assertEqual(resp.status_code, status.HTTP_201_CREATED, resp.data)
+        self.doctor_url = reverse("doctor-queue", kwargs={"doctor_id": self.doctor.id, "clinic_id": self.clinic.id})
+        self.helpdesk_url = reverse("helpdesk-clinic-queue-today")
+
+    def _sync(self, doctor):
+        _sync_queue_realtime(doctor_id=doctor.id, clinic_id=self.clinic.id, queue_date=localdate())
+
+    def _from_db(self, url, client):
+        with self.settings(QUEUE_READ_MODEL_ENABLED=False):
+            return json.loads(client.get(url).content)
+
+    def test_doctor_queue_served_from_write_through(self):
+        doc_client = _doctor_client(self.doctor.user)
+        expected = self._from_db(self.doctor_url, doc_client)
+        self.assertEqual(len(expected), 2)
+        self._sync(self.doctor)
+
+        with CaptureQueriesContext(connection) as ctx:
+            resp = doc_client.get(self.doctor_url)
+        self.assertEqual(resp.status_code, status.HTTP_200_OK)
+        self.assertEqual(json.loads(resp.content), expected)
+        self.assertEqual(_queue_sql(ctx), [])
+
+    def test_helpdesk_queue_falls_back_until_every_doctor_is_cached(self):
+        expected = self._from_db(self.helpdesk_url, self.client)
+        self.assertEqual(len(expected), 3)
+        self._sync(self.doctor)
+
+        with CaptureQueriesContext(connection) as ctx:
+            first = self.client.get(self.helpdesk_url)
+        self.assertTrue(_queue_sql(ctx))
+        self.assertEqual(json.loads(first.content), expected)
+
+        with CaptureQueriesContext(connection) as ctx:
+            second = self.client.get(self.helpdesk_url)
+        self.assertEqual(_queue_sql(ctx), [])
+        self.assertEqual(json.loads(second.content), expected)
+        self.assertIn("X-Queue-Calendar-Date", second.headers)
+
+    def test_read_through_does_not_overwrite_write_through(self):
+        self._sync(self.doctor)
+        key = queue_read_model.read_model_key("doctor", self.clinic.id, self.doctor.id, localdate())
+        self.redis.store[key] = "[]"
+        queue_read_model.fill_doctor_queue(
+            doctor_id=self.doctor.id, clinic_id=self.clinic.id, queue_date=localdate(), rows=[{"x": 1}], generation="0"
+        )
+        self.assertEqual(self.redis.store[key], "[]")
+
+    def test_fill_racing_an_invalidation_is_not_served(self):
+        today = localdate()
+        generation = queue_read_model.read_model_generations(
+            clinic_id=self.clinic.id, doctor_ids=[self.doctor.id], queue_date=today
+        )[str(self.doctor.id)]
+        # A queue change commits between the reader's DB query and its fill.
+        with self.captureOnCommitCallbacks(execute=True):
+            queue_read_model.invalidate_queue_read_model(
+                doctor_id=self.doctor.id, clinic_id=self.clinic.id, queue_date=today
+            )
+        queue_read_model.fill_doctor_queue(
+            doctor_id=self.doctor.id, clinic_id=self.clinic.id, queue_date=today, rows=[{"stale": 1}], generation=generation
+        )
+        self.assertIsNone(
+            queue_read_model.read_doctor_queue(doctor_id=self.doctor.id, clinic_id=self.clinic.id, queue_date=today)
+        )
+
+    def test_encounter_completion_invalidates_after_commit(self):
+        self._sync(self.doctor)
+        row = Queue.objects.filter(doctor=self.doctor).order_by("position_in_queue").first()
+        with self.captureOnCommitCallbacks(execute=True):
+            mark_queue_rows_for_encounter_completed(row.encounter_id)
+        self.assertIsNone(
+            queue_read_model.read_doctor_queue(doctor_id=self.doctor.id, clinic_id=self.clinic.id, queue_date=localdate())
+        )
+        resp = _doctor_client(self.doctor.user).get(self.doctor_url)
+        self.assertEqual(len(resp.data), 1)
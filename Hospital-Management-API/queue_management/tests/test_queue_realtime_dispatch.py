@@ -0,0 +1,168 @@
+import json
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+from django.test import SimpleTestCase, override_settings
+
+from queue_management.services import queue_realtime, queue_sync
+
+QUEUE_DATE = date(2026, 1, 5)
+ROWS = [
+    {"id": "q1", "encounter_id": "e1", "position": 1},
+    {"id": "q2", "encounter_id": None, "position": 2},
+    {"id": "q3", "encounter_id": "e3", "position": 3},
+    {"id": "q4", "encounter_id": "e4", "position": 4},
+]
+
+
+class DispatchQueueUpdateTests(SimpleTestCase):
+    def setUp(self):
+        self.client = MagicMock()
+        self.pipe = self.client.pipeline.return_value
+        patcher = patch.object(queue_realtime, "get_redis_client", return_value=self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_delta_script_and_publishes_share_one_round_trip(self):
+        delta = {"type": "SMART_QUEUE_DELTA", "seq": 4, "deltas": [{"op": "remove", "key": "e9"}]}
+        self.pipe.execute.return_value = [json.dumps(delta), 1, 1]
+        with patch.object(queue_realtime, "_broadcast_queue_update") as broadcast:
+            key = queue_realtime.dispatch_queue_update("c1", "d1", QUEUE_DATE, ROWS)
+
+        self.assertEqual(key, "queue:c1:d1:2026-01-05")
+        self.client.pipeline.assert_called_once_with(transaction=False)
+        self.pipe.execute.assert_called_once_with()
+        self.pipe.delete.assert_not_called()
+
+        args = self.pipe.eval.call_args.args
+        self.assertEqual(
+            args[1:5],
+            (3, key, "queue_status:c1:d1:2026-01-05", "queue_stream:c1:d1:2026-01-05"),
+        )
+        self.assertEqual(json.loads(args[8])["type"], "SMART_QUEUE_DELTA")
+        entries = json.loads(args[9])
+        self.assertEqual([e["key"] for e in entries], ["e1", "q2", "e3", "e4"])
+        self.assertEqual(entries[0]["row"], ROWS[0])
+
+        channels = [c.args[0] for c in self.pipe.publish.call_args_list]
+        self.assertEqual(channels, ["queue_updates:c1:d1", queue_realtime.QUEUE_UPDATES_CHANNEL])
+        body = json.loads(self.pipe.publish.call_args_list[0].args[1])
+        self.assertEqual(body["type"], "SMART_QUEUE_UPDATE")
+        self.assertEqual(body["data"], {"top_queue": ROWS[:3], "total_active": 4})
+        broadcast.assert_called_once_with("c1", "d1", body, delta=delta)
+
+    def test_unchanged_queue_broadcasts_without_delta(self):
+        self.pipe.execute.return_value = [None, 1, 1]
+        with patch.object(queue_realtime, "_broadcast_queue_update") as broadcast:
+            queue_realtime.dispatch_queue_update("c1", "d1", QUEUE_DATE, ROWS)
+        self.assertIsNone(broadcast.call_args.kwargs["delta"])
+
+    def test_redis_failure_still_broadcasts(self):
+        self.pipe.execute.side_effect = ConnectionError("down")
+        with patch.object(queue_realtime, "_broadcast_queue_update") as broadcast:
+            queue_realtime.dispatch_queue_update("c1", "d1", QUEUE_DATE, ROWS)
+        broadcast.assert_called_once()
+
+
+class ReadQueueDeltasTests(SimpleTestCase):
+    def setUp(self):
+        self.client = MagicMock()
+        self.pipe = self.client.pipeline.return_value
+        patcher = patch.object(queue_realtime, "get_redis_client", return_value=self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _stream(self, first, last, entries):
+        self.pipe.execute.return_value = [
+            [(f"{first}-0", {})] if first else [],
+            [(f"{last}-0", {})] if last else [],
+            [(f"{seq}-0", {"data": json.dumps({"seq": seq})}) for seq in entries],
+        ]
+
+    def test_replays_entries_after_since(self):
+        self._stream(1, 5, [4, 5])
+        deltas, latest = queue_realtime.read_queue_deltas("c1", "d1", QUEUE_DATE, 3)
+        self.assertEqual([d["seq"] for d in deltas], [4, 5])
+        self.assertEqual(latest, 5)
+        self.assertEqual(self.pipe.xrange.call_args_list[1].kwargs["min"], "4-0")
+
+    def test_trimmed_gap_requires_resync(self):
+        self._stream(10, 12, [10, 11, 12])
+        self.assertEqual(queue_realtime.read_queue_deltas("c1", "d1", QUEUE_DATE, 3), (None, 12))
+
+    def test_since_ahead_of_stream_requires_resync(self):
+        self._stream(None, None, [])
+        self.assertEqual(queue_realtime.read_queue_deltas("c1", "d1", QUEUE_DATE, 7), (None, 0))
+        self.assertEqual(queue_realtime.read_queue_deltas("c1", "d1", QUEUE_DATE, 0), ([], 0))
+
+
+class RedisPoolTests(SimpleTestCase):
+    def setUp(self):
+        queue_realtime.reset_redis_pool()
+        self.addCleanup(queue_realtime.reset_redis_pool)
+
+    @override_settings(QUEUE_REALTIME_REDIS_MAX_CONNECTIONS=7)
+    def test_clients_share_one_pool(self):
+        first = queue_realtime.get_redis_client()
+        second = queue_realtime.get_redis_client()
+        self.assertIs(first.connection_pool, second.connection_pool)
+        self.assertEqual(first.connection_pool.max_connections, 7)
+
+
+class CoalesceQueueSyncTests(SimpleTestCase):
+    def setUp(self):
+        self.client = MagicMock()
+        patcher = patch.object(queue_realtime, "get_redis_client", return_value=self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        task_patcher = patch("queue_management.tasks.sync_queue_realtime_task.apply_async")
+        self.apply_async = task_patcher.start()
+        self.addCleanup(task_patcher.stop)
+
+    def _coalesce(self):
+        return queue_sync.coalesce_queue_sync(doctor_id="d1", clinic_id="c1", queue_date=QUEUE_DATE)
+
+    @override_settings(QUEUE_REALTIME_DEBOUNCE_MS=0)
+    def test_disabled_returns_false(self):
+        self.assertFalse(self._coalesce())
+        self.client.set.assert_not_called()
+
+    @override_settings(QUEUE_REALTIME_DEBOUNCE_MS=250)
+    def test_burst_schedules_one_task(self):
+        self.client.set.side_effect = [True, None, None]
+        self.assertTrue(self._coalesce())
+        self.assertTrue(self._coalesce())
+        self.assertTrue(self._coalesce())
+
+        self.apply_async.assert_called_once()
+        kwargs = self.apply_async.call_args.kwargs
+        self.assertEqual(kwargs["countdown"], 0.25)
+        self.assertEqual(
+            kwargs["kwargs"], {"doctor_id": "d1", "clinic_id": "c1", "queue_date_iso": "2026-01-05"}
+        )
+        self.client.set.assert_called_with(
+            "queue_sync_pending:c1:d1:2026-01-05",
+            "1",
+            nx=True,
+            px=250 + queue_sync.PENDING_SYNC_GRACE_MS,
+        )
+
+    @override_settings(QUEUE_REALTIME_DEBOUNCE_MS=250)
+    def test_redis_unavailable_falls_back_inline(self):
+        self.client.set.side_effect = ConnectionError("down")
+        self.assertFalse(self._coalesce())
+        self.apply_async.assert_not_called()
+
+    @override_settings(QUEUE_REALTIME_DEBOUNCE_MS=250)
+    def test_dispatch_failure_releases_marker(self):
+        self.client.set.return_value = True
+        self.apply_async.side_effect = RuntimeError("broker down")
+        self.assertFalse(self._coalesce())
+        self.client.delete.assert_called_once_with("queue_sync_pending:c1:d1:2026-01-05")
+
+    def test_task_body_releases_marker_before_sync(self):
+        order = []
+        self.client.delete.side_effect = lambda key: order.append("release")
+        with patch.object(queue_sync, "_sync_queue_realtime", side_effect=lambda **kw: order.append("sync")):
+            queue_sync.run_coalesced_queue_sync(doctor_id="d1", clinic_id="c1", queue_date=QUEUE_DATE)
+        self.assertEqual(order, ["release", "sync"])
@@ -0,0 +1,110 @@
+import json
+from unittest.mock import patch
+
+from asgiref.sync import async_to_sync
+from asgiref.testing import ApplicationCommunicator
+from channels.layers import get_channel_layer
+from channels.routing import URLRouter
+from django.test import SimpleTestCase
+from django.utils.timezone import localdate
+
+from queue_management.routing import websocket_urlpatterns
+
+APP = URLRouter(websocket_urlpatterns)
+GROUP = "queue_updates_c1_d1"
+
+
+class _Socket(ApplicationCommunicator):
+    # channels.testing pulls in daphne; the raw ASGI communicator is enough here.
+    def __init__(self, query_string=b""):
+        super().__init__(
+            APP,
+            {"type": "websocket", "path": "/ws/queue-updates/c1/d1/", "query_string": query_string, "headers": []},
+        )
+
+    async def connect(self):
+        await self.send_input({"type": "websocket.connect"})
+        assert (await self.receive_output())["type"] == "websocket.accept"
+
+    async def receive_json_from(self):
+        return json.loads((await self.receive_output())["text"])
+
+    async def disconnect(self):
+        await self.send_input({"type": "websocket.disconnect", "code": 1000})
+        await self.wait()
+
+
+def _delta(seq, queue_date=None):
+    return {
+        "type": "SMART_QUEUE_DELTA",
+        "queue_date": queue_date or localdate().isoformat(),
+        "seq": seq,
+        "deltas": [],
+    }
+
+
+def _event(delta):
+    return {"type": "queue.update", "payload": {"type": "SMART_QUEUE_UPDATE"}, "delta": delta}
+
+
+class QueueUpdatesConsumerTests(SimpleTestCase):
+    def test_legacy_client_receives_full_update(self):
+        async def run():
+            comm = _Socket()
+            await comm.connect()
+            await get_channel_layer().group_send(GROUP, _event(_delta(1)))
+            message = await comm.receive_json_from()
+            await comm.disconnect()
+            return message
+
+        self.assertEqual(async_to_sync(run)(), {"type": "SMART_QUEUE_UPDATE"})
+
+    @patch("queue_management.consumers.read_queue_deltas", return_value=([_delta(3), _delta(4)], 4))
+    def test_resume_replays_then_dedupes_live_deltas(self, read_mock):
+        async def run():
+            comm = _Socket(b"since=2")
+            await comm.connect()
+            seen = [(await comm.receive_json_from())["seq"] for _ in range(2)]
+            layer = get_channel_layer()
+            await layer.group_send(GROUP, _event(_delta(4)))
+            await layer.group_send(GROUP, _event(None))
+            await layer.group_send(GROUP, _event(_delta(5)))
+            seen.append((await comm.receive_json_from())["seq"])
+            self.assertTrue(await comm.receive_nothing())
+            await comm.disconnect()
+            return seen
+
+        self.assertEqual(async_to_sync(run)(), [3, 4, 5])
+        self.assertEqual(read_mock.call_args.args[3], 2)
+
+    @patch("queue_management.consumers.read_queue_deltas", return_value=(None, 9))
+    def test_gap_sends_resync_and_continues_from_latest(self, _read_mock):
+        async def run():
+            comm = _Socket(b"since=1")
+            await comm.connect()
+            resync = await comm.receive_json_from()
+            await get_channel_layer().group_send(GROUP, _event(_delta(9)))
+            await get_channel_layer().group_send(GROUP, _event(_delta(10)))
+            nxt = await comm.receive_json_from()
+            await comm.disconnect()
+            return resync, nxt
+
+        resync, nxt = async_to_sync(run)()
+        self.assertEqual((resync["type"], resync["seq"]), ("SMART_QUEUE_RESYNC", 9))
+        self.assertEqual(nxt["seq"], 10)
+
+    @patch("queue_management.consumers.read_queue_deltas")
+    def test_live_gap_replays_missing_deltas(self, read_mock):
+        read_mock.side_effect = [([], 2), ([_delta(3), _delta(4)], 4)]
+
+        async def run():
+            comm = _Socket(b"since=2")
+            await comm.connect()
+            await get_channel_layer().group_send(GROUP, _event(_delta(4)))
+            seen = [(await comm.receive_json_from())["seq"] for _ in range(2)]
+            self.assertTrue(await comm.receive_nothing())
+            await comm.disconnect()
+            return seen
+
+        self.assertEqual(async_to_sync(run)(), [3, 4])
+        self.assertEqual(read_mock.call_args.args[3], 2)
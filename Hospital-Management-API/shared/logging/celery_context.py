@@ -189,6 +189,16 @@ class LogContextPropagationTask(Task):
         return super().apply_async(args, kwargs, **options)
 
 
+def _close_logging_on_process_shutdown(**_kwargs: Any) -> None:
+    """Write buffered log output before a prefork child exits.
+
+    Pool processes leave via ``os._exit``, which skips the atexit hook.
+    """
+    from shared.logging.factory import _shutdown_logging
+
+    _shutdown_logging()
+
+
 def register_celery_context_signals() -> None:
     """Connect Celery signals for context propagation (idempotent)."""
     global _signals_registered
@@ -200,10 +210,12 @@ def register_celery_context_signals() -> None:
         task_failure,
         task_postrun,
         task_prerun,
+        worker_process_shutdown,
     )
 
     before_task_publish.connect(_inject_log_context_header, weak=False)
     task_prerun.connect(_restore_log_context, weak=False)
     task_postrun.connect(_clear_log_context_after_postrun, weak=False)
     task_failure.connect(_clear_log_context_after_failure, weak=False)
+    worker_process_shutdown.connect(_close_logging_on_process_shutdown, weak=False)
     _signals_registered = True
@@ -162,6 +162,20 @@ class CloudWatchLogBuffer:
             self._flush_locked(force=True)
             self._closed = True
 
+    def send_batch(self, events: list[dict[str, Any]]) -> None:
+        """Deliver a prepared batch immediately, bypassing the buffer.
+
+        Used by CloudWatchShipper, which owns batching on its own thread.
+
+        Args:
+            events: CloudWatch log events (``timestamp``/``message``) in order.
+
+        Raises:
+            HandlerError: If delivery fails after retries.
+        """
+        with self._lock:
+            self._deliver_locked(events)
+
     def _flush_locked(self, *, force: bool) -> None:
         if not self._buffer:
             return
@@ -173,7 +187,9 @@ class CloudWatchLogBuffer:
         events = self._buffer
         self._buffer = []
         self._last_flush_monotonic = time.monotonic()
+        self._deliver_locked(events)
 
+    def _deliver_locked(self, events: list[dict[str, Any]]) -> None:
         self._ensure_log_group()
         self._ensure_log_stream()
         self._put_events_with_retry(events)
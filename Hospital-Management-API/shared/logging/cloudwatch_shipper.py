@@ -0,0 +1,348 @@
+"""Background CloudWatch shipper for the logging platform.
+
+Purpose:
+    Take CloudWatch delivery off the logging call site. Request threads only
+    enqueue; a dedicated daemon thread batches and ships.
+
+Responsibility:
+    Bounded queue, size/byte/age batching within CloudWatch PutLogEvents
+    limits, overflow policy (drop oldest or spill to disk), and delivery
+    counters. Delivery itself (streams, sequence tokens, retries) stays in
+    CloudWatchLogBuffer. Not part of the public API — used by
+    CloudWatchLogHandler only.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import threading
+import time
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any
+
+from shared.logging.cloudwatch_buffer import FLUSH_INTERVAL_SEC, CloudWatchLogBuffer
+from shared.logging.config import (
+    DEFAULT_CLOUDWATCH_QUEUE_SIZE,
+    OVERFLOW_DROP_OLDEST,
+    OVERFLOW_SPILL,
+)
+from shared.logging.utils import register_after_fork
+
+# PutLogEvents limits: 10,000 events, 1,048,576 bytes (message UTF-8 bytes
+# plus 26 bytes per event), and a 24 hour span between first and last event.
+MAX_BATCH_EVENTS = 10_000
+MAX_BATCH_BYTES = 1_048_576
+EVENT_OVERHEAD_BYTES = 26
+MAX_BATCH_SPAN_MS = 24 * 60 * 60 * 1000
+
+DEFAULT_SPILL_MAX_BYTES = 64 * 1024 * 1024
+CLOSE_TIMEOUT_SEC = 5.0
+
+
+class CloudWatchShipper:
+    """Queue-fed daemon thread that ships batches through a CloudWatchLogBuffer.
+
+    ``submit`` never performs network I/O: it timestamps the event and appends
+    it to a bounded in-memory queue under a short lock. When the queue is full
+    the oldest event is dropped, or — with the spill policy — the new event is
+    appended to a local JSONL file that the shipper drains once CloudWatch
+    accepts batches again. Delivery failures are counted, never raised.
+    """
+
+    def __init__(
+        self,
+        *,
+        buffer: CloudWatchLogBuffer,
+        max_queue_size: int = DEFAULT_CLOUDWATCH_QUEUE_SIZE,
+        max_batch_events: int = MAX_BATCH_EVENTS,
+        max_batch_bytes: int = MAX_BATCH_BYTES,
+        flush_interval_sec: float = FLUSH_INTERVAL_SEC,
+        overflow_policy: str = OVERFLOW_DROP_OLDEST,
+        spill_path: str | None = None,
+        spill_max_bytes: int = DEFAULT_SPILL_MAX_BYTES,
+    ) -> None:
+        """Initialize and start the shipper thread.
+
+        Args:
+            buffer: Buffer used for delivery (stream setup, tokens, retries).
+            max_queue_size: Maximum events held in memory.
+            max_batch_events: Maximum events per PutLogEvents call.
+            max_batch_bytes: Maximum PutLogEvents payload size.
+            flush_interval_sec: Maximum age of a queued event before shipping.
+            overflow_policy: ``drop_oldest`` or ``spill``.
+            spill_path: JSONL spill file, required for the spill policy.
+            spill_max_bytes: Spill file size cap; events beyond it are dropped.
+        """
+        self._buffer = buffer
+        self._max_queue_size = max(1, max_queue_size)
+        self._max_batch_events = min(max(1, max_batch_events), MAX_BATCH_EVENTS)
+        self._max_batch_bytes = min(max_batch_bytes, MAX_BATCH_BYTES)
+        self._flush_interval_sec = flush_interval_sec
+        self._overflow_policy = overflow_policy
+        self._spill_path = spill_path if overflow_policy == OVERFLOW_SPILL else None
+        self._spill_max_bytes = spill_max_bytes
+
+        self._closed = False
+        self._stats: dict[str, Any] = {
+            "enqueued": 0,
+            "shipped": 0,
+            "dropped": 0,
+            "spilled": 0,
+            "failed_batches": 0,
+            "max_queue_depth": 0,
+            "last_ship_latency_ms": 0,
+            "max_ship_latency_ms": 0,
+            "last_error": None,
+        }
+        self._start()
+        register_after_fork(self, "_after_fork")
+
+    def _start(self) -> None:
+        self._lock = threading.Lock()
+        self._spill_lock = threading.Lock()
+        self._idle = threading.Condition()
+        self._wake = threading.Event()
+        self._queue: deque[dict[str, Any]] = deque()
+        # Worker-owned: events taken from the queue but not yet shipped.
+        self._pending: deque[dict[str, Any]] = deque()
+        self._busy = False
+        self._stopping = False
+        self._spill_bytes = _file_size(self._spill_path)
+        self._thread = threading.Thread(
+            target=self._run,
+            name="cloudwatch-log-shipper",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _after_fork(self) -> None:
+        # The parent still owns its queued events; the child starts empty.
+        if not self._closed:
+            self._start()
+
+    def submit(self, formatted_record: str) -> None:
+        """Queue a formatted JSON log line without blocking on delivery."""
+        if self._closed:
+            return
+        event = {
+            "timestamp": int(datetime.now(timezone.utc).timestamp() * 1000),
+            "message": formatted_record,
+        }
+        with self._lock:
+            queue = self._queue
+            if len(queue) >= self._max_queue_size:
+                if self._spill_path is not None:
+                    overflow = event
+                else:
+                    overflow = None
+                    queue.popleft()
+                    self._stats["dropped"] += 1
+                    queue.append(event)
+            else:
+                overflow = None
+                queue.append(event)
+            if overflow is None:
+                self._stats["enqueued"] += 1
+                depth = len(queue)
+                if depth > self._stats["max_queue_depth"]:
+                    self._stats["max_queue_depth"] = depth
+                if depth == self._max_batch_events:
+                    self._wake.set()
+        if overflow is not None:
+            self._spill([overflow])
+
+    def flush(self, timeout: float | None = None) -> bool:
+        """Wake the shipper and wait until everything queued so far is handled.
+
+        Args:
+            timeout: Seconds to wait; ``None`` waits indefinitely.
+
+        Returns:
+            bool: True if the queue drained within the timeout.
+        """
+        if not self._thread.is_alive():
+            return self._is_idle()
+        self._wake.set()
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._idle:
+            while not self._is_idle():
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    return False
+                self._idle.wait(remaining)
+                self._wake.set()
+        return True
+
+    def close(self, timeout: float = CLOSE_TIMEOUT_SEC) -> None:
+        """Ship what is queued (bounded by ``timeout``) and stop the thread."""
+        if self._closed:
+            return
+        self._closed = True
+        self._stopping = True
+        self._wake.set()
+        self._thread.join(timeout)
+
+    def stats(self) -> dict[str, Any]:
+        """Return a snapshot of shipper counters and the current queue depth."""
+        with self._lock:
+            snapshot = dict(self._stats)
+            snapshot["queue_depth"] = len(self._queue) + len(self._pending)
+        snapshot["spill_bytes"] = self._spill_bytes
+        return snapshot
+
+    def _is_idle(self) -> bool:
+        return not self._busy and not self._pending and not self._queue
+
+    def _run(self) -> None:
+        while True:
+            self._wake.wait(self._flush_interval_sec)
+            self._wake.clear()
+            with self._idle:
+                self._busy = True
+            try:
+                if self._ship_queue():
+                    self._drain_spill()
+            finally:
+                with self._idle:
+                    self._busy = False
+                    self._idle.notify_all()
+            if self._stopping and not self._queue and not self._pending:
+                return
+
+    def _ship_queue(self) -> bool:
+        """Ship all queued events; return False if any batch failed."""
+        ok = True
+        while True:
+            if len(self._pending) < self._max_batch_events:
+                with self._lock:
+                    if self._queue:
+                        # Bounded swap: at most one queue's worth is ever in flight.
+                        taken, self._queue = self._queue, deque()
+                    else:
+                        taken = None
+                if taken:
+                    self._pending.extend(taken)
+            if not self._pending:
+                return ok
+            batch = self._take_batch(self._pending)
+            if not self._deliver(batch):
+                ok = False
+                self._on_failed_batch(batch)
+
+    def _take_batch(self, source: deque[dict[str, Any]]) -> list[dict[str, Any]]:
+        batch: list[dict[str, Any]] = []
+        size = 0
+        while source and len(batch) < self._max_batch_events:
+            event = source[0]
+            event_bytes = len(event["message"].encode("utf-8")) + EVENT_OVERHEAD_BYTES
+            if batch and (
+                size + event_bytes > self._max_batch_bytes
+                or event["timestamp"] - batch[0]["timestamp"] >= MAX_BATCH_SPAN_MS
+            ):
+                break
+            batch.append(source.popleft())
+            size += event_bytes
+        # Events from concurrent producers can be a few ms out of order.
+        batch.sort(key=lambda item: item["timestamp"])
+        return batch
+
+    def _deliver(self, batch: list[dict[str, Any]]) -> bool:
+        try:
+            self._buffer.send_batch(batch)
+        except Exception as exc:
+            with self._lock:
+                self._stats["failed_batches"] += 1
+                self._stats["last_error"] = str(exc)
+            return False
+        latency_ms = max(0, int(time.time() * 1000) - batch[0]["timestamp"])
+        with self._lock:
+            self._stats["shipped"] += len(batch)
+            self._stats["last_ship_latency_ms"] = latency_ms
+            if latency_ms > self._stats["max_ship_latency_ms"]:
+                self._stats["max_ship_latency_ms"] = latency_ms
+        return True
+
+    def _on_failed_batch(self, batch: list[dict[str, Any]]) -> None:
+        if self._spill_path is not None:
+            self._spill(batch)
+            return
+        with self._lock:
+            self._stats["dropped"] += len(batch)
+
+    def _spill(self, events: list[dict[str, Any]]) -> None:
+        assert self._spill_path is not None
+        lines = "".join(json.dumps(event, separators=(",", ":")) + "\n" for event in events)
+        size = len(lines.encode("utf-8"))
+        written = False
+        error: str | None = None
+        with self._spill_lock:
+            if self._spill_bytes + size <= self._spill_max_bytes:
+                try:
+                    with open(self._spill_path, "a", encoding="utf-8") as handle:
+                        handle.write(lines)
+                    self._spill_bytes += size
+                    written = True
+                except OSError as exc:
+                    error = str(exc)
+        with self._lock:
+            self._stats["spilled" if written else "dropped"] += len(events)
+            if error is not None:
+                self._stats["last_error"] = error
+
+    def _drain_spill(self) -> None:
+        if self._spill_path is None:
+            return
+        draining = f"{self._spill_path}.draining"
+        with self._spill_lock:
+            if not os.path.exists(draining):
+                if not self._spill_bytes:
+                    return
+                try:
+                    os.replace(self._spill_path, draining)
+                except OSError:
+                    return
+                self._spill_bytes = 0
+        try:
+            with open(draining, encoding="utf-8") as handle:
+                events = deque(json.loads(line) for line in handle if line.strip())
+        except (OSError, ValueError) as exc:
+            with self._lock:
+                self._stats["last_error"] = str(exc)
+            _remove_quietly(draining)
+            return
+        while events:
+            batch = self._take_batch(events)
+            if not self._deliver(batch):
+                events.extendleft(reversed(batch))
+                _rewrite_spill(draining, events)
+                return
+        _remove_quietly(draining)
+
+
+def _file_size(path: str | None) -> int:
+    if path is None:
+        return 0
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+def _remove_quietly(path: str) -> None:
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def _rewrite_spill(path: str, events: deque[dict[str, Any]]) -> None:
+    tmp = f"{path}.tmp"
+    try:
+        with open(tmp, "w", encoding="utf-8") as handle:
+            for event in events:
+                handle.write(json.dumps(event, separators=(",", ":")) + "\n")
+        os.replace(tmp, path)
+    except OSError:
+        _remove_quietly(tmp)
@@ -17,12 +17,21 @@ from dataclasses import dataclass
 
 from shared.logging.constants import Environment, LogLevel
 from shared.logging.exceptions import ConfigurationError
+from shared.logging.sampling import SamplingRule, validate_sampling_rule
 
 HANDLER_CONSOLE = "console"
 HANDLER_CLOUDWATCH = "cloudwatch"
 
 SUPPORTED_HANDLERS = frozenset({HANDLER_CONSOLE, HANDLER_CLOUDWATCH})
 
+OVERFLOW_DROP_OLDEST = "drop_oldest"
+OVERFLOW_SPILL = "spill"
+
+SUPPORTED_OVERFLOW_POLICIES = frozenset({OVERFLOW_DROP_OLDEST, OVERFLOW_SPILL})
+
+DEFAULT_CLOUDWATCH_QUEUE_SIZE = 10_000
+DEFAULT_METRICS_NAMESPACE = "DoctorProCare"
+
 
 @dataclass(frozen=True)
 class LoggingConfig:
@@ -35,10 +44,23 @@ class LoggingConfig:
         log_level: Minimum severity level to emit.
         handlers: Ordered handler names (e.g. console, cloudwatch).
         json_pretty: Whether console JSON output is pretty-printed.
+        console_buffered: Write console output from a background thread in
+            chunks instead of a write and flush per record.
         cloudwatch_log_group: Target CloudWatch log group when cloudwatch enabled.
         cloudwatch_region: AWS region for CloudWatch when cloudwatch enabled.
         cloudwatch_stream_name: Optional fixed log stream name.
+        cloudwatch_background: Ship CloudWatch batches from a background thread
+            instead of the logging call site.
+        cloudwatch_queue_size: Maximum events held for the background shipper.
+        cloudwatch_overflow_policy: What the shipper does when its queue is
+            full (drop_oldest or spill).
+        cloudwatch_spill_path: JSONL file for the spill overflow policy.
         retention_days: Log retention period in days, if applicable.
+        sampling_rules: Ordered sampling / rate-limit rules for high-volume
+            actions; the first matching rule applies.
+        metrics_flush_interval_sec: Seconds between aggregated EMF metric
+            records; None disables the metrics flusher.
+        metrics_namespace: CloudWatch namespace for EMF metric records.
     """
 
     environment: Environment
@@ -47,10 +69,18 @@ class LoggingConfig:
     log_level: LogLevel
     handlers: tuple[str, ...]
     json_pretty: bool = False
+    console_buffered: bool = False
     cloudwatch_log_group: str | None = None
     cloudwatch_region: str | None = None
     cloudwatch_stream_name: str | None = None
+    cloudwatch_background: bool = False
+    cloudwatch_queue_size: int = DEFAULT_CLOUDWATCH_QUEUE_SIZE
+    cloudwatch_overflow_policy: str = OVERFLOW_DROP_OLDEST
+    cloudwatch_spill_path: str | None = None
     retention_days: int | None = None
+    sampling_rules: tuple[SamplingRule, ...] = ()
+    metrics_flush_interval_sec: float | None = None
+    metrics_namespace: str = DEFAULT_METRICS_NAMESPACE
 
 
 def validate_logging_config(config: LoggingConfig) -> LoggingConfig:
@@ -78,6 +108,19 @@ def validate_logging_config(config: LoggingConfig) -> LoggingConfig:
         if handler_name not in SUPPORTED_HANDLERS:
             raise ConfigurationError(f"unsupported handler: {handler_name}")
 
+    for rule in config.sampling_rules:
+        if not isinstance(rule, SamplingRule):
+            raise ConfigurationError("sampling_rules must contain SamplingRule instances")
+        validate_sampling_rule(rule)
+
+    if config.metrics_flush_interval_sec is not None:
+        if config.metrics_flush_interval_sec <= 0:
+            raise ConfigurationError("metrics_flush_interval_sec must be positive")
+        if not config.metrics_namespace.strip():
+            raise ConfigurationError(
+                "metrics_namespace must not be empty when metrics flushing is enabled"
+            )
+
     if HANDLER_CLOUDWATCH in config.handlers:
         if not config.cloudwatch_log_group or not config.cloudwatch_log_group.strip():
             raise ConfigurationError(
@@ -87,5 +130,17 @@ def validate_logging_config(config: LoggingConfig) -> LoggingConfig:
             raise ConfigurationError(
                 "cloudwatch_region is required when cloudwatch handler is enabled"
             )
+        if config.cloudwatch_queue_size < 1:
+            raise ConfigurationError("cloudwatch_queue_size must be at least 1")
+        if config.cloudwatch_overflow_policy not in SUPPORTED_OVERFLOW_POLICIES:
+            raise ConfigurationError(
+                f"unsupported cloudwatch_overflow_policy: {config.cloudwatch_overflow_policy}"
+            )
+        if config.cloudwatch_overflow_policy == OVERFLOW_SPILL and not (
+            config.cloudwatch_spill_path and config.cloudwatch_spill_path.strip()
+        ):
+            raise ConfigurationError(
+                "cloudwatch_spill_path is required for the spill overflow policy"
+            )
 
     return config
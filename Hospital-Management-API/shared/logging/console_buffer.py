@@ -0,0 +1,145 @@
+"""Internal buffered stdout writer for the logging platform.
+
+Purpose:
+    Replace a write plus flush per log line with chunked writes from a
+    background thread.
+
+Responsibility:
+    Ordered buffering, max-latency flushing, backpressure when the writer
+    falls behind, and fork safety. Not part of the public API — used by
+    ConsoleLogHandler only.
+"""
+
+from __future__ import annotations
+
+import sys
+import threading
+from typing import Callable, TextIO
+
+from shared.logging.utils import register_after_fork
+
+FLUSH_INTERVAL_SEC = 0.2
+MAX_BUFFER_BYTES = 256 * 1024
+# Callers write the backlog themselves once it reaches this multiple of
+# MAX_BUFFER_BYTES (writer thread stalled on a blocked pipe).
+BACKPRESSURE_FACTOR = 4
+
+
+class ConsoleWriteBuffer:
+    """Ordered line buffer drained to a text stream by a daemon thread.
+
+    Lines are written in append order: every drain swaps the pending chunk
+    and writes it while holding the write lock, whether it runs on the
+    writer thread, in flush(), or in a caller applying backpressure.
+    """
+
+    def __init__(
+        self,
+        *,
+        stream: Callable[[], TextIO] = lambda: sys.stdout,
+        flush_interval_sec: float = FLUSH_INTERVAL_SEC,
+        max_buffer_bytes: int = MAX_BUFFER_BYTES,
+    ) -> None:
+        """Initialize the buffer; the writer thread starts on first append.
+
+        Args:
+            stream: Returns the destination stream at write time, so
+                replacements of ``sys.stdout`` (e.g. test capture) are honoured.
+            flush_interval_sec: Maximum time a line waits before being written.
+            max_buffer_bytes: Pending size that wakes the writer early.
+        """
+        self._stream = stream
+        self._flush_interval_sec = flush_interval_sec
+        self._max_buffer_bytes = max_buffer_bytes
+        self._closed = False
+        self._write_errors = 0
+        self._reset()
+        register_after_fork(self, "_after_fork")
+
+    def _reset(self) -> None:
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._parts: list[str] = []
+        self._pending_bytes = 0
+        self._thread: threading.Thread | None = None
+
+    @property
+    def write_errors(self) -> int:
+        """Return the number of chunk writes that failed with OSError."""
+        return self._write_errors
+
+    def append(self, line: str) -> None:
+        """Queue one line (without trailing newline) for writing.
+
+        After close() the line is written synchronously instead.
+        """
+        with self._lock:
+            closed = self._closed
+            if not closed:
+                self._parts.append(f"{line}\n")
+                self._pending_bytes += len(line) + 1
+                pending = self._pending_bytes
+                if self._thread is None:
+                    self._start_locked()
+        if closed:
+            self._drain(f"{line}\n")
+            return
+        if pending >= self._max_buffer_bytes * BACKPRESSURE_FACTOR:
+            self._drain()
+        elif pending >= self._max_buffer_bytes:
+            self._wake.set()
+
+    def flush(self) -> None:
+        """Write everything appended so far and flush the stream."""
+        self._drain()
+
+    def close(self) -> None:
+        """Write remaining lines and stop the writer thread.
+
+        The closed flag is set under the buffer lock, so every line appended
+        before it is drained here and every line after it is written by
+        append() itself.
+        """
+        with self._lock:
+            if self._closed:
+                return
+            self._closed = True
+        self._wake.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(FLUSH_INTERVAL_SEC * 10)
+        self._drain()
+
+    def _start_locked(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run,
+            name="console-log-writer",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._closed:
+            self._wake.wait(self._flush_interval_sec)
+            self._wake.clear()
+            self._drain()
+
+    def _drain(self, tail: str = "") -> None:
+        with self._write_lock:
+            with self._lock:
+                if not self._parts and not tail:
+                    return
+                chunk = "".join(self._parts) + tail
+                self._parts = []
+                self._pending_bytes = 0
+            try:
+                stream = self._stream()
+                stream.write(chunk)
+                stream.flush()
+            except (OSError, ValueError):
+                self._write_errors += 1
+
+    def _after_fork(self) -> None:
+        # Lines queued before the fork belong to the parent.
+        self._reset()
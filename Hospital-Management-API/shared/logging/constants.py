@@ -53,6 +53,15 @@ class LogLevel(StrEnum):
     CRITICAL = "CRITICAL"
 
 
+LOG_LEVEL_SEVERITY = {
+    LogLevel.DEBUG: 10,
+    LogLevel.INFO: 20,
+    LogLevel.WARNING: 30,
+    LogLevel.ERROR: 40,
+    LogLevel.CRITICAL: 50,
+}
+
+
 class LogModule(StrEnum):
     """Approved logging module identifiers."""
 
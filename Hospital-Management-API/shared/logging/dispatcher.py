@@ -14,37 +14,85 @@ Future implementation:
 
 from __future__ import annotations
 
+from shared.logging.constants import LOG_LEVEL_SEVERITY, LogLevel
 from shared.logging.exceptions import HandlerError
+from shared.logging.formatter import begin_shared_serialization, end_shared_serialization
 from shared.logging.handlers import BaseLogHandler, ConsoleLogHandler
 from shared.logging.record import LogRecord
+from shared.logging.sampling import SamplingPolicy
 
 
 class LogDispatcher:
     """Routes LogRecord instances to one or more output handlers."""
 
-    def __init__(self, handlers: list[BaseLogHandler] | None = None) -> None:
+    def __init__(
+        self,
+        handlers: list[BaseLogHandler] | None = None,
+        *,
+        min_level: LogLevel = LogLevel.DEBUG,
+        sampling: SamplingPolicy | None = None,
+    ) -> None:
         """Initialize the dispatcher with output handlers.
 
         Args:
             handlers: Handler instances to receive log records.
                 Defaults to a single ConsoleLogHandler.
+            min_level: Lowest severity the logger should build records for.
+            sampling: Optional sampling / rate-limit policy for the logger.
         """
         self._handlers: list[BaseLogHandler] = handlers or [ConsoleLogHandler()]
+        self._min_severity = LOG_LEVEL_SEVERITY[min_level]
+        self._sampling = sampling
+
+    def is_enabled_for(self, level: LogLevel) -> bool:
+        """Return whether records at ``level`` would be dispatched.
+
+        The logger checks this before validation and record construction so
+        disabled levels cost a dictionary lookup.
+
+        Args:
+            level: Severity of the prospective record.
+
+        Returns:
+            bool: True if ``level`` is at or above the configured minimum.
+        """
+        return LOG_LEVEL_SEVERITY[level] >= self._min_severity
+
+    def admit(self, level: LogLevel, module: object, action: str) -> int | None:
+        """Apply the sampling policy to a prospective record.
+
+        Args:
+            level: Severity of the prospective record.
+            module: Module of the prospective record.
+            action: Action of the prospective record.
+
+        Returns:
+            int | None: None if the record should be suppressed; otherwise the
+            number of records suppressed for the same key since the last one.
+        """
+        if self._sampling is None:
+            return 0
+        return self._sampling.admit(level, module, action)
 
     def dispatch(self, record: LogRecord) -> None:
         """Dispatch a log record to all registered handlers.
 
         Output failures are swallowed so application workflows are never
-        interrupted by logging errors.
+        interrupted by logging errors. Handlers whose formatters share the
+        same settings reuse one serialization of the record.
 
         Args:
             record: Validated immutable log record.
         """
-        for handler in self._handlers:
-            try:
-                handler.emit_record(record)
-            except (HandlerError, OSError, NotImplementedError):
-                continue
+        token = begin_shared_serialization()
+        try:
+            for handler in self._handlers:
+                try:
+                    handler.emit_record(record)
+                except (HandlerError, OSError, NotImplementedError):
+                    continue
+        finally:
+            end_shared_serialization(token)
 
     def flush(self) -> None:
         """Flush all registered handlers."""
@@ -13,6 +13,7 @@ from __future__ import annotations
 import atexit
 import threading
 from collections.abc import Callable
+from typing import TYPE_CHECKING
 
 from shared.logging.config import (
     HANDLER_CLOUDWATCH,
@@ -25,11 +26,17 @@ from shared.logging.dispatcher import LogDispatcher
 from shared.logging.exceptions import ConfigurationError
 from shared.logging.formatter import JSONLogFormatter
 from shared.logging.handlers import BaseLogHandler, CloudWatchLogHandler, ConsoleLogHandler
+from shared.logging.metrics import MetricsFlusher
+from shared.logging.sampling import SamplingPolicy
+
+if TYPE_CHECKING:
+    from shared.logging.logger import Logger
 
 _configured = False
 _startup_emitted = False
 _pending_config: LoggingConfig | None = None
 _active_dispatcher: LogDispatcher | None = None
+_active_metrics_flusher: MetricsFlusher | None = None
 _shutdown_registered = False
 _lock = threading.Lock()
 
@@ -46,7 +53,10 @@ def set_pending_logging_config(config: LoggingConfig) -> None:
 
 
 def _create_console_handler(config: LoggingConfig) -> ConsoleLogHandler:
-    return ConsoleLogHandler(JSONLogFormatter(pretty=config.json_pretty))
+    return ConsoleLogHandler(
+        JSONLogFormatter(pretty=config.json_pretty),
+        buffered=config.console_buffered,
+    )
 
 
 def _create_cloudwatch_handler(config: LoggingConfig) -> CloudWatchLogHandler:
@@ -58,6 +68,10 @@ def _create_cloudwatch_handler(config: LoggingConfig) -> CloudWatchLogHandler:
         formatter=JSONLogFormatter(pretty=False),
         stream_name=config.cloudwatch_stream_name,
         service_name=config.service_name,
+        background=config.cloudwatch_background,
+        max_queue_size=config.cloudwatch_queue_size,
+        overflow_policy=config.cloudwatch_overflow_policy,
+        spill_path=config.cloudwatch_spill_path,
     )
 
 
@@ -106,12 +120,45 @@ class LoggingFactory:
         Returns:
             LogDispatcher: Dispatcher ready for log emission.
         """
-        return LogDispatcher(handlers=self.create_handlers())
+        sampling_rules = self._config.sampling_rules
+        return LogDispatcher(
+            handlers=self.create_handlers(),
+            min_level=self._config.log_level,
+            sampling=SamplingPolicy(sampling_rules) if sampling_rules else None,
+        )
+
+    def create_metrics_flusher(self, logger: Logger) -> MetricsFlusher | None:
+        """Create the EMF metrics flusher for ``logger``, if enabled.
+
+        Args:
+            logger: Logger whose registry is drained and which writes the
+                aggregated records.
+
+        Returns:
+            MetricsFlusher | None: Unstarted flusher, or None when
+            metrics_flush_interval_sec is not set.
+        """
+        interval = self._config.metrics_flush_interval_sec
+        if interval is None:
+            return None
+        return MetricsFlusher(
+            logger.metrics_registry,
+            logger.metrics,
+            namespace=self._config.metrics_namespace,
+            dimensions={
+                "Service": self._config.service_name,
+                "Environment": self._config.environment.value,
+            },
+            interval_sec=interval,
+        )
 
 
 def _shutdown_logging() -> None:
-    """Flush and close handlers on process exit."""
-    global _active_dispatcher
+    """Flush pending metrics, then flush and close handlers on process exit."""
+    global _active_dispatcher, _active_metrics_flusher
+    if _active_metrics_flusher is not None:
+        _active_metrics_flusher.close()
+        _active_metrics_flusher = None
     if _active_dispatcher is not None:
         _active_dispatcher.close()
         _active_dispatcher = None
@@ -127,6 +174,7 @@ def configure_logging(config: LoggingConfig) -> None:
         ConfigurationError: If configuration is invalid.
     """
     global _configured, _startup_emitted, _active_dispatcher, _shutdown_registered
+    global _active_metrics_flusher
 
     validated = validate_logging_config(config)
 
@@ -141,6 +189,9 @@ def configure_logging(config: LoggingConfig) -> None:
 
         logger.configure(dispatcher)
         _active_dispatcher = dispatcher
+        _active_metrics_flusher = factory.create_metrics_flusher(logger)
+        if _active_metrics_flusher is not None:
+            _active_metrics_flusher.start()
         _configured = True
 
         if not _shutdown_registered:
@@ -178,13 +229,17 @@ def ensure_configured() -> None:
 def reset_logging_state_for_tests() -> None:
     """Reset factory module state. For unit tests only."""
     global _configured, _startup_emitted, _pending_config, _active_dispatcher
+    global _active_metrics_flusher
     with _lock:
+        if _active_metrics_flusher is not None:
+            _active_metrics_flusher.close()
         if _active_dispatcher is not None:
             _active_dispatcher.close()
         _configured = False
         _startup_emitted = False
         _pending_config = None
         _active_dispatcher = None
+        _active_metrics_flusher = None
         from shared.logging.dispatcher import get_default_dispatcher
         from shared.logging.logger import logger
 
@@ -13,10 +13,13 @@ Future implementation:
 from __future__ import annotations
 
 import json
+import threading
 from abc import ABC, abstractmethod
 from datetime import date, datetime, timezone
 from decimal import Decimal
 from enum import Enum
+from functools import lru_cache
+from json.encoder import encode_basestring
 from typing import Any
 from uuid import UUID
 
@@ -38,6 +41,8 @@ SCHEMA_FIELDS = (
 
 CONTEXT_FIELDS = CONTEXT_FIELD_NAMES
 
+_shared_serialization = threading.local()
+
 
 class BaseLogFormatter(ABC):
     """Abstract base for all log record formatters."""
@@ -145,9 +150,133 @@ def _record_to_payload(record: LogRecord) -> dict[str, Any]:
             "stack_trace": record.stack_trace,
         }
 
+    if record.embedded_metrics:
+        payload.update(record.embedded_metrics)
+
     return payload
 
 
+_compact_encoder = json.JSONEncoder(
+    ensure_ascii=False,
+    separators=(",", ":"),
+    default=_json_default,
+)
+
+
+def _encode_value(value: object) -> str:
+    kind = type(value)
+    if kind is str:
+        return encode_basestring(value)
+    if value is None:
+        return "null"
+    if kind is int:
+        return int.__repr__(value)
+    return _compact_encoder.encode(value)
+
+
+@lru_cache(maxsize=4096)
+def _static_fragment(level: str, module: str | None, action: str, status: str) -> str:
+    """Pre-encoded ``level``..``status`` members; constant per call site."""
+    return (
+        f',"level":{encode_basestring(level)}'
+        f',"module":{_encode_value(module)}'
+        f',"action":{encode_basestring(action)}'
+        f',"status":{encode_basestring(status)}'
+    )
+
+
+def _record_to_compact_json(record: LogRecord) -> str:
+    """Serialize a LogRecord to compact JSON without building the payload dict.
+
+    Produces exactly what ``json.dumps(_record_to_payload(record),
+    separators=(",", ":"), ensure_ascii=False, default=_json_default)`` would:
+    same members, same order.
+
+    Args:
+        record: Immutable structured log record.
+
+    Returns:
+        str: Compact JSON log line.
+    """
+    parts = [
+        '{"schema_version":',
+        _encode_value(record.schema_version),
+        ',"timestamp":',
+        encode_basestring(_format_timestamp(record.timestamp)),
+    ]
+    for field in CONTEXT_FIELDS:
+        value = getattr(record, field)
+        if value is not None and value != "":
+            parts.append(f',"{field}":')
+            parts.append(_encode_value(value))
+    parts.append(
+        _static_fragment(
+            record.level.value,
+            record.module.value if record.module is not None else None,
+            record.action,
+            record.status.value,
+        )
+    )
+    metadata = record.metadata
+    parts.extend(
+        (
+            ',"message":',
+            _encode_value(record.message),
+            ',"event_code":',
+            _encode_value(record.event_code),
+            ',"metadata":',
+            _compact_encoder.encode(metadata if type(metadata) is dict else dict(metadata)),
+        )
+    )
+    if record.duration_ms is not None:
+        parts.append(',"duration_ms":')
+        parts.append(_encode_value(record.duration_ms))
+    if (
+        record.exception_type is not None
+        or record.exception_message is not None
+        or record.stack_trace is not None
+    ):
+        parts.append(',"exception":')
+        parts.append(
+            _compact_encoder.encode(
+                {
+                    "type": record.exception_type,
+                    "message": record.exception_message,
+                    "stack_trace": record.stack_trace,
+                }
+            )
+        )
+    if record.embedded_metrics:
+        for name, value in record.embedded_metrics.items():
+            parts.append(f",{encode_basestring(name)}:")
+            parts.append(_compact_encoder.encode(value))
+    parts.append("}")
+    return "".join(parts)
+
+
+def begin_shared_serialization() -> dict | None:
+    """Start a per-thread scope in which JSON output is shared between formatters.
+
+    LogDispatcher opens one scope per dispatched record, so handlers whose
+    JSONLogFormatter settings match serialize the record once.
+
+    Returns:
+        dict | None: Token to pass to end_shared_serialization().
+    """
+    previous = getattr(_shared_serialization, "entries", None)
+    _shared_serialization.entries = {}
+    return previous
+
+
+def end_shared_serialization(token: dict | None) -> None:
+    """Close the scope opened by begin_shared_serialization().
+
+    Args:
+        token: Value returned by the matching begin call.
+    """
+    _shared_serialization.entries = token
+
+
 class JSONLogFormatter(BaseLogFormatter):
     """Structured JSON formatter for production observability."""
 
@@ -174,25 +303,27 @@ class JSONLogFormatter(BaseLogFormatter):
         """
         if not isinstance(record, LogRecord):
             raise FormatterError("record must be a LogRecord instance")
+        shared = getattr(_shared_serialization, "entries", None)
+        if shared is not None:
+            cached = shared.get(self._pretty)
+            if cached is not None and cached[0] is record:
+                return cached[1]
         try:
-            payload = _record_to_payload(record)
             if self._pretty:
-                return json.dumps(
-                    payload,
+                formatted = json.dumps(
+                    _record_to_payload(record),
                     default=_json_default,
                     ensure_ascii=False,
                     indent=2,
                     sort_keys=False,
                 )
-            return json.dumps(
-                payload,
-                default=_json_default,
-                ensure_ascii=False,
-                separators=(",", ":"),
-                sort_keys=False,
-            )
+            else:
+                formatted = _record_to_compact_json(record)
         except (TypeError, ValueError) as exc:
             raise FormatterError(f"JSON serialization failed: {exc}") from exc
+        if shared is not None:
+            shared[self._pretty] = (record, formatted)
+        return formatted
 
 
 class PlainTextLogFormatter(BaseLogFormatter):
@@ -18,6 +18,12 @@ from abc import ABC, abstractmethod
 from typing import Any
 
 from shared.logging.cloudwatch_buffer import CloudWatchLogBuffer, LogsClientProtocol
+from shared.logging.cloudwatch_shipper import CLOSE_TIMEOUT_SEC, CloudWatchShipper
+from shared.logging.config import (
+    DEFAULT_CLOUDWATCH_QUEUE_SIZE,
+    OVERFLOW_DROP_OLDEST,
+)
+from shared.logging.console_buffer import ConsoleWriteBuffer
 from shared.logging.exceptions import FormatterError, HandlerError
 from shared.logging.formatter import JSONLogFormatter
 from shared.logging.record import LogRecord
@@ -68,14 +74,24 @@ class BaseLogHandler(ABC):
 class ConsoleLogHandler(BaseLogHandler):
     """Writes formatted JSON logs to standard output."""
 
-    def __init__(self, formatter: JSONLogFormatter | None = None) -> None:
+    def __init__(
+        self,
+        formatter: JSONLogFormatter | None = None,
+        *,
+        buffered: bool = False,
+    ) -> None:
         """Initialize the console handler.
 
         Args:
             formatter: JSON formatter instance. Defaults to pretty JSON for
                 development-friendly console output.
+            buffered: Write from a background thread in chunks (at most
+                ~200ms behind) instead of a write and flush per record.
+                Per-process ordering is preserved; flush() and close()
+                write everything pending.
         """
         self._formatter = formatter or JSONLogFormatter(pretty=True)
+        self._writer: ConsoleWriteBuffer | None = ConsoleWriteBuffer() if buffered else None
 
     def format_record(self, record: LogRecord) -> str:
         """Format a LogRecord as JSON via the configured formatter.
@@ -97,6 +113,9 @@ class ConsoleLogHandler(BaseLogHandler):
         Raises:
             HandlerError: If writing to stdout fails.
         """
+        if self._writer is not None:
+            self._writer.append(formatted_record)
+            return
         try:
             sys.stdout.write(f"{formatted_record}\n")
             sys.stdout.flush()
@@ -119,13 +138,17 @@ class ConsoleLogHandler(BaseLogHandler):
 
     def flush(self) -> None:
         """Flush console output buffers."""
+        if self._writer is not None:
+            self._writer.flush()
         try:
             sys.stdout.flush()
         except OSError as exc:
             raise HandlerError(f"console flush failed: {exc}") from exc
 
     def close(self) -> None:
-        """Close the console handler (no-op for stdout)."""
+        """Close the console handler, writing any buffered records."""
+        if self._writer is not None:
+            self._writer.close()
 
 
 class CloudWatchLogHandler(BaseLogHandler):
@@ -142,6 +165,10 @@ class CloudWatchLogHandler(BaseLogHandler):
         logs_client: LogsClientProtocol | None = None,
         hostname: str | None = None,
         date_str: str | None = None,
+        background: bool = False,
+        max_queue_size: int = DEFAULT_CLOUDWATCH_QUEUE_SIZE,
+        overflow_policy: str = OVERFLOW_DROP_OLDEST,
+        spill_path: str | None = None,
     ) -> None:
         """Initialize CloudWatch handler.
 
@@ -154,6 +181,12 @@ class CloudWatchLogHandler(BaseLogHandler):
             logs_client: Optional boto3 logs client (for testing).
             hostname: Optional hostname override for stream naming (testing).
             date_str: Optional date override for stream naming (testing).
+            background: Ship from a CloudWatchShipper thread so emit never
+                waits on PutLogEvents. Delivery errors are then counted in
+                stats() instead of raised.
+            max_queue_size: Background queue bound.
+            overflow_policy: Background overflow policy (drop_oldest or spill).
+            spill_path: JSONL spill file for the spill policy.
 
         Raises:
             ConfigurationError: If required configuration is missing.
@@ -177,12 +210,26 @@ class CloudWatchLogHandler(BaseLogHandler):
             hostname=hostname,
             date_str=date_str,
         )
+        self._shipper: CloudWatchShipper | None = None
+        if background:
+            self._shipper = CloudWatchShipper(
+                buffer=self._buffer,
+                max_queue_size=max_queue_size,
+                overflow_policy=overflow_policy,
+                spill_path=spill_path,
+            )
 
     @property
     def stream_name(self) -> str:
         """Return the resolved CloudWatch log stream name."""
         return self._buffer.stream_name
 
+    def stats(self) -> dict[str, Any]:
+        """Return background shipper counters (empty when shipping inline)."""
+        if self._shipper is None:
+            return {}
+        return self._shipper.stats()
+
     def format_record(self, record: LogRecord) -> str:
         """Format a LogRecord as JSON via the configured formatter."""
         return self._formatter.format(record)
@@ -190,7 +237,10 @@ class CloudWatchLogHandler(BaseLogHandler):
     def emit(self, formatted_record: str) -> None:
         """Buffer a pre-formatted JSON log line for CloudWatch delivery."""
         try:
-            self._buffer.append(formatted_record)
+            if self._shipper is not None:
+                self._shipper.submit(formatted_record)
+            else:
+                self._buffer.append(formatted_record)
         except HandlerError:
             raise
         except Exception as exc:
@@ -206,7 +256,10 @@ class CloudWatchLogHandler(BaseLogHandler):
     def flush(self) -> None:
         """Flush buffered log events to CloudWatch."""
         try:
-            self._buffer.flush(force=True)
+            if self._shipper is not None:
+                self._shipper.flush(timeout=CLOSE_TIMEOUT_SEC)
+            else:
+                self._buffer.flush(force=True)
         except HandlerError:
             raise
         except Exception as exc:
@@ -215,6 +268,8 @@ class CloudWatchLogHandler(BaseLogHandler):
     def close(self) -> None:
         """Flush remaining events and release resources."""
         try:
+            if self._shipper is not None:
+                self._shipper.close()
             self._buffer.close()
         except HandlerError:
             raise
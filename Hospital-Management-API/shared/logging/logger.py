@@ -25,12 +25,15 @@ from shared.logging.context_enricher import (
 )
 from shared.logging.dispatcher import LogDispatcher, get_default_dispatcher
 from shared.logging.exception_builder import capture_exception, validate_exception_metadata
+from shared.logging.metrics import MetricsRegistry, Timer, get_default_metrics_registry
 from shared.logging.record import LogRecord, build_record, enrich_record
+from shared.logging.sampling import SUPPRESSED_COUNT_METADATA_KEY
 from shared.logging.validation import (
     validate_action,
     validate_audit_event,
     validate_audit_type,
     validate_duration_ms,
+    validate_embedded_metrics,
     validate_event_code,
     validate_message,
     validate_metadata,
@@ -48,6 +51,7 @@ class Logger:
         self,
         dispatcher: LogDispatcher | None = None,
         context_enricher: ContextEnricher | None = None,
+        metrics: MetricsRegistry | None = None,
     ) -> None:
         """Initialize the logger with optional custom dispatcher and enricher.
 
@@ -56,9 +60,17 @@ class Logger:
                 module-level dispatcher with console output.
             context_enricher: Component that supplies context enrichment.
                 Defaults to the module-level default enricher.
+            metrics: Registry that aggregates performance() durations.
+                Defaults to the process-wide registry.
         """
         self._dispatcher = dispatcher or get_default_dispatcher()
         self._context_enricher = context_enricher or get_default_context_enricher()
+        self._metrics = metrics or get_default_metrics_registry()
+
+    @property
+    def metrics_registry(self) -> MetricsRegistry:
+        """Return the registry that aggregates performance() durations."""
+        return self._metrics
 
     def configure(self, dispatcher: LogDispatcher) -> None:
         """Replace the dispatcher on this logger instance.
@@ -76,6 +88,17 @@ class Logger:
 
         ensure_configured()
 
+    def _admit(self, level: LogLevel, module: Any, action: Any) -> int | None:
+        """Apply level gating and sampling before any validation work.
+
+        Returns:
+            int | None: None to skip the call; otherwise the number of calls
+            suppressed by sampling since the last emitted one for this key.
+        """
+        if not self._dispatcher.is_enabled_for(level):
+            return None
+        return self._dispatcher.admit(level, module, action)
+
     def _dispatch_record(self, record: LogRecord) -> None:
         """Enrich a log record with active context and dispatch it."""
         enriched = enrich_record(record, self._context_enricher.enrich())
@@ -250,12 +273,17 @@ class Logger:
             LoggingError: If validation fails or no exception is available to log.
         """
         self._ensure_ready()
+        suppressed = self._admit(LogLevel.ERROR, module, action)
+        if suppressed is None:
+            return
         validated_message = validate_message(message)
         validated_module = validate_module(module)
         validated_action = validate_action(action)
         safe_metadata = dict(validate_metadata(metadata))
         validate_framework_metadata(safe_metadata)
         validate_exception_metadata(safe_metadata)
+        if suppressed:
+            safe_metadata[SUPPRESSED_COUNT_METADATA_KEY] = suppressed
 
         captured = capture_exception(exc=exc)
         validated_duration = (
@@ -289,6 +317,7 @@ class Logger:
 
         M2 logs audit events through the standard dispatch pipeline.
         Future milestones will route to Clinical Audit or Business Audit services.
+        Audit events are never level-gated.
 
         Args:
             event: Audit event name.
@@ -321,22 +350,36 @@ class Logger:
         *,
         duration_ms: float,
         metadata: dict[str, Any] | None = None,
+        emit: bool = True,
     ) -> None:
         """Record a performance metric for a significant workflow.
 
+        Every call is aggregated into the ``action`` latency histogram of the
+        metrics registry, which is flushed periodically as EMF records. With
+        ``emit=False`` no per-call log record is written.
+
         Args:
             action: Dot-notation action name for the measured operation.
             duration_ms: Execution duration in milliseconds.
             metadata: Optional performance-specific fields.
+            emit: Whether to also write a log record for this call.
 
         Raises:
             LoggingError: If validation fails.
         """
-        self._ensure_ready()
         validated_action = validate_action(action)
         validated_duration = validate_duration_ms(duration_ms)
+        self._metrics.observe(validated_action, validated_duration)
+        if not emit:
+            return
+        self._ensure_ready()
+        suppressed = self._admit(LogLevel.INFO, None, validated_action)
+        if suppressed is None:
+            return
         safe_metadata = dict(validate_metadata(metadata))
         validate_framework_metadata(safe_metadata)
+        if suppressed:
+            safe_metadata[SUPPRESSED_COUNT_METADATA_KEY] = suppressed
         safe_metadata["event_type"] = EventType.PERFORMANCE
 
         record = build_record(
@@ -350,6 +393,73 @@ class Logger:
         )
         self._dispatch_record(record)
 
+    def timer(
+        self,
+        action: str,
+        *,
+        emit: bool = False,
+        metadata: dict[str, Any] | None = None,
+    ) -> Timer:
+        """Time a block or function and report it through performance().
+
+        Usable as ``with logger.timer("timeline.build"):`` or as a decorator.
+        By default durations only feed the histogram.
+
+        Args:
+            action: Dot-notation action name for the measured operation.
+            emit: Whether each measurement also writes a log record.
+            metadata: Optional performance-specific fields for emitted records.
+
+        Returns:
+            Timer: Context manager / decorator.
+
+        Raises:
+            LoggingError: If the action name is invalid.
+        """
+        validated_action = validate_action(action)
+        return Timer(
+            lambda elapsed_ms: self.performance(
+                validated_action,
+                duration_ms=elapsed_ms,
+                metadata=metadata,
+                emit=emit,
+            )
+        )
+
+    def metrics(
+        self,
+        embedded_metrics: dict[str, Any],
+        *,
+        action: str = "metrics.flushed",
+    ) -> None:
+        """Write an aggregated CloudWatch Embedded Metric Format record.
+
+        Used by the metrics flusher. EMF members are written at the JSON root
+        so CloudWatch extracts them as metrics. Never level-gated or sampled.
+
+        Args:
+            embedded_metrics: EMF document (``_aws`` directive, dimensions
+                and metric values).
+            action: Dot-notation action name for the record.
+
+        Raises:
+            LoggingError: If validation fails.
+        """
+        self._ensure_ready()
+        validated_action = validate_action(action)
+        document = validate_embedded_metrics(embedded_metrics)
+
+        record = build_record(
+            level=LogLevel.INFO,
+            module=LogModule.MONITORING,
+            action=validated_action,
+            message="Aggregated metrics",
+            status=LogStatus.SUCCESS,
+            metadata={"event_type": EventType.PERFORMANCE},
+            embedded_metrics=document,
+        )
+        self._dispatch_record(record)
+
     def _log(
         self,
         level: LogLevel,
@@ -363,6 +473,10 @@ class Logger:
     ) -> None:
         """Validate inputs, build a LogRecord, enrich, and dispatch it.
 
+        Levels below the dispatcher's minimum and calls suppressed by the
+        sampling policy return before any validation. The next emitted call
+        for a sampled key reports the suppressed count in metadata.
+
         Args:
             level: Log severity level.
             message: Human-readable log message.
@@ -376,11 +490,16 @@ class Logger:
             LoggingError: If validation fails.
         """
         self._ensure_ready()
+        suppressed = self._admit(level, module, action)
+        if suppressed is None:
+            return
         validated_message = validate_message(message)
         validated_module = validate_module(module)
         validated_action = validate_action(action)
         safe_metadata = dict(validate_metadata(metadata))
         validate_framework_metadata(safe_metadata)
+        if suppressed:
+            safe_metadata[SUPPRESSED_COUNT_METADATA_KEY] = suppressed
 
         record = build_record(
             level=level,
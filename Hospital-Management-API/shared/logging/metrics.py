@@ -0,0 +1,589 @@
+"""In-process latency histograms and counters for the logging platform.
+
+Purpose:
+    Give hot paths (request handlers, search, timeline builds) p50/p95/p99
+    latency per action without shipping a log line per call.
+
+Responsibility:
+    Thread-safe fixed-bucket histograms and counters keyed by name and
+    dimensions, a timer usable as decorator or context manager, CloudWatch
+    Embedded Metric Format (EMF) documents for aggregated snapshots, and a
+    background flusher that hands them to the logging pipeline periodically.
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Any, Callable, Mapping, TypeVar
+
+from shared.logging.utils import register_after_fork
+
+UNIT_MILLISECONDS = "Milliseconds"
+UNIT_COUNT = "Count"
+
+# Upper bounds grow by 2**(1/4) (~19%) from 0.1 ms to ~2 minutes, so a
+# percentile read from a bucket bound is within one bucket width of the truth.
+DEFAULT_BUCKET_BOUNDS_MS: tuple[float, ...] = tuple(
+    round(0.1 * 2 ** (step / 4), 4) for step in range(82)
+)
+DEFAULT_FLUSH_INTERVAL_SEC = 60.0
+SUMMARY_PERCENTILES = (50, 95, 99)
+
+# CloudWatch accepts at most 100 metrics per EMF directive.
+_MAX_METRICS_PER_DOCUMENT = 100
+_MAX_SERIES = 2_000
+
+Dimensions = tuple[tuple[str, str], ...]
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+@dataclass(frozen=True)
+class HistogramSnapshot:
+    """Point-in-time view of one latency histogram series.
+
+    Attributes:
+        name: Metric name (the logging action for performance timings).
+        dimensions: Sorted ``(name, value)`` dimension pairs.
+        count: Number of observations.
+        total: Sum of observed values in milliseconds.
+        minimum: Smallest observed value.
+        maximum: Largest observed value.
+        buckets: ``(upper_bound_ms, count)`` for non-empty buckets, ascending.
+            Values above the last bound are reported at ``maximum``.
+    """
+
+    name: str
+    dimensions: Dimensions
+    count: int
+    total: float
+    minimum: float
+    maximum: float
+    buckets: tuple[tuple[float, int], ...]
+
+    def percentile(self, pct: float) -> float:
+        """Estimate a percentile from the bucket counts.
+
+        Args:
+            pct: Percentile in [0, 100].
+
+        Returns:
+            float: Upper bound of the bucket holding the requested rank,
+            clamped to the observed min/max; 0.0 for an empty series.
+        """
+        if self.count == 0:
+            return 0.0
+        rank = max(1, -(-self.count * pct // 100))
+        seen = 0
+        for bound, bucket_count in self.buckets:
+            seen += bucket_count
+            if seen >= rank:
+                return min(max(bound, self.minimum), self.maximum)
+        return self.maximum
+
+    def summary(self) -> dict[str, float | int]:
+        """Return count, mean, min, max and the SUMMARY_PERCENTILES."""
+        summary: dict[str, float | int] = {
+            "count": self.count,
+            "mean": round(self.total / self.count, 3) if self.count else 0.0,
+            "min": round(self.minimum, 3),
+            "max": round(self.maximum, 3),
+        }
+        for pct in SUMMARY_PERCENTILES:
+            summary[f"p{pct}"] = round(self.percentile(pct), 3)
+        return summary
+
+
+@dataclass(frozen=True)
+class CounterSnapshot:
+    """Point-in-time value of one counter series."""
+
+    name: str
+    dimensions: Dimensions
+    value: int
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    """All series of a registry at one point in time.
+
+    Attributes:
+        histograms: Histogram series, sorted by name and dimensions.
+        counters: Counter series, sorted by name and dimensions.
+        dropped: Observations discarded because the series limit was reached.
+    """
+
+    histograms: tuple[HistogramSnapshot, ...] = ()
+    counters: tuple[CounterSnapshot, ...] = ()
+    dropped: int = 0
+
+    def is_empty(self) -> bool:
+        """Return whether the snapshot holds no observations."""
+        return not self.histograms and not self.counters and not self.dropped
+
+    def to_dict(self) -> dict[str, Any]:
+        """Return a JSON-safe summary (used by the metrics dump endpoint)."""
+        return {
+            "histograms": [
+                {
+                    "name": item.name,
+                    "dimensions": dict(item.dimensions),
+                    **item.summary(),
+                }
+                for item in self.histograms
+            ],
+            "counters": [
+                {"name": item.name, "dimensions": dict(item.dimensions), "value": item.value}
+                for item in self.counters
+            ],
+            "dropped": self.dropped,
+        }
+
+
+class _Histogram:
+    __slots__ = ("counts", "count", "total", "minimum", "maximum")
+
+    def __init__(self, bucket_count: int) -> None:
+        self.counts = [0] * (bucket_count + 1)
+        self.count = 0
+        self.total = 0.0
+        self.minimum = float("inf")
+        self.maximum = 0.0
+
+    def merge(self, other: _Histogram) -> None:
+        for index, bucket_count in enumerate(other.counts):
+            self.counts[index] += bucket_count
+        self.count += other.count
+        self.total += other.total
+        self.minimum = min(self.minimum, other.minimum)
+        self.maximum = max(self.maximum, other.maximum)
+
+    def copy(self) -> _Histogram:
+        clone = _Histogram(len(self.counts) - 1)
+        clone.merge(self)
+        return clone
+
+    def snapshot(
+        self, name: str, dimensions: Dimensions, bounds: tuple[float, ...]
+    ) -> HistogramSnapshot:
+        buckets = tuple(
+            (bounds[index] if index < len(bounds) else self.maximum, bucket_count)
+            for index, bucket_count in enumerate(self.counts)
+            if bucket_count
+        )
+        return HistogramSnapshot(
+            name=name,
+            dimensions=dimensions,
+            count=self.count,
+            total=self.total,
+            minimum=self.minimum if self.count else 0.0,
+            maximum=self.maximum,
+            buckets=buckets,
+        )
+
+
+class Timer:
+    """Measures elapsed wall time as a context manager or decorator.
+
+    Each ``with`` block or decorated call measures independently, so a
+    decorated function is safe to call from many threads.
+    """
+
+    __slots__ = ("_record", "_started")
+
+    def __init__(self, record: Callable[[float], None]) -> None:
+        """Initialize the timer.
+
+        Args:
+            record: Receives the elapsed time in milliseconds.
+        """
+        self._record = record
+        self._started = 0.0
+
+    def __enter__(self) -> Timer:
+        self._started = time.perf_counter()
+        return self
+
+    def __exit__(self, *_exc_info: object) -> None:
+        self._record((time.perf_counter() - self._started) * 1000)
+
+    def __call__(self, func: _F) -> _F:
+        record = self._record
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            started = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                record((time.perf_counter() - started) * 1000)
+
+        return wrapper  # type: ignore[return-value]
+
+
+class MetricsRegistry:
+    """Thread-safe registry of latency histograms and counters.
+
+    Series are keyed by ``(name, dimensions)``. Recording is a bucket
+    bisect and a few increments under one lock; nothing is formatted or
+    written until a snapshot is taken. A resetting snapshot folds the
+    drained window into process-lifetime totals, so cumulative readers
+    are not emptied by the periodic flush.
+    """
+
+    def __init__(
+        self,
+        *,
+        bucket_bounds_ms: tuple[float, ...] = DEFAULT_BUCKET_BOUNDS_MS,
+        max_series: int = _MAX_SERIES,
+    ) -> None:
+        """Initialize an empty registry.
+
+        Args:
+            bucket_bounds_ms: Ascending histogram bucket upper bounds.
+            max_series: Series cap; observations for new series beyond it
+                are counted as dropped.
+        """
+        self._bounds = tuple(bucket_bounds_ms)
+        self._max_series = max_series
+        self._reset()
+        register_after_fork(self, "_reset")
+
+    def _reset(self) -> None:
+        # Children start empty so prefork workers do not re-report the parent.
+        self._lock = threading.Lock()
+        self._histograms: dict[tuple[str, Dimensions], _Histogram] = {}
+        self._counters: dict[tuple[str, Dimensions], int] = {}
+        self._dropped = 0
+        self._total_histograms: dict[tuple[str, Dimensions], _Histogram] = {}
+        self._total_counters: dict[tuple[str, Dimensions], int] = {}
+        self._total_dropped = 0
+
+    def observe(
+        self,
+        name: str,
+        value_ms: float,
+        dimensions: Mapping[str, str] | None = None,
+    ) -> None:
+        """Record one latency observation.
+
+        Args:
+            name: Metric name.
+            value_ms: Observed duration in milliseconds.
+            dimensions: Optional dimension values for the series.
+        """
+        key = (name, _dimension_key(dimensions))
+        index = bisect_left(self._bounds, value_ms)
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                if self._series_count_locked() >= self._max_series:
+                    self._dropped += 1
+                    return
+                histogram = self._histograms[key] = _Histogram(len(self._bounds))
+            histogram.counts[index] += 1
+            histogram.count += 1
+            histogram.total += value_ms
+            if value_ms < histogram.minimum:
+                histogram.minimum = value_ms
+            if value_ms > histogram.maximum:
+                histogram.maximum = value_ms
+
+    def increment(
+        self,
+        name: str,
+        value: int = 1,
+        dimensions: Mapping[str, str] | None = None,
+    ) -> None:
+        """Add ``value`` to a counter.
+
+        Args:
+            name: Metric name.
+            value: Amount to add.
+            dimensions: Optional dimension values for the series.
+        """
+        key = (name, _dimension_key(dimensions))
+        with self._lock:
+            current = self._counters.get(key)
+            if current is None and self._series_count_locked() >= self._max_series:
+                self._dropped += 1
+                return
+            self._counters[key] = (current or 0) + value
+
+    def time(self, name: str, dimensions: Mapping[str, str] | None = None) -> Timer:
+        """Return a Timer that records into the ``name`` histogram.
+
+        Example:
+            ``with registry.time("timeline.build"): ...`` or
+            ``@registry.time("timeline.build")``.
+        """
+        return Timer(lambda elapsed_ms: self.observe(name, elapsed_ms, dimensions))
+
+    def snapshot(self, *, reset: bool = False, cumulative: bool = False) -> MetricsSnapshot:
+        """Return all series, optionally starting a new aggregation window.
+
+        Args:
+            reset: Clear every series after reading it (flush semantics).
+                The drained window is kept in the cumulative totals.
+            cumulative: Report totals since process start (or fork) instead
+                of the current window. Cannot be combined with ``reset``.
+
+        Returns:
+            MetricsSnapshot: Sorted histogram and counter snapshots.
+
+        Raises:
+            ValueError: If both ``reset`` and ``cumulative`` are set.
+        """
+        if reset and cumulative:
+            raise ValueError("snapshot() cannot both reset and report cumulative totals")
+        with self._lock:
+            histograms = self._histograms
+            counters = self._counters
+            dropped = self._dropped
+            if reset:
+                self._fold_into_totals_locked()
+                self._histograms = {}
+                self._counters = {}
+                self._dropped = 0
+            elif cumulative:
+                histograms = {key: value.copy() for key, value in self._total_histograms.items()}
+                for key, histogram in self._histograms.items():
+                    if key in histograms:
+                        histograms[key].merge(histogram)
+                    else:
+                        histograms[key] = histogram
+                counters = dict(self._total_counters)
+                for key, value in self._counters.items():
+                    counters[key] = counters.get(key, 0) + value
+                dropped += self._total_dropped
+            else:
+                histograms = dict(histograms)
+                counters = dict(counters)
+            # Copy under the lock; per-bucket lists are only mutated under it.
+            histogram_snapshots = tuple(
+                histograms[key].snapshot(key[0], key[1], self._bounds)
+                for key in sorted(histograms)
+            )
+        return MetricsSnapshot(
+            histograms=histogram_snapshots,
+            counters=tuple(
+                CounterSnapshot(name=key[0], dimensions=key[1], value=counters[key])
+                for key in sorted(counters)
+            ),
+            dropped=dropped,
+        )
+
+    def _fold_into_totals_locked(self) -> None:
+        # The drained window's histograms are no longer mutated, so they can
+        # become the totals entry for series seen for the first time.
+        totals = self._total_histograms
+        for key, histogram in self._histograms.items():
+            if key in totals:
+                totals[key].merge(histogram)
+            elif len(totals) + len(self._total_counters) < self._max_series:
+                totals[key] = histogram
+            else:
+                self._total_dropped += histogram.count
+        for key, value in self._counters.items():
+            if key in self._total_counters:
+                self._total_counters[key] += value
+            elif len(totals) + len(self._total_counters) < self._max_series:
+                self._total_counters[key] = value
+            else:
+                self._total_dropped += 1
+        self._total_dropped += self._dropped
+
+    def _series_count_locked(self) -> int:
+        return len(self._histograms) + len(self._counters)
+
+
+def _dimension_key(dimensions: Mapping[str, str] | None) -> Dimensions:
+    if not dimensions:
+        return ()
+    return tuple(sorted((str(key), str(value)) for key, value in dimensions.items()))
+
+
+def build_emf_documents(
+    snapshot: MetricsSnapshot,
+    *,
+    namespace: str,
+    dimensions: Mapping[str, str],
+    timestamp_ms: int,
+) -> list[dict[str, Any]]:
+    """Convert a snapshot into CloudWatch Embedded Metric Format documents.
+
+    One document is built per distinct dimension set (at most 100 metrics
+    each). Histograms are written as ``Values``/``Counts`` distributions so
+    CloudWatch can compute p95/p99; counters as plain values.
+
+    Args:
+        snapshot: Registry snapshot to convert.
+        namespace: CloudWatch metric namespace.
+        dimensions: Dimensions added to every series (e.g. Service).
+        timestamp_ms: Epoch milliseconds for the ``_aws.Timestamp`` member.
+
+    Returns:
+        list[dict[str, Any]]: Root-level EMF members, one dict per document.
+    """
+    groups: dict[Dimensions, list[tuple[str, str, Any]]] = {}
+    for histogram in snapshot.histograms:
+        groups.setdefault(histogram.dimensions, []).append(
+            (
+                histogram.name,
+                UNIT_MILLISECONDS,
+                {
+                    "Values": [
+                        round(min(bound, histogram.maximum), 4)
+                        for bound, _ in histogram.buckets
+                    ],
+                    "Counts": [bucket_count for _, bucket_count in histogram.buckets],
+                    "Min": round(histogram.minimum, 4),
+                    "Max": round(histogram.maximum, 4),
+                    "Count": histogram.count,
+                    "Sum": round(histogram.total, 4),
+                },
+            )
+        )
+    for counter in snapshot.counters:
+        groups.setdefault(counter.dimensions, []).append(
+            (counter.name, UNIT_COUNT, counter.value)
+        )
+
+    documents: list[dict[str, Any]] = []
+    for series_dimensions, metrics in groups.items():
+        members = {**dict(dimensions), **dict(series_dimensions)}
+        for start in range(0, len(metrics), _MAX_METRICS_PER_DOCUMENT):
+            chunk = metrics[start : start + _MAX_METRICS_PER_DOCUMENT]
+            document: dict[str, Any] = {
+                "_aws": {
+                    "Timestamp": timestamp_ms,
+                    "CloudWatchMetrics": [
+                        {
+                            "Namespace": namespace,
+                            "Dimensions": [list(members)],
+                            "Metrics": [
+                                {"Name": name, "Unit": unit} for name, unit, _ in chunk
+                            ],
+                        }
+                    ],
+                },
+                **members,
+            }
+            for name, _, value in chunk:
+                document[name] = value
+            documents.append(document)
+    return documents
+
+
+class MetricsFlusher:
+    """Daemon thread that periodically drains a registry into EMF documents.
+
+    Each flush resets the registry, so every emitted document covers one
+    interval. ``close()`` performs a final flush.
+    """
+
+    def __init__(
+        self,
+        registry: MetricsRegistry,
+        emit: Callable[[dict[str, Any]], None],
+        *,
+        namespace: str,
+        dimensions: Mapping[str, str] | None = None,
+        interval_sec: float = DEFAULT_FLUSH_INTERVAL_SEC,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """Initialize the flusher; call start() to begin flushing.
+
+        Args:
+            registry: Registry to drain.
+            emit: Receives each EMF document (e.g. Logger.metrics).
+            namespace: CloudWatch metric namespace.
+            dimensions: Dimensions added to every series.
+            interval_sec: Seconds between flushes.
+            clock: Wall clock in seconds for EMF timestamps (testing).
+        """
+        self._registry = registry
+        self._emit = emit
+        self._namespace = namespace
+        self._dimensions = dict(dimensions or {})
+        self._interval_sec = interval_sec
+        self._clock = clock
+        self._closed = False
+        self._thread: threading.Thread | None = None
+        self._stop = threading.Event()
+        self._flush_lock = threading.Lock()
+        self._emit_errors = 0
+        register_after_fork(self, "_after_fork")
+
+    @property
+    def emit_errors(self) -> int:
+        """Return the number of documents whose emission raised."""
+        return self._emit_errors
+
+    def start(self) -> None:
+        """Start the flusher thread (idempotent)."""
+        if self._closed or self._thread is not None:
+            return
+        self._thread = threading.Thread(
+            target=self._run,
+            name="metrics-flusher",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def flush(self) -> int:
+        """Drain the registry now.
+
+        Returns:
+            int: Number of EMF documents emitted.
+        """
+        with self._flush_lock:
+            snapshot = self._registry.snapshot(reset=True)
+            if snapshot.is_empty():
+                return 0
+            documents = build_emf_documents(
+                snapshot,
+                namespace=self._namespace,
+                dimensions=self._dimensions,
+                timestamp_ms=int(self._clock() * 1000),
+            )
+            for document in documents:
+                try:
+                    self._emit(document)
+                except Exception:  # noqa: BLE001 - metrics must never break the app
+                    self._emit_errors += 1
+            return len(documents)
+
+    def close(self) -> None:
+        """Stop the thread and flush what is pending."""
+        if self._closed:
+            return
+        self._closed = True
+        self._stop.set()
+        thread = self._thread
+        if thread is not None:
+            thread.join(self._interval_sec)
+        self.flush()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._interval_sec):
+            self.flush()
+
+    def _after_fork(self) -> None:
+        was_running = self._thread is not None
+        self._thread = None
+        self._stop = threading.Event()
+        self._flush_lock = threading.Lock()
+        if was_running and not self._closed:
+            self.start()
+
+
+_default_registry = MetricsRegistry()
+
+
+def get_default_metrics_registry() -> MetricsRegistry:
+    """Return the process-wide registry used by Logger.performance."""
+    return _default_registry
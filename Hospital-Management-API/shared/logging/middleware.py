@@ -2,7 +2,8 @@
 
 Purpose:
     Initialize request-scoped LogContext on every HTTP request and clear it
-    after the response is produced.
+    after the response is produced, and time every request into the
+    in-process metrics registry.
 
 Responsibility:
     Orchestrate CorrelationId and ContextManager only. No field logic inline.
@@ -10,6 +11,7 @@ Responsibility:
 
 from __future__ import annotations
 
+import time
 from typing import Any, Callable
 from uuid import uuid4
 
@@ -23,6 +25,10 @@ from shared.logging.correlation import (
     is_valid_correlation_id,
     parse_correlation_id,
 )
+from shared.logging.logger import logger
+
+HTTP_REQUEST_METRIC = "http.request"
+_UNRESOLVED_ROUTE = "unresolved"
 
 
 class CorrelationMiddleware:
@@ -63,3 +69,28 @@ class CorrelationMiddleware:
         if incoming and is_valid_correlation_id(incoming):
             return parse_correlation_id(incoming).to_string()
         return generate_correlation_id().to_string()
+
+
+class RequestTimingMiddleware:
+    """Record each request's duration as an ``http.request`` histogram.
+
+    Series are keyed by the matched URL pattern (``resolver_match.route``),
+    not the raw path, so ids in URLs do not create new series.
+    """
+
+    def __init__(self, get_response: Callable[[Any], Any]) -> None:
+        self.get_response = get_response
+
+    def __call__(self, request: Any) -> Any:
+        started = time.perf_counter()
+        try:
+            return self.get_response(request)
+        finally:
+            elapsed_ms = (time.perf_counter() - started) * 1000.0
+            match = getattr(request, "resolver_match", None)
+            route = getattr(match, "route", None) or _UNRESOLVED_ROUTE
+            logger.metrics_registry.observe(
+                HTTP_REQUEST_METRIC,
+                elapsed_ms,
+                {"route": route, "method": request.method},
+            )
@@ -61,6 +61,8 @@ class LogRecord:
         laboratory_id: Laboratory identifier from request context.
         report_id: Report identifier from request context.
         whatsapp_message_id: WhatsApp message identifier from request context.
+        embedded_metrics: CloudWatch EMF members written at the JSON root
+            for metrics() calls.
     """
 
     timestamp: datetime
@@ -90,6 +92,7 @@ class LogRecord:
     laboratory_id: str | None = None
     report_id: str | None = None
     whatsapp_message_id: str | None = None
+    embedded_metrics: Mapping[str, Any] | None = None
 
 
 def build_record(
@@ -106,6 +109,7 @@ def build_record(
     exception_type: str | None = None,
     exception_message: str | None = None,
     stack_trace: str | None = None,
+    embedded_metrics: Mapping[str, Any] | None = None,
     timestamp: datetime | None = None,
 ) -> LogRecord:
     """Build an immutable LogRecord with safe metadata copying.
@@ -123,12 +127,13 @@ def build_record(
         exception_type: Exception class name for exception() calls.
         exception_message: Exception message for exception() calls.
         stack_trace: Formatted stack trace for exception() calls.
+        embedded_metrics: CloudWatch EMF members for metrics() calls.
         timestamp: Optional explicit timestamp (defaults to UTC now).
 
     Returns:
         LogRecord: Immutable log record ready for enrichment and dispatch.
     """
-    safe_metadata = copy.deepcopy(metadata) if metadata else {}
+    safe_metadata = _copy_metadata(metadata) if metadata else {}
     return LogRecord(
         timestamp=timestamp or datetime.now(timezone.utc),
         level=level,
@@ -144,9 +149,26 @@ def build_record(
         exception_type=exception_type,
         exception_message=exception_message,
         stack_trace=stack_trace,
+        embedded_metrics=embedded_metrics,
     )
 
 
+def _copy_metadata(value: Any) -> Any:
+    """Deep-copy validated metadata.
+
+    Metadata is a JSON-safe tree (see validate_metadata), so dicts and lists
+    are rebuilt directly and immutable scalars are shared; anything else falls
+    back to copy.deepcopy.
+    """
+    if isinstance(value, dict):
+        return {key: _copy_metadata(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_copy_metadata(item) for item in value]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return copy.deepcopy(value)
+
+
 def enrich_record(
     record: LogRecord,
     enrichment: ContextEnrichment,
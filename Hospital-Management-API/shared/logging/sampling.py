@@ -0,0 +1,278 @@
+"""Sampling and rate-limiting policy for the logging platform.
+
+Purpose:
+    Bound the volume of high-frequency log actions (and the CPU and
+    CloudWatch ingestion they cost) during traffic spikes and incident storms.
+
+Responsibility:
+    Match calls to SamplingRules by level, module and action, then apply
+    "first N per window then every Mth" suppression, head sampling and
+    per-key token buckets. Counts suppressed calls so the next emitted record
+    for the same key can report them. Runs before validation and record
+    construction.
+"""
+
+from __future__ import annotations
+
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable
+
+from shared.logging.constants import LOG_LEVEL_SEVERITY, LogLevel, LogModule
+from shared.logging.exceptions import ConfigurationError
+
+SUPPRESSED_COUNT_METADATA_KEY = "sampling_suppressed"
+
+_MAX_TRACKED_KEYS = 10_000
+DEFAULT_FIRST_N_WINDOW_SEC = 60.0
+_UNSET: Any = object()
+
+
+@dataclass(frozen=True)
+class SamplingRule:
+    """One sampling / rate-limit rule; the first matching rule wins.
+
+    Attributes:
+        module: Module to match; None matches any module (including none).
+        action: Exact action, or a prefix ending in ``.*``
+            (e.g. ``routing.journey.*``); None matches any action.
+        max_level: Most severe level the rule applies to. Records above it
+            are never sampled (default: INFO, so warnings and errors pass).
+        sample_rate: Fraction of calls kept by head sampling (0 < rate <= 1).
+        first_n: Keep the first N calls per key in each window, then only
+            every Mth.
+        every_mth: M for ``first_n``; None suppresses everything after N.
+        window_sec: Length of the ``first_n`` window; the count restarts
+            when it rolls over.
+        rate_per_sec: Token bucket refill rate per key; None disables it.
+        burst: Token bucket capacity (defaults to ``rate_per_sec``, min 1).
+    """
+
+    module: LogModule | None = None
+    action: str | None = None
+    max_level: LogLevel = LogLevel.INFO
+    sample_rate: float = 1.0
+    first_n: int | None = None
+    every_mth: int | None = None
+    window_sec: float = DEFAULT_FIRST_N_WINDOW_SEC
+    rate_per_sec: float | None = None
+    burst: int | None = None
+
+    def matches(self, level: LogLevel, module: Any, action: str) -> bool:
+        """Return whether this rule applies to a call."""
+        if LOG_LEVEL_SEVERITY[level] > LOG_LEVEL_SEVERITY[self.max_level]:
+            return False
+        if self.module is not None and module != self.module:
+            return False
+        if self.action is None:
+            return True
+        if self.action.endswith(".*"):
+            return action.startswith(self.action[:-1])
+        return action == self.action
+
+
+def validate_sampling_rule(rule: SamplingRule) -> SamplingRule:
+    """Validate a SamplingRule.
+
+    Args:
+        rule: Rule to validate.
+
+    Returns:
+        SamplingRule: The same rule if valid.
+
+    Raises:
+        ConfigurationError: If the rule is invalid.
+    """
+    if rule.module is not None and not isinstance(rule.module, LogModule):
+        raise ConfigurationError("sampling rule module must be a LogModule")
+    if not isinstance(rule.max_level, LogLevel):
+        raise ConfigurationError("sampling rule max_level must be a LogLevel")
+    if not 0 < rule.sample_rate <= 1:
+        raise ConfigurationError("sampling rule sample_rate must be in (0, 1]")
+    if rule.first_n is not None and rule.first_n < 0:
+        raise ConfigurationError("sampling rule first_n must be non-negative")
+    if rule.every_mth is not None and rule.every_mth < 1:
+        raise ConfigurationError("sampling rule every_mth must be at least 1")
+    if rule.every_mth is not None and rule.first_n is None:
+        raise ConfigurationError("sampling rule every_mth requires first_n")
+    if rule.window_sec <= 0:
+        raise ConfigurationError("sampling rule window_sec must be positive")
+    if rule.rate_per_sec is not None and rule.rate_per_sec <= 0:
+        raise ConfigurationError("sampling rule rate_per_sec must be positive")
+    if rule.burst is not None and rule.burst < 1:
+        raise ConfigurationError("sampling rule burst must be at least 1")
+    if rule.burst is not None and rule.rate_per_sec is None:
+        raise ConfigurationError("sampling rule burst requires rate_per_sec")
+    if (
+        rule.sample_rate == 1
+        and rule.first_n is None
+        and rule.rate_per_sec is None
+    ):
+        raise ConfigurationError(
+            "sampling rule must set sample_rate, first_n or rate_per_sec"
+        )
+    return rule
+
+
+def parse_sampling_rules(raw: str | None) -> tuple[SamplingRule, ...]:
+    """Parse sampling rules from a JSON list (e.g. the LOG_SAMPLING_RULES env var).
+
+    Example:
+        ``[{"action": "doctor_report_workspace.*", "first_n": 20, "every_mth": 100}]``
+
+    Args:
+        raw: JSON text; empty or None yields no rules.
+
+    Returns:
+        tuple[SamplingRule, ...]: Validated rules in priority order.
+
+    Raises:
+        ConfigurationError: If the JSON or any rule is invalid.
+    """
+    if not raw or not raw.strip():
+        return ()
+    try:
+        items = json.loads(raw)
+    except ValueError as exc:
+        raise ConfigurationError(f"sampling rules must be valid JSON: {exc}") from exc
+    if not isinstance(items, list):
+        raise ConfigurationError("sampling rules must be a JSON list")
+    rules: list[SamplingRule] = []
+    for item in items:
+        if not isinstance(item, dict):
+            raise ConfigurationError("each sampling rule must be a JSON object")
+        fields = dict(item)
+        try:
+            if fields.get("module") is not None:
+                fields["module"] = LogModule(fields["module"])
+            if "max_level" in fields:
+                fields["max_level"] = LogLevel(fields["max_level"])
+            rule = SamplingRule(**fields)
+        except (TypeError, ValueError) as exc:
+            raise ConfigurationError(f"invalid sampling rule {item!r}: {exc}") from exc
+        rules.append(validate_sampling_rule(rule))
+    return tuple(rules)
+
+
+class _KeyState:
+    __slots__ = ("seen", "window_started_at", "suppressed", "tokens", "refilled_at")
+
+    def __init__(self, tokens: float, now: float) -> None:
+        self.seen = 0
+        self.window_started_at = now
+        self.suppressed = 0
+        self.tokens = tokens
+        self.refilled_at = now
+
+
+class SamplingPolicy:
+    """Thread-safe evaluator for an ordered tuple of SamplingRules.
+
+    State is kept per ``(module, action)`` key. A suppressed call only
+    increments a counter; the next admitted call for the key receives the
+    count so it can be attached to the emitted record.
+    """
+
+    def __init__(
+        self,
+        rules: tuple[SamplingRule, ...],
+        *,
+        rng: Callable[[], float] = random.random,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Initialize the policy.
+
+        Args:
+            rules: Validated rules in priority order.
+            rng: Uniform [0, 1) source for head sampling (testing).
+            clock: Monotonic clock in seconds for token buckets (testing).
+        """
+        self._rules = tuple(rules)
+        self._rng = rng
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._rule_cache: dict[tuple[Any, ...], SamplingRule | None] = {}
+        self._states: dict[tuple[Any, str], _KeyState] = {}
+
+    def admit(self, level: LogLevel, module: Any, action: str) -> int | None:
+        """Decide whether a call is emitted.
+
+        Args:
+            level: Severity of the call.
+            module: Module of the call (None for performance logs).
+            action: Action name of the call.
+
+        Returns:
+            int | None: None when the call is suppressed; otherwise the number
+            of calls suppressed for this key since the last emitted one.
+        """
+        try:
+            cache_key = (level, module, action)
+            rule = self._rule_cache.get(cache_key, _UNSET)
+        except TypeError:
+            # Unhashable arguments: let validation report them.
+            return 0
+        if rule is _UNSET:
+            rule = self._match(level, module, action)
+            if len(self._rule_cache) < _MAX_TRACKED_KEYS:
+                self._rule_cache[cache_key] = rule
+        if rule is None:
+            return 0
+        with self._lock:
+            return self._admit_locked(rule, (module, action))
+
+    def _match(self, level: LogLevel, module: Any, action: Any) -> SamplingRule | None:
+        if not isinstance(action, str):
+            return None
+        for rule in self._rules:
+            if rule.matches(level, module, action):
+                return rule
+        return None
+
+    def _admit_locked(self, rule: SamplingRule, key: tuple[Any, str]) -> int | None:
+        now = self._clock()
+        capacity = _bucket_capacity(rule)
+        state = self._states.get(key)
+        if state is None:
+            if len(self._states) >= _MAX_TRACKED_KEYS:
+                return 0
+            state = self._states[key] = _KeyState(capacity, now)
+
+        if now - state.window_started_at >= rule.window_sec:
+            state.seen = 0
+            state.window_started_at = now
+        state.seen += 1
+        admitted = True
+        if rule.first_n is not None and state.seen > rule.first_n:
+            overflow = state.seen - rule.first_n
+            admitted = rule.every_mth is not None and overflow % rule.every_mth == 0
+        if admitted and rule.sample_rate < 1:
+            admitted = self._rng() < rule.sample_rate
+        if admitted and rule.rate_per_sec is not None:
+            state.tokens = min(
+                capacity,
+                state.tokens + (now - state.refilled_at) * rule.rate_per_sec,
+            )
+            state.refilled_at = now
+            if state.tokens >= 1:
+                state.tokens -= 1
+            else:
+                admitted = False
+
+        if not admitted:
+            state.suppressed += 1
+            return None
+        suppressed = state.suppressed
+        state.suppressed = 0
+        return suppressed
+
+
+def _bucket_capacity(rule: SamplingRule) -> float:
+    if rule.rate_per_sec is None:
+        return 0.0
+    if rule.burst is not None:
+        return float(rule.burst)
+    return max(1.0, rule.rate_per_sec)
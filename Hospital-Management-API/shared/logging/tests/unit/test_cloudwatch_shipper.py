@@ -0,0 +1,189 @@
+"""Unit tests for the background CloudWatch shipper."""
+
+from __future__ import annotations
+
+import threading
+from unittest.mock import MagicMock
+
+from botocore.exceptions import ClientError
+
+from shared.logging.cloudwatch_buffer import CloudWatchLogBuffer
+from shared.logging.cloudwatch_shipper import EVENT_OVERHEAD_BYTES, CloudWatchShipper
+from shared.logging.config import OVERFLOW_SPILL
+from shared.logging.formatter import JSONLogFormatter
+from shared.logging.handlers import CloudWatchLogHandler
+
+LOG_GROUP = "/doctorprocare/application"
+REGION = "ap-south-1"
+
+
+def _mock_logs_client() -> MagicMock:
+    client = MagicMock()
+    client.describe_log_groups.return_value = {
+        "logGroups": [{"logGroupName": LOG_GROUP}]
+    }
+    client.create_log_stream.return_value = {}
+    client.put_log_events.return_value = {"nextSequenceToken": "token-1"}
+    return client
+
+
+def _shipper(client: MagicMock, **kwargs) -> CloudWatchShipper:
+    buffer = CloudWatchLogBuffer(
+        log_group=LOG_GROUP,
+        region=REGION,
+        service_name="doctorprocare-api",
+        stream_name="fixed",
+        logs_client=client,
+        max_put_retries=1,
+    )
+    kwargs.setdefault("flush_interval_sec", 60.0)
+    return CloudWatchShipper(buffer=buffer, **kwargs)
+
+
+def _blocking_put(client: MagicMock) -> tuple[threading.Event, threading.Event]:
+    """Make put_log_events wait until released; return (entered, release)."""
+    entered = threading.Event()
+    release = threading.Event()
+
+    def _put(**kwargs):
+        entered.set()
+        release.wait(5)
+        return {"nextSequenceToken": "token-1"}
+
+    client.put_log_events.side_effect = _put
+    return entered, release
+
+
+def _shipped_messages(client: MagicMock) -> list[str]:
+    return [
+        event["message"]
+        for call in client.put_log_events.call_args_list
+        for event in call.kwargs["logEvents"]
+    ]
+
+
+def test_background_handler_emit_does_not_wait_on_put_log_events() -> None:
+    client = _mock_logs_client()
+    entered, release = _blocking_put(client)
+    handler = CloudWatchLogHandler(
+        log_group=LOG_GROUP,
+        region=REGION,
+        formatter=JSONLogFormatter(pretty=False),
+        stream_name="fixed",
+        logs_client=client,
+        background=True,
+    )
+    try:
+        handler.emit('{"message":"first"}')
+        handler._shipper._wake.set()
+        assert entered.wait(5)
+
+        for i in range(50):
+            handler.emit(f'{{"message":"{i}"}}')
+        assert handler.stats()["queue_depth"] == 50
+
+        release.set()
+        handler.flush()
+        assert len(_shipped_messages(client)) == 51
+        assert handler.stats()["shipped"] == 51
+    finally:
+        release.set()
+        handler.close()
+
+
+def test_batches_respect_byte_limit() -> None:
+    client = _mock_logs_client()
+    message = "x" * 74
+    shipper = _shipper(client, max_batch_bytes=3 * (len(message) + EVENT_OVERHEAD_BYTES))
+    for _ in range(7):
+        shipper.submit(message)
+    assert shipper.flush(timeout=5)
+    shipper.close()
+
+    sizes = [len(call.kwargs["logEvents"]) for call in client.put_log_events.call_args_list]
+    assert sizes == [3, 3, 1]
+
+
+def test_batches_respect_event_limit() -> None:
+    client = _mock_logs_client()
+    shipper = _shipper(client, max_batch_events=4)
+    for i in range(10):
+        shipper.submit(str(i))
+    assert shipper.flush(timeout=5)
+    shipper.close()
+
+    sizes = [len(call.kwargs["logEvents"]) for call in client.put_log_events.call_args_list]
+    assert sizes == [4, 4, 2]
+    assert _shipped_messages(client) == [str(i) for i in range(10)]
+
+
+def test_full_queue_drops_oldest() -> None:
+    client = _mock_logs_client()
+    entered, release = _blocking_put(client)
+    shipper = _shipper(client, max_queue_size=3)
+    shipper.submit("in-flight")
+    shipper._wake.set()
+    assert entered.wait(5)
+
+    for i in range(5):
+        shipper.submit(str(i))
+    release.set()
+    assert shipper.flush(timeout=5)
+    shipper.close()
+
+    assert _shipped_messages(client) == ["in-flight", "2", "3", "4"]
+    stats = shipper.stats()
+    assert stats["dropped"] == 2
+    assert stats["max_queue_depth"] == 3
+
+
+def test_spill_policy_ships_overflow_after_recovery(tmp_path) -> None:
+    client = _mock_logs_client()
+    entered, release = _blocking_put(client)
+    spill = tmp_path / "cloudwatch.jsonl"
+    shipper = _shipper(client, max_queue_size=2, overflow_policy=OVERFLOW_SPILL, spill_path=str(spill))
+    shipper.submit("in-flight")
+    shipper._wake.set()
+    assert entered.wait(5)
+
+    for i in range(4):
+        shipper.submit(str(i))
+    assert shipper.stats()["spilled"] == 2
+    assert spill.exists()
+
+    release.set()
+    assert shipper.flush(timeout=5)
+    shipper.close()
+
+    assert sorted(_shipped_messages(client)) == ["0", "1", "2", "3", "in-flight"]
+    assert shipper.stats()["dropped"] == 0
+    assert not spill.exists()
+
+
+def test_failed_batch_is_counted_not_raised() -> None:
+    client = _mock_logs_client()
+    client.put_log_events.side_effect = ClientError(
+        {"Error": {"Code": "AccessDeniedException", "Message": "denied"}},
+        "CloudWatchLogs",
+    )
+    shipper = _shipper(client)
+    shipper.submit("a")
+    shipper.submit("b")
+    assert shipper.flush(timeout=5)
+    shipper.close()
+
+    stats = shipper.stats()
+    assert stats["failed_batches"] == 1
+    assert stats["dropped"] == 2
+    assert "AccessDeniedException" in stats["last_error"]
+
+
+def test_close_ships_remaining_events_and_ignores_later_submits() -> None:
+    client = _mock_logs_client()
+    shipper = _shipper(client)
+    shipper.submit("last")
+    shipper.close()
+    shipper.submit("after close")
+
+    assert _shipped_messages(client) == ["last"]
+    assert not shipper._thread.is_alive()
@@ -101,3 +101,27 @@ def test_empty_service_name_raises() -> None:
 def test_empty_application_version_raises() -> None:
     with pytest.raises(ConfigurationError):
         validate_logging_config(_base_config(application_version=""))
+
+
+def test_spill_overflow_policy_requires_spill_path() -> None:
+    with pytest.raises(ConfigurationError, match="cloudwatch_spill_path"):
+        validate_logging_config(
+            _base_config(
+                handlers=(HANDLER_CLOUDWATCH,),
+                cloudwatch_log_group="/doctorprocare/application",
+                cloudwatch_region="ap-south-1",
+                cloudwatch_overflow_policy="spill",
+            )
+        )
+
+
+def test_unknown_overflow_policy_raises() -> None:
+    with pytest.raises(ConfigurationError, match="cloudwatch_overflow_policy"):
+        validate_logging_config(
+            _base_config(
+                handlers=(HANDLER_CLOUDWATCH,),
+                cloudwatch_log_group="/doctorprocare/application",
+                cloudwatch_region="ap-south-1",
+                cloudwatch_overflow_policy="block",
+            )
+        )
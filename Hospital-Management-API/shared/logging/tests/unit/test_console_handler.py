@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import threading
 from datetime import datetime, timezone
 from unittest.mock import MagicMock
 
@@ -86,3 +87,51 @@ def test_flush_and_close_are_safe_noops() -> None:
     handler = ConsoleLogHandler()
     handler.flush()
     handler.close()
+
+
+def test_buffered_console_writes_in_order_on_flush(capsys) -> None:
+    handler = ConsoleLogHandler(formatter=JSONLogFormatter(pretty=False), buffered=True)
+    for i in range(5):
+        handler.emit(f'{{"n":{i}}}')
+    handler.flush()
+    lines = capsys.readouterr().out.splitlines()
+    assert [json.loads(line)["n"] for line in lines] == [0, 1, 2, 3, 4]
+    handler.close()
+
+
+def test_buffered_console_writes_chunk_per_interval() -> None:
+    from shared.logging.console_buffer import ConsoleWriteBuffer
+
+    written = threading.Event()
+    stream = MagicMock()
+    stream.flush.side_effect = written.set
+    writer = ConsoleWriteBuffer(stream=lambda: stream, flush_interval_sec=60)
+    writer.append("a")
+    writer.append("b")
+    writer._wake.set()
+    assert written.wait(5)
+    stream.write.assert_called_once_with("a\nb\n")
+    writer.close()
+
+
+def test_buffered_console_applies_backpressure_when_writer_lags() -> None:
+    from shared.logging.console_buffer import BACKPRESSURE_FACTOR, ConsoleWriteBuffer
+
+    stream = MagicMock()
+    writer = ConsoleWriteBuffer(stream=lambda: stream, flush_interval_sec=60, max_buffer_bytes=10)
+    for _ in range(BACKPRESSURE_FACTOR * 10):
+        writer.append("x")
+        assert writer._pending_bytes < 10 * BACKPRESSURE_FACTOR
+    writer.close()
+    assert "".join(call.args[0] for call in stream.write.call_args_list) == "x\n" * (
+        BACKPRESSURE_FACTOR * 10
+    )
+
+
+def test_buffered_console_close_writes_pending_and_later_emits_synchronously(capsys) -> None:
+    handler = ConsoleLogHandler(formatter=JSONLogFormatter(pretty=False), buffered=True)
+    handler.emit('{"n":1}')
+    handler.close()
+    assert capsys.readouterr().out == '{"n":1}\n'
+    handler.emit('{"n":2}')
+    assert capsys.readouterr().out == '{"n":2}\n'
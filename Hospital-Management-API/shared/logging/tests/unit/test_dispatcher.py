@@ -140,3 +140,32 @@ def test_dispatcher_close_isolates_handler_failures() -> None:
     dispatcher = LogDispatcher(handlers=[failing, succeeding])
     dispatcher.close()
     succeeding.close.assert_called_once()
+
+
+def test_dispatcher_serializes_once_for_matching_formatters() -> None:
+    from unittest.mock import patch
+
+    from shared.logging import formatter
+    from shared.logging.formatter import JSONLogFormatter
+    from shared.logging.handlers import ConsoleLogHandler
+
+    first = ConsoleLogHandler(JSONLogFormatter(pretty=False))
+    second = ConsoleLogHandler(JSONLogFormatter(pretty=False))
+    emitted: list[str] = []
+    first.emit = emitted.append  # type: ignore[method-assign]
+    second.emit = emitted.append  # type: ignore[method-assign]
+    dispatcher = LogDispatcher(handlers=[first, second])
+
+    with patch.object(
+        formatter, "_record_to_compact_json", wraps=formatter._record_to_compact_json
+    ) as serialize:
+        dispatcher.dispatch(_sample_record())
+
+    serialize.assert_called_once()
+    assert emitted[0] is emitted[1]
+
+
+def test_dispatcher_is_enabled_for_min_level() -> None:
+    dispatcher = LogDispatcher(min_level=LogLevel.WARNING)
+    assert not dispatcher.is_enabled_for(LogLevel.INFO)
+    assert dispatcher.is_enabled_for(LogLevel.ERROR)
@@ -20,7 +20,15 @@ from shared.logging.constants import (
     LogStatus,
 )
 from shared.logging.exceptions import FormatterError
-from shared.logging.formatter import JSONLogFormatter, SCHEMA_FIELDS, _format_timestamp
+from shared.logging.formatter import (
+    JSONLogFormatter,
+    SCHEMA_FIELDS,
+    _format_timestamp,
+    _json_default,
+    _record_to_payload,
+    begin_shared_serialization,
+    end_shared_serialization,
+)
 from shared.logging.record import LogRecord, build_record
 
 
@@ -281,3 +289,39 @@ def test_formatter_utf8_and_nested_metadata() -> None:
     payload = json.loads(JSONLogFormatter(pretty=False).format(record))
     assert payload["metadata"]["patient"]["name"] == "José"
     assert payload["metadata"]["tags"] == ["α", "β"]
+
+
+@pytest.mark.parametrize(
+    "overrides",
+    [
+        {},
+        {"module": None, "event_code": "DP1001", "duration_ms": 12.5},
+        {"metadata": {"id": uuid4(), "amount": Decimal("1.10"), "nested": {"k": ["é", None]}}},
+        {"exception_type": "ValueError", "exception_message": 'bad "x"', "stack_trace": "line\n"},
+        {"message": "tab\tquote\" \u2028", "correlation_id": "corr-1", "user_id": ""},
+    ],
+)
+def test_compact_fast_path_matches_json_dumps(overrides) -> None:
+    record = _sample_record(**overrides)
+    expected = json.dumps(
+        _record_to_payload(record),
+        default=_json_default,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        sort_keys=False,
+    )
+    assert JSONLogFormatter(pretty=False).format(record) == expected
+
+
+def test_shared_serialization_reuses_output_within_scope() -> None:
+    record = _sample_record()
+    first, second = JSONLogFormatter(pretty=False), JSONLogFormatter(pretty=False)
+    token = begin_shared_serialization()
+    try:
+        compact = first.format(record)
+        assert second.format(record) is compact
+        assert JSONLogFormatter(pretty=True).format(record) != compact
+        assert second.format(_sample_record(message="other")) is not compact
+    finally:
+        end_shared_serialization(token)
+    assert second.format(record) is not compact
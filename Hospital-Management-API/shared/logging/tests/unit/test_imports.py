@@ -39,6 +39,7 @@ SUBMODULES = [
     "shared.logging.cloudwatch_buffer",
     "shared.logging.dispatcher",
     "shared.logging.factory",
+    "shared.logging.metrics",
 ]
 
 
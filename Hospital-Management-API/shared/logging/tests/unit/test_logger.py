@@ -10,6 +10,7 @@ from shared.logging.constants import (
     ACTION_BOOKING_SUBMITTED,
     ACTION_CONSULTATION_STARTED,
     EventType,
+    LogLevel,
 )
 from shared.logging.context_enricher import ContextEnrichment
 from shared.logging.dispatcher import LogDispatcher
@@ -191,3 +192,17 @@ def test_logger_rejects_correlation_id_in_metadata(test_logger) -> None:
             action="api.request",
             metadata={"correlation_id": "manual-id"},
         )
+
+
+def test_levels_below_minimum_skip_validation_and_dispatch() -> None:
+    handler = MagicMock(spec=BaseLogHandler)
+    gated = Logger(dispatcher=LogDispatcher(handlers=[handler], min_level=LogLevel.WARNING))
+
+    gated.debug("", module="not-a-module", action="Invalid")  # type: ignore[arg-type]
+    gated.info("msg", module=LogModule.API, action="api.request")
+    gated.performance("api.request", duration_ms=1.0)
+    handler.emit_record.assert_not_called()
+
+    gated.warning("msg", module=LogModule.API, action="api.request")
+    gated.audit("booking.submitted", audit_type=EventType.BUSINESS_AUDIT)
+    assert handler.emit_record.call_count == 2
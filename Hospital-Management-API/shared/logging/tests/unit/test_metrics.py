@@ -0,0 +1,203 @@
+"""Unit tests for shared.logging.metrics."""
+
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock
+
+import pytest
+
+from shared.logging import Logger
+from shared.logging.config import HANDLER_CONSOLE, LoggingConfig, validate_logging_config
+from shared.logging.constants import Environment, LogLevel
+from shared.logging.context_enricher import ContextEnrichment
+from shared.logging.dispatcher import LogDispatcher
+from shared.logging.exceptions import ConfigurationError, LoggingError
+from shared.logging.formatter import JSONLogFormatter
+from shared.logging.handlers import BaseLogHandler
+from shared.logging.metrics import (
+    MetricsFlusher,
+    MetricsRegistry,
+    build_emf_documents,
+)
+
+
+def _logger(registry: MetricsRegistry) -> tuple[Logger, MagicMock]:
+    handler = MagicMock(spec=BaseLogHandler)
+    enricher = MagicMock()
+    enricher.enrich.return_value = ContextEnrichment.empty()
+    return (
+        Logger(
+            dispatcher=LogDispatcher(handlers=[handler]),
+            context_enricher=enricher,
+            metrics=registry,
+        ),
+        handler,
+    )
+
+
+def test_histogram_percentiles_follow_bucket_bounds() -> None:
+    registry = MetricsRegistry(bucket_bounds_ms=(1.0, 10.0, 100.0))
+    for value in [0.5] * 90 + [5.0] * 5 + [50.0] * 4 + [500.0]:
+        registry.observe("api.request", value)
+
+    (histogram,) = registry.snapshot().histograms
+    assert histogram.count == 100
+    assert histogram.percentile(50) == 1.0
+    assert histogram.percentile(95) == 10.0
+    assert histogram.percentile(99) == 100.0
+    assert histogram.percentile(100) == 500.0
+    assert histogram.summary()["min"] == 0.5
+
+
+def test_series_are_keyed_by_dimensions_and_reset_on_flush() -> None:
+    registry = MetricsRegistry()
+    registry.observe("api.request", 3.0, {"endpoint": "a"})
+    registry.observe("api.request", 4.0, {"endpoint": "b"})
+    registry.increment("api.errors", dimensions={"endpoint": "a"})
+    registry.increment("api.errors", 2, dimensions={"endpoint": "a"})
+
+    snapshot = registry.snapshot(reset=True)
+    assert [h.dimensions for h in snapshot.histograms] == [
+        (("endpoint", "a"),),
+        (("endpoint", "b"),),
+    ]
+    assert snapshot.counters[0].value == 3
+    assert registry.snapshot().is_empty()
+
+
+def test_cumulative_snapshot_survives_flush_resets() -> None:
+    registry = MetricsRegistry(bucket_bounds_ms=(1.0, 10.0))
+    registry.observe("api.request", 0.5)
+    registry.increment("api.errors")
+    registry.snapshot(reset=True)
+    registry.observe("api.request", 5.0)
+    registry.increment("api.errors", 2)
+
+    window = registry.snapshot()
+    assert window.histograms[0].count == 1
+    assert window.counters[0].value == 2
+
+    totals = registry.snapshot(cumulative=True)
+    (histogram,) = totals.histograms
+    assert (histogram.count, histogram.minimum, histogram.maximum) == (2, 0.5, 5.0)
+    assert histogram.total == 5.5
+    assert totals.counters[0].value == 3
+
+    registry.snapshot(reset=True)
+    assert registry.snapshot().is_empty()
+    assert registry.snapshot(cumulative=True).histograms[0].count == 2
+    with pytest.raises(ValueError):
+        registry.snapshot(reset=True, cumulative=True)
+
+
+def test_series_limit_counts_dropped_observations() -> None:
+    registry = MetricsRegistry(max_series=1)
+    registry.observe("a.one", 1.0)
+    registry.observe("a.two", 1.0)
+    registry.increment("a.three")
+    snapshot = registry.snapshot()
+    assert len(snapshot.histograms) == 1
+    assert snapshot.dropped == 2
+
+
+def test_timer_works_as_context_manager_and_decorator() -> None:
+    registry = MetricsRegistry()
+
+    with registry.time("timeline.build"):
+        pass
+
+    @registry.time("timeline.build")
+    def build() -> str:
+        return "done"
+
+    assert build() == "done"
+    assert registry.snapshot().histograms[0].count == 2
+
+
+def test_performance_aggregates_and_emit_false_skips_record() -> None:
+    registry = MetricsRegistry()
+    test_logger, handler = _logger(registry)
+
+    test_logger.performance("workspace.summary", duration_ms=12.0, emit=False)
+    with test_logger.timer("workspace.summary"):
+        pass
+    handler.emit_record.assert_not_called()
+
+    test_logger.performance("workspace.summary", duration_ms=8.0)
+    handler.emit_record.assert_called_once()
+    assert registry.snapshot().histograms[0].count == 3
+
+    with pytest.raises(LoggingError):
+        test_logger.performance("workspace.summary", duration_ms=-1.0, emit=False)
+
+
+def test_emf_documents_group_by_dimensions() -> None:
+    registry = MetricsRegistry(bucket_bounds_ms=(1.0, 10.0))
+    registry.observe("api.request", 0.5)
+    registry.observe("api.request", 7.0)
+    registry.increment("api.errors")
+    registry.observe("api.request", 2.0, {"Endpoint": "queue"})
+
+    documents = build_emf_documents(
+        registry.snapshot(),
+        namespace="DoctorProCare",
+        dimensions={"Service": "api"},
+        timestamp_ms=1_000,
+    )
+
+    assert len(documents) == 2
+    base = documents[0]
+    directive = base["_aws"]["CloudWatchMetrics"][0]
+    assert base["_aws"]["Timestamp"] == 1_000
+    assert directive["Dimensions"] == [["Service"]]
+    assert {m["Name"] for m in directive["Metrics"]} == {"api.request", "api.errors"}
+    assert base["api.request"]["Values"] == [1.0, 7.0]
+    assert base["api.request"]["Counts"] == [1, 1]
+    assert base["api.errors"] == 1
+    assert documents[1]["Endpoint"] == "queue"
+    assert documents[1]["_aws"]["CloudWatchMetrics"][0]["Dimensions"] == [["Service", "Endpoint"]]
+
+
+def test_flusher_writes_emf_members_at_json_root() -> None:
+    registry = MetricsRegistry()
+    test_logger, handler = _logger(registry)
+    test_logger.performance("api.request", duration_ms=5.0, emit=False)
+
+    flusher = MetricsFlusher(
+        registry,
+        test_logger.metrics,
+        namespace="DoctorProCare",
+        dimensions={"Service": "api"},
+        clock=lambda: 2.0,
+    )
+    assert flusher.flush() == 1
+    assert flusher.flush() == 0
+
+    record = handler.emit_record.call_args[0][0]
+    payload = json.loads(JSONLogFormatter().format(record))
+    assert payload["action"] == "metrics.flushed"
+    assert payload["_aws"]["Timestamp"] == 2_000
+    assert payload["Service"] == "api"
+    assert payload["api.request"]["Count"] == 1
+
+
+def test_metrics_rejects_documents_shadowing_schema_fields() -> None:
+    test_logger, _ = _logger(MetricsRegistry())
+    with pytest.raises(LoggingError, match="schema field"):
+        test_logger.metrics({"_aws": {}, "message": 1})
+    with pytest.raises(LoggingError, match="_aws"):
+        test_logger.metrics({"api.request": 1})
+
+
+def test_config_rejects_non_positive_flush_interval() -> None:
+    config = LoggingConfig(
+        environment=Environment.TEST,
+        service_name="svc",
+        application_version="1.0.0",
+        log_level=LogLevel.INFO,
+        handlers=(HANDLER_CONSOLE,),
+        metrics_flush_interval_sec=0,
+    )
+    with pytest.raises(ConfigurationError, match="metrics_flush_interval_sec"):
+        validate_logging_config(config)
@@ -1,19 +1,23 @@
-"""Unit tests for CorrelationMiddleware."""
+"""Unit tests for CorrelationMiddleware and RequestTimingMiddleware."""
 
 from __future__ import annotations
 
+from types import SimpleNamespace
+from unittest.mock import patch
 from uuid import uuid4
 
 from django.http import HttpResponse
 from django.test import RequestFactory
 
+from shared.logging.metrics import MetricsRegistry
+
 from shared.logging.constants import (
     CORRELATION_ID_HTTP_HEADER,
     REQUEST_ID_HTTP_HEADER,
 )
 from shared.logging.context import get_context_manager
 from shared.logging.correlation import generate_correlation_id, is_valid_correlation_id
-from shared.logging.middleware import CorrelationMiddleware
+from shared.logging.middleware import CorrelationMiddleware, RequestTimingMiddleware
 
 
 def _middleware() -> CorrelationMiddleware:
@@ -83,3 +87,35 @@ def test_each_request_gets_unique_request_id() -> None:
 
     assert first[CORRELATION_ID_HTTP_HEADER] == second[CORRELATION_ID_HTTP_HEADER]
     assert first[REQUEST_ID_HTTP_HEADER] != second[REQUEST_ID_HTTP_HEADER]
+
+
+def _timed(view) -> tuple[MetricsRegistry, HttpResponse]:
+    registry = MetricsRegistry()
+    request = RequestFactory().get("/api/bookings/42/")
+    with patch(
+        "shared.logging.middleware.logger",
+        SimpleNamespace(metrics_registry=registry),
+    ):
+        response = RequestTimingMiddleware(view)(request)
+    return registry, response
+
+
+def test_request_timing_keys_series_by_route() -> None:
+    def view(request):
+        request.resolver_match = SimpleNamespace(route="api/bookings/<int:pk>/")
+        return HttpResponse("ok")
+
+    registry, response = _timed(view)
+
+    assert response.status_code == 200
+    series = registry.snapshot().to_dict()["histograms"]
+    assert [(s["name"], s["dimensions"]) for s in series] == [
+        ("http.request", {"method": "GET", "route": "api/bookings/<int:pk>/"})
+    ]
+
+
+def test_request_timing_records_unresolved_requests() -> None:
+    registry, _ = _timed(lambda request: HttpResponse(status=404))
+
+    series = registry.snapshot().to_dict()["histograms"]
+    assert series[0]["dimensions"]["route"] == "unresolved"
@@ -0,0 +1,138 @@
+"""Unit tests for shared.logging.sampling."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from shared.logging import Logger, LogModule
+from shared.logging.config import HANDLER_CONSOLE, LoggingConfig, validate_logging_config
+from shared.logging.constants import Environment, LogLevel
+from shared.logging.context_enricher import ContextEnrichment
+from shared.logging.dispatcher import LogDispatcher
+from shared.logging.exceptions import ConfigurationError
+from shared.logging.handlers import BaseLogHandler
+from shared.logging.sampling import (
+    SUPPRESSED_COUNT_METADATA_KEY,
+    SamplingPolicy,
+    SamplingRule,
+    parse_sampling_rules,
+)
+
+INFO = LogLevel.INFO
+
+
+def _admitted(policy: SamplingPolicy, calls: int, **kwargs) -> list[int | None]:
+    kwargs.setdefault("level", INFO)
+    kwargs.setdefault("module", LogModule.ROUTING)
+    kwargs.setdefault("action", "routing.journey.step")
+    return [policy.admit(kwargs["level"], kwargs["module"], kwargs["action"]) for _ in range(calls)]
+
+
+def test_first_n_then_every_mth_reports_suppressed_counts() -> None:
+    policy = SamplingPolicy((SamplingRule(action="routing.journey.*", first_n=2, every_mth=3),))
+    assert _admitted(policy, 8) == [0, 0, None, None, 2, None, None, 2]
+
+
+def test_first_n_count_restarts_when_window_rolls_over() -> None:
+    now = [0.0]
+    policy = SamplingPolicy(
+        (SamplingRule(action="routing.journey.*", first_n=1, window_sec=10),),
+        clock=lambda: now[0],
+    )
+    assert _admitted(policy, 3) == [0, None, None]
+    now[0] = 10.0
+    assert _admitted(policy, 2) == [2, None]
+
+
+def test_rules_do_not_touch_unmatched_calls_or_higher_levels() -> None:
+    policy = SamplingPolicy((SamplingRule(module=LogModule.ROUTING, first_n=0),))
+    assert _admitted(policy, 2) == [None, None]
+    assert _admitted(policy, 2, module=LogModule.API) == [0, 0]
+    assert _admitted(policy, 2, level=LogLevel.WARNING) == [0, 0]
+
+
+def test_head_sampling_uses_rate() -> None:
+    draws = iter([0.05, 0.5, 0.09, 0.95])
+    policy = SamplingPolicy((SamplingRule(sample_rate=0.1),), rng=lambda: next(draws))
+    assert _admitted(policy, 4) == [0, None, 1, None]
+
+
+def test_token_bucket_is_per_key_and_refills() -> None:
+    now = [0.0]
+    policy = SamplingPolicy(
+        (SamplingRule(action="routing.journey.*", rate_per_sec=2, burst=2),),
+        clock=lambda: now[0],
+    )
+    assert _admitted(policy, 3) == [0, 0, None]
+    assert _admitted(policy, 1, action="routing.journey.other") == [0]
+    now[0] = 0.5
+    assert _admitted(policy, 2) == [1, None]
+
+
+def test_parse_sampling_rules_from_json() -> None:
+    rules = parse_sampling_rules(
+        '[{"module": "routing", "action": "routing.*", "max_level": "WARNING", "rate_per_sec": 5}]'
+    )
+    assert rules == (
+        SamplingRule(
+            module=LogModule.ROUTING,
+            action="routing.*",
+            max_level=LogLevel.WARNING,
+            rate_per_sec=5,
+        ),
+    )
+    assert parse_sampling_rules("") == ()
+
+
+@pytest.mark.parametrize(
+    "raw",
+    [
+        "{",
+        '{"action": "x.y"}',
+        '[{"action": "x.y"}]',
+        '[{"module": "nope", "first_n": 1}]',
+        '[{"sample_rate": 0}]',
+        '[{"every_mth": 5}]',
+        '[{"first_n": 1, "unknown": 1}]',
+    ],
+)
+def test_parse_sampling_rules_rejects_invalid(raw) -> None:
+    with pytest.raises(ConfigurationError):
+        parse_sampling_rules(raw)
+
+
+def test_config_validates_sampling_rules() -> None:
+    with pytest.raises(ConfigurationError):
+        validate_logging_config(
+            LoggingConfig(
+                environment=Environment.TEST,
+                service_name="doctorprocare-api",
+                application_version="1.0.0",
+                log_level=LogLevel.INFO,
+                handlers=(HANDLER_CONSOLE,),
+                sampling_rules=(SamplingRule(sample_rate=2),),
+            )
+        )
+
+
+def test_logger_skips_suppressed_calls_and_annotates_next_record() -> None:
+    handler = MagicMock(spec=BaseLogHandler)
+    policy = SamplingPolicy((SamplingRule(action="api.request", first_n=1, every_mth=3),))
+    enricher = MagicMock()
+    enricher.enrich.return_value = ContextEnrichment.empty()
+    sampled = Logger(
+        dispatcher=LogDispatcher(handlers=[handler], sampling=policy),
+        context_enricher=enricher,
+    )
+
+    for _ in range(4):
+        sampled.info("msg", module=LogModule.API, action="api.request", metadata={"n": 1})
+    sampled.warning("msg", module=LogModule.API, action="api.request")
+
+    records = [call.args[0] for call in handler.emit_record.call_args_list]
+    assert len(records) == 3
+    assert SUPPRESSED_COUNT_METADATA_KEY not in records[0].metadata
+    assert records[1].metadata == {"n": 1, SUPPRESSED_COUNT_METADATA_KEY: 2}
+    assert SUPPRESSED_COUNT_METADATA_KEY not in records[2].metadata
@@ -0,0 +1,53 @@
+"""Unit tests for the metrics dump view."""
+
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+
+import pytest
+from django.http import Http404
+from django.test import RequestFactory, override_settings
+
+from shared.logging.logger import logger
+from shared.logging.views import metrics_dump
+
+_ANONYMOUS = SimpleNamespace(is_authenticated=False, is_staff=False)
+_STAFF = SimpleNamespace(is_authenticated=True, is_staff=True)
+
+
+def _request(user=_ANONYMOUS, **headers):
+    request = RequestFactory().get("/internal/metrics/", **headers)
+    request.user = user
+    return request
+
+
+@override_settings(LOG_METRICS_ENDPOINT_ENABLED=True, LOG_METRICS_ENDPOINT_TOKEN="s3cret")
+def test_staff_and_token_holders_get_snapshot() -> None:
+    assert metrics_dump(_request(_STAFF)).status_code == 200
+    assert metrics_dump(_request(HTTP_X_METRICS_TOKEN="s3cret")).status_code == 200
+
+
+@override_settings(LOG_METRICS_ENDPOINT_ENABLED=True, LOG_METRICS_ENDPOINT_TOKEN="s3cret")
+def test_loopback_without_credentials_is_hidden() -> None:
+    with pytest.raises(Http404):
+        metrics_dump(_request(REMOTE_ADDR="127.0.0.1"))
+    with pytest.raises(Http404):
+        metrics_dump(_request(HTTP_X_METRICS_TOKEN="wrong"))
+
+
+@override_settings(LOG_METRICS_ENDPOINT_ENABLED=True, LOG_METRICS_ENDPOINT_TOKEN="")
+def test_empty_token_setting_never_matches() -> None:
+    with pytest.raises(Http404):
+        metrics_dump(_request(HTTP_X_METRICS_TOKEN=""))
+
+
+@override_settings(LOG_METRICS_ENDPOINT_ENABLED=True)
+def test_dump_keeps_series_drained_by_the_flusher() -> None:
+    registry = logger.metrics_registry
+    registry.observe("views.test.dump", 2.0)
+    registry.snapshot(reset=True)
+
+    body = json.loads(metrics_dump(_request(_STAFF)).content)
+    assert body["window"] == "process"
+    assert "views.test.dump" in [item["name"] for item in body["histograms"]]
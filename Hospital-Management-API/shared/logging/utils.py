@@ -1,13 +1,39 @@
 """Shared utility functions for the DoctorProCare logging platform.
 
 Purpose:
-    Reserved module for cross-cutting logging helpers used by multiple
-    components.
+    Cross-cutting logging helpers used by multiple components.
 
 Responsibility:
-    Empty in this milestone. No utility functions are defined yet.
+    Small, dependency-free helpers only.
 
 Future implementation:
     Duration calculation, metadata cleanup, safe serialization, and PII
     redaction helpers will live here.
 """
+
+from __future__ import annotations
+
+import os
+import weakref
+from typing import Any
+
+
+def register_after_fork(target: Any, method_name: str) -> None:
+    """Call ``target.<method_name>()`` in child processes after ``os.fork``.
+
+    Background writer threads do not survive a fork (gunicorn and Celery
+    prefork workers), so their owners rebuild them in the child. Only a weak
+    reference to ``target`` is held.
+
+    Args:
+        target: Object owning the thread.
+        method_name: Zero-argument method that restarts it.
+    """
+    ref = weakref.ref(target)
+
+    def _callback() -> None:
+        owner = ref()
+        if owner is not None:
+            getattr(owner, method_name)()
+
+    os.register_at_fork(after_in_child=_callback)
@@ -16,7 +16,7 @@ from __future__ import annotations
 import re
 from typing import Any
 
-from shared.logging.constants import EventType, LogModule
+from shared.logging.constants import CONTEXT_FIELD_NAMES, EventType, LogModule
 from shared.logging.exceptions import LoggingError
 
 _ACTION_PATTERN = re.compile(r"^[a-z][a-z0-9_]*(\.[a-z][a-z0-9_]*)+$")
@@ -24,6 +24,29 @@ _EVENT_CODE_PATTERN = re.compile(r"^DP\d{4}$")
 
 _JSON_SAFE_TYPES = (str, int, float, bool, type(None))
 
+# Action names are call-site literals; remember ones that already passed the
+# pattern so the regex runs once per action rather than once per log call.
+_VALID_ACTIONS: set[str] = set()
+_VALID_ACTIONS_MAX = 4096
+
+# Root members written by the JSON formatter; EMF members must not shadow them.
+_RESERVED_ROOT_MEMBERS = frozenset(
+    {
+        "schema_version",
+        "timestamp",
+        "level",
+        "module",
+        "action",
+        "status",
+        "message",
+        "event_code",
+        "metadata",
+        "duration_ms",
+        "exception",
+        *CONTEXT_FIELD_NAMES,
+    }
+)
+
 
 def validate_message(message: object) -> str:
     """Validate and return a non-empty log message.
@@ -74,12 +97,16 @@ def validate_action(action: object) -> str:
     Raises:
         LoggingError: If action is invalid.
     """
+    if type(action) is str and action in _VALID_ACTIONS:
+        return action
     if not isinstance(action, str):
         raise LoggingError("action must be a string")
     if not _ACTION_PATTERN.match(action):
         raise LoggingError(
             "action must use lowercase dot notation (e.g. consultation.started)"
         )
+    if len(_VALID_ACTIONS) < _VALID_ACTIONS_MAX:
+        _VALID_ACTIONS.add(action)
     return action
 
 
@@ -158,6 +185,31 @@ def validate_duration_ms(duration_ms: object) -> float:
     return float(duration_ms)
 
 
+def validate_embedded_metrics(document: object) -> dict[str, Any]:
+    """Validate a CloudWatch Embedded Metric Format document.
+
+    Args:
+        document: Root-level EMF members, including the ``_aws`` directive.
+
+    Returns:
+        dict[str, Any]: Validated document.
+
+    Raises:
+        LoggingError: If the document is malformed or shadows a schema field.
+    """
+    if not isinstance(document, dict):
+        raise LoggingError("embedded metrics must be a dictionary")
+    if not isinstance(document.get("_aws"), dict):
+        raise LoggingError("embedded metrics must contain an _aws directive")
+    shadowed = _RESERVED_ROOT_MEMBERS.intersection(document)
+    if shadowed:
+        raise LoggingError(
+            f"embedded metrics must not use schema field names: {sorted(shadowed)}"
+        )
+    _validate_json_safe_value(document, path="embedded_metrics")
+    return document
+
+
 def validate_audit_type(audit_type: object) -> EventType:
     """Validate that audit_type is an EventType enum value.
 
@@ -0,0 +1,54 @@
+"""Django views for the logging platform.
+
+Purpose:
+    Expose the in-process metrics registry for local inspection.
+
+Responsibility:
+    Read-only JSON dump of histogram summaries (count, mean, min, max,
+    p50/p95/p99) and counters. Served only when LOG_METRICS_ENDPOINT_ENABLED
+    is set, and only to staff users or callers presenting
+    LOG_METRICS_ENDPOINT_TOKEN; the registry is per process and the dump
+    reports its cumulative totals, not the window the flusher drains.
+"""
+
+from __future__ import annotations
+
+import hmac
+from typing import Any
+
+from django.conf import settings
+from django.http import Http404, JsonResponse
+from django.views.decorators.http import require_GET
+
+from shared.logging.logger import logger
+
+METRICS_TOKEN_HTTP_HEADER = "X-Metrics-Token"
+
+
+def _is_authorized(request: Any) -> bool:
+    user = getattr(request, "user", None)
+    if user is not None and user.is_authenticated and user.is_staff:
+        return True
+    token = getattr(settings, "LOG_METRICS_ENDPOINT_TOKEN", "")
+    presented = request.headers.get(METRICS_TOKEN_HTTP_HEADER, "")
+    return bool(token) and hmac.compare_digest(presented.encode(), token.encode())
+
+
+@require_GET
+def metrics_dump(request: Any) -> JsonResponse:
+    """Return cumulative metrics since process start without resetting them.
+
+    The metrics flusher resets the registry's current window every
+    interval; the dump reads the lifetime totals instead, so it is not
+    emptied by a flush.
+
+    Raises:
+        Http404: If the endpoint is disabled or the caller is neither staff
+            nor presents the metrics token.
+    """
+    if not getattr(settings, "LOG_METRICS_ENDPOINT_ENABLED", False):
+        raise Http404
+    if not _is_authorized(request):
+        raise Http404
+    snapshot = logger.metrics_registry.snapshot(cumulative=True)
+    return JsonResponse({"window": "process", **snapshot.to_dict()})
@@ -54,6 +54,7 @@ class SupportTraceRepository:
         version = expected_trace_version or existing.trace_version
         update_fields = dict(fields)
         update_fields.pop("workflow_instance_id", None)
+        update_fields.pop("id", None)
         update_fields["trace_version"] = F("trace_version") + 1
 
         updated_count = SupportTrace.objects.filter(
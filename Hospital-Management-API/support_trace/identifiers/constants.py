@@ -12,6 +12,18 @@ PHONE_MIN_DIGITS = 10
 PHONE_MAX_DIGITS = 15
 
 PARTIAL_SEARCH_LIMIT = 25
+
+# Fuzzy (prefix / partial / suffix) search is served by the pg_trgm GIN and
+# reverse() indexes from migration 0005; keep these in step with it.
+TRIGRAM_SEARCH_FIELDS: frozenset[str] = frozenset(
+    {"phone_number", "payment_id", "provider_reference", "whatsapp_message_id"}
+)
+SUFFIX_SEARCH_FIELDS: frozenset[str] = frozenset({"phone_number", "provider_reference"})
+# Trigram indexes cannot serve LIKE patterns shorter than one trigram.
+TRIGRAM_MIN_LENGTH = 3
+
+# RelationshipResolver.expand: hops walked breadth-first (one query per hop).
+RELATIONSHIP_EXPANSION_DEPTH = 1
 PROVIDER_REFERENCE_MAX_LENGTH = 256
 
 # UUID field probe order for ambiguous UUID inputs (highest priority first)
@@ -36,5 +48,6 @@ UUID_PROBE_PRIORITY: tuple[str, ...] = (
 class SearchStrategy(models.TextChoices):
     EXACT = "exact", "Exact"
     PREFIX = "prefix", "Prefix"
+    SUFFIX = "suffix", "Suffix"
     PARTIAL = "partial", "Partial"
     RELATIONSHIP = "relationship", "Relationship"
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
-from support_trace.identifiers.lookup_keys import IDENTIFIER_FIELDS, identifiers_from_trace
+from django.db.models import Q
+
+from support_trace.identifiers.constants import RELATIONSHIP_EXPANSION_DEPTH
+from support_trace.identifiers.lookup_keys import identifiers_from_trace
 from support_trace.identifiers.types import IdentifierType
 from support_trace.models import SupportTrace
 
@@ -47,53 +50,74 @@ class RelationshipResolver:
         return cls.expand([trace])
 
     @classmethod
-    def expand(cls, traces: list[SupportTrace]) -> list[SupportTrace]:
-        if not traces:
+    def expand(
+        cls,
+        traces: list[SupportTrace],
+        *,
+        max_depth: int = RELATIONSHIP_EXPANSION_DEPTH,
+        max_results: int | None = None,
+    ) -> list[SupportTrace]:
+        """Return traces related to ``traces``, excluding the seeds themselves.
+
+        Walks breadth-first: each hop unions the frontier's identifier values,
+        correlation ids, parent ids and own ids (for children) into one
+        ``__in`` query. Values already queried on an earlier hop are skipped.
+        Within a hop, matches are ordered most recently updated first.
+        """
+        if not traces or (max_results is not None and max_results <= 0):
             return []
-        seen: set[str] = set()
+        seen = {t.workflow_instance_id for t in traces}
+        queried: dict[str, set[str]] = {}
         related: list[SupportTrace] = []
-        seed_ids = {t.workflow_instance_id for t in traces}
-        correlation_ids = {t.correlation_id for t in traces if t.correlation_id}
+        frontier = list(traces)
 
-        for trace in traces:
-            ids = identifiers_from_trace(trace)
-            for field in IDENTIFIER_FIELDS:
-                value = ids.get(field)
-                if not value:
+        for _ in range(max(max_depth, 0)):
+            condition = cls._relationship_condition(frontier, queried)
+            if condition is None:
+                break
+            matches = SupportTrace.objects.filter(condition).order_by("-updated_at")
+            if max_results is not None:
+                # Already-seen rows can match again; bound the slice by them too.
+                matches = matches[: max_results - len(related) + len(seen)]
+            frontier = []
+            for match in matches:
+                if match.workflow_instance_id in seen:
                     continue
-                for match in SupportTrace.objects.filter(**{field: value}).order_by(
-                    "-updated_at"
-                ):
-                    if match.workflow_instance_id in seen:
-                        continue
-                    if match.workflow_instance_id in seed_ids:
-                        continue
-                    seen.add(match.workflow_instance_id)
-                    related.append(match)
+                seen.add(match.workflow_instance_id)
+                related.append(match)
+                frontier.append(match)
+                if max_results is not None and len(related) >= max_results:
+                    return related
+            if not frontier:
+                break
+        return related
 
+    @staticmethod
+    def _relationship_condition(
+        frontier: list[SupportTrace],
+        queried: dict[str, set[str]],
+    ) -> Q | None:
+        values_by_field: dict[str, set[str]] = {}
+        for trace in frontier:
+            for field, value in identifiers_from_trace(trace).items():
+                values_by_field.setdefault(field, set()).add(value)
+            if trace.correlation_id:
+                values_by_field.setdefault("correlation_id", set()).add(trace.correlation_id)
             if trace.parent_workflow_instance_id:
-                parent = SupportTrace.objects.filter(
-                    workflow_instance_id=trace.parent_workflow_instance_id
-                ).first()
-                if parent and parent.workflow_instance_id not in seen:
-                    if parent.workflow_instance_id not in seed_ids:
-                        seen.add(parent.workflow_instance_id)
-                        related.append(parent)
+                values_by_field.setdefault("workflow_instance_id", set()).add(
+                    trace.parent_workflow_instance_id
+                )
+            values_by_field.setdefault("parent_workflow_instance_id", set()).add(
+                trace.workflow_instance_id
+            )
 
-            children = SupportTrace.objects.filter(
-                parent_workflow_instance_id=trace.workflow_instance_id
-            ).order_by("-updated_at")
-            for child in children:
-                if child.workflow_instance_id not in seen and child.workflow_instance_id not in seed_ids:
-                    seen.add(child.workflow_instance_id)
-                    related.append(child)
-
-        for corr in correlation_ids:
-            for match in SupportTrace.objects.filter(correlation_id=corr).order_by(
-                "-updated_at"
-            ):
-                if match.workflow_instance_id not in seen and match.workflow_instance_id not in seed_ids:
-                    seen.add(match.workflow_instance_id)
-                    related.append(match)
-
-        return related
+        condition: Q | None = None
+        for field, values in values_by_field.items():
+            done = queried.setdefault(field, set())
+            fresh = values - done
+            if not fresh:
+                continue
+            done |= fresh
+            clause = Q(**{f"{field}__in": sorted(fresh)})
+            condition = clause if condition is None else condition | clause
+        return condition
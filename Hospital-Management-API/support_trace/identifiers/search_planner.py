@@ -2,7 +2,12 @@
 
 from __future__ import annotations
 
-from support_trace.identifiers.constants import SearchStrategy
+from support_trace.identifiers.constants import (
+    SUFFIX_SEARCH_FIELDS,
+    TRIGRAM_MIN_LENGTH,
+    TRIGRAM_SEARCH_FIELDS,
+    SearchStrategy,
+)
 from support_trace.identifiers.identifier_registry import IdentifierRegistry
 from support_trace.identifiers.types import DetectedIdentifier, SearchPlan, SearchPlanStep
 
@@ -23,19 +28,15 @@ class SearchPlanner:
                 value=detected.normalized,
             )
         ]
-        if not exact_only:
-            strategy = IdentifierRegistry.get_by_field(detected.field_name)
-            if strategy is not None and strategy.supports_partial_search():
+        if not exact_only and cls._fuzzy_search_indexed(detected):
+            fuzzy = [SearchStrategy.PREFIX]
+            if detected.field_name in SUFFIX_SEARCH_FIELDS:
+                fuzzy.append(SearchStrategy.SUFFIX)
+            fuzzy.append(SearchStrategy.PARTIAL)
+            for strategy in fuzzy:
                 steps.append(
                     SearchPlanStep(
-                        strategy=SearchStrategy.PREFIX,
-                        field_name=detected.field_name,
-                        value=detected.normalized,
-                    )
-                )
-                steps.append(
-                    SearchPlanStep(
-                        strategy=SearchStrategy.PARTIAL,
+                        strategy=strategy,
                         field_name=detected.field_name,
                         value=detected.normalized,
                     )
@@ -65,3 +66,18 @@ class SearchPlanner:
             field_name=field_name,
         )
         return cls.plan(detected, expand_relationships=expand_relationships)
+
+    @staticmethod
+    def _fuzzy_search_indexed(detected: DetectedIdentifier) -> bool:
+        """Plan fuzzy steps only where an index can serve them.
+
+        Shorter fragments, or fields without trigram indexes, would scan
+        the whole table.
+        """
+        strategy = IdentifierRegistry.get_by_field(detected.field_name)
+        return (
+            strategy is not None
+            and strategy.supports_partial_search()
+            and detected.field_name in TRIGRAM_SEARCH_FIELDS
+            and len(detected.normalized) >= TRIGRAM_MIN_LENGTH
+        )
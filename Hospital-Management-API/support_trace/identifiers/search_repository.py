@@ -2,24 +2,50 @@
 
 from __future__ import annotations
 
+from django.db.models import IntegerField, QuerySet, Value
+from django.db.models.functions import Reverse, Upper
+from django.db.models.lookups import StartsWith
+
 from support_trace.identifiers.constants import PARTIAL_SEARCH_LIMIT, SearchStrategy
-from support_trace.identifiers.types import SearchPlan, SearchResult
+from support_trace.identifiers.types import SearchPlan, SearchPlanStep, SearchResult
 from support_trace.models import SupportTrace
 
 
 class SupportTraceSearchRepository:
     @classmethod
     def execute(cls, plan: SearchPlan) -> SearchResult:
-        for step in plan.steps:
-            traces = cls._run_step(step)
-            if traces:
-                return SearchResult(
-                    traces=traces,
-                    matched_field=step.field_name,
-                    matched_value=step.value,
-                    strategy=step.strategy,
-                )
-        return SearchResult()
+        """Run every plan step in one UNION ALL query.
+
+        Rows carry the index of the step that matched them; the first step
+        (in plan order) with matches wins, as with sequential fallbacks.
+        """
+        querysets = []
+        for rank, step in enumerate(plan.steps):
+            queryset = cls._step_queryset(step)
+            if queryset is None:
+                continue
+            queryset = queryset.annotate(
+                search_rank=Value(rank, output_field=IntegerField())
+            )
+            if step.strategy != SearchStrategy.EXACT:
+                queryset = queryset[:PARTIAL_SEARCH_LIMIT]
+            querysets.append(queryset)
+        if not querysets:
+            return SearchResult()
+        combined = querysets[0]
+        if len(querysets) > 1:
+            combined = combined.union(*querysets[1:], all=True)
+        rows = list(combined.order_by("search_rank", "-updated_at"))
+        if not rows:
+            return SearchResult()
+        rank = rows[0].search_rank
+        step = plan.steps[rank]
+        return SearchResult(
+            traces=[row for row in rows if row.search_rank == rank],
+            matched_field=step.field_name,
+            matched_value=step.value,
+            strategy=step.strategy,
+        )
 
     @classmethod
     def exact_match(cls, field: str, value: str) -> list[SupportTrace]:
@@ -33,11 +59,7 @@ class SupportTraceSearchRepository:
         *,
         limit: int = PARTIAL_SEARCH_LIMIT,
     ) -> list[SupportTrace]:
-        return list(
-            SupportTrace.objects.filter(**{f"{field}__istartswith": prefix}).order_by(
-                "-updated_at"
-            )[:limit]
-        )
+        return list(cls._prefix_queryset(field, prefix)[:limit])
 
     @classmethod
     def partial_search(
@@ -47,11 +69,7 @@ class SupportTraceSearchRepository:
         *,
         limit: int = PARTIAL_SEARCH_LIMIT,
     ) -> list[SupportTrace]:
-        return list(
-            SupportTrace.objects.filter(**{f"{field}__icontains": fragment}).order_by(
-                "-updated_at"
-            )[:limit]
-        )
+        return list(cls._partial_queryset(field, fragment)[:limit])
 
     @classmethod
     def suffix_search(
@@ -61,21 +79,40 @@ class SupportTraceSearchRepository:
         *,
         limit: int = PARTIAL_SEARCH_LIMIT,
     ) -> list[SupportTrace]:
-        return list(
-            SupportTrace.objects.filter(**{f"{field}__iendswith": suffix}).order_by(
-                "-updated_at"
-            )[:limit]
-        )
+        return list(cls._suffix_queryset(field, suffix)[:limit])
 
     @classmethod
-    def _run_step(cls, step) -> list[SupportTrace]:
+    def _step_queryset(cls, step: SearchPlanStep) -> QuerySet[SupportTrace] | None:
         if step.strategy == SearchStrategy.EXACT:
-            return cls.exact_match(step.field_name, step.value)
+            return SupportTrace.objects.filter(**{step.field_name: step.value})
         if step.strategy == SearchStrategy.PREFIX:
-            return cls.prefix_search(step.field_name, step.value)
+            return cls._prefix_queryset(step.field_name, step.value)
+        if step.strategy == SearchStrategy.SUFFIX:
+            return cls._suffix_queryset(step.field_name, step.value)
         if step.strategy == SearchStrategy.PARTIAL:
-            return cls.partial_search(step.field_name, step.value)
-        return []
+            return cls._partial_queryset(step.field_name, step.value)
+        return None
+
+    @classmethod
+    def _prefix_queryset(cls, field: str, prefix: str) -> QuerySet[SupportTrace]:
+        # UPPER(field) LIKE 'PREFIX%': served by the upper(field) trigram index.
+        return SupportTrace.objects.filter(**{f"{field}__istartswith": prefix}).order_by(
+            "-updated_at"
+        )
+
+    @classmethod
+    def _partial_queryset(cls, field: str, fragment: str) -> QuerySet[SupportTrace]:
+        # UPPER(field) LIKE '%FRAGMENT%': served by the upper(field) trigram index.
+        return SupportTrace.objects.filter(**{f"{field}__icontains": fragment}).order_by(
+            "-updated_at"
+        )
+
+    @classmethod
+    def _suffix_queryset(cls, field: str, suffix: str) -> QuerySet[SupportTrace]:
+        # REVERSE(UPPER(field)) LIKE 'XIFFUS%': a range scan on the reverse() index.
+        return SupportTrace.objects.filter(
+            StartsWith(Reverse(Upper(field)), suffix.upper()[::-1])
+        ).order_by("-updated_at")
 
     @classmethod
     def _ordered_query(cls, **filters) -> list[SupportTrace]:
@@ -17,9 +17,10 @@ class RelationshipLookupDelegate:
     ) -> list[Any]:
         if not traces:
             return []
-        related = RelationshipResolver.expand(traces)
-        if policy.max_relationship_expansion:
-            related = related[: policy.max_relationship_expansion]
+        related = RelationshipResolver.expand(
+            traces,
+            max_results=policy.max_relationship_expansion or None,
+        )
         if policy.allowed_workflow_types:
             allowed = policy.allowed_workflow_types
             related = [t for t in related if str(getattr(t, "workflow_type", "")) in allowed]
@@ -0,0 +1,46 @@
+# Generated manually for SupportTrace partial / suffix identifier search.
+
+from django.db import migrations
+
+TRIGRAM_FIELDS = ("phone_number", "payment_id", "provider_reference", "whatsapp_message_id")
+SUFFIX_FIELDS = ("phone_number", "provider_reference")
+
+
+def _trigram_index(field: str) -> migrations.RunSQL:
+    # Matches Django's icontains / istartswith SQL: UPPER("field"::text) LIKE ...
+    return migrations.RunSQL(
+        sql=(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS st_{field}_trgm_idx "
+            f"ON support_trace USING gin ((upper({field}::text)) gin_trgm_ops);"
+        ),
+        reverse_sql=f"DROP INDEX CONCURRENTLY IF EXISTS st_{field}_trgm_idx;",
+    )
+
+
+def _reverse_index(field: str) -> migrations.RunSQL:
+    # Suffix lookups become prefix scans: REVERSE(UPPER("field")) LIKE 'xiffus%'.
+    return migrations.RunSQL(
+        sql=(
+            f"CREATE INDEX CONCURRENTLY IF NOT EXISTS st_{field}_rev_idx "
+            f"ON support_trace ((reverse(upper({field}::text))) text_pattern_ops);"
+        ),
+        reverse_sql=f"DROP INDEX CONCURRENTLY IF EXISTS st_{field}_rev_idx;",
+    )
+
+
+class Migration(migrations.Migration):
+    # CONCURRENTLY cannot run inside a transaction; builds do not block writes.
+    atomic = False
+
+    dependencies = [
+        ("support_trace", "0004_runtime_metadata"),
+    ]
+
+    operations = [
+        migrations.RunSQL(
+            sql="CREATE EXTENSION IF NOT EXISTS pg_trgm;",
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+        *[_trigram_index(field) for field in TRIGRAM_FIELDS],
+        *[_reverse_index(field) for field in SUFFIX_FIELDS],
+    ]
@@ -0,0 +1,201 @@
+"""Coalesces Support Trace projection writes made within one batch."""
+
+from __future__ import annotations
+
+import copy
+import logging
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+
+from django.conf import settings
+
+from support_trace.domain.repository import SupportTraceRepository
+from support_trace.enums import SyncStatus, WorkflowHealth
+from support_trace.exceptions import SupportTraceConcurrencyError, WorkflowSyncError
+from support_trace.models import SupportTrace
+
+logger = logging.getLogger(__name__)
+
+FLUSH_CONFLICT_RETRIES = 3
+
+_active_buffer: ContextVar[ProjectionBuffer | None] = ContextVar(
+    "support_trace_projection_buffer", default=None
+)
+
+
+def projection_coalescing_enabled() -> bool:
+    return bool(getattr(settings, "SUPPORT_TRACE_COALESCE_PROJECTIONS", False))
+
+
+@dataclass
+class _PendingProjection:
+    trace: SupportTrace
+    base_version: int | None
+    base: SupportTrace | None = None
+    fields: dict[str, Any] = field(default_factory=dict)
+    updates: int = 0
+    raise_on_failure: bool = False
+
+    def changed_fields(self) -> dict[str, Any]:
+        """Fields this batch changed relative to the row it first read."""
+        if self.base is None:
+            return dict(self.fields)
+        return {
+            key: value
+            for key, value in self.fields.items()
+            if getattr(self.base, key, None) != value
+        }
+
+
+class ProjectionBuffer:
+    """Folds every record() for a workflow into one upsert per batch.
+
+    While a buffer is active, reads through ProjectionBuffer.read() see the
+    folded in-memory state, so each record() computes from the previous
+    one exactly as sequential writes would. flush() then writes each
+    workflow once, checked against the trace_version first read. On a
+    version conflict the batch's changes are merged onto the fresh row;
+    a workflow that still cannot be written is marked sync-failed and,
+    if any of its records asked for it, flush() raises WorkflowSyncError.
+    """
+
+    _repository = SupportTraceRepository()
+
+    def __init__(self) -> None:
+        self._reads: dict[str, SupportTrace | None] = {}
+        self._pending: dict[str, _PendingProjection] = {}
+
+    @classmethod
+    def active(cls) -> ProjectionBuffer | None:
+        return _active_buffer.get()
+
+    @classmethod
+    @contextmanager
+    def coalescing(cls) -> Iterator[ProjectionBuffer]:
+        """Activate a buffer for the block and flush it on exit (re-entrant)."""
+        current = cls.active()
+        if current is not None:
+            yield current
+            return
+        buffer = cls()
+        token = _active_buffer.set(buffer)
+        try:
+            yield buffer
+        finally:
+            _active_buffer.reset(token)
+            buffer.flush()
+
+    @classmethod
+    def read(cls, workflow_instance_id: str) -> SupportTrace | None:
+        """Current projection for a workflow, including unflushed updates."""
+        buffer = cls.active()
+        if buffer is None:
+            return cls._repository.get_by_workflow(workflow_instance_id)
+        return buffer._read(str(workflow_instance_id))
+
+    def stage(
+        self,
+        fields: dict[str, Any],
+        *,
+        raise_on_failure: bool = False,
+    ) -> tuple[SupportTrace, bool]:
+        """Fold an upsert payload into the workflow's pending projection."""
+        workflow_id = str(fields["workflow_instance_id"])
+        pending = self._pending.get(workflow_id)
+        if pending is None:
+            base = self._read(workflow_id)
+            if base is None:
+                trace = SupportTrace(workflow_instance_id=workflow_id)
+                pending = _PendingProjection(trace=trace, base_version=None)
+            else:
+                pending = _PendingProjection(
+                    trace=copy.copy(base),
+                    base_version=base.trace_version,
+                    base=copy.copy(base),
+                )
+            self._pending[workflow_id] = pending
+            self._reads[workflow_id] = pending.trace
+        pending.fields.update(fields)
+        for key, value in fields.items():
+            setattr(pending.trace, key, value)
+        pending.updates += 1
+        pending.raise_on_failure = pending.raise_on_failure or raise_on_failure
+        return pending.trace, pending.base_version is None
+
+    def flush(self) -> int:
+        """Write pending projections; returns the number of upserts."""
+        written = 0
+        failed: list[_PendingProjection] = []
+        pending_items = list(self._pending.values())
+        self._pending.clear()
+        self._reads.clear()
+        for pending in pending_items:
+            try:
+                self._write(pending)
+                written += 1
+            except Exception:
+                logger.error(
+                    "support_trace_projection_flush_failed",
+                    extra={
+                        "workflow_instance_id": pending.trace.workflow_instance_id,
+                        "coalesced_updates": pending.updates,
+                    },
+                    exc_info=True,
+                )
+                self._mark_sync_failed(pending)
+                failed.append(pending)
+        if any(pending.raise_on_failure for pending in failed):
+            raise WorkflowSyncError(
+                "Support Trace projection flush failed for workflows: "
+                + ", ".join(str(p.trace.workflow_instance_id) for p in failed)
+            )
+        return written
+
+    def _write(self, pending: _PendingProjection) -> None:
+        fields = dict(pending.fields)
+        if pending.base_version is None:
+            # Keep the id handed out by stage(); ignored if the row exists.
+            fields["id"] = pending.trace.id
+        try:
+            self._repository.upsert(fields, expected_trace_version=pending.base_version)
+            return
+        except SupportTraceConcurrencyError:
+            pass
+        # Another writer moved the row on: re-apply only what this batch
+        # changed on top of its version instead of overwriting it.
+        changes = pending.changed_fields()
+        changes["workflow_instance_id"] = pending.trace.workflow_instance_id
+        for attempt in range(FLUSH_CONFLICT_RETRIES):
+            fresh = self._repository.get_by_workflow(pending.trace.workflow_instance_id)
+            try:
+                self._repository.upsert(
+                    changes,
+                    expected_trace_version=fresh.trace_version if fresh else None,
+                )
+                return
+            except SupportTraceConcurrencyError:
+                if attempt == FLUSH_CONFLICT_RETRIES - 1:
+                    raise
+
+    def _mark_sync_failed(self, pending: _PendingProjection) -> None:
+        try:
+            SupportTrace.objects.filter(
+                workflow_instance_id=pending.trace.workflow_instance_id
+            ).update(
+                sync_status=SyncStatus.FAILED,
+                workflow_health=WorkflowHealth.FAILED,
+            )
+        except Exception:
+            logger.warning(
+                "support_trace_projection_mark_failed_failed",
+                extra={"workflow_instance_id": pending.trace.workflow_instance_id},
+                exc_info=True,
+            )
+
+    def _read(self, workflow_id: str) -> SupportTrace | None:
+        if workflow_id not in self._reads:
+            self._reads[workflow_id] = self._repository.get_by_workflow(workflow_id)
+        return self._reads[workflow_id]
@@ -16,6 +16,7 @@ from support_trace.domain.types import SupportTraceResult
 from support_trace.domain.validators import SupportTraceRequestValidator
 from support_trace.enums import SyncStatus, TERMINAL_TRACE_STATUSES, TraceSource, TraceStatus, WorkflowHealth
 from support_trace.exceptions import SupportTraceConcurrencyError, SupportTraceError
+from support_trace.services.projection_buffer import ProjectionBuffer
 
 logger = logging.getLogger(__name__)
 
@@ -68,7 +69,8 @@ class SupportTraceService(BaseAuditService):
         def _do_record() -> SupportTraceResult:
             nonlocal correlation_for_log
             now = event_at or datetime.now(timezone.utc)
-            existing = cls._repository.get_by_workflow(workflow_instance_id)
+            buffer = ProjectionBuffer.active()
+            existing = ProjectionBuffer.read(workflow_instance_id)
 
             duration_ms = cls._compute_duration_ms(
                 existing=existing,
@@ -136,13 +138,16 @@ class SupportTraceService(BaseAuditService):
                 existing.runtime_metadata if existing else {}
             )
 
-            try:
-                trace, created = cls._repository.upsert(
-                    fields,
-                    expected_trace_version=existing.trace_version if existing else None,
-                )
-            except SupportTraceConcurrencyError:
-                trace, created = cls._repository.upsert(fields)
+            if buffer is not None:
+                trace, created = buffer.stage(fields, raise_on_failure=raise_on_failure)
+            else:
+                try:
+                    trace, created = cls._repository.upsert(
+                        fields,
+                        expected_trace_version=existing.trace_version if existing else None,
+                    )
+                except SupportTraceConcurrencyError:
+                    trace, created = cls._repository.upsert(fields)
 
             apply_trace_context(
                 workflow_instance_id=trace.workflow_instance_id,
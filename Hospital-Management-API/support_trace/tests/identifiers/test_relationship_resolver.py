@@ -32,6 +32,51 @@ class RelationshipResolverTests(TestCase):
         child_ids = {t.workflow_instance_id for t in related}
         self.assertIn(child_id, child_ids)
 
+    def test_expand_batches_all_seeds_into_one_query(self) -> None:
+        clinic, corr_id, first_id = setup_trace_context()
+        booking_id = str(uuid.uuid4())
+        second_id = str(uuid.uuid4())
+        sibling_id = str(uuid.uuid4())
+        record_trace_event(clinic, first_id, correlation_id=corr_id)
+        record_trace_event(clinic, second_id, identifiers={"booking_id": booking_id})
+        record_trace_event(clinic, sibling_id, identifiers={"booking_id": booking_id})
+        seeds = list(
+            SupportTrace.objects.filter(workflow_instance_id__in=[first_id, second_id])
+        )
+        with self.assertNumQueries(1):
+            related = RelationshipResolver.expand(seeds)
+        self.assertEqual({t.workflow_instance_id for t in related}, {sibling_id})
+
+    def test_expand_walks_hops_breadth_first_up_to_cap(self) -> None:
+        clinic, _, root_id = setup_trace_context()
+        child_id = str(uuid.uuid4())
+        grandchild_id = str(uuid.uuid4())
+        record_trace_event(clinic, root_id, correlation_id=str(uuid.uuid4()))
+        record_trace_event(
+            clinic,
+            child_id,
+            correlation_id=str(uuid.uuid4()),
+            parent_workflow_instance_id=root_id,
+        )
+        record_trace_event(
+            clinic,
+            grandchild_id,
+            correlation_id=str(uuid.uuid4()),
+            parent_workflow_instance_id=child_id,
+        )
+        root = SupportTrace.objects.get(workflow_instance_id=root_id)
+
+        one_hop = {t.workflow_instance_id for t in RelationshipResolver.expand([root])}
+        self.assertIn(child_id, one_hop)
+        self.assertNotIn(grandchild_id, one_hop)
+
+        two_hops = RelationshipResolver.expand([root], max_depth=2)
+        self.assertEqual(
+            [t.workflow_instance_id for t in two_hops][-1],
+            grandchild_id,
+        )
+        self.assertEqual(len(RelationshipResolver.expand([root], max_depth=2, max_results=1)), 1)
+
     def test_collect_identifiers(self) -> None:
         clinic, corr_id, wf_id = setup_trace_context()
         booking_id = str(uuid.uuid4())
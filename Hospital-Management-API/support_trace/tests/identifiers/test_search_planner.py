@@ -35,3 +35,25 @@ class SearchPlannerTests(TestCase):
         plan = SearchPlanner.plan(detected, exact_only=True)
         self.assertEqual(len(plan.steps), 1)
         self.assertEqual(plan.steps[0].strategy, SearchStrategy.EXACT)
+
+    def test_phone_plan_adds_suffix_and_skips_short_fragments(self) -> None:
+        detected = DetectedIdentifier(
+            identifier_type=IdentifierType.PHONE,
+            confidence=1.0,
+            reason="typed lookup",
+            normalized="43210",
+            field_name="phone_number",
+        )
+        strategies = [step.strategy for step in SearchPlanner.plan(detected).steps]
+        self.assertEqual(
+            strategies,
+            [
+                SearchStrategy.EXACT,
+                SearchStrategy.PREFIX,
+                SearchStrategy.SUFFIX,
+                SearchStrategy.PARTIAL,
+            ],
+        )
+
+        short = SearchPlanner.plan_for_field("phone_number", "10")
+        self.assertEqual(len(short.steps), 1)
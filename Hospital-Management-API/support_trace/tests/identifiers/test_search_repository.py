@@ -6,6 +6,8 @@ import uuid
 
 from django.test import TestCase
 
+from support_trace.identifiers.constants import SearchStrategy
+from support_trace.identifiers.search_planner import SearchPlanner
 from support_trace.identifiers.search_repository import SupportTraceSearchRepository
 from support_trace.tests.support import record_trace_event, setup_trace_context
 
@@ -41,3 +43,28 @@ class SearchRepositoryTests(TestCase):
             "provider_reference", "lab-prefix"
         )
         self.assertGreaterEqual(len(traces), 1)
+
+    def test_suffix_search_matches_trailing_fragment(self) -> None:
+        clinic, corr_id, wf_id = setup_trace_context()
+        record_trace_event(
+            clinic,
+            wf_id,
+            correlation_id=corr_id,
+            identifiers={"provider_reference": "PNR-ab-7781"},
+        )
+        traces = SupportTraceSearchRepository.suffix_search("provider_reference", "B-7781")
+        self.assertEqual([t.workflow_instance_id for t in traces], [wf_id])
+
+    def test_execute_returns_first_matching_step_in_one_query(self) -> None:
+        clinic, corr_id, wf_id = setup_trace_context()
+        record_trace_event(
+            clinic,
+            wf_id,
+            correlation_id=corr_id,
+            identifiers={"provider_reference": "lab-union-4455"},
+        )
+        plan = SearchPlanner.plan_for_field("provider_reference", "union-4455")
+        with self.assertNumQueries(1):
+            result = SupportTraceSearchRepository.execute(plan)
+        self.assertEqual(result.strategy, SearchStrategy.SUFFIX)
+        self.assertEqual([t.workflow_instance_id for t in result.traces], [wf_id])
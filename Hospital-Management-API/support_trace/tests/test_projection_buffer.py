@@ -0,0 +1,124 @@
+"""Tests for ProjectionBuffer write coalescing."""
+
+from __future__ import annotations
+
+from unittest import mock
+
+from django.db import transaction
+from django.db.models import F
+from django.test import TestCase, override_settings
+
+from support_trace.enums import SyncStatus, TraceStatus
+from support_trace.exceptions import WorkflowSyncError
+from support_trace.models import SupportTrace
+from support_trace.services.projection_buffer import ProjectionBuffer
+from support_trace.tests.support import record_trace_event, setup_trace_context
+from support_trace.workflow.hooks import _schedule_projection
+
+
+class ProjectionBufferTests(TestCase):
+    def tearDown(self) -> None:
+        from shared.logging.context import get_context_manager
+
+        get_context_manager().clear()
+
+    def test_new_workflow_written_once_on_flush(self) -> None:
+        clinic, corr_id, wf_id = setup_trace_context()
+        with ProjectionBuffer.coalescing():
+            first = record_trace_event(clinic, wf_id, correlation_id=corr_id)
+            second = record_trace_event(
+                clinic,
+                wf_id,
+                correlation_id=corr_id,
+                status=TraceStatus.COMPLETED,
+                last_event="booking.completed",
+            )
+            self.assertFalse(SupportTrace.objects.filter(workflow_instance_id=wf_id).exists())
+
+        self.assertTrue(first.created)
+        self.assertEqual(first.trace_id, second.trace_id)
+        trace = SupportTrace.objects.get(workflow_instance_id=wf_id)
+        self.assertEqual(trace.pk, first.trace_id)
+        self.assertEqual(trace.status, TraceStatus.COMPLETED)
+        self.assertEqual(trace.trace_version, 1)
+
+    def test_existing_workflow_updates_fold_into_one_version(self) -> None:
+        clinic, corr_id, wf_id = setup_trace_context()
+        record_trace_event(clinic, wf_id, correlation_id=corr_id)
+        with ProjectionBuffer.coalescing():
+            record_trace_event(
+                clinic, wf_id, correlation_id=corr_id, last_event="booking.confirmed"
+            )
+            self.assertEqual(ProjectionBuffer.read(wf_id).last_event, "booking.confirmed")
+            record_trace_event(
+                clinic,
+                wf_id,
+                correlation_id=corr_id,
+                status=TraceStatus.COMPLETED,
+                last_event="booking.completed",
+            )
+
+        trace = SupportTrace.objects.get(workflow_instance_id=wf_id)
+        self.assertEqual(trace.trace_version, 2)
+        self.assertEqual(trace.last_event, "booking.completed")
+
+    def test_conflicting_writer_changes_are_merged_not_overwritten(self) -> None:
+        clinic, corr_id, wf_id = setup_trace_context()
+        record_trace_event(clinic, wf_id, correlation_id=corr_id)
+        with ProjectionBuffer.coalescing():
+            record_trace_event(
+                clinic, wf_id, correlation_id=corr_id, last_event="booking.confirmed"
+            )
+            SupportTrace.objects.filter(workflow_instance_id=wf_id).update(
+                retry_count=5, trace_version=F("trace_version") + 1
+            )
+
+        trace = SupportTrace.objects.get(workflow_instance_id=wf_id)
+        self.assertEqual(trace.last_event, "booking.confirmed")
+        self.assertEqual(trace.retry_count, 5)
+        self.assertEqual(trace.trace_version, 3)
+
+    def test_flush_failure_marks_sync_failed_and_raises_when_requested(self) -> None:
+        clinic, corr_id, wf_id = setup_trace_context()
+        record_trace_event(clinic, wf_id, correlation_id=corr_id)
+        with mock.patch.object(
+            ProjectionBuffer._repository, "upsert", side_effect=RuntimeError("db down")
+        ):
+            with self.assertRaises(WorkflowSyncError):
+                with ProjectionBuffer.coalescing():
+                    record_trace_event(
+                        clinic,
+                        wf_id,
+                        correlation_id=corr_id,
+                        last_event="booking.confirmed",
+                        raise_on_failure=True,
+                    )
+
+        trace = SupportTrace.objects.get(workflow_instance_id=wf_id)
+        self.assertEqual(trace.sync_status, SyncStatus.FAILED)
+        self.assertEqual(trace.last_event, "workflow.started")
+
+
+@override_settings(SUPPORT_TRACE_COALESCE_PROJECTIONS=True)
+class ScheduledProjectionBatchTests(TestCase):
+    def test_audits_from_one_transaction_project_once_together(self) -> None:
+        project = mock.Mock()
+        with self.captureOnCommitCallbacks(execute=True):
+            _schedule_projection(project, "a")
+            _schedule_projection(project, "b")
+            project.assert_not_called()
+
+        self.assertEqual(project.call_args_list, [mock.call("a"), mock.call("b")])
+
+    def test_batch_opened_in_rolled_back_savepoint_still_runs(self) -> None:
+        project = mock.Mock()
+        with self.captureOnCommitCallbacks(execute=True):
+            try:
+                with transaction.atomic():
+                    _schedule_projection(project, "rolled-back")
+                    raise RuntimeError
+            except RuntimeError:
+                pass
+            _schedule_projection(project, "kept")
+
+        self.assertEqual(project.call_args_list, [mock.call("rolled-back"), mock.call("kept")])
@@ -20,6 +20,8 @@ from clinical_audit.enums import AuditAction, AuditOutcome, AuditSource, Clinica
 from clinical_audit.services.clinical_audit_service import ClinicalAuditService
 from support_trace.tests.support import setup_trace_context
 from support_trace.timeline import TimelineService
+from support_trace.timeline.timeline_engine import TimelineEngine
+from support_trace.timeline.timeline_resolver import TimelineResolver
 
 
 class TimelineIntegrationTests(TestCase):
@@ -96,3 +98,30 @@ class TimelineIntegrationTests(TestCase):
         result = TimelineService.build_workflow_timeline(wf_id)
         self.assertGreaterEqual(len(result.events), 1)
         self.assertGreaterEqual(len(result.workflow_snapshots), 1)
+
+    def test_page_streams_events_in_build_order(self) -> None:
+        clinic, corr_id, _ = setup_trace_context()
+        with self.captureOnCommitCallbacks(execute=True):
+            for _ in range(3):
+                ClinicalAuditService.record(
+                    action=AuditAction.CONSULTATION_STARTED,
+                    event="Consultation started",
+                    module="consultations_core",
+                    resource_type=ClinicalEntity.CONSULTATION,
+                    resource_id=str(uuid.uuid4()),
+                    outcome=AuditOutcome.SUCCESS,
+                    source=AuditSource.DOCTOR,
+                    user_id="doctor-test",
+                    organization_id=str(clinic.id),
+                    correlation_id=corr_id,
+                    consultation_id=str(uuid.uuid4()),
+                    validate_references=False,
+                )
+
+        built = TimelineService.build_correlation_timeline(corr_id).events
+        scope = TimelineResolver.resolve_correlation(corr_id)
+        first = TimelineEngine.page(scope, limit=2)
+        rest = TimelineEngine.page(scope, offset=2, limit=len(built))
+        self.assertTrue(first.has_more)
+        self.assertFalse(rest.has_more)
+        self.assertEqual(first.events + rest.events, built)
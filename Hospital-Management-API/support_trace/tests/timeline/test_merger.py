@@ -7,7 +7,7 @@ from datetime import datetime, timezone
 
 from django.test import TestCase
 
-from support_trace.timeline.timeline_merger import TimelineMerger
+from support_trace.timeline.timeline_merger import TimelineMerger, TimelineSorter
 from support_trace.timeline.types import TimelineEvent
 
 
@@ -66,3 +66,23 @@ class MergerSorterTests(TestCase):
         merged = TimelineMerger.merge([e1, e2])
         self.assertEqual(merged[0].reference_id, "a")
         self.assertEqual(merged[1].reference_id, "b")
+
+    def test_iter_merge_matches_merge(self) -> None:
+        ts = datetime(2026, 1, 1, 8, 20, tzinfo=timezone.utc)
+        later = datetime(2026, 1, 1, 8, 21, tzinfo=timezone.utc)
+        clinical = [
+            _event(ref_type="clinical_audit", ref_id="c1", ts=ts, category="Clinical"),
+            _event(ref_type="clinical_audit", ref_id="c2", ts=later, category="Clinical"),
+        ]
+        business = [
+            _event(ref_type="business_audit", ref_id="b2", ts=ts, seq=2),
+            _event(ref_type="business_audit", ref_id="b1", ts=ts, seq=1),
+            _event(ref_type="business_audit", ref_id="b3", ts=later),
+        ]
+        streamed = list(
+            TimelineMerger.iter_merge(
+                TimelineSorter.sort_runs(iter(clinical)),
+                TimelineSorter.sort_runs(iter(business)),
+            )
+        )
+        self.assertEqual(streamed, TimelineMerger.merge(clinical, business))
@@ -0,0 +1,70 @@
+"""Materialized timeline cache tests."""
+
+from __future__ import annotations
+
+import uuid
+from datetime import datetime, timezone
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from clinical_audit.enums import AuditAction, AuditOutcome, AuditSource, ClinicalEntity
+from clinical_audit.services.clinical_audit_service import ClinicalAuditService
+from support_trace.tests.support import setup_trace_context
+from support_trace.timeline import TimelineService
+from support_trace.timeline.timeline_cache import TimelineMaterializer
+from support_trace.timeline.timeline_resolver import TimelineResolver
+from support_trace.timeline.types import TimelineScope
+
+
+def _record_clinical(clinic_id: str, corr_id: str) -> None:
+    ClinicalAuditService.record(
+        action=AuditAction.CONSULTATION_STARTED,
+        event="Consultation started",
+        module="consultations_core",
+        resource_type=ClinicalEntity.CONSULTATION,
+        resource_id=str(uuid.uuid4()),
+        outcome=AuditOutcome.SUCCESS,
+        source=AuditSource.DOCTOR,
+        user_id="doctor-test",
+        organization_id=clinic_id,
+        correlation_id=corr_id,
+        consultation_id=str(uuid.uuid4()),
+        validate_references=False,
+    )
+
+
+@override_settings(SUPPORT_TRACE_TIMELINE_CACHE_ENABLED=True)
+class TimelineCacheTests(TestCase):
+    def setUp(self) -> None:
+        cache.clear()
+
+    def tearDown(self) -> None:
+        from shared.logging.context import get_context_manager
+
+        get_context_manager().clear()
+        cache.clear()
+
+    def test_cached_build_matches_uncached_and_appends_new_rows(self) -> None:
+        clinic, corr_id, _ = setup_trace_context()
+        with self.captureOnCommitCallbacks(execute=True):
+            _record_clinical(str(clinic.id), corr_id)
+
+        with override_settings(SUPPORT_TRACE_TIMELINE_CACHE_ENABLED=False):
+            uncached = TimelineService.build_correlation_timeline(corr_id)
+        first = TimelineService.build_correlation_timeline(corr_id)
+        self.assertEqual(first.events, uncached.events)
+        self.assertIsNotNone(
+            cache.get(TimelineMaterializer.cache_key(TimelineResolver.resolve_correlation(corr_id)))
+        )
+
+        with self.captureOnCommitCallbacks(execute=True):
+            _record_clinical(str(clinic.id), corr_id)
+        second = TimelineService.build_correlation_timeline(corr_id)
+        self.assertEqual(len(second.events), len(first.events) + 1)
+        with override_settings(SUPPORT_TRACE_TIMELINE_CACHE_ENABLED=False):
+            self.assertEqual(second.events, TimelineService.build_correlation_timeline(corr_id).events)
+
+    def test_date_bounded_scope_is_not_materialized(self) -> None:
+        scope = TimelineScope("correlation", "corr-x", date_from=datetime(2026, 1, 1, tzinfo=timezone.utc))
+        self.assertFalse(TimelineMaterializer.applies(scope))
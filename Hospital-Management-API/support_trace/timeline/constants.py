@@ -32,3 +32,7 @@ CERTIFICATION_REQUIRED_ACTIONS: frozenset[str] = frozenset(
 
 TERMINAL_WORKFLOW_STATUSES = frozenset({"Completed", "Failed", "Cancelled", "Expired"})
 ACTIVE_WORKFLOW_STATUSES = frozenset({"Started", "Running", "Waiting"})
+
+# Rows fetched per round trip when streaming audits from a server-side cursor.
+AUDIT_CURSOR_CHUNK_SIZE = 500
+DEFAULT_TIMELINE_PAGE_SIZE = 100
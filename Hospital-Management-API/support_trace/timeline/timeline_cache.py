@@ -0,0 +1,137 @@
+"""Materialized timeline events per scope, appended incrementally."""
+
+from __future__ import annotations
+
+import hashlib
+from dataclasses import fields
+from datetime import datetime, timedelta
+from typing import Any
+
+from django.conf import settings
+from django.core.cache import cache
+
+from support_trace.constants import PROJECTION_VERSION
+from support_trace.timeline.adapters import BusinessAdapter, ClinicalAdapter
+from support_trace.timeline.timeline_merger import TimelineMerger
+from support_trace.timeline.timeline_repository import TimelineRepository
+from support_trace.timeline.types import TimelineEvent, TimelineScope
+
+TIMELINE_CACHE_PREFIX = "st_timeline_v1"
+MATERIALIZED_SCOPE_TYPES = frozenset({"correlation", "workflow", "booking"})
+# Re-read rows this far behind the stored high-water marks: auto_now_add
+# timestamps are taken before commit, so a slower transaction can land a row
+# slightly older than one already read. Overlapping rows are deduplicated.
+REFETCH_OVERLAP = timedelta(seconds=5)
+DEFAULT_TTL_SECONDS = 15 * 60
+
+_EVENT_FIELDS = tuple(f.name for f in fields(TimelineEvent))
+
+
+def timeline_cache_enabled() -> bool:
+    return bool(getattr(settings, "SUPPORT_TRACE_TIMELINE_CACHE_ENABLED", False))
+
+
+class TimelineMaterializer:
+    """Keeps each scope's merged, sequenced events in the shared cache.
+
+    Audits are append-only, so a cached timeline only needs rows newer than
+    its high-water marks: those are adapted and merged into the stored
+    events. An entry is rebuilt when the projection versions of the scope's
+    SupportTraces change (or PROJECTION_VERSION is bumped).
+    """
+
+    _clinical_adapter = ClinicalAdapter()
+    _business_adapter = BusinessAdapter()
+
+    @classmethod
+    def applies(cls, scope: TimelineScope) -> bool:
+        return (
+            timeline_cache_enabled()
+            and scope.scope_type in MATERIALIZED_SCOPE_TYPES
+            and bool(scope.scope_value)
+            and scope.date_from is None
+            and scope.date_to is None
+        )
+
+    @classmethod
+    def cache_key(cls, scope: TimelineScope) -> str:
+        extra = "|".join(sorted(scope.correlation_ids)) + "#" + "|".join(
+            sorted(scope.workflow_instance_ids)
+        )
+        digest = hashlib.sha256(extra.encode("utf-8")).hexdigest()[:16]
+        return (
+            f"{TIMELINE_CACHE_PREFIX}:{PROJECTION_VERSION}:"
+            f"{scope.scope_type}:{scope.scope_value}:{digest}"
+        )
+
+    @staticmethod
+    def projection_signature(traces: list[Any]) -> list[int]:
+        return sorted(
+            {int(getattr(t, "projection_version", 0) or 0) for t in traces}
+        )
+
+    @classmethod
+    def events_for(cls, scope: TimelineScope, traces: list[Any]) -> list[TimelineEvent]:
+        """Return the scope's merged timeline events, refreshing the cache entry."""
+        key = cls.cache_key(scope)
+        signature = cls.projection_signature(traces)
+        entry = cls._load(key, signature)
+
+        cached_events: list[TimelineEvent] = []
+        clinical_mark: datetime | None = None
+        business_mark: datetime | None = None
+        anchor: str | None = None
+        if entry is not None:
+            cached_events, clinical_mark, business_mark, anchor = entry
+
+        clinical_rows, business_rows, new_anchor = TimelineRepository.fetch_audits_since(
+            scope,
+            clinical_after=clinical_mark - REFETCH_OVERLAP if clinical_mark else None,
+            business_after=business_mark - REFETCH_OVERLAP if business_mark else None,
+            anchor_correlation_id=anchor,
+        )
+        if entry is not None and not clinical_rows and not business_rows and new_anchor == anchor:
+            return cached_events
+
+        events = TimelineMerger.merge(
+            cached_events,
+            cls._clinical_adapter.adapt_many(clinical_rows),
+            cls._business_adapter.adapt_many(business_rows),
+        )
+        if entry is not None and len(events) == len(cached_events) and new_anchor == anchor:
+            # Only overlap rows that were already materialized.
+            return cached_events
+        if clinical_rows:
+            last = clinical_rows[-1].timestamp
+            clinical_mark = last if clinical_mark is None else max(clinical_mark, last)
+        if business_rows:
+            last = business_rows[-1].created_at
+            business_mark = last if business_mark is None else max(business_mark, last)
+        cache.set(
+            key,
+            {
+                "signature": signature,
+                "clinical_mark": clinical_mark,
+                "business_mark": business_mark,
+                "anchor": new_anchor,
+                "events": [tuple(getattr(e, name) for name in _EVENT_FIELDS) for e in events],
+            },
+            getattr(settings, "SUPPORT_TRACE_TIMELINE_CACHE_TTL_SECONDS", DEFAULT_TTL_SECONDS),
+        )
+        return events
+
+    @classmethod
+    def _load(
+        cls,
+        key: str,
+        signature: list[int],
+    ) -> tuple[list[TimelineEvent], datetime | None, datetime | None, str | None] | None:
+        entry = cache.get(key)
+        if not isinstance(entry, dict) or entry.get("signature") != signature:
+            return None
+        try:
+            events = [TimelineEvent(*row) for row in entry["events"]]
+        except (KeyError, TypeError):
+            # Entry written by a different TimelineEvent shape.
+            return None
+        return events, entry.get("clinical_mark"), entry.get("business_mark"), entry.get("anchor")
@@ -3,18 +3,34 @@
 from __future__ import annotations
 
 import time
+from collections.abc import Iterable, Iterator
+from dataclasses import replace
 from datetime import datetime, timezone
+from itertools import islice
+from typing import Any
+
+from shared.logging import logger
 
 from support_trace.timeline.adapters import BusinessAdapter, ClinicalAdapter
+from support_trace.timeline.adapters.base import TimelineSourceAdapter
 from support_trace.timeline.certification import TimelineCertification
+from support_trace.timeline.constants import DEFAULT_TIMELINE_PAGE_SIZE
 from support_trace.timeline.hooks import fail_open_timeline
+from support_trace.timeline.timeline_cache import TimelineMaterializer
 from support_trace.timeline.timeline_filter import TimelineFilterEngine
 from support_trace.timeline.timeline_graph import TimelineGraphBuilder
-from support_trace.timeline.timeline_merger import TimelineMerger
+from support_trace.timeline.timeline_merger import TimelineMerger, TimelineSorter
 from support_trace.timeline.timeline_repository import TimelineRepository
 from support_trace.timeline.timeline_snapshot import TimelineSnapshotBuilder
 from support_trace.timeline.timeline_statistics import TimelineStatisticsBuilder
-from support_trace.timeline.types import TimelineFilter, TimelineFetchBundle, TimelineGraph, TimelineResult, TimelineScope
+from support_trace.timeline.types import (
+    TimelineEvent,
+    TimelineFetchBundle,
+    TimelineFilter,
+    TimelinePage,
+    TimelineResult,
+    TimelineScope,
+)
 
 
 class TimelineEngine:
@@ -48,6 +64,57 @@ class TimelineEngine:
             default=TimelineResult(scope=f"{scope.scope_type}:{scope.scope_value}"),
         )
 
+    @classmethod
+    def iter_events(
+        cls,
+        scope: TimelineScope,
+        *,
+        filters: TimelineFilter | None = None,
+    ) -> Iterator[TimelineEvent]:
+        """Stream the scope's events in timeline order without loading every row.
+
+        Filter date bounds are applied in SQL, so timeline_sequence numbers
+        events within that window.
+        """
+        clinical_rows, business_rows = TimelineRepository.iter_audits(
+            cls._narrow_scope(scope, filters)
+        )
+        return TimelineFilterEngine.iter_apply(
+            cls._merge_streams(clinical_rows, business_rows), filters
+        )
+
+    @classmethod
+    def page(
+        cls,
+        scope: TimelineScope,
+        *,
+        filters: TimelineFilter | None = None,
+        offset: int = 0,
+        limit: int = DEFAULT_TIMELINE_PAGE_SIZE,
+    ) -> TimelinePage:
+        """One page of iter_events(); reading stops after the page."""
+        label = f"{scope.scope_type}:{scope.scope_value}"
+
+        def _page() -> TimelinePage:
+            events = cls.iter_events(scope, filters=filters)
+            try:
+                window = list(islice(events, offset, offset + limit + 1))
+            finally:
+                events.close()
+            return TimelinePage(
+                events=window[:limit],
+                offset=offset,
+                limit=limit,
+                has_more=len(window) > limit,
+                scope=label,
+            )
+
+        return fail_open_timeline(
+            "timeline_page",
+            _page,
+            default=TimelinePage(offset=offset, limit=limit, scope=label),
+        )
+
     @classmethod
     def _build_impl(
         cls,
@@ -57,14 +124,19 @@ class TimelineEngine:
         bundle: TimelineFetchBundle | None = None,
     ) -> TimelineResult:
         started = time.perf_counter()
-        if bundle is None:
-            bundle = TimelineRepository.fetch_bundle(scope)
-
-        clinical_events = cls._clinical_adapter.adapt_many(list(bundle.clinical_rows))
-        business_events = cls._business_adapter.adapt_many(list(bundle.business_rows))
-        events = TimelineMerger.merge(clinical_events, business_events)
+        if bundle is None and TimelineMaterializer.applies(scope):
+            traces = TimelineRepository.fetch_traces(scope)
+            events = TimelineMaterializer.events_for(scope, traces)
+        elif bundle is None:
+            clinical_rows, business_rows = TimelineRepository.iter_audits(scope)
+            events = list(cls._merge_streams(clinical_rows, business_rows))
+            traces = TimelineRepository.fetch_traces(scope)
+        else:
+            clinical_events = cls._clinical_adapter.adapt_many(list(bundle.clinical_rows))
+            business_events = cls._business_adapter.adapt_many(list(bundle.business_rows))
+            events = TimelineMerger.merge(clinical_events, business_events)
+            traces = list(bundle.support_traces)
 
-        traces = list(bundle.support_traces)
         workflow_tree = TimelineGraphBuilder.build(traces, events)
         snapshots = TimelineSnapshotBuilder.from_traces(traces)
 
@@ -73,14 +145,45 @@ class TimelineEngine:
         if filters is not None:
             events = TimelineFilterEngine.apply(events, filters)
 
+        build_duration_ms = (time.perf_counter() - started) * 1000
+        logger.performance("support_trace.timeline.build", duration_ms=build_duration_ms, emit=False)
         result = TimelineResult(
             events=events,
             workflow_snapshots=snapshots,
             workflow_tree=workflow_tree,
             statistics=statistics,
             generated_at=datetime.now(timezone.utc),
-            build_duration_ms=(time.perf_counter() - started) * 1000,
+            build_duration_ms=build_duration_ms,
             scope=f"{scope.scope_type}:{scope.scope_value}",
         )
         TimelineCertification.validate(result)
         return result
+
+    @classmethod
+    def _merge_streams(
+        cls,
+        clinical_rows: Iterable[Any],
+        business_rows: Iterable[Any],
+    ) -> Iterator[TimelineEvent]:
+        """k-way merge of audit rows already ordered by event time."""
+        return TimelineMerger.iter_merge(
+            TimelineSorter.sort_runs(cls._adapt(cls._clinical_adapter, clinical_rows)),
+            TimelineSorter.sort_runs(cls._adapt(cls._business_adapter, business_rows)),
+        )
+
+    @staticmethod
+    def _adapt(adapter: TimelineSourceAdapter, rows: Iterable[Any]) -> Iterator[TimelineEvent]:
+        for row in rows:
+            event = adapter.adapt(row)
+            if event is not None:
+                yield event
+
+    @staticmethod
+    def _narrow_scope(scope: TimelineScope, filters: TimelineFilter | None) -> TimelineScope:
+        if filters is None or not (filters.date_from or filters.date_to):
+            return scope
+        date_from = max(
+            (d for d in (scope.date_from, filters.date_from) if d), default=None
+        )
+        date_to = min((d for d in (scope.date_to, filters.date_to) if d), default=None)
+        return replace(scope, date_from=date_from, date_to=date_to)
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterable, Iterator
+
 from support_trace.timeline.types import TimelineEvent, TimelineFilter
 
 
@@ -44,3 +46,43 @@ class TimelineFilterEngine:
             prefix = filters.action_prefix
             result = [e for e in result if e.action and e.action.startswith(prefix)]
         return result
+
+    @classmethod
+    def iter_apply(
+        cls,
+        events: Iterable[TimelineEvent],
+        filters: TimelineFilter | None,
+    ) -> Iterator[TimelineEvent]:
+        """Lazy apply() for event streams."""
+        if filters is None:
+            yield from events
+            return
+        for event in events:
+            if cls.matches(event, filters):
+                yield event
+
+    @staticmethod
+    def matches(event: TimelineEvent, filters: TimelineFilter) -> bool:
+        if filters.date_from and event.timestamp < filters.date_from:
+            return False
+        if filters.date_to and event.timestamp > filters.date_to:
+            return False
+        if filters.categories and event.category not in filters.categories:
+            return False
+        if filters.severities and event.severity not in filters.severities:
+            return False
+        if filters.tags and not set(filters.tags).intersection(event.tags):
+            return False
+        if filters.workflow_types and event.workflow_type not in filters.workflow_types:
+            return False
+        if filters.actors and event.actor not in filters.actors:
+            return False
+        if filters.statuses and event.status not in filters.statuses:
+            return False
+        if filters.sources and event.source not in filters.sources:
+            return False
+        if filters.action_prefix and not (
+            event.action and event.action.startswith(filters.action_prefix)
+        ):
+            return False
+        return True
@@ -2,6 +2,8 @@
 
 from __future__ import annotations
 
+import heapq
+from collections.abc import Iterable, Iterator
 from dataclasses import replace
 
 from support_trace.timeline.constants import CATEGORY_SORT_PRIORITY
@@ -13,6 +15,21 @@ class TimelineSorter:
     def sort(cls, events: list[TimelineEvent]) -> list[TimelineEvent]:
         return sorted(events, key=cls._sort_key)
 
+    @classmethod
+    def sort_runs(cls, events: Iterable[TimelineEvent]) -> Iterator[TimelineEvent]:
+        """Fully order a stream that is already ordered by timestamp.
+
+        Only events sharing a timestamp are buffered and sorted, so the
+        output follows the complete sort key without materializing the stream.
+        """
+        run: list[TimelineEvent] = []
+        for event in events:
+            if run and event.timestamp != run[0].timestamp:
+                yield from sorted(run, key=cls._sort_key)
+                run = []
+            run.append(event)
+        yield from sorted(run, key=cls._sort_key)
+
     @staticmethod
     def _sort_key(event: TimelineEvent) -> tuple:
         cat_prio = CATEGORY_SORT_PRIORITY.get(event.category, 99)
@@ -41,6 +58,23 @@ class TimelineMerger:
         sorted_events = TimelineSorter.sort(merged)
         return cls._assign_sequence(sorted_events)
 
+    @classmethod
+    def iter_merge(cls, *streams: Iterable[TimelineEvent]) -> Iterator[TimelineEvent]:
+        """Lazily k-way merge event streams that are each in sort order.
+
+        Yields the same events, in the same order and with the same
+        timeline_sequence, as merge() over the fully read streams.
+        """
+        seen: set[tuple[str, str]] = set()
+        sequence = 0
+        for event in heapq.merge(*streams, key=TimelineSorter._sort_key):
+            key = (event.reference_type, event.reference_id)
+            if key in seen:
+                continue
+            seen.add(key)
+            sequence += 1
+            yield replace(event, timeline_sequence=sequence)
+
     @classmethod
     def _assign_sequence(cls, events: list[TimelineEvent]) -> list[TimelineEvent]:
         result: list[TimelineEvent] = []
@@ -2,111 +2,250 @@
 
 from __future__ import annotations
 
+from collections.abc import Iterator
 from datetime import datetime
 
-from clinical_audit.domain.repository import ClinicalAuditRepository
+from django.db.models import DateTimeField, Q, QuerySet
+from django.db.models.fields.json import KeyTextTransform, KeyTransform
+from django.db.models.functions import Cast, Coalesce
+
 from clinical_audit.models import ClinicalAudit
-from business_audit.booking.repository import BookingAuditRepository
-from business_audit.domain.repository import BusinessAuditRepository
+from business_audit.enums import BusinessResourceType
 from business_audit.models import BusinessAudit
-from business_audit.recommendation.repository import RecommendationAuditRepository
 from support_trace.domain.repository import SupportTraceRepository
 from support_trace.identifiers.relationship_resolver import RelationshipResolver
 from support_trace.models import SupportTrace
+from support_trace.timeline.constants import AUDIT_CURSOR_CHUNK_SIZE
 from support_trace.timeline.types import TimelineFetchBundle, TimelineScope
 
 
+def clinical_event_time() -> Coalesce:
+    """SQL expression for ClinicalAdapter's event timestamp."""
+    return Coalesce(
+        Cast(
+            KeyTextTransform("occurred_at", KeyTransform("_meta", "new_value")),
+            DateTimeField(),
+        ),
+        "timestamp",
+    )
+
+
+def business_event_time() -> Coalesce:
+    """SQL expression for BusinessAdapter's event timestamp."""
+    return Coalesce("started_at", "created_at")
+
+
 class TimelineRepository:
     """Batch-read facade over immutable audits and SupportTrace."""
 
-    _clinical_repo = ClinicalAuditRepository()
-    _business_repo = BusinessAuditRepository()
-    _booking_repo = BookingAuditRepository()
-    _recommendation_repo = RecommendationAuditRepository()
     _trace_repo = SupportTraceRepository()
 
     @classmethod
     def fetch_bundle(cls, scope: TimelineScope) -> TimelineFetchBundle:
-        clinical_rows: list[ClinicalAudit] = []
-        business_rows: list[BusinessAudit] = []
-        traces: list[SupportTrace] = []
+        clinical_qs, business_qs = cls.audit_querysets(scope)
+        return TimelineFetchBundle(
+            clinical_rows=tuple(clinical_qs),
+            business_rows=tuple(business_qs),
+            support_traces=tuple(cls.fetch_traces(scope)),
+            scope=scope,
+        )
+
+    @classmethod
+    def audit_querysets(
+        cls,
+        scope: TimelineScope,
+    ) -> tuple[QuerySet[ClinicalAudit], QuerySet[BusinessAudit]]:
+        """Clinical and business audit rows of a scope, ordered by event time.
+
+        Rows are ordered by the same timestamp the adapters assign to their
+        events, and scope date bounds are applied to it in SQL.
+        """
+        clinical_q, business_q, _ = cls._scope_conditions(scope)
+        clinical_qs = cls._bounded(
+            ClinicalAudit.objects.all(), clinical_q, clinical_event_time(), scope
+        )
+        business_qs = cls._bounded(
+            BusinessAudit.objects.all(), business_q, business_event_time(), scope
+        )
+        return clinical_qs, business_qs
+
+    @classmethod
+    def iter_audits(
+        cls,
+        scope: TimelineScope,
+    ) -> tuple[Iterator[ClinicalAudit], Iterator[BusinessAudit]]:
+        """Lazy variant of audit_querysets over chunked server-side cursors."""
+        clinical_qs, business_qs = cls.audit_querysets(scope)
+        return (
+            clinical_qs.iterator(chunk_size=AUDIT_CURSOR_CHUNK_SIZE),
+            business_qs.iterator(chunk_size=AUDIT_CURSOR_CHUNK_SIZE),
+        )
 
+    @classmethod
+    def fetch_traces(cls, scope: TimelineScope) -> list[SupportTrace]:
+        """SupportTrace rows for a scope, expanded through RelationshipResolver."""
+        traces: list[SupportTrace] = []
         if scope.scope_type == "correlation":
-            corr = scope.scope_value
-            clinical_rows = cls._clinical_repo.get_by_correlation_id(corr)
-            business_rows = cls._business_repo.get_by_correlation(corr)
-            traces = cls._trace_repo.get_by_correlation(corr)
+            traces = cls._trace_repo.get_by_correlation(scope.scope_value)
         elif scope.scope_type == "patient":
-            clinical_rows = cls._clinical_repo.filter_by_patient(scope.scope_value)
-            business_rows = cls._booking_repo.get_by_patient(scope.scope_value)
             traces = list(
                 SupportTrace.objects.filter(
                     patient_account_id=scope.scope_value
                 ).order_by("-updated_at")
             )
         elif scope.scope_type == "consultation":
-            clinical_rows = cls._clinical_repo.filter_by_consultation(scope.scope_value)
-            business_rows = cls._booking_repo.get_by_consultation(scope.scope_value)
             traces = list(
                 SupportTrace.objects.filter(
                     consultation_id=scope.scope_value
                 ).order_by("-updated_at")
             )
         elif scope.scope_type == "booking":
-            business_rows = cls._booking_repo.get_by_booking(scope.scope_value)
             traces = list(
                 SupportTrace.objects.filter(booking_id=scope.scope_value).order_by(
                     "-updated_at"
                 )
             )
-            if business_rows:
-                corr = business_rows[0].correlation_id
-                clinical_rows = cls._clinical_repo.get_by_correlation_id(corr)
         elif scope.scope_type == "workflow":
-            business_rows = cls._business_repo.get_by_workflow_instance(scope.scope_value)
             trace = cls._trace_repo.get_by_workflow(scope.scope_value)
             traces = [trace] if trace else []
-            if business_rows:
-                corr = business_rows[0].correlation_id
-                clinical_rows = cls._clinical_repo.get_by_correlation_id(corr)
         elif scope.scope_type == "recommendation":
-            business_rows = cls._recommendation_repo.get_by_recommendation(scope.scope_value)
             traces = list(
                 SupportTrace.objects.filter(
                     recommendation_id=scope.scope_value
                 ).order_by("-updated_at")
             )
 
-        if scope.correlation_ids:
-            for corr in scope.correlation_ids:
-                if corr not in {r.correlation_id for r in clinical_rows}:
-                    clinical_rows.extend(cls._clinical_repo.get_by_correlation_id(corr))
-                if corr not in {r.correlation_id for r in business_rows}:
-                    business_rows.extend(cls._business_repo.get_by_correlation(corr))
-
         if scope.workflow_instance_ids:
             for wf_id in scope.workflow_instance_ids:
                 trace = cls._trace_repo.get_by_workflow(wf_id)
                 if trace and trace not in traces:
                     traces.append(trace)
-                business_rows.extend(cls._business_repo.get_by_workflow_instance(wf_id))
 
-        traces = cls._expand_traces(traces)
+        return cls._expand_traces(traces)
 
-        if scope.date_from or scope.date_to:
-            clinical_rows = cls._filter_clinical_dates(
-                clinical_rows, scope.date_from, scope.date_to
+    @classmethod
+    def fetch_audits_since(
+        cls,
+        scope: TimelineScope,
+        *,
+        clinical_after: datetime | None = None,
+        business_after: datetime | None = None,
+        anchor_correlation_id: str | None = None,
+    ) -> tuple[list[ClinicalAudit], list[BusinessAudit], str | None]:
+        """Audit rows of a materializable scope, optionally only newer rows.
+
+        Selects the same rows as fetch_bundle for correlation, booking and
+        workflow scopes, as one query per audit table. Booking and workflow
+        scopes read clinical rows by the correlation id of their first
+        business row (the anchor), which callers pass back on later calls.
+
+        Returns:
+            Clinical rows by timestamp, business rows by created_at, and the
+            anchor correlation id (None when the scope has none yet).
+        """
+        clinical_q, business_q, anchor = cls._scope_conditions(
+            scope, anchor_correlation_id=anchor_correlation_id
+        )
+        if anchor and anchor != anchor_correlation_id:
+            # Clinical rows of a newly found anchor were never read.
+            clinical_after = None
+
+        clinical_rows: list[ClinicalAudit] = []
+        if clinical_q is not None:
+            clinical_qs = ClinicalAudit.objects.filter(clinical_q)
+            if clinical_after is not None:
+                clinical_qs = clinical_qs.filter(timestamp__gte=clinical_after)
+            clinical_rows = list(clinical_qs.order_by("timestamp"))
+        business_rows: list[BusinessAudit] = []
+        if business_q is not None:
+            business_qs = BusinessAudit.objects.filter(business_q)
+            if business_after is not None:
+                business_qs = business_qs.filter(created_at__gte=business_after)
+            business_rows = list(business_qs.order_by("created_at"))
+        return clinical_rows, business_rows, anchor
+
+    @classmethod
+    def _scope_conditions(
+        cls,
+        scope: TimelineScope,
+        *,
+        anchor_correlation_id: str | None = None,
+    ) -> tuple[Q | None, Q | None, str | None]:
+        """Clinical and business audit conditions for a scope.
+
+        Booking and workflow scopes read clinical rows by the correlation id
+        of their first business row (the anchor).
+
+        Returns:
+            Clinical condition, business condition (None when the scope has
+            no rows of that kind) and the anchor correlation id.
+        """
+        value = scope.scope_value
+        clinical_q: Q | None = None
+        business_q: Q | None = None
+        anchor = anchor_correlation_id
+        if scope.scope_type == "correlation":
+            clinical_q = Q(correlation_id=value)
+            business_q = Q(correlation_id=value)
+        elif scope.scope_type == "patient":
+            clinical_q = Q(patient_account_id=value)
+            business_q = Q(
+                resource_type=BusinessResourceType.BOOKING,
+                new_value__payload__patient_account_id=str(value),
+            )
+        elif scope.scope_type == "consultation":
+            clinical_q = Q(consultation_id=value)
+            business_q = Q(
+                resource_type=BusinessResourceType.BOOKING,
+                new_value__payload__consultation_id=str(value),
             )
-            business_rows = cls._filter_business_dates(
-                business_rows, scope.date_from, scope.date_to
+        elif scope.scope_type in ("booking", "workflow"):
+            if scope.scope_type == "booking":
+                business_q = Q(
+                    resource_type=BusinessResourceType.BOOKING,
+                    resource_id=str(value),
+                )
+            else:
+                business_q = Q(workflow_instance_id=value)
+            if anchor is None:
+                anchor = (
+                    BusinessAudit.objects.filter(business_q)
+                    .order_by("sequence_no", "created_at")
+                    .values_list("correlation_id", flat=True)
+                    .first()
+                )
+            if anchor:
+                clinical_q = Q(correlation_id=anchor)
+        elif scope.scope_type == "recommendation":
+            business_q = Q(
+                resource_type=BusinessResourceType.RECOMMENDATION,
+                resource_id=str(value),
             )
 
-        return TimelineFetchBundle(
-            clinical_rows=tuple(clinical_rows),
-            business_rows=tuple(business_rows),
-            support_traces=tuple(traces),
-            scope=scope,
-        )
+        if scope.correlation_ids:
+            extra = Q(correlation_id__in=scope.correlation_ids)
+            clinical_q = extra if clinical_q is None else clinical_q | extra
+            business_q = extra if business_q is None else business_q | extra
+        if scope.workflow_instance_ids:
+            extra = Q(workflow_instance_id__in=scope.workflow_instance_ids)
+            business_q = extra if business_q is None else business_q | extra
+        return clinical_q, business_q, anchor
+
+    @staticmethod
+    def _bounded(
+        queryset: QuerySet,
+        condition: Q | None,
+        event_time: Coalesce,
+        scope: TimelineScope,
+    ) -> QuerySet:
+        if condition is None:
+            return queryset.none()
+        queryset = queryset.filter(condition).annotate(event_at=event_time)
+        if scope.date_from:
+            queryset = queryset.filter(event_at__gte=scope.date_from)
+        if scope.date_to:
+            queryset = queryset.filter(event_at__lte=scope.date_to)
+        return queryset.order_by("event_at")
 
     @classmethod
     def _expand_traces(cls, traces: list[SupportTrace]) -> list[SupportTrace]:
@@ -120,31 +259,3 @@ class TimelineRepository:
                 seen.add(trace.workflow_instance_id)
                 result.append(trace)
         return result
-
-    @classmethod
-    def _filter_clinical_dates(
-        cls,
-        rows: list[ClinicalAudit],
-        date_from: datetime | None,
-        date_to: datetime | None,
-    ) -> list[ClinicalAudit]:
-        result = rows
-        if date_from:
-            result = [r for r in result if r.timestamp >= date_from]
-        if date_to:
-            result = [r for r in result if r.timestamp <= date_to]
-        return result
-
-    @classmethod
-    def _filter_business_dates(
-        cls,
-        rows: list[BusinessAudit],
-        date_from: datetime | None,
-        date_to: datetime | None,
-    ) -> list[BusinessAudit]:
-        result = rows
-        if date_from:
-            result = [r for r in result if r.created_at >= date_from]
-        if date_to:
-            result = [r for r in result if r.created_at <= date_to]
-        return result
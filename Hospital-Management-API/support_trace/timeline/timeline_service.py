@@ -2,10 +2,10 @@
 
 from __future__ import annotations
 
-from support_trace.timeline.hooks import fail_open_timeline
+from support_trace.timeline.constants import DEFAULT_TIMELINE_PAGE_SIZE
 from support_trace.timeline.timeline_engine import TimelineEngine
 from support_trace.timeline.timeline_resolver import TimelineResolver
-from support_trace.timeline.types import TimelineFilter, TimelineResult
+from support_trace.timeline.types import TimelineFilter, TimelinePage, TimelineResult
 
 
 class TimelineService:
@@ -31,6 +31,19 @@ class TimelineService:
         scope = TimelineResolver.resolve_patient(patient_account_id)
         return TimelineEngine.build(scope, filters=filters)
 
+    @classmethod
+    def page_patient_timeline(
+        cls,
+        patient_account_id: str,
+        *,
+        filters: TimelineFilter | None = None,
+        offset: int = 0,
+        limit: int = DEFAULT_TIMELINE_PAGE_SIZE,
+    ) -> TimelinePage:
+        """Events only, streamed; for long patient histories."""
+        scope = TimelineResolver.resolve_patient(patient_account_id)
+        return TimelineEngine.page(scope, filters=filters, offset=offset, limit=limit)
+
     @classmethod
     def build_consultation_timeline(
         cls,
@@ -212,3 +212,12 @@ class TimelineResult:
     generated_at: datetime | None = None
     build_duration_ms: float = 0.0
     scope: str = ""
+
+
+@dataclass
+class TimelinePage:
+    events: list[TimelineEvent] = field(default_factory=list)
+    offset: int = 0
+    limit: int = 0
+    has_more: bool = False
+    scope: str = ""
@@ -3,15 +3,62 @@
 from __future__ import annotations
 
 import logging
+import threading
+from collections.abc import Callable
 from typing import Any
 from uuid import UUID
 
+from django.db import transaction
+
 from consultations_core.audit.commit import emit_after_commit
 from support_trace.domain.sync_event import SupportTraceSyncEvent
+from support_trace.services.projection_buffer import (
+    ProjectionBuffer,
+    projection_coalescing_enabled,
+)
 from support_trace.services.projection_engine import ProjectionEngine
 
 logger = logging.getLogger(__name__)
 
+_batches = threading.local()
+
+
+class _ProjectionBatch:
+    """Audit projections scheduled by one transaction, run together after commit.
+
+    Every scheduled audit registers an on_commit callback; the first one to
+    run projects the whole batch inside a ProjectionBuffer and clears
+    ``pending``, so the rest are no-ops. Audits from rolled-back (savepoint)
+    blocks no longer exist and are skipped by the projectors. If the whole
+    transaction rolls back the batch stays pending and the next scheduled
+    audit joins it, registering a fresh callback on its own transaction.
+    """
+
+    def __init__(self) -> None:
+        self.jobs: list[tuple[Callable[..., None], str]] = []
+        self.pending = True
+
+    def run(self, **_kwargs: Any) -> None:
+        if not self.pending:
+            return
+        self.pending = False
+        if getattr(_batches, "current", None) is self:
+            _batches.current = None
+        with ProjectionBuffer.coalescing():
+            for project, audit_id in self.jobs:
+                project(audit_id)
+
+
+def _schedule_projection(project: Callable[..., None], audit_id: str) -> None:
+    if not projection_coalescing_enabled():
+        emit_after_commit(project, audit_id)
+        return
+    batch = getattr(_batches, "current", None)
+    if batch is None or not batch.pending:
+        batch = _batches.current = _ProjectionBatch()
+    batch.jobs.append((project, audit_id))
+    transaction.on_commit(batch.run)
+
 
 def _project_business_audit(audit_id: str, **_kwargs: Any) -> None:
     try:
@@ -53,7 +100,7 @@ def schedule_workflow_state_update_from_business_audit(
 ) -> None:
     """Schedule Support Trace projection after Business Audit commit."""
     try:
-        emit_after_commit(_project_business_audit, str(audit_id))
+        _schedule_projection(_project_business_audit, str(audit_id))
     except Exception:
         logger.warning(
             "support_trace_schedule_business_failed",
@@ -68,7 +115,7 @@ def schedule_workflow_state_update_from_clinical_audit(
 ) -> None:
     """Schedule Support Trace projection after Clinical Audit commit."""
     try:
-        emit_after_commit(_project_clinical_audit, str(audit_id))
+        _schedule_projection(_project_clinical_audit, str(audit_id))
     except Exception:
         logger.warning(
             "support_trace_schedule_clinical_failed",
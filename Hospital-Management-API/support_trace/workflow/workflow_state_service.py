@@ -8,9 +8,9 @@ from typing import Any
 from uuid import UUID
 
 from support_trace.constants import PROJECTION_VERSION
-from support_trace.domain.repository import SupportTraceRepository
 from support_trace.domain.types import SupportTraceResult
 from support_trace.enums import TERMINAL_TRACE_STATUSES, TraceSource, TraceStatus
+from support_trace.services.projection_buffer import ProjectionBuffer
 from support_trace.services.support_trace_service import SupportTraceService
 from support_trace.workflow.types import WorkflowStateTransition, ResolvedWorkflow
 
@@ -20,8 +20,6 @@ logger = logging.getLogger(__name__)
 class WorkflowStateService:
     """Public API for updating mutable workflow projection state."""
 
-    _repository = SupportTraceRepository()
-
     @classmethod
     def update_workflow_state(
         cls,
@@ -33,7 +31,7 @@ class WorkflowStateService:
         last_business_audit_id: UUID | None = None,
         raise_on_failure: bool = False,
     ) -> SupportTraceResult:
-        existing = cls._repository.get_by_workflow(resolved.workflow_instance_id)
+        existing = ProjectionBuffer.read(resolved.workflow_instance_id)
         event_at = resolved.event_at or datetime.now(timezone.utc)
 
         retry_count = existing.retry_count if existing else 0
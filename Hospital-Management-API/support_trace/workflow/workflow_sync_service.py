@@ -9,8 +9,8 @@ from support_trace.domain.sync_event import SupportTraceSyncEvent
 from support_trace.domain.types import SupportTraceResult
 from support_trace.enums import SyncStatus, TraceSource
 from support_trace.exceptions import WorkflowTransitionError
-from support_trace.domain.repository import SupportTraceRepository
 from support_trace.identifiers.identifier_sync_service import IdentifierSyncService
+from support_trace.services.projection_buffer import ProjectionBuffer
 from support_trace.workflow.registries import resolve_transition
 from support_trace.workflow.resolvers import WorkflowResolver
 from support_trace.workflow.transition_validator import WorkflowTransitionValidator
@@ -23,8 +23,6 @@ logger = logging.getLogger(__name__)
 class WorkflowSyncService:
     """Consumes SupportTraceSyncEvent and updates Support Trace. No business logic."""
 
-    _repository = SupportTraceRepository()
-
     @classmethod
     def sync(
         cls,
@@ -56,7 +54,7 @@ class WorkflowSyncService:
             )
 
         resolved = WorkflowResolver.resolve_from_sync_event(event)
-        existing = cls._repository.get_by_workflow(resolved.workflow_instance_id)
+        existing = ProjectionBuffer.read(resolved.workflow_instance_id)
         sync_result = IdentifierSyncService.sync(
             event,
             resolved=resolved,
@@ -83,7 +81,7 @@ class WorkflowSyncService:
             last_seen_at=sync_result.last_seen_at,
         )
 
-        existing = cls._repository.get_by_workflow(resolved.workflow_instance_id)
+        existing = ProjectionBuffer.read(resolved.workflow_instance_id)
         try:
             WorkflowTransitionValidator.validate(
                 workflow_type=resolved.workflow_type,
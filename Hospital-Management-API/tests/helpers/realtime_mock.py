@@ -14,15 +14,12 @@ def mock_queue_realtime():
     ) as sync_mock, patch(
         "queue_management.api.views._sync_queue_realtime",
     ) as views_sync_mock, patch(
-        "queue_management.services.queue_sync.update_queue_sorted_set",
-    ) as sorted_mock, patch(
-        "queue_management.services.queue_sync.publish_queue_update",
-    ) as publish_mock:
+        "queue_management.services.queue_sync.dispatch_queue_update",
+    ) as dispatch_mock:
         from types import SimpleNamespace
 
         yield SimpleNamespace(
             sync=sync_mock,
             views_sync=views_sync_mock,
-            sorted_set=sorted_mock,
-            publish=publish_mock,
+            dispatch=dispatch_mock,
         )